@@ -1,79 +1,186 @@
-from flask import Flask, request, render_template, jsonify
+import time
+STARTUP_STARTED = time.perf_counter()
+
+from flask import Flask, Response, g, request, render_template, jsonify, before_render_template, template_rendered
 from flask_cors import CORS
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
-import pandas as pd
-import csv
+import hmac
 import json
 import os
-import pickle
-from ats_analyzer import analyze_ats, get_ats_score_color, get_ats_score_label
+from itertools import islice
+from career_index import CareerIndex
+from features import create_user_profile
+from recommender import Recommender
+from ats_cache import ResultCache, resume_cache_key
+from job_index import JobIndexStore
+from ats_executor import ATSExecutor, ExecutorBusy, analyze_batch, analyze_resume_task
+from ats_jobs import JobManager, QueueFull
+from ats_analyzer import ATSAnalyzer, get_analyzer, get_ats_score_color, get_ats_score_label, rank_resumes
+from components import ComponentDisabled, LazyComponent
+from response_cache import ResponseCache
+from metrics import CONTENT_TYPE, REGISTRY, REQUEST_SECONDS, REQUESTS_TOTAL, STAGE_SECONDS
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for cross-origin requests from Node.js backend
 
-# Cache directory for trained models
-CACHE_DIR = '__pycache__'
-MODEL_CACHE = os.path.join(CACHE_DIR, 'model_cache.pkl')
-VECTORIZER_CACHE = os.path.join(CACHE_DIR, 'vectorizer_cache.pkl')
-
-# Load your career data from a CSV file (adjust the file path and column names)
-print("[APP] Loading career data...")
-df = pd.read_csv('skills.csv')
-
-# Load aptitude test questions from a CSV file
-def load_aptitude_questions(file_path):
-    print(f"[APP] Loading aptitude questions from {file_path}...")
-    questions = []
-    with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            options = [row[f'option{i}'] for i in range(1, 5)]
-            question = {
-                'id': row['id'],
-                'question': row['question'],
-                'options': options,
-                'answer': row['answer']
-            }
-            questions.append(question)
-    print(f"[APP] Loaded {len(questions)} questions")
-    return questions
-
-print("[APP] Loading aptitude questions...")
-aptitude_questions = load_aptitude_questions('aptitude_questions.csv')
-
-# Load or train the model
-print("[APP] Initializing ML model...")
-if os.path.exists(MODEL_CACHE) and os.path.exists(VECTORIZER_CACHE):
-    print("[APP] Loading cached model...")
-    with open(VECTORIZER_CACHE, 'rb') as f:
-        tfidf_vectorizer = pickle.load(f)
-    with open(MODEL_CACHE, 'rb') as f:
-        rf_classifier = pickle.load(f)
-    print("[APP] Model loaded from cache ✓")
+# Upper bound on resumes accepted by a single batch ATS request
+MAX_ATS_BATCH_SIZE = 500
+
+# Upper bounds for recruiter ranking requests
+MAX_RANK_RESUMES = 50000
+MAX_RANK_TOP_N = 100
+
+# Upper bound on postings returned by a reverse job match
+MAX_JOB_MATCH_TOP_K = 50
+
+# Upper bound on student profiles accepted by a single batch recommendation request
+MAX_RECOMMEND_BATCH_SIZE = 500
+MAX_RECOMMEND_K = 10
+
+# Repeat analyses of an unchanged resume are served from this cache
+ats_result_cache = ResultCache(
+    maxsize=int(os.environ.get('ATS_CACHE_SIZE', 1024)),
+    ttl=float(os.environ.get('ATS_CACHE_TTL', 600))
+)
+
+# Aptitude test, career pages and ATS scoring info rendered once per data
+# version, with ETag / Last-Modified revalidation (PAGE_CACHE_SIZE)
+page_cache = ResponseCache.from_env()
+
+# ATS analysis runs inline, or in worker processes when ATS_WORKERS is set;
+# requests beyond the workers and their queue get 503 with Retry-After
+ats_executor = ATSExecutor.from_env()
+
+
+def load_recommendation_models():
+    """
+    Load the model, career table and aptitude questions from the artifact
+    bundle; it is rebuilt only when skills.csv or aptitude_questions.csv
+    change. RECOMMENDER_ENGINE selects the model (random_forest, linear or
+    centroid). Imports scikit-learn, so ATS-only processes never call it.
+    """
+    from artifacts import load_or_build_bundle
+
+    print("[APP] Loading recommender artifacts...")
+    bundle = load_or_build_bundle()
+    print(f"[APP] Recommender engine: {bundle['engine']}")
+    print(f"[APP] Loaded {len(bundle['questions'])} aptitude questions")
+
+    # Career name -> salary, job security, description and topics
+    careers = CareerIndex.from_table(bundle['careers'])
+    print(f"[APP] Indexed {len(careers)} careers")
+
+    return {
+        'recommender': Recommender(bundle['vectorizer'], bundle['model'], careers, bundle['field_weights']),
+        'aptitude_questions': bundle['questions'],
+        # Checksum of skills.csv and aptitude_questions.csv; versions the cached pages
+        'data_version': bundle['checksum']
+    }
+
+
+# RECOMMENDER_LOAD: background (default), lazy, eager or off for ATS-only
+# processes; see components.py
+recommendation_models = LazyComponent(
+    'recommender',
+    load_recommendation_models,
+    os.environ.get('RECOMMENDER_LOAD', 'background').strip().lower()
+)
+
+
+def get_recommender() -> Recommender:
+    """The recommender, loading it on first use"""
+    return recommendation_models.get()['recommender']
+
+
+def get_career_index() -> CareerIndex:
+    """The career lookup table, loaded with the recommender"""
+    return get_recommender().careers
+
+
+def get_aptitude_questions() -> list:
+    """The aptitude question bank, loaded with the recommender"""
+    return recommendation_models.get()['aptitude_questions']
+
+
+def get_data_version() -> str:
+    """Version of the career and question data, changing with the CSV files"""
+    return recommendation_models.get()['data_version']
+
+
+# Inverted index of the job posting corpus, memory-mapped from disk; only
+# postings added, changed or removed since the last run are re-indexed
+job_postings = JobIndexStore(taxonomy=ATSAnalyzer.TAXONOMY)
+print(f"[APP] Indexed {len(job_postings.sync())} job postings")
+
+# The ATS routes are ready as soon as the module is imported
+get_analyzer().job_weights.current
+
+if ats_executor.inline:
+    print("[APP] ATS analysis runs inline")
 else:
-    print("[APP] Training new model (this may take a moment)...")
-    # Tokenize the text data using TF-IDF vectorization
-    tfidf_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-    X = tfidf_vectorizer.fit_transform(df['Skills'])
-    y = df['Recommended Career']
-
-    # Train a Random Forest classifier
-    rf_classifier = RandomForestClassifier(n_estimators=100, random_state=42)
-    rf_classifier.fit(X, y)
-    
-    # Cache the model
-    os.makedirs(CACHE_DIR, exist_ok=True)
-    with open(VECTORIZER_CACHE, 'wb') as f:
-        pickle.dump(tfidf_vectorizer, f)
-    with open(MODEL_CACHE, 'wb') as f:
-        pickle.dump(rf_classifier, f)
-    print("[APP] Model trained and cached ✓")
+    print(f"[APP] ATS analysis runs in {ats_executor.workers} worker processes, queue size {ats_executor.queue_size}")
 
 # Serve static files (CSS)
 app.static_folder = 'static'
 
-print("[APP] Flask app initialized ✓")
+
+# Request latency and template rendering time for /metrics
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def record_request_metrics(response):
+    started = g.pop('request_started', None)
+    if started is not None and REGISTRY.enabled:
+        route = request.url_rule.rule if request.url_rule is not None else 'unmatched'
+        status = str(response.status_code)
+        REQUEST_SECONDS.observe(time.perf_counter() - started, request.method, route, status)
+        REQUESTS_TOTAL.inc(request.method, route, status)
+    return response
+
+
+def apply_taxonomy_change():
+    """Bring the job index and ATS worker processes in line with a new taxonomy"""
+    # Postings are indexed by taxonomy skills, so re-index them with the new taxonomy
+    job_postings.sync()
+    # Worker processes hold their own copy of the taxonomy
+    ats_executor.restart()
+
+
+# Every gunicorn worker holds its own taxonomy, and a reload request only
+# reaches one of them; the others notice the changed file here
+@app.before_request
+def refresh_ats_taxonomy():
+    if request.endpoint == 'reload_ats_taxonomy':
+        # The endpoint reloads and reports the change itself
+        return
+    taxonomy = ATSAnalyzer.TAXONOMY.refresh()
+    if taxonomy is not None:
+        print(f"[APP] Skill taxonomy file changed: version {taxonomy.version}, {taxonomy.skill_count} skills")
+        apply_taxonomy_change()
+
+
+def start_template_timer(sender, template, context, **extra):
+    g.template_started = time.perf_counter()
+
+
+def record_template_time(sender, template, context, **extra):
+    started = g.pop('template_started', None)
+    if started is not None:
+        STAGE_SECONDS.observe(time.perf_counter() - started, 'render_template')
+
+
+before_render_template.connect(start_template_timer, app)
+template_rendered.connect(record_template_time, app)
+
+print(f"[APP] Flask app initialized in {time.perf_counter() - STARTUP_STARTED:.2f}s ✓")
+
+if recommendation_models.enabled:
+    print(f"[APP] Recommender load mode: {recommendation_models.mode}")
+else:
+    print("[APP] Recommender disabled (RECOMMENDER_LOAD=off); serving ATS routes only")
+recommendation_models.start()
 
 # Define the root route to render the HTML form
 @app.route('/', methods=['GET'])
@@ -85,38 +192,28 @@ def index():
 @app.route('/recommend', methods=['POST'])
 def recommend_career():
     user_input = request.form  # Receive user input from the HTML form
-    user_profile_text = create_user_profile(user_input)
-    user_profile_vector = tfidf_vectorizer.transform([user_profile_text])
-    predicted_probs = rf_classifier.predict_proba(user_profile_vector)
+    recommender = get_recommender()
+    user_profile_text = create_user_profile(user_input, recommender.field_weights)
     
     # Get the top N predicted career paths
     num_paths = 3  # Adjust the number of desired career paths
-    top_careers = [rf_classifier.classes_[i] for i in predicted_probs.argsort()[0][-num_paths:]][::-1]
+    top_careers = [career for career, _ in recommender.top_careers([user_profile_text], num_paths)[0]]
     
     # Build detailed career objects with descriptions and metadata
     recommendations = []
     for career in top_careers:
-        career_data = df[df['Recommended Career'] == career].iloc[0]
+        career_data = recommender.careers.get(career)
         recommendations.append({
             'name': career,
-            'salary': int(career_data['Salary']),
-            'job_security': career_data['Job Security'],
-            'job_description': career_data['Job Description'][:150] + '...' if len(str(career_data['Job Description'])) > 150 else career_data['Job Description'],
+            'salary': career_data.salary,
+            'job_security': career_data.job_security,
+            'job_description': career_data.short_description(150),
             'description': f"Career in {career}. A promising role with strong growth potential and competitive compensation."
         })
     
     # Render the recommendations selection page
     return render_template('recommendations.html', recommendations=recommendations)
 
-# Create a user profile text from user input
-def create_user_profile(user_input):
-    return f"Class/Grade: {user_input['Class/Grade']} " \
-           f"Skills: {user_input['Skills']} " \
-           f"Interests: {user_input['Interests']} " \
-           f"Hobbies: {user_input['Hobbies']} " \
-           f"Passion: {user_input['Passion']} " \
-           f"Favourite Subject: {user_input['Favourite Subject']}"
-
 # Route to display career details including topics to be covered
 @app.route('/career', methods=['GET'])
 def display_career_details():
@@ -129,37 +226,30 @@ def display_career_details():
         
         print(f"[ROUTE] Fetching career details for: {career_name}")
         
-        # Retrieve career details from the dataset
-        career_data = df[df['Recommended Career'] == career_name]
+        # Retrieve career details from the index (exact, then case-insensitive)
+        career_details = get_career_index().get(career_name)
         
-        if career_data.empty:
+        if career_details is None:
             print(f"[ERROR] Career '{career_name}' not found in dataset")
-            # Try case-insensitive match
-            career_data = df[df['Recommended Career'].str.lower() == career_name.lower()]
-            
-        if career_data.empty:
-            print(f"[ERROR] Career not found even with case-insensitive search")
             return render_template('error.html', error="Career not found"), 404
         
-        career_details = career_data.iloc[0]
-        
-        # Add topics to be covered to the template context
-        topics_string = str(career_details['Topics to Be Covered']).strip()
-        if topics_string:
-            topics_covered = [topic.strip() for topic in topics_string.split('-') if topic.strip()]
-        else:
-            topics_covered = []
-        
-        print(f"[ROUTE] Found {len(topics_covered)} topics for {career_name}")
+        def render():
+            topics_covered = list(career_details.topics)
+            print(f"[ROUTE] Found {len(topics_covered)} topics for {career_name}")
+            
+            # Render the career details template with the data
+            return render_template('career_template.html',
+                                   career=career_name,
+                                   salary=career_details.salary,
+                                   job_description=career_details.job_description,
+                                   job_security=career_details.job_security,
+                                   topics_covered=topics_covered)
         
-        # Render the career details template with the data
-        return render_template('career_template.html',
-                               career=career_name,
-                               salary=int(career_details['Salary']),
-                               job_description=career_details['Job Description'],
-                               job_security=career_details['Job Security'],
-                               topics_covered=topics_covered)
+        page = page_cache.get_or_render(('career', career_name), get_data_version(), render)
+        return page_cache.respond(page)
     
+    except ComponentDisabled:
+        raise
     except Exception as e:
         print(f"[ERROR] Exception in display_career_details: {str(e)}")
         import traceback
@@ -169,8 +259,13 @@ def display_career_details():
 # Route to take the aptitude test
 @app.route('/aptitude_test', methods=['GET', 'POST'])
 def aptitude_test():
+    aptitude_questions = get_aptitude_questions()
     if request.method == 'GET':
-        return render_template('aptitude_test.html', questions=aptitude_questions)
+        page = page_cache.get_or_render(
+            ('aptitude_test',), get_data_version(),
+            lambda: render_template('aptitude_test.html', questions=aptitude_questions)
+        )
+        return page_cache.respond(page)
     elif request.method == 'POST':
         # Calculate the score based on selected options
         score = 0
@@ -180,10 +275,121 @@ def aptitude_test():
                 score += 1
         return render_template('aptitude_result.html', score=score, total=len(aptitude_questions))
 
+@app.route('/api/recommend/batch', methods=['POST'])
+def recommend_batch_endpoint():
+    """
+    Recommend careers for many student profiles in one request
+    
+    Request JSON:
+    {
+        "profiles": [
+            {
+                "Class/Grade": "12th",
+                "Skills": "Python, SQL",
+                "Interests": "...",
+                "Hobbies": "...",
+                "Passion": "...",
+                "Favourite Subject": "..."
+            },
+            ...
+        ],
+        "k": 3
+    }
+    
+    All profiles are scored with a single model call. Each item in the
+    response carries its own success flag.
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or not isinstance(data.get('profiles'), list):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'Missing profiles list in request body',
+                'error': 'MISSING_PROFILES',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        profiles = data['profiles']
+        k = data.get('k', 3)
+        
+        if len(profiles) > MAX_RECOMMEND_BATCH_SIZE:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': f'A batch may contain at most {MAX_RECOMMEND_BATCH_SIZE} profiles',
+                'error': 'BATCH_TOO_LARGE',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if isinstance(k, bool) or not isinstance(k, int) or not 1 <= k <= MAX_RECOMMEND_K:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': f'k must be an integer between 1 and {MAX_RECOMMEND_K}',
+                'error': 'INVALID_K',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        results = get_recommender().recommend_batch(profiles, k)
+        succeeded = sum(1 for item in results if item['success'])
+        print(f"[ROUTE] POST /api/recommend/batch - {len(results)} profiles, k={k}")
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'k': k,
+                'results': results,
+                'total': len(results),
+                'succeeded': succeeded,
+                'failed': len(results) - succeeded
+            },
+            'message': 'Recommendations generated successfully',
+            'error': None,
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 200
+    
+    except ComponentDisabled:
+        raise
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Error generating recommendations',
+            'error': str(e),
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 500
+
 # ============================================
 # ATS RESUME ANALYSIS ENDPOINTS
 # ============================================
 
+def analyze_resume_cached(resume_data, job_description):
+    """
+    ATS analysis of one resume through the result cache
+    
+    Returns:
+        tuple: (analysis result, whether it came from the cache)
+    """
+    def run_analysis():
+        # Run ATS analysis, plus a detailed match analysis when a job
+        # description is provided
+        return ats_executor.run(analyze_resume_task, resume_data, get_resume_text(resume_data), job_description)
+    
+    # Scores depend on the taxonomy and, with a job description, on the job keyword weights
+    version = f"{ATSAnalyzer.TAXONOMY.version}:{get_analyzer().job_weights.version}"
+    cache_key = resume_cache_key(resume_data, job_description, version)
+    return ats_result_cache.get_or_compute(cache_key, run_analysis)
+
+
+# Asynchronous analyses (/api/analyze-ats/jobs) run on background threads
+# and share the result cache and worker processes with the synchronous route
+ats_jobs = JobManager.from_env(
+    lambda payload: analyze_resume_cached(payload['resume_data'], payload['job_description'])[0]
+)
+
+
 @app.route('/api/analyze-ats', methods=['POST'])
 def analyze_ats_endpoint():
     """
@@ -221,50 +427,495 @@ def analyze_ats_endpoint():
                 'timestamp': str(__import__('datetime').datetime.now())
             }), 400
         
-        # Run ATS analysis
-        analysis_result = analyze_ats(resume_data)
+        analysis_result, cached = analyze_resume_cached(resume_data, job_description)
         
-        # If job description provided, add detailed match analysis
-        if job_description and len(job_description.strip()) > 0:
-            from ats_analyzer import ATSAnalyzer
-            
-            analyzer = ATSAnalyzer()
-            resume_text = get_resume_text(resume_data)
-            job_match_result = analyzer.analyze_job_match(resume_text, job_description)
-            
-            analysis_result['job_match'] = job_match_result
+        response = jsonify({
+            'success': True,
+            'data': analysis_result,
+            'message': 'Resume analyzed successfully',
+            'error': None,
+            'timestamp': str(__import__('datetime').datetime.now())
+        })
+        response.headers['X-Cache'] = 'HIT' if cached else 'MISS'
+        return response, 200
+    
+    except ExecutorBusy as e:
+        return _busy_response(e)
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Error analyzing resume',
+            'error': str(e),
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 500
+
+
+@app.route('/api/analyze-ats/batch', methods=['POST'])
+def analyze_ats_batch_endpoint():
+    """
+    Analyze many resumes for ATS compatibility in one request
+    
+    Request JSON:
+    {
+        "resumes": [ { complete resume object }, ... ],
+        "job_description": "optional job description shared by every resume"
+    }
+    
+    Each item in the response carries its own success flag, so one bad
+    resume does not fail the whole batch.
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not data or not isinstance(data.get('resumes'), list):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'Missing resumes list in request body',
+                'error': 'MISSING_RESUMES',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        resumes = data['resumes']
+        job_description = data.get('job_description') or ''
+        
+        if len(resumes) > MAX_ATS_BATCH_SIZE:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': f'A batch may contain at most {MAX_ATS_BATCH_SIZE} resumes',
+                'error': 'BATCH_TOO_LARGE',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if not isinstance(job_description, str):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'job_description must be a string',
+                'error': 'INVALID_JOB_DESCRIPTION',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        results = analyze_batch(ats_executor, resumes, job_description)
+        succeeded = sum(1 for item in results if item['success'])
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'results': results,
+                'total': len(results),
+                'succeeded': succeeded,
+                'failed': len(results) - succeeded
+            },
+            'message': 'Batch analyzed successfully',
+            'error': None,
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 200
+    
+    except ExecutorBusy as e:
+        return _busy_response(e)
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Error analyzing resume batch',
+            'error': str(e),
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 500
+
+
+@app.route('/api/analyze-ats/rank', methods=['POST'])
+def rank_resumes_endpoint():
+    """
+    Rank many resumes against one job description (recruiter mode)
+    
+    Request JSON:
+    {
+        "job_description": "job posting text",
+        "resumes": [ { complete resume object }, ... ],
+        "top_n": 10
+    }
+    
+    Large result sets can be streamed as newline-delimited JSON instead
+    (Content-Type: application/x-ndjson): the first line holds
+    {"job_description": ..., "top_n": ...} and every further line is one
+    resume. Resumes are scored as they arrive and only the top N are kept;
+    at most MAX_RANK_RESUMES lines are read.
+    """
+    try:
+        if request.mimetype == 'application/x-ndjson':
+            lines = (line for line in request.stream if line.strip())
+            header = next(lines, b'')
+            try:
+                data = json.loads(header)
+            except ValueError:
+                data = None
+            resumes = _ndjson_resumes(lines) if isinstance(data, dict) else None
         else:
-            analysis_result['job_match'] = {
-                'match_score': 0,
-                'matched_keywords': [],
-                'missing_keywords': [],
-                'job_keywords': [],
-                'match_percentage': 0
-            }
+            data = request.get_json(silent=True)
+            resumes = data.get('resumes') if isinstance(data, dict) else None
+            if resumes is not None and not isinstance(resumes, list):
+                resumes = None
+        
+        if not isinstance(data, dict) or resumes is None:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'Missing resumes in request body',
+                'error': 'MISSING_RESUMES',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        job_description = data.get('job_description')
+        top_n = data.get('top_n', 10)
+        
+        if not isinstance(job_description, str) or not job_description.strip():
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'job_description must be a non-empty string',
+                'error': 'INVALID_JOB_DESCRIPTION',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if isinstance(top_n, bool) or not isinstance(top_n, int) or not 1 <= top_n <= MAX_RANK_TOP_N:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': f'top_n must be an integer between 1 and {MAX_RANK_TOP_N}',
+                'error': 'INVALID_TOP_N',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if isinstance(resumes, list) and len(resumes) > MAX_RANK_RESUMES:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': f'A ranking request may contain at most {MAX_RANK_RESUMES} resumes',
+                'error': 'BATCH_TOO_LARGE',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if isinstance(resumes, list):
+            ranking = ats_executor.run(rank_resumes, resumes, job_description, top_n)
+        else:
+            # Streamed resumes are read from the request, so they are ranked here
+            ranking = rank_resumes(islice(resumes, MAX_RANK_RESUMES), job_description, top_n)
+        print(f"[ROUTE] POST /api/analyze-ats/rank - ranked {ranking['ranked']} of {ranking['total_resumes']} resumes")
         
         return jsonify({
             'success': True,
-            'data': analysis_result,
-            'message': 'Resume analyzed successfully',
+            'data': ranking,
+            'message': 'Resumes ranked successfully',
             'error': None,
             'timestamp': str(__import__('datetime').datetime.now())
         }), 200
     
+    except ExecutorBusy as e:
+        return _busy_response(e)
+    
     except Exception as e:
         return jsonify({
             'success': False,
             'data': None,
-            'message': 'Error analyzing resume',
+            'message': 'Error ranking resumes',
+            'error': str(e),
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 500
+
+
+@app.route('/api/job-postings/match', methods=['POST'])
+def match_job_postings_endpoint():
+    """
+    Find the job postings that best match one resume (reverse job matching)
+    
+    Request JSON:
+    {
+        "resume_data": { complete resume object },
+        "top_k": 10
+    }
+    
+    Postings come from the job posting index, so a request reads only the
+    posting lists of the resume's terms instead of matching every posting.
+    """
+    try:
+        data = request.get_json(silent=True)
+        resume_data = data.get('resume_data') if isinstance(data, dict) else None
+        
+        if not isinstance(resume_data, dict):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'resume_data must be a JSON object',
+                'error': 'MISSING_RESUME_DATA',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        top_k = data.get('top_k', 10)
+        if isinstance(top_k, bool) or not isinstance(top_k, int) or not 1 <= top_k <= MAX_JOB_MATCH_TOP_K:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': f'top_k must be an integer between 1 and {MAX_JOB_MATCH_TOP_K}',
+                'error': 'INVALID_TOP_K',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        matches = job_postings.search(get_analyzer()._get_resume_text(resume_data), top_k)
+        print(f"[ROUTE] POST /api/job-postings/match - {len(matches['results'])} of {matches['total_postings']} postings matched")
+        
+        return jsonify({
+            'success': True,
+            'data': matches,
+            'message': 'Job postings matched successfully',
+            'error': None,
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 200
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Error matching job postings',
             'error': str(e),
             'timestamp': str(__import__('datetime').datetime.now())
         }), 500
 
 
+@app.route('/api/analyze-ats/jobs', methods=['POST'])
+def submit_ats_job():
+    """
+    Queue a resume for ATS analysis and return immediately
+    
+    Request JSON:
+    {
+        "resume_data": { complete resume object },
+        "job_description": "optional job description for keyword matching",
+        "callback_url": "optional URL the finished job is POSTed to"
+    }
+    
+    Responds 202 with the job id; poll GET /api/analyze-ats/jobs/<job_id>
+    or wait for the callback, which receives the same body as a poll.
+    """
+    try:
+        data = request.get_json(silent=True)
+        
+        if not isinstance(data, dict) or 'resume_data' not in data:
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'Missing resume_data in request body',
+                'error': 'MISSING_RESUME_DATA',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        resume_data = data.get('resume_data')
+        job_description = data.get('job_description') or ''
+        callback_url = data.get('callback_url')
+        
+        if not isinstance(resume_data, dict):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'resume_data must be a JSON object',
+                'error': 'INVALID_RESUME_FORMAT',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if not isinstance(job_description, str):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'job_description must be a string',
+                'error': 'INVALID_JOB_DESCRIPTION',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        if callback_url is not None and (not isinstance(callback_url, str) or not ats_jobs.check_callback_url(callback_url)):
+            return jsonify({
+                'success': False,
+                'data': None,
+                'message': 'callback_url must be an http(s) URL to an allowed public host',
+                'error': 'INVALID_CALLBACK_URL',
+                'timestamp': str(__import__('datetime').datetime.now())
+            }), 400
+        
+        job = ats_jobs.submit({'resume_data': resume_data, 'job_description': job_description}, callback_url)
+        job['status_url'] = f"/api/analyze-ats/jobs/{job['job_id']}"
+        print(f"[ROUTE] POST /api/analyze-ats/jobs - queued job {job['job_id']}")
+        
+        response = jsonify({
+            'success': True,
+            'data': job,
+            'message': 'ATS analysis queued',
+            'error': None,
+            'timestamp': str(__import__('datetime').datetime.now())
+        })
+        response.headers['Location'] = job['status_url']
+        return response, 202
+    
+    except QueueFull as e:
+        return _busy_response(e)
+    
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Error queueing ATS analysis',
+            'error': str(e),
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 500
+
+
+@app.route('/api/analyze-ats/jobs/<job_id>', methods=['GET'])
+def get_ats_job(job_id):
+    """
+    Status of an asynchronous ATS analysis, with its result once it has succeeded
+    
+    Finished jobs are kept for ATS_JOB_TTL seconds.
+    """
+    job = ats_jobs.get(job_id)
+    if job is None:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Job not found or expired',
+            'error': 'JOB_NOT_FOUND',
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 404
+    
+    return jsonify({
+        'success': True,
+        'data': job,
+        'message': f"ATS job {job['status']}",
+        'error': None,
+        'timestamp': str(__import__('datetime').datetime.now())
+    }), 200
+
+
+def _busy_response(error):
+    """
+    503 response telling the client when to retry
+    """
+    response = jsonify({
+        'success': False,
+        'data': None,
+        'message': 'ATS analysis is at capacity, please retry later',
+        'error': 'SERVER_BUSY',
+        'timestamp': str(__import__('datetime').datetime.now())
+    })
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
+
+def _ndjson_resumes(lines):
+    """
+    Decode streamed resume lines; unreadable lines become None and are skipped by the ranker
+    """
+    for line in lines:
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+@app.errorhandler(ComponentDisabled)
+def component_disabled(error):
+    """Routes that need a disabled component answer 503"""
+    if request.path.startswith('/api/'):
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': str(error),
+            'error': 'COMPONENT_DISABLED',
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 503
+    return render_template('error.html', error="Career recommendations are not available on this server"), 503
+
+
+@app.route('/ready', methods=['GET'])
+def ready():
+    """
+    Readiness probe: which components are loaded
+    
+    The ATS routes are ready once the process has started. The recommender
+    may still be loading (or be disabled); pass ?require=recommender to get
+    503 until it is loaded, e.g. for a load balancer that routes
+    recommendation traffic.
+    """
+    components = {
+        'ats': {'state': 'loaded', 'mode': 'eager', 'load_seconds': None, 'error': None},
+        'recommender': recommendation_models.status()
+    }
+    required = [name.strip() for name in request.args.get('require', '').split(',') if name.strip()]
+    unknown = [name for name in required if name not in components]
+    if unknown:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': f"Unknown component(s): {', '.join(unknown)}",
+            'error': 'UNKNOWN_COMPONENT',
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 400
+    
+    is_ready = all(components[name]['state'] == 'loaded' for name in required)
+    return jsonify({
+        'success': is_ready,
+        'data': {'ready': is_ready, 'components': components},
+        'message': 'Ready' if is_ready else 'Required components are not loaded',
+        'error': None if is_ready else 'NOT_READY',
+        'timestamp': str(__import__('datetime').datetime.now())
+    }), 200 if is_ready else 503
+
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Latency histograms and request counters in the Prometheus text format
+    """
+    if not REGISTRY.enabled:
+        return Response("Metrics are disabled (METRICS_ENABLED=0)\n", status=404, mimetype='text/plain')
+    return Response(REGISTRY.expose(), content_type=CONTENT_TYPE)
+
+
+@app.route('/api/analyze-ats/cache-stats', methods=['GET'])
+def ats_cache_stats():
+    """
+    Get hit/miss/eviction counters of the ATS result cache
+    """
+    return jsonify({
+        'success': True,
+        'data': ats_result_cache.stats(),
+        'message': 'ATS cache statistics retrieved successfully',
+        'error': None,
+        'timestamp': str(__import__('datetime').datetime.now())
+    }), 200
+
+
 @app.route('/api/ats-score-info', methods=['GET'])
 def ats_score_info():
     """
     Get information about ATS scoring system
+    
+    The payload is built once per taxonomy version; its timestamp is the
+    time it was built.
     """
+    taxonomy = ATSAnalyzer.TAXONOMY.current
+    page = page_cache.get_or_render(('ats_score_info',), taxonomy.version, lambda: build_ats_score_info(taxonomy))
+    return page_cache.respond(page)
+
+
+def build_ats_score_info(taxonomy):
+    """Response for /api/ats-score-info"""
+    important_keywords = {
+        category: [taxonomy.label(skill) for skill in skills]
+        for category, skills in taxonomy.core.items()
+    }
+    
     return jsonify({
         'success': True,
         'data': {
@@ -292,16 +943,89 @@ def ats_score_info():
                     'description': 'Proper resume structure with required sections and details'
                 }
             },
-            'important_keywords': {
-                'programming_languages': ['Python', 'JavaScript', 'Java', 'C++', 'C#', 'PHP', 'Ruby'],
-                'frameworks': ['React', 'Angular', 'Django', 'Flask', 'Spring'],
-                'databases': ['MySQL', 'PostgreSQL', 'MongoDB'],
-                'cloud_platforms': ['AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes']
+            'important_keywords': important_keywords,
+            'taxonomy': {
+                'version': taxonomy.version,
+                'skills': taxonomy.skill_count,
+                'synonyms': taxonomy.synonym_count
             }
         },
         'message': 'ATS scoring information retrieved successfully',
         'error': None,
         'timestamp': str(__import__('datetime').datetime.now())
+    })
+
+
+def is_admin_request() -> bool:
+    """
+    Whether the current request may use admin endpoints
+
+    The request must send ATS_ADMIN_TOKEN as `Authorization: Bearer <token>`.
+    Without a token configured every request is refused, unless
+    ATS_ADMIN_ALLOW_LOCAL=1 admits requests from this machine. Behind a
+    reverse proxy every request comes from this machine, so that flag is
+    off by default and only meant for a server nothing else can reach.
+    """
+    token = os.environ.get('ATS_ADMIN_TOKEN')
+    if token:
+        supplied = request.headers.get('Authorization', '')
+        return hmac.compare_digest(supplied.encode('utf-8'), f'Bearer {token}'.encode('utf-8'))
+    if os.environ.get('ATS_ADMIN_ALLOW_LOCAL', '0') == '1':
+        return request.remote_addr in ('127.0.0.1', '::1')
+    return False
+
+
+@app.route('/api/ats-taxonomy/reload', methods=['POST'])
+def reload_ats_taxonomy():
+    """
+    Reload the skill taxonomy file without restarting the server
+    
+    Admin only (see is_admin_request). The job index and the ATS worker
+    processes are only rebuilt when the taxonomy version changed.
+    
+    The new taxonomy is compiled before it replaces the active one, so
+    in-flight analyses finish on the old taxonomy and a broken file leaves
+    the old taxonomy in place. Under gunicorn this reloads the worker that
+    handles the request; the other workers see the changed file on their
+    next request (refresh_ats_taxonomy).
+    """
+    if not is_admin_request():
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Reloading the skill taxonomy requires the ATS_ADMIN_TOKEN bearer token',
+            'error': 'FORBIDDEN',
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 403
+    
+    previous = ATSAnalyzer.TAXONOMY.version
+    try:
+        taxonomy = ATSAnalyzer.TAXONOMY.reload()
+    except (OSError, ValueError) as e:
+        return jsonify({
+            'success': False,
+            'data': None,
+            'message': 'Error reloading skill taxonomy',
+            'error': str(e),
+            'timestamp': str(__import__('datetime').datetime.now())
+        }), 400
+    
+    changed = taxonomy.version != previous
+    if changed:
+        print(f"[APP] Skill taxonomy reloaded: version {taxonomy.version}, {taxonomy.skill_count} skills")
+        apply_taxonomy_change()
+    return jsonify({
+        'success': True,
+        'data': {
+            'version': taxonomy.version,
+            'changed': changed,
+            'skills': taxonomy.skill_count,
+            'synonyms': taxonomy.synonym_count,
+            'core_skills': taxonomy.core_size
+        },
+        'message': 'Skill taxonomy reloaded successfully' if changed else 'Skill taxonomy unchanged',
+        'error': None,
+        'timestamp': str(__import__('datetime').datetime.now())
     }), 200
 
 
@@ -356,4 +1080,4 @@ def extract_job_keywords(job_description):
 
 
 if __name__ == '__main__':
-    app.run(debug=True, port=5001)
+    app.run(debug=True, port=int(os.environ.get('PORT', 5001)))
@@ -1,8 +1,4 @@
 from flask import Flask, request, render_template
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.ensemble import RandomForestClassifier
-import pandas as pd
-import csv
 import os
 import subprocess
 import time
@@ -10,38 +6,22 @@ import socket
 import webbrowser
 from threading import Thread
 
+from artifacts import load_or_build_bundle
+from career_index import CareerIndex
+from features import create_user_profile
+
 # ----------------------------------------------------
 # 1) FLASK APP
 # ----------------------------------------------------
 app = Flask(__name__)
 
-# Load recommendation CSV
-df = pd.read_csv('skills.csv')
-
-# Load aptitude questions CSV
-def load_aptitude_questions(file_path):
-    questions = []
-    with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        for row in reader:
-            options = [row[f'option{i}'] for i in range(1, 5)]
-            questions.append({
-                'id': row['id'],
-                'question': row['question'],
-                'options': options,
-                'answer': row['answer']
-            })
-    return questions
-
-aptitude_questions = load_aptitude_questions('aptitude_questions.csv')
-
-# TF-IDF + RandomForest
-tfidf_vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
-X = tfidf_vectorizer.fit_transform(df['Skills'])
-y = df['Recommended Career']
-
-rf_classifier = RandomForestClassifier(n_estimators=100, random_state=42)
-rf_classifier.fit(X, y)
+# Vectorizer, model and aptitude questions come from the artifact bundle,
+# which is only retrained when the CSV files change
+bundle = load_or_build_bundle()
+aptitude_questions = bundle['questions']
+tfidf_vectorizer = bundle['vectorizer']
+career_model = bundle['model']
+career_index = CareerIndex.from_table(bundle['careers'])
 
 app.static_folder = 'static'
 
@@ -54,25 +34,23 @@ def index():
 @app.route('/recommend', methods=['POST'])
 def recommend_career():
     user_input = request.form
-    user_profile_text = create_user_profile(user_input)
+    user_profile_text = create_user_profile(user_input, bundle['field_weights'])
     user_profile_vector = tfidf_vectorizer.transform([user_profile_text])
-    predicted_probs = rf_classifier.predict_proba(user_profile_vector)
-    top_careers = [rf_classifier.classes_[i] for i in predicted_probs.argsort()[0][-3:]][::-1]
+    predicted_probs = career_model.predict_proba(user_profile_vector)
+    top_careers = [career_model.classes_[i] for i in predicted_probs.argsort()[0][-3:]][::-1]
     return render_template('results.html', recommendations=top_careers)
 
-def create_user_profile(user_input):
-    return f"Class/Grade: {user_input['Class/Grade']} Skills: {user_input['Skills']} Interests: {user_input['Interests']} Hobbies: {user_input['Hobbies']} Passion: {user_input['Passion']} Favourite Subject: {user_input['Favourite Subject']}"
-
 @app.route('/career/<career_name>')
 def career_details(career_name):
-    item = df[df['Recommended Career'] == career_name].iloc[0]
-    topics = item['Topics to Be Covered'].split(', ')
+    item = career_index.get(career_name)
+    if item is None:
+        return "Career not found", 404
     return render_template('career_template.html',
                            career=career_name,
-                           salary=item['Salary'],
-                           job_description=item['Job Description'],
-                           job_security=item['Job Security'],
-                           topics_covered=topics)
+                           salary=item.salary,
+                           job_description=item.job_description,
+                           job_security=item.job_security,
+                           topics_covered=list(item.topics))
 
 @app.route('/aptitude_test', methods=['GET', 'POST'])
 def aptitude_test():
@@ -0,0 +1,458 @@
+"""
+Recommender Artifacts Module
+Builds and loads the versioned bundle the Flask app starts from
+
+The bundle holds everything the recommendation routes need: the fitted
+TF-IDF vectorizer, the trained classifier, a career lookup table and the
+aptitude question bank, plus a key identifying what it was built from:
+the CSV files, the scikit-learn version, the engine's hyperparameters, the
+vectorizer settings and the profile field weights.
+
+Build it offline with:
+    python artifacts.py build
+
+The app loads the bundle memory-mapped at startup and only retrains when
+the key no longer matches. Bundles are written to a temporary file and
+renamed into place, and a lock file makes sure that when several workers
+start on a stale bundle, one trains while the others wait and load its
+result. Each recommender engine (see engines.py) has its own bundle file.
+"""
+
+import argparse
+import csv
+import datetime
+import hashlib
+import importlib
+import importlib.abc
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+import joblib
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent builds are not serialized
+    fcntl = None
+
+
+class _BlockedImport(importlib.abc.MetaPathFinder):
+    """Import hook that makes a package look uninstalled"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname == self.name or fullname.startswith(self.name + '.'):
+            raise ModuleNotFoundError(f"No module named '{fullname}'", name=fullname)
+        return None
+
+
+@contextmanager
+def without_package(name: str):
+    """
+    Hide an installed package from imports made inside the block
+
+    The hook is removed when the block exits, also on errors.
+
+    Args:
+        name (str): Top-level package name
+    """
+    blocker = _BlockedImport(name)
+    sys.meta_path.insert(0, blocker)
+    try:
+        yield
+    finally:
+        sys.meta_path.remove(blocker)
+
+
+def import_without(module: str, hidden: str) -> bool:
+    """
+    Import a module with a package hidden, or normally if the module needs it
+
+    Only the import of `module` itself runs with the package hidden. If it
+    fails, whatever it left half imported is dropped and it is imported
+    again with the package available, so a library release that starts to
+    depend on the package costs memory instead of breaking the import.
+
+    Args:
+        module (str): Module to import, e.g. 'sklearn.feature_extraction.text'
+        hidden (str): Top-level package to keep out, e.g. 'pandas'
+
+    Returns:
+        bool: True if the module was imported without the package
+    """
+    if hidden in sys.modules:
+        return False
+    try:
+        with without_package(hidden):
+            importlib.import_module(module)
+        return True
+    except ImportError as e:
+        top = module.split('.')[0]
+        for name in [name for name in sys.modules if name == top or name.startswith(top + '.')]:
+            del sys.modules[name]
+        print(f"[ARTIFACTS] {module} cannot be imported without {hidden} ({e}); importing both")
+        importlib.import_module(module)
+        return False
+
+
+# Recent scikit-learn releases import pandas on `import sklearn` whenever it
+# is installed, for DataFrame input the service never passes (1.3, the
+# pinned release, does not). Importing the modules needed to load a bundle
+# with pandas hidden keeps pandas (about 50 MB and a fifth of startup) out
+# of the serving process; build_bundle() imports pandas itself when it trains.
+import_without('sklearn.feature_extraction.text', 'pandas')
+
+from engines import DEFAULT_ENGINE, ENGINES, configured_engine, make_engine
+from features import FIELD_WEIGHTS, training_texts
+from metrics import STAGE_SECONDS
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SKILLS_CSV = os.path.join(BASE_DIR, 'skills.csv')
+QUESTIONS_CSV = os.path.join(BASE_DIR, 'aptitude_questions.csv')
+BUNDLE_DIR = os.path.join(BASE_DIR, 'artifacts')
+
+# Bump when the bundle layout changes so old bundles are rebuilt
+BUNDLE_FORMAT_VERSION = 4
+
+# TF-IDF settings the recommender is trained with
+VECTORIZER_PARAMS = {'max_features': 1000, 'stop_words': 'english'}
+
+
+def default_bundle_path(engine: str = DEFAULT_ENGINE) -> str:
+    """
+    Bundle file for an engine; RECOMMENDER_BUNDLE overrides it
+
+    Args:
+        engine (str): Recommender engine name
+
+    Returns:
+        str: Path of the bundle file
+    """
+    return os.environ.get('RECOMMENDER_BUNDLE') or os.path.join(BUNDLE_DIR, f'recommender-{engine}.joblib')
+
+
+def source_checksum(paths: List[str]) -> str:
+    """
+    SHA-256 over the contents of the source files
+
+    Args:
+        paths (List[str]): Source files, in a fixed order
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.basename(path).encode('utf-8'))
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def bundle_key(checksum: str, engine: str, field_weights: Dict[str, int] = FIELD_WEIGHTS) -> str:
+    """
+    Identity of the bundle that sources and settings produce
+
+    Args:
+        checksum (str): source_checksum() of the CSV files
+        engine (str): Recommender engine name
+        field_weights (Dict[str, int]): Repetitions per profile field
+
+    Returns:
+        str: SHA-256 over the checksum, scikit-learn version, engine
+            hyperparameters, vectorizer settings and field weights
+    """
+    import sklearn
+
+    model = make_engine(engine)
+    identity = {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'checksum': checksum,
+        'sklearn_version': sklearn.__version__,
+        'engine': engine,
+        'model_params': model.get_params() if hasattr(model, 'get_params') else {},
+        'vectorizer_params': VECTORIZER_PARAMS,
+        'field_weights': field_weights
+    }
+    encoded = json.dumps(identity, sort_keys=True, default=repr).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def load_aptitude_questions(file_path: str) -> List[Dict]:
+    """
+    Load aptitude test questions from a CSV file
+
+    Args:
+        file_path (str): Path to aptitude_questions.csv
+
+    Returns:
+        List[Dict]: Questions with id, question, options and answer
+    """
+    questions = []
+    with open(file_path, 'r', newline='', encoding='utf-8') as csvfile:
+        reader = csv.DictReader(csvfile)
+        for row in reader:
+            options = [row[f'option{i}'] for i in range(1, 5)]
+            question = {
+                'id': row['id'],
+                'question': row['question'],
+                'options': options,
+                'answer': row['answer']
+            }
+            questions.append(question)
+    return questions
+
+
+def build_career_table(df) -> Dict[str, Dict]:
+    """
+    Career lookup table from the first skills.csv row of each career
+
+    Args:
+        df (pandas.DataFrame): Contents of skills.csv
+
+    Returns:
+        Dict[str, Dict]: Career name to salary, job security, description and topics
+    """
+    careers = {}
+    for record in df.drop_duplicates('Recommended Career').to_dict('records'):
+        careers[record['Recommended Career']] = {
+            'salary': int(record['Salary']),
+            'job_security': str(record['Job Security']),
+            'job_description': str(record['Job Description']),
+            'topics': str(record['Topics to Be Covered'])
+        }
+    return careers
+
+
+def train_recommender(df, engine: str = DEFAULT_ENGINE, field_weights: Dict[str, int] = FIELD_WEIGHTS):
+    """
+    Fit the TF-IDF vectorizer and the engine's classifier
+
+    The model is trained on the same profile text create_user_profile
+    builds for queries, from every profile column of skills.csv.
+
+    Args:
+        df (pandas.DataFrame): Contents of skills.csv
+        engine (str): Recommender engine name
+        field_weights (Dict[str, int]): Repetitions per profile field
+
+    Returns:
+        Tuple[TfidfVectorizer, object]: Fitted vectorizer and model
+    """
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    # Tokenize the text data using TF-IDF vectorization
+    tfidf_vectorizer = TfidfVectorizer(**VECTORIZER_PARAMS)
+    X = tfidf_vectorizer.fit_transform(training_texts(df.to_dict('records'), field_weights))
+    y = df['Recommended Career']
+
+    model = make_engine(engine)
+    model.fit(X, y)
+    return tfidf_vectorizer, model
+
+
+def build_bundle(skills_csv: str = SKILLS_CSV, questions_csv: str = QUESTIONS_CSV,
+                 engine: str = DEFAULT_ENGINE) -> Dict:
+    """
+    Train the recommender and collect every artifact into one bundle
+
+    Args:
+        skills_csv (str): Path to skills.csv
+        questions_csv (str): Path to aptitude_questions.csv
+        engine (str): Recommender engine name
+
+    Returns:
+        Dict: The bundle
+    """
+    import pandas as pd
+    import sklearn
+
+    start = time.perf_counter()
+    checksum = source_checksum([skills_csv, questions_csv])
+    df = pd.read_csv(skills_csv)
+    with STAGE_SECONDS.time('bundle_train'):
+        tfidf_vectorizer, model = train_recommender(df, engine, FIELD_WEIGHTS)
+
+    return {
+        'format_version': BUNDLE_FORMAT_VERSION,
+        'key': bundle_key(checksum, engine, FIELD_WEIGHTS),
+        'checksum': checksum,
+        'built_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'build_seconds': round(time.perf_counter() - start, 3),
+        'sklearn_version': sklearn.__version__,
+        'engine': engine,
+        'field_weights': dict(FIELD_WEIGHTS),
+        'vectorizer': tfidf_vectorizer,
+        'model': model,
+        'careers': build_career_table(df),
+        'questions': load_aptitude_questions(questions_csv)
+    }
+
+
+def write_bundle(bundle: Dict, path: str) -> None:
+    """
+    Write a bundle uncompressed so its arrays can be memory-mapped
+
+    The bundle is written to a temporary file next to the destination and
+    renamed over it, so readers see the old bundle or the new one, never a
+    partial file.
+
+    Args:
+        bundle (Dict): Bundle from build_bundle()
+        path (str): Destination file
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, staging = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}-', dir=directory)
+    os.close(fd)
+    try:
+        joblib.dump(bundle, staging)
+        os.replace(staging, path)
+    except BaseException:
+        if os.path.exists(staging):
+            os.remove(staging)
+        raise
+
+
+@contextmanager
+def build_lock(path: str):
+    """
+    Exclusive lock on '<bundle>.lock' while a bundle is checked and rebuilt
+
+    Args:
+        path (str): Bundle file
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path + '.lock', 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Closing the file releases the lock
+        yield
+
+
+def load_bundle(path: str, mmap: bool = True) -> Optional[Dict]:
+    """
+    Load a bundle, memory-mapping its numpy arrays
+
+    Args:
+        path (str): Bundle file
+        mmap (bool): Memory-map arrays read-only instead of copying them
+
+    Returns:
+        Dict: The bundle, or None if it is missing, unreadable or of another format
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        bundle = joblib.load(path, mmap_mode='r' if mmap else None)
+    except Exception as e:
+        print(f"[ARTIFACTS] Could not read bundle {path}: {e}")
+        return None
+    if not isinstance(bundle, dict) or bundle.get('format_version') != BUNDLE_FORMAT_VERSION:
+        return None
+    return bundle
+
+
+def load_or_build_bundle(path: Optional[str] = None,
+                         skills_csv: str = SKILLS_CSV,
+                         questions_csv: str = QUESTIONS_CSV,
+                         engine: Optional[str] = None) -> Dict:
+    """
+    Load the bundle, rebuilding it only when its key no longer matches
+
+    When the bundle is stale, the build lock is taken and the bundle
+    checked again, so of several processes starting at once only the first
+    trains; the others wait and load what it wrote. Load and train times
+    are recorded as the bundle_load and bundle_train stages in /metrics.
+
+    Args:
+        path (str): Bundle file; defaults to the engine's bundle
+        skills_csv (str): Path to skills.csv
+        questions_csv (str): Path to aptitude_questions.csv
+        engine (str): Recommender engine; defaults to RECOMMENDER_ENGINE or random_forest
+
+    Returns:
+        Dict: A bundle matching the current CSV files, library version and settings
+    """
+    start = time.perf_counter()
+    engine = engine or configured_engine()
+    path = path or default_bundle_path(engine)
+    key = bundle_key(source_checksum([skills_csv, questions_csv]), engine, FIELD_WEIGHTS)
+
+    with STAGE_SECONDS.time('bundle_load'):
+        bundle = load_bundle(path)
+    if bundle is not None and bundle.get('key') == key:
+        print(f"[ARTIFACTS] Loaded {engine} bundle built {bundle['built_at']} in {time.perf_counter() - start:.2f}s")
+        return bundle
+
+    with build_lock(path):
+        # Another process may have rebuilt the bundle while we waited
+        bundle = load_bundle(path)
+        if bundle is not None and bundle.get('key') == key:
+            print(f"[ARTIFACTS] Loaded {engine} bundle built by another process "
+                  f"in {time.perf_counter() - start:.2f}s")
+            return bundle
+
+        reason = 'missing' if bundle is None else 'stale'
+        print(f"[ARTIFACTS] Bundle {reason}, training new {engine} model (this may take a moment)...")
+        bundle = build_bundle(skills_csv, questions_csv, engine)
+        write_bundle(bundle, path)
+    print(f"[ARTIFACTS] Bundle built in {bundle['build_seconds']:.2f}s and saved "
+          f"in {time.perf_counter() - start:.2f}s total")
+    return load_bundle(path) or bundle
+
+
+def main(argv: List[str] = None) -> int:
+    """Command line entry point"""
+    parser = argparse.ArgumentParser(description='Build or inspect the recommender artifact bundle')
+    subcommands = parser.add_subparsers(dest='command', required=True)
+
+    build = subcommands.add_parser('build', help='train the model and write the bundle')
+    build.add_argument('--engine', default=configured_engine(), choices=sorted(ENGINES), help='recommender engine')
+    build.add_argument('--output', help='bundle file to write (default: artifacts/recommender-<engine>.joblib)')
+    build.add_argument('--skills', default=SKILLS_CSV, help='path to skills.csv')
+    build.add_argument('--questions', default=QUESTIONS_CSV, help='path to aptitude_questions.csv')
+
+    info = subcommands.add_parser('info', help='show bundle metadata and whether it is current')
+    info.add_argument('--engine', default=configured_engine(), choices=sorted(ENGINES), help='recommender engine')
+    info.add_argument('--bundle', help='bundle file to inspect (default: the engine\'s bundle)')
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        output = args.output or default_bundle_path(args.engine)
+        with build_lock(output):
+            bundle = build_bundle(args.skills, args.questions, args.engine)
+            write_bundle(bundle, output)
+        size_mb = os.path.getsize(output) / (1024 * 1024)
+        print(f"Wrote {output} ({size_mb:.1f} MB) in {time.perf_counter() - start:.2f}s")
+        print(f"Checksum {bundle['checksum']}")
+        return 0
+
+    path = args.bundle or default_bundle_path(args.engine)
+    bundle = load_bundle(path)
+    if bundle is None:
+        print(f"No usable bundle at {path}")
+        return 1
+    current = bundle['key'] == bundle_key(source_checksum([SKILLS_CSV, QUESTIONS_CSV]), bundle['engine'])
+    print(f"Bundle:     {path}")
+    print(f"Engine:     {bundle['engine']}")
+    print(f"Built:      {bundle['built_at']} in {bundle['build_seconds']}s (scikit-learn {bundle['sklearn_version']})")
+    print(f"Careers:    {len(bundle['careers'])}")
+    print(f"Questions:  {len(bundle['questions'])}")
+    print(f"Checksum:   {bundle['checksum']}")
+    print(f"Key:        {bundle['key']} ({'current' if current else 'stale'})")
+    return 0 if current else 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,16 +3,112 @@ ATS Resume Analyzer Module
 Analyzes resumes for Applicant Tracking System compatibility
 """
 
+import heapq
 import re
 import string
-from typing import Dict, List, Tuple
+import threading
+from itertools import islice
+from typing import Dict, Iterable, List, NamedTuple, Tuple, Union
 from collections import Counter
 import json
 
+import numpy as np
+
+from job_matcher import IDFStore, JobProfile, extract_keywords, resume_tokens
+from metrics import STAGE_SECONDS
+from ranking import top_k_indices
+from skill_taxonomy import SkillTaxonomy, TaxonomyStore
+
+
+class ATSResult(NamedTuple):
+    """
+    Immutable outcome of one resume analysis
+    """
+    ats_score: int
+    formatting_score: int
+    keyword_score: int
+    structure_score: int
+    suggestions: Tuple[str, ...]
+    missing_keywords: Tuple[str, ...]
+    strengths: Tuple[str, ...]
+    timestamp: str
+
+    def to_dict(self) -> Dict:
+        """
+        Convert to the JSON-ready dict returned by analyze_resume
+        
+        Returns:
+            Dict: Comprehensive ATS analysis results
+        """
+        return {
+            'ats_score': self.ats_score,
+            'formatting_score': self.formatting_score,
+            'keyword_score': self.keyword_score,
+            'structure_score': self.structure_score,
+            'suggestions': list(self.suggestions),
+            'missing_keywords': list(self.missing_keywords),
+            'strengths': list(self.strengths),
+            'timestamp': self.timestamp
+        }
+
+    def score_breakdown(self) -> Dict:
+        """
+        Get detailed score breakdown
+        
+        Returns:
+            Dict: Score breakdown with percentages
+        """
+        return {
+            'overall': self.ats_score,
+            'formatting': {
+                'score': self.formatting_score,
+                'max': 25,
+                'percentage': (self.formatting_score / 25 * 100) if self.formatting_score > 0 else 0
+            },
+            'keywords': {
+                'score': self.keyword_score,
+                'max': 40,
+                'percentage': (self.keyword_score / 40 * 100) if self.keyword_score > 0 else 0
+            },
+            'structure': {
+                'score': self.structure_score,
+                'max': 35,
+                'percentage': (self.structure_score / 35 * 100) if self.structure_score > 0 else 0
+            }
+        }
+
+
+class FormattingSignals(NamedTuple):
+    """
+    Formatting facts about a resume text, gathered by scan_formatting()
+    """
+    special_characters: int
+    spacing_runs: int
+    non_ascii: int
+    has_email: bool
+    has_phone: bool
+
+
+# Formatting patterns, compiled once
+EXTRA_SPACES_PATTERN = re.compile(r'  {2,}')
+EMAIL_PATTERN = re.compile(r'[\w\.-]+@[\w\.-]+\.\w+')
+PHONE_PATTERN = re.compile(r'[\d\-\+\(\) ]{10,}')
+
+# More runs of extra spaces than this cost formatting points
+EXCESSIVE_SPACING_RUNS = 10
+
+
+# Result reported by get_score_breakdown() before any analysis has run
+_EMPTY_RESULT = ATSResult(0, 0, 0, 0, (), (), (), '')
+
+
 class ATSAnalyzer:
     """
     Analyzes resumes for ATS (Applicant Tracking System) compatibility
     Provides scoring and suggestions for improvement
+    
+    An analyzer holds only read-only tables, so one instance can serve
+    concurrent requests; every analysis returns a new ATSResult.
     """
 
     # Common ATS-unfriendly words and characters
@@ -28,7 +124,8 @@ class ATSAnalyzer:
         'contact', 'personal info', 'header', 'about'
     }
 
-    # Important technical keywords to look for
+    # Important technical keywords to look for; used as the taxonomy when
+    # no taxonomy file is available (see skill_taxonomy.py)
     IMPORTANT_KEYWORDS = {
         'programming_languages': ['python', 'java', 'javascript', 'c++', 'c#', 'php', 'ruby', 'swift', 'kotlin', 'go', 'rust'],
         'frameworks': ['react', 'angular', 'vue', 'django', 'flask', 'spring', 'express', 'fastapi', 'laravel', 'rails'],
@@ -37,6 +134,12 @@ class ATSAnalyzer:
         'soft_skills': ['leadership', 'communication', 'teamwork', 'problem-solving', 'project management', 'analytical', 'creative']
     }
 
+    # Shared, hot-reloadable skill taxonomy compiled into a keyword matcher
+    TAXONOMY = TaxonomyStore(fallback=IMPORTANT_KEYWORDS)
+
+    # Job keyword weights learned from a corpus of job postings
+    JOB_WEIGHTS = IDFStore()
+
     # ATS-unfriendly elements
     ATS_UNFRIENDLY_ELEMENTS = {
         'images': ['image', 'picture', 'photo', 'graphic', 'logo'],
@@ -45,58 +148,105 @@ class ATSAnalyzer:
         'headers_footers': ['header', 'footer', 'page number', 'page break']
     }
 
-    def __init__(self):
-        """Initialize the ATS Analyzer"""
-        self.formatting_score = 0
-        self.keyword_score = 0
-        self.structure_score = 0
-        self.ats_score = 0
-        self.suggestions = []
-        self.missing_keywords = []
-        self.strengths = []
+    def __init__(self, taxonomy: TaxonomyStore = None, job_weights: IDFStore = None):
+        """
+        Initialize the ATS Analyzer
+        
+        Args:
+            taxonomy (TaxonomyStore): Skill taxonomy to score against;
+                defaults to the shared ATSAnalyzer.TAXONOMY
+            job_weights (IDFStore): Job keyword weights; defaults to the
+                shared ATSAnalyzer.JOB_WEIGHTS
+        """
+        self.taxonomy = taxonomy or self.TAXONOMY
+        self.job_weights = job_weights or self.JOB_WEIGHTS
+        # Last result per thread, only for get_score_breakdown() without arguments
+        self._last_result = threading.local()
 
-    def analyze_resume(self, resume_data: Dict) -> Dict:
+    def analyze(self, resume_data: Dict) -> ATSResult:
         """
-        Main method to analyze a complete resume
+        Analyze a complete resume without touching analyzer state
         
         Args:
             resume_data (Dict): Complete resume object with all sections
             
         Returns:
-            Dict: Comprehensive ATS analysis results
+            ATSResult: Immutable analysis results
         """
-        # Reset scores
-        self.suggestions = []
-        self.missing_keywords = []
-        self.strengths = []
-
         # Get plain text version of resume
-        resume_text = self._get_resume_text(resume_data)
+        with STAGE_SECONDS.time('ats_text_build'):
+            resume_text = self._get_resume_text(resume_data)
+        
+        # Take one snapshot so a concurrent reload cannot change the
+        # taxonomy halfway through the analysis
+        taxonomy = self.taxonomy.current
+        
+        with STAGE_SECONDS.time('ats_formatting'):
+            signals = self.scan_formatting(resume_text)
+        with STAGE_SECONDS.time('ats_keywords'):
+            found = taxonomy.matcher.find(resume_text)
         
+        return self.build_result(resume_data, signals, found, len(resume_text), taxonomy)
+
+    def build_result(self, resume_data: Dict, signals: FormattingSignals, found: set,
+                     text_length: int, taxonomy: SkillTaxonomy) -> ATSResult:
+        """
+        Score a resume from facts already gathered about its text
+        
+        analyze() gathers them from the full resume text; the incremental
+        analyzer (ats_incremental.py) merges them from per-section results.
+        
+        Args:
+            resume_data (Dict): Complete resume object with all sections
+            signals (FormattingSignals): Formatting facts about the resume text
+            found (set): (category, keyword) pairs present in the resume text
+            text_length (int): Length of the resume text
+            taxonomy (SkillTaxonomy): Taxonomy snapshot `found` was matched against
+            
+        Returns:
+            ATSResult: Immutable analysis results
+        """
         # Run all analyses
-        self.formatting_score = self.analyze_formatting(resume_text)
-        self.keyword_score = self.analyze_keywords(resume_text, resume_data)
-        self.structure_score = self.analyze_structure(resume_data)
+        formatting_score, suggestions = self._formatting_from_signals(signals)
+        keyword_score, missing_keywords = self._keywords_from_found(found, taxonomy, resume_data)
+        with STAGE_SECONDS.time('ats_structure'):
+            structure_score, structure_suggestions = self._score_structure(resume_data)
+        suggestions.extend(structure_suggestions)
         
         # Calculate overall ATS score
-        self.ats_score = self._calculate_ats_score()
+        ats_score = self._calculate_ats_score(formatting_score, keyword_score, structure_score)
         
-        # Generate suggestions
-        self._generate_suggestions(resume_data, resume_text)
-        
-        # Identify strengths
-        self._identify_strengths(resume_data)
+        with STAGE_SECONDS.time('ats_suggestions'):
+            # Generate suggestions
+            suggestions = self._content_suggestions(resume_data, text_length, suggestions)
+            
+            # Identify strengths
+            strengths = self._identify_strengths(resume_data)
 
-        return {
-            'ats_score': self.ats_score,
-            'formatting_score': self.formatting_score,
-            'keyword_score': self.keyword_score,
-            'structure_score': self.structure_score,
-            'suggestions': self.suggestions,
-            'missing_keywords': self.missing_keywords,
-            'strengths': self.strengths,
-            'timestamp': str(__import__('datetime').datetime.now())
-        }
+        return ATSResult(
+            ats_score=ats_score,
+            formatting_score=formatting_score,
+            keyword_score=keyword_score,
+            structure_score=structure_score,
+            suggestions=tuple(suggestions),
+            missing_keywords=tuple(missing_keywords),
+            strengths=tuple(strengths),
+            timestamp=str(__import__('datetime').datetime.now())
+        )
+
+    def analyze_resume(self, resume_data: Dict) -> Dict:
+        """
+        Main method to analyze a complete resume
+        
+        Args:
+            resume_data (Dict): Complete resume object with all sections
+            
+        Returns:
+            Dict: Comprehensive ATS analysis results
+        """
+        result = self.analyze(resume_data)
+        self._last_result.value = result
+        return result.to_dict()
 
     def analyze_formatting(self, resume_text: str) -> int:
         """
@@ -108,40 +258,96 @@ class ATSAnalyzer:
         Returns:
             int: Formatting score (0-25 points)
         """
+        return self._score_formatting(resume_text)[0]
+
+    def _score_formatting(self, resume_text: str) -> Tuple[int, List[str]]:
+        """
+        Score formatting and collect formatting suggestions
+        
+        Args:
+            resume_text (str): Plain text version of resume
+            
+        Returns:
+            Tuple[int, List[str]]: Formatting score (0-25 points) and suggestions
+        """
+        return self._formatting_from_signals(self.scan_formatting(resume_text))
+
+    def _formatting_from_signals(self, signals: FormattingSignals) -> Tuple[int, List[str]]:
+        """
+        Score formatting from the signals gathered by scan_formatting()
+        
+        Args:
+            signals (FormattingSignals): Formatting facts about the resume text
+            
+        Returns:
+            Tuple[int, List[str]]: Formatting score (0-25 points) and suggestions
+        """
         score = 25  # Start with full points
+        suggestions = []
         
         # Check for special characters
-        special_char_count = sum(1 for char in resume_text if char in self.UNFRIENDLY_CHARACTERS)
-        if special_char_count > 0:
-            score -= min(5, special_char_count)
-            self.suggestions.append(f"Remove {special_char_count} special characters - ATS systems may not parse them correctly")
+        if signals.special_characters > 0:
+            score -= min(5, signals.special_characters)
+            suggestions.append(f"Remove {signals.special_characters} special characters - ATS systems may not parse them correctly")
 
         # Check for multiple spaces (indicates formatting)
-        multiple_spaces = len(re.findall(r'  {2,}', resume_text))
-        if multiple_spaces > 10:
+        if signals.spacing_runs > EXCESSIVE_SPACING_RUNS:
             score -= 5
-            self.suggestions.append("Reduce excessive spacing - Use single spaces between words")
+            suggestions.append("Reduce excessive spacing - Use single spaces between words")
 
         # Check for unusual characters that might indicate images/graphics
-        unusual_chars = re.findall(r'[^\x00-\x7F]', resume_text)
-        if len(unusual_chars) > 5:
+        if signals.non_ascii > 5:
             score -= 5
-            self.suggestions.append("Remove non-ASCII characters - ATS systems work best with standard characters")
+            suggestions.append("Remove non-ASCII characters - ATS systems work best with standard characters")
 
         # Check for email format validity
-        email_matches = re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', resume_text)
-        if not email_matches:
+        if not signals.has_email:
             score -= 3
-            self.suggestions.append("Add a valid email address in standard format")
+            suggestions.append("Add a valid email address in standard format")
 
         # Check for phone number validity
-        phone_matches = re.findall(r'[\d\-\+\(\) ]{10,}', resume_text)
-        if not phone_matches:
+        if not signals.has_phone:
             score -= 2
-            self.suggestions.append("Add a phone number in a standard format")
+            suggestions.append("Add a phone number in a standard format")
 
         # Ensure score doesn't go below 0
-        return max(0, score)
+        return max(0, score), suggestions
+
+    def scan_formatting(self, resume_text: str) -> FormattingSignals:
+        """
+        Collect every formatting signal without building match lists
+        
+        ASCII text (the common case) skips the character checks entirely,
+        since every unfriendly character is non-ASCII. Otherwise characters
+        are counted with str methods that run in C. Spacing runs are counted
+        only up to the penalty threshold, and the email and phone checks
+        stop at the first match.
+        
+        Args:
+            resume_text (str): Plain text version of resume
+            
+        Returns:
+            FormattingSignals: Counts and flags used by the formatting score
+        """
+        if resume_text.isascii():
+            special_characters = non_ascii = 0
+        else:
+            # Encoding to ASCII drops exactly one character per non-ASCII code point
+            non_ascii = len(resume_text) - len(resume_text.encode('ascii', 'ignore'))
+            special_characters = sum(map(resume_text.count, self.UNFRIENDLY_CHARACTERS))
+        
+        spacing_runs = 0
+        if '   ' in resume_text:
+            runs = EXTRA_SPACES_PATTERN.finditer(resume_text)
+            spacing_runs = sum(1 for _ in islice(runs, EXCESSIVE_SPACING_RUNS + 1))
+        
+        return FormattingSignals(
+            special_characters=special_characters,
+            spacing_runs=spacing_runs,
+            non_ascii=non_ascii,
+            has_email='@' in resume_text and EMAIL_PATTERN.search(resume_text) is not None,
+            has_phone=PHONE_PATTERN.search(resume_text) is not None
+        )
 
     def analyze_keywords(self, resume_text: str, resume_data: Dict) -> int:
         """
@@ -154,46 +360,57 @@ class ATSAnalyzer:
         Returns:
             int: Keyword score (0-40 points)
         """
-        score = 0
-        text_lower = resume_text.lower()
-        
-        # Count keywords found
-        keywords_found = 0
-        keywords_total = sum(len(v) for v in self.IMPORTANT_KEYWORDS.values())
-        
-        # Check for programming languages
-        for lang in self.IMPORTANT_KEYWORDS['programming_languages']:
-            if lang.lower() in text_lower:
-                keywords_found += 1
-            else:
-                self.missing_keywords.append(lang.capitalize())
+        return self._score_keywords(resume_text, resume_data)[0]
+
+    def _score_keywords(self, resume_text: str, resume_data: Dict) -> Tuple[int, List[str]]:
+        """
+        Score keywords and collect the most important missing ones
         
-        # Check for frameworks
-        for framework in self.IMPORTANT_KEYWORDS['frameworks']:
-            if framework.lower() in text_lower:
-                keywords_found += 1
-            else:
-                self.missing_keywords.append(framework.capitalize())
+        Args:
+            resume_text (str): Plain text version of resume
+            resume_data (Dict): Complete resume object
+            
+        Returns:
+            Tuple[int, List[str]]: Keyword score (0-40 points) and up to 5 missing keywords
+        """
+        # Take one snapshot so a concurrent reload cannot change the
+        # taxonomy halfway through the analysis
+        taxonomy = self.taxonomy.current
         
-        # Check for databases
-        for db in self.IMPORTANT_KEYWORDS['databases']:
-            if db.lower() in text_lower:
-                keywords_found += 1
-            else:
-                self.missing_keywords.append(db.capitalize())
+        # Find every keyword category in one pass over the text
+        return self._keywords_from_found(taxonomy.matcher.find(resume_text), taxonomy, resume_data)
+
+    def _keywords_from_found(self, found: set, taxonomy: SkillTaxonomy, resume_data: Dict) -> Tuple[int, List[str]]:
+        """
+        Score keywords from the taxonomy keywords present in the resume
         
-        # Check for cloud/DevOps
-        for cloud in self.IMPORTANT_KEYWORDS['cloud']:
-            if cloud.lower() in text_lower:
-                keywords_found += 1
-            else:
-                self.missing_keywords.append(cloud.capitalize())
+        Args:
+            found (set): (category, keyword) pairs present in the resume text
+            taxonomy (SkillTaxonomy): Taxonomy snapshot `found` was matched against
+            resume_data (Dict): Complete resume object
+            
+        Returns:
+            Tuple[int, List[str]]: Keyword score (0-40 points) and up to 5 missing keywords
+        """
+        score = 0
+        missing_keywords = []
         
-        # Check for soft skills
+        # Count keywords found
+        keywords_found = 0
+        keywords_total = taxonomy.core_size
         soft_skills_found = 0
-        for skill in self.IMPORTANT_KEYWORDS['soft_skills']:
-            if skill.lower() in text_lower:
-                soft_skills_found += 1
+        
+        # Check technical categories (languages, frameworks, databases,
+        # cloud/DevOps) and soft skills
+        for category, keywords in taxonomy.core.items():
+            for keyword in keywords:
+                if (category, keyword) not in found:
+                    if category != 'soft_skills':
+                        missing_keywords.append(keyword.capitalize())
+                elif category == 'soft_skills':
+                    soft_skills_found += 1
+                else:
+                    keywords_found += 1
         
         # Calculate score
         keyword_percentage = (keywords_found / keywords_total * 100) if keywords_total > 0 else 0
@@ -204,10 +421,10 @@ class ATSAnalyzer:
         if 'skills' in resume_data and len(resume_data['skills']) > 0:
             score += min(5, len(resume_data['skills']) // 2)
         
-        # Limit missing keywords to top 5
-        self.missing_keywords = list(set(self.missing_keywords))[:5]
+        # Limit missing keywords to top 5, in taxonomy order
+        missing_keywords = list(dict.fromkeys(missing_keywords))[:5]
         
-        return min(40, score)
+        return min(40, score), missing_keywords
 
     def analyze_structure(self, resume_data: Dict) -> int:
         """
@@ -219,7 +436,20 @@ class ATSAnalyzer:
         Returns:
             int: Structure score (0-35 points)
         """
+        return self._score_structure(resume_data)[0]
+
+    def _score_structure(self, resume_data: Dict) -> Tuple[int, List[str]]:
+        """
+        Score structure and collect structure suggestions
+        
+        Args:
+            resume_data (Dict): Complete resume object
+            
+        Returns:
+            Tuple[int, List[str]]: Structure score (0-35 points) and suggestions
+        """
         score = 0
+        suggestions = []
         
         # Check for required sections
         required_sections = {
@@ -233,7 +463,7 @@ class ATSAnalyzer:
             if section in resume_data and resume_data[section]:
                 score += points
             else:
-                self.suggestions.append(f"Add {section.replace('personalInfo', 'Personal Information')} section")
+                suggestions.append(f"Add {section.replace('personalInfo', 'Personal Information')} section")
         
         # Check experience details
         if 'experience' in resume_data and resume_data['experience']:
@@ -248,7 +478,7 @@ class ATSAnalyzer:
                         missing_fields.append(field)
                 
                 if missing_fields:
-                    self.suggestions.append(f"Complete experience entry: add {', '.join(missing_fields)}")
+                    suggestions.append(f"Complete experience entry: add {', '.join(missing_fields)}")
         
         # Check education details
         if 'education' in resume_data and resume_data['education']:
@@ -262,7 +492,7 @@ class ATSAnalyzer:
                         missing_fields.append(field)
                 
                 if missing_fields:
-                    self.suggestions.append(f"Complete education entry: add {', '.join(missing_fields)}")
+                    suggestions.append(f"Complete education entry: add {', '.join(missing_fields)}")
         
         # Check for proper contact info
         if 'personalInfo' in resume_data:
@@ -270,18 +500,23 @@ class ATSAnalyzer:
             contact_fields = ['firstName', 'lastName', 'email', 'phone', 'location']
             missing_contact = [f for f in contact_fields if f not in pi or not pi[f]]
             if missing_contact:
-                self.suggestions.append(f"Add missing contact info: {', '.join(missing_contact)}")
+                suggestions.append(f"Add missing contact info: {', '.join(missing_contact)}")
         
-        return min(35, score)
+        return min(35, score), suggestions
 
-    def _calculate_ats_score(self) -> int:
+    def _calculate_ats_score(self, formatting_score: int, keyword_score: int, structure_score: int) -> int:
         """
         Calculate overall ATS score from component scores
         
+        Args:
+            formatting_score (int): Formatting score
+            keyword_score (int): Keyword score
+            structure_score (int): Structure score
+            
         Returns:
             int: Overall ATS score (0-100)
         """
-        total = self.formatting_score + self.keyword_score + self.structure_score
+        total = formatting_score + keyword_score + structure_score
         return min(100, max(0, total))
 
     def _get_resume_text(self, resume_data: Dict) -> str:
@@ -294,152 +529,190 @@ class ATSAnalyzer:
         Returns:
             str: Plain text version of resume
         """
-        text_parts = []
+        return ' '.join(part for _, parts in self.resume_sections(resume_data) for part in parts)
+
+    def resume_sections(self, resume_data: Dict) -> List[Tuple[str, List[str]]]:
+        """
+        Split a resume into the text parts of each section, in text order
+        
+        Every experience, education, certification, project and language
+        entry is a section of its own, named after its list position
+        (e.g. 'experience.0'). Joining all parts with single spaces gives
+        _get_resume_text().
+        
+        Args:
+            resume_data (Dict): Resume object
+            
+        Returns:
+            List[Tuple[str, List[str]]]: (section name, text parts) pairs
+        """
+        sections = []
         
         # Personal Info
         if 'personalInfo' in resume_data:
             pi = resume_data['personalInfo']
-            text_parts.append(f"{pi.get('firstName', '')} {pi.get('lastName', '')}")
-            text_parts.append(pi.get('email', ''))
-            text_parts.append(pi.get('phone', ''))
-            text_parts.append(pi.get('location', ''))
+            sections.append(('personalInfo', [
+                f"{pi.get('firstName', '')} {pi.get('lastName', '')}",
+                pi.get('email', ''),
+                pi.get('phone', ''),
+                pi.get('location', '')
+            ]))
         
         # Professional Summary
         if 'professionalSummary' in resume_data:
-            text_parts.append(resume_data['professionalSummary'])
+            sections.append(('professionalSummary', [resume_data['professionalSummary']]))
         
         # Experience
         if 'experience' in resume_data:
-            for exp in resume_data['experience']:
+            for i, exp in enumerate(resume_data['experience']):
                 if isinstance(exp, dict):
-                    text_parts.append(f"{exp.get('jobTitle', '')} at {exp.get('companyName', '')}")
-                    text_parts.append(exp.get('description', ''))
+                    sections.append((f'experience.{i}', [
+                        f"{exp.get('jobTitle', '')} at {exp.get('companyName', '')}",
+                        exp.get('description', '')
+                    ]))
         
         # Education
         if 'education' in resume_data:
-            for edu in resume_data['education']:
+            for i, edu in enumerate(resume_data['education']):
                 if isinstance(edu, dict):
-                    text_parts.append(f"{edu.get('degree', '')} in {edu.get('fieldOfStudy', '')}")
-                    text_parts.append(edu.get('schoolName', ''))
+                    sections.append((f'education.{i}', [
+                        f"{edu.get('degree', '')} in {edu.get('fieldOfStudy', '')}",
+                        edu.get('schoolName', '')
+                    ]))
         
         # Skills
         if 'skills' in resume_data:
-            text_parts.append(' '.join(resume_data['skills']))
+            sections.append(('skills', [' '.join(resume_data['skills'])]))
         
         # Certifications
         if 'certifications' in resume_data:
-            for cert in resume_data['certifications']:
+            for i, cert in enumerate(resume_data['certifications']):
                 if isinstance(cert, dict):
-                    text_parts.append(cert.get('certificationName', ''))
+                    sections.append((f'certifications.{i}', [cert.get('certificationName', '')]))
         
         # Projects
         if 'projects' in resume_data:
-            for proj in resume_data['projects']:
+            for i, proj in enumerate(resume_data['projects']):
                 if isinstance(proj, dict):
-                    text_parts.append(proj.get('projectName', ''))
-                    text_parts.append(proj.get('description', ''))
+                    sections.append((f'projects.{i}', [proj.get('projectName', ''), proj.get('description', '')]))
         
         # Languages
         if 'languages' in resume_data:
-            for lang in resume_data['languages']:
+            for i, lang in enumerate(resume_data['languages']):
                 if isinstance(lang, dict):
-                    text_parts.append(lang.get('language', ''))
+                    sections.append((f'languages.{i}', [lang.get('language', '')]))
         
-        return ' '.join(text_parts)
+        return sections
 
-    def _generate_suggestions(self, resume_data: Dict, resume_text: str) -> None:
+    def _generate_suggestions(self, resume_data: Dict, resume_text: str, suggestions: List[str]) -> List[str]:
         """
         Generate specific improvement suggestions based on analysis
         
         Args:
             resume_data (Dict): Resume object
             resume_text (str): Plain text resume
+            suggestions (List[str]): Suggestions collected during analysis
+            
+        Returns:
+            List[str]: Up to 8 suggestions
         """
+        return self._content_suggestions(resume_data, len(resume_text), suggestions)
+
+    def _content_suggestions(self, resume_data: Dict, text_length: int, suggestions: List[str]) -> List[str]:
+        """
+        Add content suggestions to those collected during analysis
+        
+        Args:
+            resume_data (Dict): Resume object
+            text_length (int): Length of the plain text resume
+            suggestions (List[str]): Suggestions collected during analysis
+            
+        Returns:
+            List[str]: Up to 8 suggestions
+        """
+        suggestions = list(suggestions)
+        
         # Formatting suggestions (already added during analysis)
         
         # Structure suggestions (already added during analysis)
         
         # Content suggestions
         if 'professionalSummary' not in resume_data or not resume_data['professionalSummary']:
-            self.suggestions.append("Add a professional summary at the top of your resume")
+            suggestions.append("Add a professional summary at the top of your resume")
         
         if not resume_data.get('experience') or len(resume_data['experience']) == 0:
-            self.suggestions.append("Add your professional experience")
+            suggestions.append("Add your professional experience")
         
         if not resume_data.get('education') or len(resume_data['education']) == 0:
-            self.suggestions.append("Add your educational background")
+            suggestions.append("Add your educational background")
         
         # Skills suggestions
         if not resume_data.get('skills') or len(resume_data['skills']) < 5:
-            self.suggestions.append("Add more skills (recommended: 5-15 relevant skills)")
+            suggestions.append("Add more skills (recommended: 5-15 relevant skills)")
         
         # Length check
-        if len(resume_text) < 200:
-            self.suggestions.append("Your resume seems too short - add more details about your experience and achievements")
-        elif len(resume_text) > 3000:
-            self.suggestions.append("Your resume is quite long - consider removing less relevant information")
+        if text_length < 200:
+            suggestions.append("Your resume seems too short - add more details about your experience and achievements")
+        elif text_length > 3000:
+            suggestions.append("Your resume is quite long - consider removing less relevant information")
         
         # Limit suggestions to top 8
-        self.suggestions = self.suggestions[:8]
+        return suggestions[:8]
 
-    def _identify_strengths(self, resume_data: Dict) -> None:
+    def _identify_strengths(self, resume_data: Dict) -> List[str]:
         """
         Identify strengths in the resume
         
         Args:
             resume_data (Dict): Resume object
+            
+        Returns:
+            List[str]: Strengths found
         """
+        strengths = []
+        
         if 'personalInfo' in resume_data:
             pi = resume_data['personalInfo']
             if all([pi.get('firstName'), pi.get('lastName'), pi.get('email'), pi.get('phone')]):
-                self.strengths.append("Complete contact information provided")
+                strengths.append("Complete contact information provided")
         
         if resume_data.get('experience') and len(resume_data['experience']) >= 2:
-            self.strengths.append("Good work experience history")
+            strengths.append("Good work experience history")
         
         if resume_data.get('education') and len(resume_data['education']) > 0:
-            self.strengths.append("Educational background included")
+            strengths.append("Educational background included")
         
         if resume_data.get('skills') and len(resume_data['skills']) >= 5:
-            self.strengths.append("Good number of relevant skills listed")
+            strengths.append("Good number of relevant skills listed")
         
         if resume_data.get('certifications') and len(resume_data['certifications']) > 0:
-            self.strengths.append("Professional certifications included")
+            strengths.append("Professional certifications included")
         
         if resume_data.get('projects') and len(resume_data['projects']) > 0:
-            self.strengths.append("Project portfolio included - great for ATS and recruiters")
+            strengths.append("Project portfolio included - great for ATS and recruiters")
         
         if resume_data.get('languages') and len(resume_data['languages']) > 0:
-            self.strengths.append("Multiple languages listed")
+            strengths.append("Multiple languages listed")
         
         if resume_data.get('professionalSummary') and len(resume_data['professionalSummary']) > 50:
-            self.strengths.append("Strong professional summary")
+            strengths.append("Strong professional summary")
+        
+        return strengths
 
-    def get_score_breakdown(self) -> Dict:
+    def get_score_breakdown(self, result: ATSResult = None) -> Dict:
         """
         Get detailed score breakdown
         
+        Args:
+            result (ATSResult): Analysis to break down; defaults to the last
+                analyze_resume() call made by the current thread
+            
         Returns:
             Dict: Score breakdown with percentages
         """
-        return {
-            'overall': self.ats_score,
-            'formatting': {
-                'score': self.formatting_score,
-                'max': 25,
-                'percentage': (self.formatting_score / 25 * 100) if self.formatting_score > 0 else 0
-            },
-            'keywords': {
-                'score': self.keyword_score,
-                'max': 40,
-                'percentage': (self.keyword_score / 40 * 100) if self.keyword_score > 0 else 0
-            },
-            'structure': {
-                'score': self.structure_score,
-                'max': 35,
-                'percentage': (self.structure_score / 35 * 100) if self.structure_score > 0 else 0
-            }
-        }
+        if result is None:
+            result = getattr(self._last_result, 'value', _EMPTY_RESULT)
+        return result.score_breakdown()
 
     def analyze_job_match(self, resume_text: str, job_description: str) -> Dict:
         """
@@ -453,54 +726,137 @@ class ATSAnalyzer:
             Dict: Job matching analysis results
         """
         if not job_description or len(job_description.strip()) == 0:
-            return {
-                'match_score': 0,
-                'matched_keywords': [],
-                'missing_keywords': [],
-                'job_keywords': [],
-                'match_percentage': 0
-            }
+            return empty_job_match()
         
-        # Convert to lowercase for comparison
-        resume_lower = resume_text.lower()
-        job_desc_lower = job_description.lower()
-        
-        # Extract keywords from job description
-        job_keywords = self._extract_keywords(job_description)
-        
-        # Find which job keywords are in the resume
-        matched_keywords = []
-        for keyword in job_keywords:
-            if keyword.lower() in resume_lower:
-                matched_keywords.append(keyword)
-        
-        # Find missing keywords
-        missing_keywords = [kw for kw in job_keywords if kw not in matched_keywords]
-        
-        # Calculate match percentage
-        match_percentage = (len(matched_keywords) / len(job_keywords) * 100) if job_keywords else 0
-        
-        # Determine match score (0-100)
-        if match_percentage >= 80:
-            match_score = 100
-        elif match_percentage >= 60:
-            match_score = 80
-        elif match_percentage >= 40:
-            match_score = 60
-        elif match_percentage >= 20:
-            match_score = 40
-        else:
-            match_score = 20
+        with STAGE_SECONDS.time('job_match_parse'):
+            job = self.parse_job_description(job_description)
+        with STAGE_SECONDS.time('job_match_score'):
+            return self.match_job(resume_text, job)
+
+    def parse_job_description(self, job_description: str) -> JobProfile:
+        """
+        Extract and weight the keywords of a job description
+        
+        Parse a job description once and pass the result to match_job()
+        for every resume compared against it.
+        
+        Args:
+            job_description (str): Job description text
+            
+        Returns:
+            JobProfile: Weighted job keywords
+        """
+        return JobProfile(extract_keywords(job_description or ''), self.job_weights.current)
+
+    def match_job(self, resume_text: str, job: JobProfile) -> Dict:
+        """
+        Match a resume against a parsed job description
+        
+        The resume is tokenized once into a set and every job keyword is
+        a set lookup. match_score is the IDF-weighted share of job keywords
+        found in the resume.
+        
+        Args:
+            resume_text (str): Plain text version of resume
+            job (JobProfile): Result of parse_job_description()
+            
+        Returns:
+            Dict: Job matching analysis results
+        """
+        if not len(job):
+            return empty_job_match()
+        
+        return job.match(resume_tokens(resume_text))
+
+    def match_job_keywords(self, resume_text: str, job_keywords: List[str]) -> Dict:
+        """
+        Match a resume against keywords already extracted from a job description
+        
+        Args:
+            resume_text (str): Plain text version of resume
+            job_keywords (List[str]): Keywords from _extract_keywords
+            
+        Returns:
+            Dict: Job matching analysis results
+        """
+        return self.match_job(resume_text, JobProfile(job_keywords, self.job_weights.current))
+
+    def rank_resumes(self, resumes: Iterable[Dict], job_description: Union[str, JobProfile],
+                     top_n: int = 10, chunk_size: int = 1000) -> Dict:
+        """
+        Rank many resumes against one job description
+        
+        The job description is parsed once. Resumes are consumed in chunks,
+        so `resumes` may be a generator over a database cursor; each chunk
+        is turned into a sparse resume-by-keyword matrix and scored with one
+        matrix-vector product. Only the best `top_n` resumes are kept.
+        
+        Args:
+            resumes (Iterable[Dict]): Resume objects; anything else is skipped
+            job_description (str or JobProfile): Job description text or
+                the result of parse_job_description()
+            top_n (int): Number of resumes to return
+            chunk_size (int): Resumes scored per matrix
+            
+        Returns:
+            Dict: 'results' (best first, with rank, index, resume_id and the
+            job match fields), 'total_resumes', 'ranked', 'skipped',
+            'job_keywords' and 'total_job_keywords'
+        """
+        job = job_description
+        if not isinstance(job, JobProfile):
+            job = self.parse_job_description(job_description)
+        
+        # Min-heap of the best resumes so far: (score, -index, index, resume_id, tokens)
+        best = []
+        total = 0
+        skipped = 0
+        iterator = iter(resumes)
+        
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            
+            entries = []
+            for offset, resume_data in enumerate(chunk):
+                if not isinstance(resume_data, dict):
+                    skipped += 1
+                    continue
+                try:
+                    tokens = resume_tokens(self._get_resume_text(resume_data))
+                except (AttributeError, TypeError):
+                    # Malformed sections, e.g. "skills": null
+                    skipped += 1
+                    continue
+                entries.append((total + offset, resume_data.get('_id', resume_data.get('id')), tokens))
+            total += len(chunk)
+            
+            if not entries or not len(job) or top_n <= 0:
+                continue
+            
+            scores = job.score_many(tokens for _, _, tokens in entries)
+            for position in top_k_indices(scores[np.newaxis, :], top_n)[0]:
+                index, resume_id, tokens = entries[position]
+                item = (float(scores[position]), -index, index, resume_id, tokens)
+                if len(best) < top_n:
+                    heapq.heappush(best, item)
+                elif item[:2] > best[0][:2]:
+                    heapq.heapreplace(best, item)
+        
+        results = []
+        for rank, (_, _, index, resume_id, tokens) in enumerate(sorted(best, key=lambda item: (-item[0], item[2])), 1):
+            match = job.match(tokens)
+            del match['job_keywords']
+            results.append(dict(rank=rank, index=index, resume_id=None if resume_id is None else str(resume_id), **match))
         
         return {
-            'match_score': match_score,
-            'matched_keywords': matched_keywords[:20],  # Limit to top 20
-            'missing_keywords': missing_keywords[:10],  # Show top 10 missing
-            'job_keywords': job_keywords[:30],
-            'match_percentage': round(match_percentage, 2),
-            'keywords_matched_count': len(matched_keywords),
-            'keywords_missing_count': len(missing_keywords),
-            'total_job_keywords': len(job_keywords)
+            'results': results,
+            'total_resumes': total,
+            'ranked': total - skipped,
+            'skipped': skipped,
+            'job_keywords': job.job_keywords[:30],
+            'total_job_keywords': len(job)
         }
 
     def _extract_keywords(self, text: str) -> List[str]:
@@ -513,40 +869,41 @@ class ATSAnalyzer:
         Returns:
             List[str]: List of extracted keywords
         """
-        # Remove special characters and convert to lowercase
-        text = re.sub(r'[^a-zA-Z0-9\s\-\+]', '', text)
-        
-        # Split into words
-        words = text.lower().split()
-        
-        # Filter out common words and short words
-        stop_words = {
-            'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-            'of', 'with', 'by', 'from', 'as', 'is', 'be', 'are', 'was', 'were',
-            'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
-            'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all',
-            'each', 'every', 'both', 'few', 'more', 'some', 'such', 'no', 'not'
-        }
-        
-        keywords = []
-        for word in words:
-            # Keep words that are:
-            # 1. Not stop words
-            # 2. At least 4 characters long (unless hyphenated)
-            # 3. Not pure numbers
-            if (word not in stop_words and 
-                (len(word) > 3 or '-' in word) and 
-                not word.isdigit()):
-                keywords.append(word)
-        
-        # Return unique keywords, preserving order
-        return list(dict.fromkeys(keywords))
+        return extract_keywords(text)
 
 
 # Helper functions for external use
 
+# Process-wide analyzer shared by every request and thread
+_shared_analyzer = ATSAnalyzer()
+
+
+def get_analyzer() -> ATSAnalyzer:
+    """
+    Get the shared, thread-safe analyzer instance
+    
+    Returns:
+        ATSAnalyzer: Process-wide analyzer
+    """
+    return _shared_analyzer
+
+
+def empty_job_match() -> Dict:
+    """
+    Job match result used when no job description is given
+    
+    Returns:
+        Dict: Zeroed job matching results
+    """
+    return {
+        'match_score': 0,
+        'matched_keywords': [],
+        'missing_keywords': [],
+        'job_keywords': [],
+        'match_percentage': 0
+    }
+
+
 def analyze_ats(resume_data: Dict) -> Dict:
     """
     Convenience function to analyze a resume
@@ -557,8 +914,81 @@ def analyze_ats(resume_data: Dict) -> Dict:
     Returns:
         Dict: ATS analysis results
     """
-    analyzer = ATSAnalyzer()
-    return analyzer.analyze_resume(resume_data)
+    return get_analyzer().analyze_resume(resume_data)
+
+
+def analyze_ats_batch(resumes: List[Dict], job_description: str = '') -> List[Dict]:
+    """
+    Analyze many resumes in one call, optionally against a shared job description
+    
+    The job description is parsed once for the whole batch and a single
+    analyzer is reused. A failing item is reported in its own result and
+    does not fail the rest of the batch.
+    
+    Args:
+        resumes (List[Dict]): Resume objects
+        job_description (str): Optional job description for keyword matching
+        
+    Returns:
+        List[Dict]: One entry per resume, in input order, with 'index',
+        'success', 'data' and 'error' keys
+    """
+    analyzer = get_analyzer()
+    
+    job = None
+    if job_description and len(job_description.strip()) > 0:
+        job = analyzer.parse_job_description(job_description)
+    
+    results = []
+    for index, resume_data in enumerate(resumes):
+        if not isinstance(resume_data, dict):
+            results.append({
+                'index': index,
+                'success': False,
+                'data': None,
+                'error': 'INVALID_RESUME_FORMAT'
+            })
+            continue
+        
+        try:
+            analysis_result = analyzer.analyze_resume(resume_data)
+            if job is not None:
+                resume_text = analyzer._get_resume_text(resume_data)
+                analysis_result['job_match'] = analyzer.match_job(resume_text, job)
+            else:
+                analysis_result['job_match'] = empty_job_match()
+        except Exception as e:
+            results.append({
+                'index': index,
+                'success': False,
+                'data': None,
+                'error': str(e)
+            })
+            continue
+        
+        results.append({
+            'index': index,
+            'success': True,
+            'data': analysis_result,
+            'error': None
+        })
+    
+    return results
+
+
+def rank_resumes(resumes: Iterable[Dict], job_description: str, top_n: int = 10) -> Dict:
+    """
+    Convenience function to rank resumes against a job description
+    
+    Args:
+        resumes (Iterable[Dict]): Resume objects, e.g. a stream from the database
+        job_description (str): Job description text
+        top_n (int): Number of resumes to return
+        
+    Returns:
+        Dict: Ranking results, see ATSAnalyzer.rank_resumes()
+    """
+    return get_analyzer().rank_resumes(resumes, job_description, top_n)
 
 
 def get_ats_score_color(score: int) -> str:
@@ -0,0 +1,156 @@
+"""
+ATS Result Cache Module
+Bounded LRU/TTL cache for ATS analysis results keyed by resume content
+"""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+# Resume fields that influence ATS analysis and job matching. Database
+# bookkeeping such as _id, userId, createdAt or a stored atsScore is left
+# out so re-saving an unchanged resume still hits the cache.
+RESUME_FIELDS = (
+    'personalInfo', 'professionalSummary', 'experience', 'education',
+    'skills', 'certifications', 'projects', 'languages'
+)
+
+
+def resume_cache_key(resume_data: Dict, job_description: str = '', version: str = '') -> str:
+    """
+    Canonical content hash of an analysis request
+
+    Args:
+        resume_data (Dict): Resume object
+        job_description (str): Optional job description
+        version (str): Taxonomy or scoring version; a new version misses every old entry
+
+    Returns:
+        str: Hex digest identifying the request
+    """
+    relevant = {field: resume_data[field] for field in RESUME_FIELDS if field in resume_data}
+    payload = json.dumps(
+        [version, (job_description or '').strip(), relevant],
+        sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with a per-entry time to live
+
+    The cache holds at most `maxsize` entries; adding one more evicts the
+    least recently used. Entries older than `ttl` seconds count as misses.
+    Cached values are shared between callers and must not be mutated.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 600.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            maxsize (int): Maximum number of entries; 0 disables caching
+            ttl (float): Seconds an entry stays valid; 0 or less means no expiry
+            clock (Callable): Time source, replaceable in tests
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Optional[object]]:
+        """
+        Look up a key
+
+        Args:
+            key (Hashable): Cache key
+
+        Returns:
+            Tuple[bool, object]: (found, value)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def put(self, key: Hashable, value: object) -> None:
+        """
+        Store a value, evicting least recently used entries beyond maxsize
+
+        Args:
+            key (Hashable): Cache key
+            value (object): Value to cache
+        """
+        if self.maxsize <= 0:
+            return
+        expires_at = self._clock() + self.ttl if self.ttl > 0 else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]) -> Tuple[object, bool]:
+        """
+        Return the cached value or compute and cache it
+
+        The computation runs outside the lock, so two threads that miss on
+        the same key at once may both compute it.
+
+        Args:
+            key (Hashable): Cache key
+            compute (Callable): Produces the value on a miss
+
+        Returns:
+            Tuple[object, bool]: (value, whether it came from the cache)
+        """
+        found, value = self.get(key)
+        if found:
+            return value, True
+        value = compute()
+        self.put(key, value)
+        return value, False
+
+    def clear(self) -> None:
+        """Drop every entry; counters are kept"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        """
+        Cache counters and configuration
+
+        Returns:
+            Dict: Hit, miss, eviction and expiration counts plus current size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl_seconds': self.ttl
+            }
@@ -0,0 +1,317 @@
+"""
+ATS Executor Module
+Runs ATS analysis and job matching in worker processes instead of on the
+request thread
+
+Scoring a resume is pure Python regex and set work, so threads serving
+requests in one process take turns on the GIL. With ATS_WORKERS set the
+work is handed to a pool of processes; requests only wait for the result.
+
+At most workers + queue size tasks are accepted at once. Anything beyond
+that is refused straight away with ExecutorBusy, which the API turns into
+503 Service Unavailable with a Retry-After header, instead of piling up
+requests the server cannot finish in time.
+
+Configuration (environment variables):
+    ATS_WORKERS        Worker processes; 0 (default) runs everything inline
+    ATS_QUEUE_SIZE     Tasks that may wait for a free worker (default 2 per worker)
+    ATS_RETRY_AFTER    Seconds clients are told to wait when busy (default 1)
+"""
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from ats_analyzer import analyze_ats_batch, empty_job_match, get_analyzer
+from ats_incremental import get_incremental_analyzer
+
+DEFAULT_RETRY_AFTER = 1
+
+
+class ExecutorBusy(Exception):
+    """Raised when every worker and queue slot is taken"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"ATS workers are busy; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class ATSExecutor:
+    """
+    Bounded process pool for ATS work, or inline execution when it has no workers
+
+    The pool is created on first use and shared by every request thread.
+    """
+
+    def __init__(self, workers: int = 0, queue_size: Optional[int] = None, retry_after: int = DEFAULT_RETRY_AFTER):
+        """
+        Args:
+            workers (int): Worker processes; 0 runs tasks on the calling thread
+            queue_size (int): Tasks that may wait for a worker; defaults to 2 per worker
+            retry_after (int): Seconds reported to rejected clients
+        """
+        if workers < 0:
+            raise ValueError('workers must not be negative')
+        self.workers = workers
+        self.queue_size = 2 * workers if queue_size is None else queue_size
+        self.retry_after = retry_after
+        self.rejected = 0
+        self.completed = 0
+        self._capacity = workers + self.queue_size
+        self._in_flight = 0
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> 'ATSExecutor':
+        """Executor configured from ATS_WORKERS, ATS_QUEUE_SIZE and ATS_RETRY_AFTER"""
+        queue_size = os.environ.get('ATS_QUEUE_SIZE')
+        return cls(
+            workers=int(os.environ.get('ATS_WORKERS') or 0),
+            queue_size=int(queue_size) if queue_size else None,
+            retry_after=int(os.environ.get('ATS_RETRY_AFTER') or DEFAULT_RETRY_AFTER)
+        )
+
+    @property
+    def inline(self) -> bool:
+        """True when tasks run on the calling thread"""
+        return self.workers == 0
+
+    def run(self, func: Callable, *args):
+        """
+        Run one task and wait for its result
+
+        Args:
+            func (Callable): Module-level function, so it can be sent to a worker
+            *args: Picklable arguments
+
+        Returns:
+            object: The task's return value
+
+        Raises:
+            ExecutorBusy: If the pool and its queue are full
+        """
+        return self.run_many(func, [args])[0]
+
+    def run_many(self, func: Callable, arguments: List[tuple]) -> List:
+        """
+        Run several tasks in parallel and wait for all of them
+
+        Either every task is accepted or none is, so a large batch cannot
+        take the last free slots and then fail halfway.
+
+        Args:
+            func (Callable): Module-level function
+            arguments (List[tuple]): Argument tuple of each task
+
+        Returns:
+            List: Results in the order of `arguments`
+
+        Raises:
+            ExecutorBusy: If there are not enough free slots for all tasks
+        """
+        if self.inline:
+            return [func(*args) for args in arguments]
+
+        with self._lock:
+            if self._in_flight + len(arguments) > self._capacity:
+                self.rejected += 1
+                raise ExecutorBusy(self.retry_after)
+            self._in_flight += len(arguments)
+            pool = self._get_pool()
+
+        futures = []
+        try:
+            for args in arguments:
+                future = pool.submit(func, *args)
+                future.add_done_callback(self._release)
+                futures.append(future)
+        except BaseException:
+            # Tasks that were never submitted give back their slots now
+            with self._lock:
+                self._in_flight -= len(arguments) - len(futures)
+            raise
+
+        try:
+            return [future.result() for future in futures]
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool next time
+            self.restart()
+            raise
+
+    def imap(self, func: Callable, arguments: Iterable[tuple]) -> Iterator:
+        """
+        Run a stream of tasks, yielding their results in order
+
+        Meant for batch jobs such as ats_rescore.py rather than requests:
+        instead of rejecting work, the next task is taken from `arguments`
+        only when fewer than workers + queue size tasks are in flight, so a
+        generator of millions of tasks is consumed in constant memory.
+
+        Args:
+            func (Callable): Module-level function
+            arguments (Iterable[tuple]): Argument tuple of each task, read lazily
+
+        Yields:
+            object: Each task's return value, in the order of `arguments`
+        """
+        if self.inline:
+            for args in arguments:
+                yield func(*args)
+            return
+
+        window = max(1, self._capacity)
+        pending = deque()
+        try:
+            for args in arguments:
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+                with self._lock:
+                    self._in_flight += 1
+                    pool = self._get_pool()
+                try:
+                    future = pool.submit(func, *args)
+                except BaseException:
+                    with self._lock:
+                        self._in_flight -= 1
+                    raise
+                future.add_done_callback(self._release)
+                pending.append(future)
+            while pending:
+                yield pending.popleft().result()
+        except BrokenProcessPool:
+            self.restart()
+            raise
+        finally:
+            # Abandoned by the caller or failed: drop tasks that have not started
+            for future in pending:
+                future.cancel()
+
+    def _release(self, _future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self.completed += 1
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Create the pool on first use; call with the lock held"""
+        if self._pool is None:
+            # forkserver children do not inherit the request threads or their
+            # locks, and start from a small preloaded process instead of app.py
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                context = multiprocessing.get_context('forkserver')
+                context.set_forkserver_preload(['ats_executor'])
+            else:
+                context = multiprocessing.get_context('spawn')
+            self._pool = ProcessPoolExecutor(self.workers, mp_context=context, initializer=_warm_worker)
+        return self._pool
+
+    def restart(self) -> None:
+        """
+        Replace the worker processes, e.g. after the taxonomy was reloaded
+
+        Running tasks finish in the old workers; new tasks go to new ones.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Stop the worker processes"""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    def stats(self) -> Dict:
+        """
+        Executor configuration and counters
+
+        Returns:
+            Dict: Mode, worker and queue sizes, tasks in flight, completed and rejected requests
+        """
+        with self._lock:
+            return {
+                'mode': 'inline' if self.inline else 'process_pool',
+                'workers': self.workers,
+                'queue_size': self.queue_size,
+                'in_flight': self._in_flight,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'retry_after_seconds': self.retry_after
+            }
+
+
+def _warm_worker() -> None:
+    """Load the taxonomy and job keyword weights once per worker process"""
+    analyzer = get_analyzer()
+    analyzer.taxonomy.current
+    analyzer.job_weights.current
+
+
+# Tasks run in the workers; they live at module level so they can be pickled
+
+def analyze_resume_task(resume_data: Dict, resume_text: str, job_description: str) -> Dict:
+    """
+    ATS analysis of one resume, with a job match when a job description is given
+
+    Args:
+        resume_data (Dict): Resume object
+        resume_text (str): Plain text of the resume used for job matching
+        job_description (str): Optional job description
+
+    Returns:
+        Dict: ATS analysis results with a 'job_match' entry
+    """
+    # Editors re-submit mostly unchanged resumes; only edited sections are rescanned
+    analysis_result = get_incremental_analyzer().analyze_resume(resume_data)
+    if job_description and len(job_description.strip()) > 0:
+        analysis_result['job_match'] = get_analyzer().analyze_job_match(resume_text, job_description)
+    else:
+        analysis_result['job_match'] = empty_job_match()
+    return analysis_result
+
+
+def analyze_batch_task(resumes: List[Dict], job_description: str, start: int) -> List[Dict]:
+    """
+    analyze_ats_batch over one slice of a batch
+
+    Args:
+        resumes (List[Dict]): Resumes of the slice
+        job_description (str): Optional job description shared by the batch
+        start (int): Position of the slice in the whole batch
+
+    Returns:
+        List[Dict]: Batch items with indexes relative to the whole batch
+    """
+    results = analyze_ats_batch(resumes, job_description)
+    for item in results:
+        item['index'] += start
+    return results
+
+
+def analyze_batch(executor: ATSExecutor, resumes: List[Dict], job_description: str = '') -> List[Dict]:
+    """
+    Analyze a batch, split into one slice per worker
+
+    Args:
+        executor (ATSExecutor): Executor to run the slices on
+        resumes (List[Dict]): Resume objects
+        job_description (str): Optional job description shared by the batch
+
+    Returns:
+        List[Dict]: Same items as analyze_ats_batch()
+
+    Raises:
+        ExecutorBusy: If the executor cannot take the slices
+    """
+    if executor.inline or len(resumes) <= 1:
+        return executor.run(analyze_batch_task, resumes, job_description, 0)
+
+    size = -(-len(resumes) // executor.workers)
+    slices = [(resumes[start:start + size], job_description, start) for start in range(0, len(resumes), size)]
+    return [item for part in executor.run_many(analyze_batch_task, slices) for item in part]
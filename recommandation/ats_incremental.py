@@ -0,0 +1,311 @@
+"""
+Incremental ATS Analysis Module
+Re-analyzes only the resume sections that changed since an earlier analysis
+
+The editor re-runs the ATS analysis on every autosave, although a save
+usually changes one field. The incremental analyzer splits the resume into
+sections (personal info, summary, every experience, education, project,
+certification and language entry, and skills; see
+ATSAnalyzer.resume_sections), and caches a SectionSummary per section keyed
+by a hash of its text. Only sections whose text is not in the cache are
+scanned; the summaries are then merged into the same formatting signals and
+keyword set a scan of the full resume text yields, so the result is
+identical to ATSAnalyzer.analyze().
+
+Most signals simply add up over sections. Two need care because the
+resume text joins sections with a space and a match can cross that
+boundary: runs of spaces (excessive spacing) and runs of phone number
+characters. For those a section keeps the length of the run it starts and
+ends with, so runs meeting at a boundary can be joined. Keyword tokens
+never contain a space, so the tokens of the full text are the section
+tokens one after the other: besides the keywords found in each section,
+only a multi-word skill can span a boundary, and it is looked for in the
+few tokens on either side.
+
+Structure, content suggestions and strengths look only at the resume
+fields, not the text, and are cheap, so they are recomputed every time.
+
+Configuration (environment variables):
+    ATS_SECTION_CACHE_SIZE    Section summaries kept (default 4096; 0 disables caching)
+"""
+
+import hashlib
+import os
+import re
+from typing import Dict, List, NamedTuple, Optional, Pattern
+
+from ats_analyzer import (ATSAnalyzer, ATSResult, EXCESSIVE_SPACING_RUNS, EXTRA_SPACES_PATTERN,
+                          FormattingSignals, PHONE_PATTERN, get_analyzer)
+from ats_cache import ResultCache
+from skill_taxonomy import SkillTaxonomy
+from keyword_matcher import tokenize
+from metrics import STAGE_SECONDS
+
+DEFAULT_SECTION_CACHE_SIZE = 4096
+
+# Runs of the characters EXTRA_SPACES_PATTERN and PHONE_PATTERN look for,
+# of any length, and the shortest run each of those patterns matches
+_ANY_SPACES = re.compile(r' *')
+_ANY_PHONE_CHARACTERS = re.compile(r'[\d\-\+\(\) ]*')
+SPACING_RUN_MINIMUM = 3
+PHONE_RUN_MINIMUM = 10
+
+
+class RunSummary(NamedTuple):
+    """
+    Runs of one character class in a text, reduced to what is needed to
+    count them in a longer text that contains this one
+
+    `inner` counts the runs long enough to match that touch neither end;
+    the runs at the ends are kept as lengths because they may continue in
+    the neighbouring text. When the whole text is one run, prefix and
+    suffix both equal the length.
+    """
+    length: int
+    prefix: int
+    suffix: int
+    inner: int
+
+
+# Summary of the single space that joins two sections
+_SEPARATOR = RunSummary(1, 1, 1, 0)
+_EMPTY_RUNS = RunSummary(0, 0, 0, 0)
+
+
+def summarize_runs(text: str, any_run: Pattern, long_run: Pattern) -> RunSummary:
+    """
+    Summarize the runs of one character class in a text
+
+    Args:
+        text (str): Text to scan
+        any_run (Pattern): Matches any run of the characters, including an empty one
+        long_run (Pattern): Matches the runs that count
+
+    Returns:
+        RunSummary: Run lengths at both ends and the number of counted runs between them
+    """
+    length = len(text)
+    prefix = any_run.match(text).end()
+    if prefix == length:
+        return RunSummary(length, length, length, 0)
+    suffix = any_run.match(text[::-1]).end()
+    inner = sum(1 for run in long_run.finditer(text) if run.start() > 0 and run.end() < length)
+    return RunSummary(length, prefix, suffix, inner)
+
+
+def join_runs(left: RunSummary, right: RunSummary, minimum: int) -> RunSummary:
+    """
+    Summary of two texts placed one after the other
+
+    Args:
+        left (RunSummary): Summary of the first text
+        right (RunSummary): Summary of the second text
+        minimum (int): Shortest run that counts
+
+    Returns:
+        RunSummary: Summary of the concatenated text
+    """
+    length = left.length + right.length
+    if left.prefix == left.length:
+        if right.prefix == right.length:
+            return RunSummary(length, length, length, 0)
+        return RunSummary(length, left.length + right.prefix, right.suffix, right.inner)
+    if right.prefix == right.length:
+        return RunSummary(length, left.prefix, left.suffix + right.length, left.inner)
+    joined = 1 if left.suffix + right.prefix >= minimum else 0
+    return RunSummary(length, left.prefix, right.suffix, left.inner + right.inner + joined)
+
+
+def count_runs(summary: RunSummary, minimum: int) -> int:
+    """
+    Number of runs of at least `minimum` characters in a summarized text
+
+    Args:
+        summary (RunSummary): Summary of the text
+        minimum (int): Shortest run that counts
+
+    Returns:
+        int: Number of counted runs
+    """
+    if summary.prefix == summary.length:
+        return 1 if summary.length >= minimum else 0
+    return summary.inner + (summary.prefix >= minimum) + (summary.suffix >= minimum)
+
+
+class SectionSummary(NamedTuple):
+    """
+    Everything the ATS score needs from the text of one resume section
+    """
+    length: int
+    special_characters: int
+    non_ascii: int
+    has_email: bool
+    spaces: RunSummary
+    phone_characters: RunSummary
+    found: frozenset
+    # First and last tokens, as many as a keyword spanning a boundary can
+    # have on this side of it; both are all tokens of a short section
+    head: tuple
+    tail: tuple
+
+
+def section_key(text: str) -> bytes:
+    """
+    Cache key of a section text
+
+    Args:
+        text (str): Section text
+
+    Returns:
+        bytes: 16-byte digest of the text
+    """
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+class IncrementalAnalyzer:
+    """
+    ATS analysis that reuses the results of unchanged resume sections
+
+    Section summaries depend only on the section text and the taxonomy
+    version, not on the resume they came from, so one cache serves every
+    resume. The analyzer is thread-safe.
+    """
+
+    def __init__(self, analyzer: Optional[ATSAnalyzer] = None, cache: Optional[ResultCache] = None):
+        """
+        Args:
+            analyzer (ATSAnalyzer): Analyzer whose scoring is reused; the shared one by default
+            cache (ResultCache): Section summary cache; an LRU cache without expiry by default
+        """
+        self.analyzer = analyzer or get_analyzer()
+        self.cache = cache if cache is not None else ResultCache(maxsize=DEFAULT_SECTION_CACHE_SIZE, ttl=0)
+
+    @classmethod
+    def from_env(cls) -> 'IncrementalAnalyzer':
+        """Analyzer whose cache size comes from ATS_SECTION_CACHE_SIZE"""
+        size = int(os.environ.get('ATS_SECTION_CACHE_SIZE') or DEFAULT_SECTION_CACHE_SIZE)
+        return cls(cache=ResultCache(maxsize=size, ttl=0))
+
+    def analyze(self, resume_data: Dict) -> ATSResult:
+        """
+        Analyze a resume, scanning only sections not seen before
+
+        Args:
+            resume_data (Dict): Complete resume object with all sections
+
+        Returns:
+            ATSResult: The same result ATSAnalyzer.analyze() returns
+        """
+        # Take one snapshot so a concurrent reload cannot change the
+        # taxonomy halfway through the analysis
+        taxonomy = self.analyzer.taxonomy.current
+        with STAGE_SECONDS.time('ats_sections'):
+            summaries = self.section_summaries(resume_data, taxonomy)
+        edge = max(0, taxonomy.matcher.max_phrase_tokens - 1)
+        found = set()
+        before = ()
+
+        spaces = phone_characters = _EMPTY_RUNS
+        for i, summary in enumerate(summaries):
+            if i:
+                spaces = join_runs(spaces, _SEPARATOR, SPACING_RUN_MINIMUM)
+                phone_characters = join_runs(phone_characters, _SEPARATOR, PHONE_RUN_MINIMUM)
+                if before and summary.head:
+                    # Multi-word keywords that start before this section and end in it
+                    found.update(taxonomy.matcher.find_tokens(list(before + summary.head)))
+            found.update(summary.found)
+            if edge:
+                before = (before + summary.tail)[-edge:]
+            spaces = join_runs(spaces, summary.spaces, SPACING_RUN_MINIMUM)
+            phone_characters = join_runs(phone_characters, summary.phone_characters, PHONE_RUN_MINIMUM)
+
+        signals = FormattingSignals(
+            special_characters=sum(summary.special_characters for summary in summaries),
+            spacing_runs=min(count_runs(spaces, SPACING_RUN_MINIMUM), EXCESSIVE_SPACING_RUNS + 1),
+            non_ascii=sum(summary.non_ascii for summary in summaries),
+            has_email=any(summary.has_email for summary in summaries),
+            has_phone=count_runs(phone_characters, PHONE_RUN_MINIMUM) > 0
+        )
+        text_length = sum(summary.length for summary in summaries) + max(0, len(summaries) - 1)
+
+        return self.analyzer.build_result(resume_data, signals, found, text_length, taxonomy)
+
+    def analyze_resume(self, resume_data: Dict) -> Dict:
+        """
+        Incremental counterpart of ATSAnalyzer.analyze_resume()
+
+        Args:
+            resume_data (Dict): Complete resume object with all sections
+
+        Returns:
+            Dict: Comprehensive ATS analysis results
+        """
+        return self.analyze(resume_data).to_dict()
+
+    def section_summaries(self, resume_data: Dict, taxonomy: SkillTaxonomy) -> List[SectionSummary]:
+        """
+        Summaries of every resume section, from the cache where possible
+
+        Args:
+            resume_data (Dict): Resume object
+            taxonomy (SkillTaxonomy): Taxonomy snapshot keywords are matched against
+
+        Returns:
+            List[SectionSummary]: One summary per section, in text order
+        """
+        summaries = []
+        for _, parts in self.analyzer.resume_sections(resume_data):
+            text = ' '.join(parts)
+            summary, _ = self.cache.get_or_compute((taxonomy.version, section_key(text)),
+                                                   lambda: self.summarize_section(text, taxonomy))
+            summaries.append(summary)
+        return summaries
+
+    def summarize_section(self, text: str, taxonomy: SkillTaxonomy) -> SectionSummary:
+        """
+        Scan the text of one section
+
+        Args:
+            text (str): Section text
+            taxonomy (SkillTaxonomy): Taxonomy snapshot keywords are matched against
+
+        Returns:
+            SectionSummary: Formatting counts, boundary runs and keywords
+        """
+        signals = self.analyzer.scan_formatting(text)
+        tokens = tokenize(text)
+        edge = max(0, taxonomy.matcher.max_phrase_tokens - 1)
+        return SectionSummary(
+            length=len(text),
+            special_characters=signals.special_characters,
+            non_ascii=signals.non_ascii,
+            has_email=signals.has_email,
+            spaces=summarize_runs(text, _ANY_SPACES, EXTRA_SPACES_PATTERN),
+            phone_characters=summarize_runs(text, _ANY_PHONE_CHARACTERS, PHONE_PATTERN),
+            found=frozenset(taxonomy.matcher.find_tokens(tokens)),
+            head=tuple(tokens[:edge]),
+            tail=tuple(tokens[-edge:]) if edge else ()
+        )
+
+    def stats(self) -> Dict:
+        """
+        Section cache counters
+
+        Returns:
+            Dict: ResultCache statistics of the section cache
+        """
+        return self.cache.stats()
+
+
+# Process-wide incremental analyzer, sharing its section cache across requests
+_shared_incremental = IncrementalAnalyzer.from_env()
+
+
+def get_incremental_analyzer() -> IncrementalAnalyzer:
+    """
+    Get the shared, thread-safe incremental analyzer
+
+    Returns:
+        IncrementalAnalyzer: Process-wide incremental analyzer
+    """
+    return _shared_incremental
@@ -0,0 +1,791 @@
+"""
+ATS Jobs Module
+Asynchronous ATS analysis: submit a resume, get a job id, collect the result later
+
+A submitted job is put on a JobQueue and picked up by a small pool of
+worker threads, which run the analysis and store the outcome in a
+JobStore. Clients poll for the result or have it POSTed to a callback URL.
+
+The queue and the store are interfaces. LocalJobQueue and LocalJobStore
+keep jobs in process memory, so a job is only visible to the process that
+accepted it; that is enough for `python app.py`. With ATS_JOB_DB set,
+SqliteJobQueue and SqliteJobStore keep them in a SQLite file instead, and
+every process opening it (the gunicorn workers) sees the same jobs: any
+worker can answer a poll, and jobs are run by whichever worker is free.
+Another shared backend (Redis, SQS, ...) can be plugged in by
+implementing JobQueue and JobStore.
+
+Callback URLs are supplied by anonymous clients, so the server must not
+be usable to reach internal services. Without ATS_CALLBACK_HOSTS a
+callback host must resolve only to public addresses (no loopback,
+private, link-local or otherwise reserved ranges). The host is checked
+when the job is submitted and again before delivery, and the callback
+connects to the address that passed that check instead of resolving the
+name a second time, so a host cannot pass the check and then re-point
+its DNS record at an internal address. Redirects are never followed.
+
+Callbacks are delivered by their own small thread pool, so slow or
+unreachable callback URLs never hold up the job workers.
+
+Configuration (environment variables):
+    ATS_JOB_WORKERS          Worker threads (default 2)
+    ATS_JOB_QUEUE_SIZE       Jobs that may wait for a worker (default 100)
+    ATS_JOB_TTL              Seconds a finished job stays retrievable (default 3600)
+    ATS_JOB_DB               SQLite file shared by all server processes; empty keeps
+                             jobs in process memory (default: empty; gunicorn.conf.py
+                             sets it to artifacts/ats_jobs.sqlite3)
+    ATS_CALLBACK_HOSTS       Comma-separated hosts callbacks may go to, internal ones
+                             included; empty allows any host with only public addresses
+    ATS_CALLBACK_WORKERS     Threads delivering callbacks (default 4)
+    ATS_CALLBACK_BACKLOG     Callbacks that may wait for delivery; more are dropped
+                             and reported as failed (default 100)
+"""
+
+import abc
+import contextlib
+import datetime
+import http.client
+import ipaddress
+import json
+import os
+import queue
+import socket
+import sqlite3
+import ssl
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+from ats_executor import ExecutorBusy
+
+# Job states, in order
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+
+CALLBACK_TIMEOUT = 10
+CALLBACK_ATTEMPTS = 3
+
+
+class QueueFull(Exception):
+    """Raised when no more jobs can be queued"""
+
+    def __init__(self, retry_after: int):
+        super().__init__(f"ATS job queue is full; retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+class JobQueue(abc.ABC):
+    """
+    Interface of the queue between the API and the job workers
+
+    Items are job ids; the job itself lives in the JobStore.
+    """
+
+    @abc.abstractmethod
+    def put(self, job_id: str) -> None:
+        """
+        Enqueue a job without blocking
+
+        Raises:
+            queue.Full: If the queue cannot take more jobs
+        """
+
+    @abc.abstractmethod
+    def get(self, timeout: float) -> Optional[str]:
+        """
+        Next job id, or None if none arrived within `timeout` seconds
+        """
+
+    @abc.abstractmethod
+    def qsize(self) -> int:
+        """Approximate number of waiting jobs"""
+
+
+class LocalJobQueue(JobQueue):
+    """Bounded in-process queue"""
+
+    def __init__(self, maxsize: int = 100):
+        """
+        Args:
+            maxsize (int): Jobs that may wait at once; 0 means unbounded
+        """
+        self._queue = queue.Queue(maxsize)
+
+    def put(self, job_id: str) -> None:
+        self._queue.put_nowait(job_id)
+
+    def get(self, timeout: float) -> Optional[str]:
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+class JobStore(abc.ABC):
+    """
+    Interface of the table of jobs
+
+    Jobs are dicts keyed by their 'job_id'. Finished jobs (status
+    SUCCEEDED or FAILED) may expire after `ttl` seconds; jobs that are
+    still queued or running must be kept.
+    """
+
+    ttl: float
+    # Whether other processes opening the same store see the same jobs
+    shared = False
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        """Number of stored jobs"""
+
+    @abc.abstractmethod
+    def add(self, job: Dict) -> None:
+        """Store a new job"""
+
+    @abc.abstractmethod
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Snapshot of a job
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            Dict or None: Copy of the job record, None if unknown or expired
+        """
+
+    @abc.abstractmethod
+    def update(self, job_id: str, **fields) -> Optional[Dict]:
+        """
+        Change fields of a job
+
+        Args:
+            job_id (str): Job id
+            **fields: Fields to set
+
+        Returns:
+            Dict or None: Copy of the updated job, None if it is gone
+        """
+
+    @abc.abstractmethod
+    def discard(self, job_id: str) -> None:
+        """Forget a job"""
+
+
+class LocalJobStore(JobStore):
+    """
+    Thread-safe in-process table of jobs
+
+    Finished jobs expire `ttl` seconds after they finish, or earlier when
+    more than `max_finished` have piled up; jobs that are still queued or
+    running are never dropped.
+    """
+
+    def __init__(self, ttl: float = 3600.0, max_finished: int = 10000, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl (float): Seconds a finished job is kept
+            max_finished (int): Finished jobs kept at most
+            clock (Callable): Time source, replaceable in tests
+        """
+        self.ttl = ttl
+        self.max_finished = max_finished
+        self._clock = clock
+        self._jobs = OrderedDict()
+        self._finished_at = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def add(self, job: Dict) -> None:
+        with self._lock:
+            self._expire()
+            self._jobs[job['job_id']] = job
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with self._lock:
+            self._expire()
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def update(self, job_id: str, **fields) -> Optional[Dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            job.update(fields)
+            if job['status'] in (SUCCEEDED, FAILED):
+                self._finished_at.setdefault(job_id, self._clock())
+            return dict(job)
+
+    def discard(self, job_id: str) -> None:
+        with self._lock:
+            self._jobs.pop(job_id, None)
+            self._finished_at.pop(job_id, None)
+
+    def _expire(self) -> None:
+        """Drop finished jobs past their TTL or the size limit; call with the lock held"""
+        deadline = self._clock() - self.ttl
+        # Jobs are recorded in the order they finished, so the oldest come first
+        while self._finished_at:
+            job_id, finished = next(iter(self._finished_at.items()))
+            if finished > deadline and len(self._finished_at) <= self.max_finished:
+                break
+            del self._finished_at[job_id]
+            self._jobs.pop(job_id, None)
+
+
+class SqliteJobQueue(JobQueue):
+    """
+    Bounded queue in a SQLite file, shared by every process that opens it
+    """
+
+    # Seconds between checks while get() waits for a job
+    POLL_INTERVAL = 0.05
+
+    def __init__(self, path: str, maxsize: int = 100):
+        """
+        Args:
+            path (str): Database file; created if missing
+            maxsize (int): Jobs that may wait at once; 0 means unbounded
+        """
+        self.path = path
+        self.maxsize = maxsize
+        _init_database(path)
+
+    def put(self, job_id: str) -> None:
+        with _transaction(self.path) as db:
+            if self.maxsize and db.execute('SELECT COUNT(*) FROM ats_job_queue').fetchone()[0] >= self.maxsize:
+                raise queue.Full
+            db.execute('INSERT INTO ats_job_queue (job_id) VALUES (?)', (job_id,))
+
+    def get(self, timeout: float) -> Optional[str]:
+        deadline = time.monotonic() + timeout
+        while True:
+            job_id = self._pop()
+            if job_id is not None:
+                return job_id
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            time.sleep(min(self.POLL_INTERVAL, remaining))
+
+    def qsize(self) -> int:
+        with _connection(self.path) as db:
+            return db.execute('SELECT COUNT(*) FROM ats_job_queue').fetchone()[0]
+
+    def _pop(self) -> Optional[str]:
+        """Take the oldest job id, or None if the queue is empty"""
+        # Look without the write lock first, so idle workers do not contend for it
+        with _connection(self.path) as db:
+            if db.execute('SELECT 1 FROM ats_job_queue LIMIT 1').fetchone() is None:
+                return None
+        with _transaction(self.path) as db:
+            row = db.execute('SELECT seq, job_id FROM ats_job_queue ORDER BY seq LIMIT 1').fetchone()
+            if row is None:
+                return None  # another worker took it
+            db.execute('DELETE FROM ats_job_queue WHERE seq = ?', (row[0],))
+            return row[1]
+
+
+class SqliteJobStore(JobStore):
+    """
+    Job table in a SQLite file, shared by every process that opens it
+
+    Jobs are stored as JSON, so payloads and results must be JSON
+    serializable. Expiry works as in LocalJobStore, on wall-clock time
+    since the processes share no monotonic clock.
+    """
+
+    shared = True
+
+    def __init__(self, path: str, ttl: float = 3600.0, max_finished: int = 10000,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path (str): Database file; created if missing
+            ttl (float): Seconds a finished job is kept
+            max_finished (int): Finished jobs kept at most
+            clock (Callable): Time source, replaceable in tests
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_finished = max_finished
+        self._clock = clock
+        _init_database(path)
+
+    def __len__(self) -> int:
+        with _connection(self.path) as db:
+            return db.execute('SELECT COUNT(*) FROM ats_jobs').fetchone()[0]
+
+    def add(self, job: Dict) -> None:
+        with _transaction(self.path) as db:
+            self._expire(db)
+            db.execute('INSERT OR REPLACE INTO ats_jobs (job_id, record, finished_at) VALUES (?, ?, NULL)',
+                       (job['job_id'], json.dumps(job)))
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        with _transaction(self.path) as db:
+            self._expire(db)
+            row = db.execute('SELECT record FROM ats_jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def update(self, job_id: str, **fields) -> Optional[Dict]:
+        with _transaction(self.path) as db:
+            row = db.execute('SELECT record, finished_at FROM ats_jobs WHERE job_id = ?', (job_id,)).fetchone()
+            if row is None:
+                return None
+            job = json.loads(row[0])
+            job.update(fields)
+            finished_at = row[1]
+            if finished_at is None and job['status'] in (SUCCEEDED, FAILED):
+                finished_at = self._clock()
+            db.execute('UPDATE ats_jobs SET record = ?, finished_at = ? WHERE job_id = ?',
+                       (json.dumps(job), finished_at, job_id))
+        return job
+
+    def discard(self, job_id: str) -> None:
+        with _transaction(self.path) as db:
+            db.execute('DELETE FROM ats_jobs WHERE job_id = ?', (job_id,))
+
+    def _expire(self, db: sqlite3.Connection) -> None:
+        """Drop finished jobs past their TTL or the size limit; call inside a transaction"""
+        db.execute('DELETE FROM ats_jobs WHERE finished_at <= ?', (self._clock() - self.ttl,))
+        excess = db.execute('SELECT COUNT(*) FROM ats_jobs WHERE finished_at IS NOT NULL').fetchone()[0] \
+            - self.max_finished
+        if excess > 0:
+            db.execute('DELETE FROM ats_jobs WHERE job_id IN (SELECT job_id FROM ats_jobs WHERE finished_at IS NOT NULL '
+                       'ORDER BY finished_at LIMIT ?)', (excess,))
+
+
+def _init_database(path: str) -> None:
+    """Create the job tables if they do not exist yet"""
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with _connection(path) as db:
+        # Readers (polls) then never wait for the writer
+        db.execute('PRAGMA journal_mode=WAL')
+    with _transaction(path) as db:
+        db.execute('CREATE TABLE IF NOT EXISTS ats_job_queue (seq INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL)')
+        db.execute('CREATE TABLE IF NOT EXISTS ats_jobs (job_id TEXT PRIMARY KEY, record TEXT NOT NULL, finished_at REAL)')
+        db.execute('CREATE INDEX IF NOT EXISTS ats_jobs_finished_at ON ats_jobs (finished_at)')
+
+
+@contextlib.contextmanager
+def _connection(path: str):
+    """
+    A connection to the job database, closed afterwards
+
+    Every operation opens its own connection, so nothing is shared between
+    threads or inherited by processes forked from the gunicorn master.
+    """
+    db = sqlite3.connect(path, timeout=30, isolation_level=None)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+@contextlib.contextmanager
+def _transaction(path: str):
+    """A connection holding the database's write lock until the block ends"""
+    with _connection(path) as db:
+        db.execute('BEGIN IMMEDIATE')
+        try:
+            yield db
+        except BaseException:
+            db.execute('ROLLBACK')
+            raise
+        db.execute('COMMIT')
+
+
+class JobManager:
+    """
+    Accepts ATS jobs and runs them on background worker threads
+
+    `handler` receives the job payload and returns the analysis result;
+    when it raises ExecutorBusy the job is retried after the suggested
+    delay instead of failing.
+    """
+
+    def __init__(self, handler: Callable[[Dict], Dict], job_queue: Optional[JobQueue] = None,
+                 store: Optional[JobStore] = None, workers: int = 2, retry_after: int = 1,
+                 callback_hosts: Optional[set] = None, callback_workers: int = 4,
+                 callback_backlog: int = 100):
+        """
+        Args:
+            handler (Callable): Runs one job payload and returns its result
+            job_queue (JobQueue): Queue of job ids; a LocalJobQueue by default
+            store (JobStore): Job table; a LocalJobStore with a one hour TTL by default
+            workers (int): Worker threads started by start()
+            retry_after (int): Seconds clients are told to wait when the queue is full
+            callback_hosts (set): Hosts callbacks may be sent to; None allows any host
+                that resolves only to public addresses
+            callback_workers (int): Threads delivering callbacks; 0 delivers them
+                on the job's worker thread
+            callback_backlog (int): Callbacks that may be waiting for delivery at once
+        """
+        self.handler = handler
+        self.queue = job_queue if job_queue is not None else LocalJobQueue()
+        self.store = store if store is not None else LocalJobStore()
+        self.workers = workers
+        self.retry_after = retry_after
+        self.callback_hosts = callback_hosts
+        self.callback_workers = callback_workers
+        self._callback_slots = threading.BoundedSemaphore(callback_backlog)
+        self._callback_executor = None
+        self._threads = []
+        self._stopping = threading.Event()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, handler: Callable[[Dict], Dict]) -> 'JobManager':
+        """Manager configured from the ATS_JOB_* and ATS_CALLBACK_* variables"""
+        hosts = {host.strip().lower() for host in os.environ.get('ATS_CALLBACK_HOSTS', '').split(',') if host.strip()}
+        queue_size = int(os.environ.get('ATS_JOB_QUEUE_SIZE') or 100)
+        ttl = float(os.environ.get('ATS_JOB_TTL') or 3600)
+        database = os.environ.get('ATS_JOB_DB', '').strip()
+        if database:
+            job_queue, store = SqliteJobQueue(database, queue_size), SqliteJobStore(database, ttl=ttl)
+        else:
+            job_queue, store = LocalJobQueue(queue_size), LocalJobStore(ttl=ttl)
+        return cls(
+            handler,
+            job_queue=job_queue,
+            store=store,
+            workers=int(os.environ.get('ATS_JOB_WORKERS') or 2),
+            callback_hosts=hosts or None,
+            callback_workers=int(os.environ.get('ATS_CALLBACK_WORKERS') or 4),
+            callback_backlog=int(os.environ.get('ATS_CALLBACK_BACKLOG') or 100)
+        )
+
+    @property
+    def shared(self) -> bool:
+        """Whether jobs are visible to every process using the same store"""
+        return self.store.shared
+
+    def check_callback_url(self, url: str) -> bool:
+        """
+        Whether a callback URL is acceptable
+
+        Args:
+            url (str): URL supplied by the client
+
+        Returns:
+            bool: True for http(s) URLs to a listed host or, without a
+            list, to a host with only public addresses
+        """
+        return self.resolve_callback(url) is not None
+
+    def resolve_callback(self, url: str) -> Optional[str]:
+        """
+        Address a callback URL may be delivered to
+
+        Args:
+            url (str): Callback URL
+
+        Returns:
+            str or None: The IP address to connect to, None if the URL is
+            not an http(s) URL to a listed host or, without a list, to a
+            host with only public addresses
+        """
+        try:
+            parsed = urlparse(url)
+            hostname = parsed.hostname
+            parsed.port  # raises ValueError for a malformed port
+        except ValueError:
+            return None
+        if parsed.scheme not in ('http', 'https') or not hostname:
+            return None
+        if self.callback_hosts is not None and hostname.lower() not in self.callback_hosts:
+            return None
+        addresses = resolve_host(hostname)
+        if not addresses:
+            return None
+        if self.callback_hosts is None and not all(is_public_address(address) for address in addresses):
+            return None
+        return addresses[0]
+
+    def submit(self, payload: Dict, callback_url: Optional[str] = None) -> Dict:
+        """
+        Queue a job
+
+        Args:
+            payload (Dict): Handler input
+            callback_url (str): Optional URL the finished job is POSTed to
+
+        Returns:
+            Dict: The new job record
+
+        Raises:
+            QueueFull: If the queue cannot take more jobs
+        """
+        self.start()
+        job = {
+            'job_id': uuid.uuid4().hex,
+            'status': QUEUED,
+            'created_at': _now(),
+            'started_at': None,
+            'finished_at': None,
+            'result': None,
+            'error': None,
+            'callback_url': callback_url,
+            'callback_status': 'pending' if callback_url else None,
+            'payload': payload
+        }
+        self.store.add(job)
+        try:
+            self.queue.put(job['job_id'])
+        except queue.Full:
+            self.store.discard(job['job_id'])
+            raise QueueFull(self.retry_after)
+        return public_job(job)
+
+    def get(self, job_id: str) -> Optional[Dict]:
+        """
+        Current state of a job
+
+        Args:
+            job_id (str): Job id
+
+        Returns:
+            Dict or None: Public job record, None if unknown or expired
+        """
+        job = self.store.get(job_id)
+        return public_job(job) if job is not None else None
+
+    def start(self) -> None:
+        """Start the worker threads once"""
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._work, name=f'ats-job-worker-{number}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Ask the workers to exit once their current job is done"""
+        self._stopping.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+        with self._lock:
+            if self._callback_executor is not None:
+                # Queued callbacks are still delivered, without waiting for them here
+                self._callback_executor.shutdown(wait=False)
+                self._callback_executor = None
+        self._stopping.clear()
+
+    def _work(self) -> None:
+        while not self._stopping.is_set():
+            self.process_next(timeout=0.5)
+
+    def process_next(self, timeout: float = 0.0) -> Optional[Dict]:
+        """
+        Run the next queued job on the calling thread
+
+        Args:
+            timeout (float): Seconds to wait for a job
+
+        Returns:
+            Dict or None: The finished public job record, None if there was no job
+        """
+        job_id = self.queue.get(timeout)
+        if job_id is None:
+            return None
+        job = self.store.update(job_id, status=RUNNING, started_at=_now())
+        if job is None:
+            return None
+
+        while True:
+            try:
+                result = self.handler(job['payload'])
+                job = self.store.update(job_id, status=SUCCEEDED, result=result, finished_at=_now(), payload=None)
+            except ExecutorBusy as e:
+                # The analysis workers are saturated; this job can wait
+                if self._stopping.wait(e.retry_after):
+                    job = self.store.update(job_id, status=FAILED, error='Server shutting down',
+                                            finished_at=_now(), payload=None)
+                    break
+                continue
+            except Exception as e:
+                job = self.store.update(job_id, status=FAILED, error=str(e), finished_at=_now(), payload=None)
+            break
+
+        if job is not None and job.get('callback_url'):
+            job = self._schedule_callback(job) or job
+        return public_job(job) if job is not None else None
+
+    def _schedule_callback(self, job: Dict) -> Optional[Dict]:
+        """
+        Deliver a finished job's callback, on the callback threads if there are any
+
+        Returns:
+            Dict or None: The updated job if the callback was handled on
+            this thread, else None
+        """
+        if self.callback_workers <= 0:
+            return self._send_callback(job)
+        if not self._callback_slots.acquire(blocking=False):
+            print(f"[ATS JOBS] Callback backlog full; dropping callback for job {job['job_id']}")
+            return self.store.update(job['job_id'], callback_status='failed: callback backlog full')
+        with self._lock:
+            if self._callback_executor is None:
+                self._callback_executor = ThreadPoolExecutor(self.callback_workers,
+                                                             thread_name_prefix='ats-job-callback')
+            future = self._callback_executor.submit(self._send_callback, job)
+        future.add_done_callback(lambda _: self._callback_slots.release())
+        return None
+
+    def _send_callback(self, job: Dict) -> Optional[Dict]:
+        """POST a finished job to its callback URL and record the outcome"""
+        # Checked again: the host may resolve differently than at submission
+        address = self.resolve_callback(job['callback_url'])
+        if address is None:
+            status = 'failed: callback host not allowed'
+        else:
+            status = deliver_callback(job['callback_url'], public_job(job), address)
+        return self.store.update(job['job_id'], callback_status=status)
+
+    def stats(self) -> Dict:
+        """
+        Queue and worker counters
+
+        Returns:
+            Dict: Worker count, whether the store is shared, queued jobs and stored jobs
+        """
+        return {
+            'workers': self.workers,
+            'shared_store': self.store.shared,
+            'queued': self.queue.qsize(),
+            'stored_jobs': len(self.store),
+            'job_ttl_seconds': self.store.ttl
+        }
+
+
+def resolve_host(hostname: str) -> List[str]:
+    """
+    IP addresses a host name resolves to
+
+    Args:
+        hostname (str): Host name or IP literal
+
+    Returns:
+        List[str]: Addresses; empty if the name does not resolve
+    """
+    try:
+        infos = socket.getaddrinfo(hostname, None, proto=socket.IPPROTO_TCP)
+    except (socket.gaierror, UnicodeError):
+        return []
+    return [info[4][0] for info in infos]
+
+
+def is_public_address(text: str) -> bool:
+    """
+    Whether an IP address is publicly routable
+
+    Args:
+        text (str): IPv4 or IPv6 address
+
+    Returns:
+        bool: False for loopback, private, link-local, multicast and
+        otherwise reserved addresses
+    """
+    address = ipaddress.ip_address(text.split('%', 1)[0])
+    if address.version == 6 and address.ipv4_mapped is not None:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+
+class _PinnedHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection to a given address, sending the URL's host name in the Host header"""
+
+    def __init__(self, host: str, port: Optional[int], address: str, **kwargs):
+        super().__init__(host, port, **kwargs)
+        self.address = address
+
+    def connect(self):
+        self.sock = socket.create_connection((self.address, self.port), self.timeout)
+
+
+class _PinnedHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS connection to a given address; the certificate is verified for the URL's host name"""
+
+    def __init__(self, host: str, port: Optional[int], address: str, **kwargs):
+        self.ssl_context = ssl.create_default_context()
+        super().__init__(host, port, context=self.ssl_context, **kwargs)
+        self.address = address
+
+    def connect(self):
+        sock = socket.create_connection((self.address, self.port), self.timeout)
+        self.sock = self.ssl_context.wrap_socket(sock, server_hostname=self.host)
+
+
+def public_job(job: Dict) -> Dict:
+    """Job record as returned to clients, without the submitted resume"""
+    return {key: value for key, value in job.items() if key != 'payload'}
+
+
+def deliver_callback(url: str, job: Dict, address: str) -> str:
+    """
+    POST a finished job to its callback URL, retrying failures
+
+    Every attempt connects to `address`, the address the URL's host was
+    checked with; the host name is not resolved again. Redirects are not
+    followed.
+
+    Args:
+        url (str): Callback URL
+        job (Dict): Public job record
+        address (str): IP address to connect to
+
+    Returns:
+        str: 'delivered' or 'failed: <reason>'
+    """
+    body = json.dumps({
+        'success': job['status'] == SUCCEEDED,
+        'data': job,
+        'message': f"ATS job {job['status']}",
+        'error': job['error'],
+        'timestamp': str(datetime.datetime.now())
+    }).encode('utf-8')
+
+    parsed = urlparse(url)
+    path = (parsed.path or '/') + (f'?{parsed.query}' if parsed.query else '')
+    connection_class = _PinnedHTTPSConnection if parsed.scheme == 'https' else _PinnedHTTPConnection
+
+    reason = ''
+    for attempt in range(CALLBACK_ATTEMPTS):
+        if attempt:
+            time.sleep(2 ** (attempt - 1))
+        connection = connection_class(parsed.hostname, parsed.port, address, timeout=CALLBACK_TIMEOUT)
+        try:
+            connection.request('POST', path, body=body, headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            if 200 <= response.status < 300:
+                return 'delivered'
+            reason = f'HTTP {response.status}'
+            if response.status < 500:
+                break  # rejected or redirected; retrying will not help
+        except (OSError, http.client.HTTPException) as e:
+            reason = str(e) or type(e).__name__
+        finally:
+            connection.close()
+    print(f"[ATS JOBS] Callback to {url} failed: {reason}")
+    return f'failed: {reason}'
+
+
+def _now() -> str:
+    return datetime.datetime.now().isoformat(timespec='milliseconds')
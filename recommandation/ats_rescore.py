@@ -0,0 +1,201 @@
+"""
+ATS Rescore Module
+Re-scores a stream of stored resumes, e.g. the whole resume collection after
+the skill taxonomy or the scoring changed
+
+Input is newline-delimited JSON, one resume per line, as written by
+mongoexport for the Node app's resumes collection; output is one JSON
+object per input resume, in input order:
+
+    {"line": 1, "resume_id": "...", "success": true, "data": {...ATS analysis...}, "error": null}
+
+Lines are read lazily and handed to the workers in chunks, with a bounded
+number of chunks in flight, so memory use does not grow with the input and
+millions of resumes can be piped through. Progress goes to stderr.
+
+Usage:
+    mongoexport --db careers --collection resumes | python ats_rescore.py --workers 4 > scores.ndjson
+    python ats_rescore.py resumes.ndjson -o scores.ndjson
+
+Scoring uses the taxonomy in ATS_TAXONOMY_PATH, like the API.
+"""
+
+import argparse
+import io
+import json
+import os
+import sys
+import time
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from ats_analyzer import get_analyzer
+from ats_executor import ATSExecutor
+
+DEFAULT_CHUNK_SIZE = 200
+DEFAULT_PROGRESS_INTERVAL = 5.0
+
+
+def read_chunks(stream: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[List[Tuple[int, str]]]:
+    """
+    Read non-blank lines in chunks
+
+    Args:
+        stream (TextIO): NDJSON input
+        chunk_size (int): Lines per chunk
+
+    Yields:
+        List[Tuple[int, str]]: (line number, line) pairs, numbered from 1
+    """
+    lines = ((number, line) for number, line in enumerate(stream, 1) if line.strip())
+    while True:
+        chunk = list(islice(lines, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def resume_id(resume_data: Dict) -> Optional[str]:
+    """
+    Id of a stored resume, also in mongoexport's {"$oid": ...} form
+
+    Args:
+        resume_data (Dict): Resume object
+
+    Returns:
+        str or None: The resume id, None if it has none
+    """
+    value = resume_data.get('_id', resume_data.get('id'))
+    if isinstance(value, dict):
+        value = value.get('$oid')
+    return None if value is None else str(value)
+
+
+def rescore_line(number: int, line: str) -> Dict:
+    """
+    ATS analysis of one NDJSON line
+
+    Args:
+        number (int): Line number in the input
+        line (str): JSON-encoded resume
+
+    Returns:
+        Dict: 'line', 'resume_id', 'success', 'data' and 'error'
+    """
+    item = {'line': number, 'resume_id': None, 'success': False, 'data': None, 'error': None}
+    try:
+        resume_data = json.loads(line)
+    except ValueError:
+        item['error'] = 'INVALID_JSON'
+        return item
+    if not isinstance(resume_data, dict):
+        item['error'] = 'INVALID_RESUME_FORMAT'
+        return item
+
+    item['resume_id'] = resume_id(resume_data)
+    try:
+        item['data'] = get_analyzer().analyze(resume_data).to_dict()
+        item['success'] = True
+    except Exception as e:
+        item['error'] = str(e)
+    return item
+
+
+def rescore_chunk(chunk: List[Tuple[int, str]]) -> Tuple[str, int, int]:
+    """
+    Score one chunk of lines; runs in a worker process
+
+    The output comes back as one NDJSON string, which is cheaper to send
+    between processes than the result dicts.
+
+    Args:
+        chunk (List[Tuple[int, str]]): (line number, line) pairs
+
+    Returns:
+        Tuple[str, int, int]: NDJSON output, resumes scored and resumes failed
+    """
+    output = []
+    failed = 0
+    for number, line in chunk:
+        item = rescore_line(number, line)
+        failed += not item['success']
+        output.append(json.dumps(item))
+    output.append('')
+    return '\n'.join(output), len(chunk), failed
+
+
+def rescore(stream: TextIO, out: TextIO, executor: ATSExecutor, chunk_size: int = DEFAULT_CHUNK_SIZE,
+            progress_interval: float = DEFAULT_PROGRESS_INTERVAL, log: Optional[TextIO] = None) -> Dict:
+    """
+    Score every resume in an NDJSON stream and write the results as NDJSON
+
+    Args:
+        stream (TextIO): NDJSON input
+        out (TextIO): NDJSON output
+        executor (ATSExecutor): Runs the chunks inline or in worker processes
+        chunk_size (int): Resumes per task
+        progress_interval (float): Seconds between progress lines; 0 disables them
+        log (TextIO): Where progress goes; stderr by default
+
+    Returns:
+        Dict: 'resumes', 'failed', 'seconds' and 'resumes_per_second'
+    """
+    log = log or sys.stderr
+    start = last_report = time.monotonic()
+    resumes = failed = 0
+
+    tasks = ((chunk,) for chunk in read_chunks(stream, chunk_size))
+    for text, count, chunk_failed in executor.imap(rescore_chunk, tasks):
+        out.write(text)
+        resumes += count
+        failed += chunk_failed
+        now = time.monotonic()
+        if progress_interval > 0 and now - last_report >= progress_interval:
+            last_report = now
+            print(f"[ATS RESCORE] {resumes} resumes, {resumes / (now - start):.0f}/s, {failed} failed",
+                  file=log, flush=True)
+
+    seconds = time.monotonic() - start
+    return {
+        'resumes': resumes,
+        'failed': failed,
+        'seconds': round(seconds, 3),
+        'resumes_per_second': round(resumes / seconds, 1) if seconds > 0 else 0.0
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Re-score resumes from newline-delimited JSON')
+    parser.add_argument('input', nargs='?', default='-', help='NDJSON resumes (default: stdin)')
+    parser.add_argument('-o', '--output', default='-', help='NDJSON results (default: stdout)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes; 0 scores on the main process (default: CPU count)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help='Resumes per worker task')
+    parser.add_argument('--progress-interval', type=float, default=DEFAULT_PROGRESS_INTERVAL,
+                        help='Seconds between progress lines on stderr; 0 disables them')
+    args = parser.parse_args(argv)
+    if args.chunk_size < 1 or args.workers < 0:
+        parser.error('--chunk-size must be positive and --workers must not be negative')
+
+    stream = (io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8') if args.input == '-'
+              else open(args.input, encoding='utf-8'))
+    out = (io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8') if args.output == '-'
+           else open(args.output, 'w', encoding='utf-8'))
+    executor = ATSExecutor(workers=args.workers)
+    try:
+        summary = rescore(stream, out, executor, args.chunk_size, args.progress_interval)
+    finally:
+        executor.shutdown()
+        out.flush()
+        if args.output != '-':
+            out.close()
+        if args.input != '-':
+            stream.close()
+
+    print(f"[ATS RESCORE] Done: {summary['resumes']} resumes in {summary['seconds']}s "
+          f"({summary['resumes_per_second']}/s), {summary['failed']} failed", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
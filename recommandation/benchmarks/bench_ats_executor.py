@@ -0,0 +1,90 @@
+"""
+ATS Executor Load Benchmark
+Throughput and tail latency of concurrent ATS analyses of long resumes,
+run inline on the request threads versus in a process pool
+
+Every client thread stands in for one Flask request thread. With a pool,
+requests that find the workers and queue full are rejected (503) and
+counted instead of timed.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_utils import print_table, summarize
+
+from ats_executor import ATSExecutor, ExecutorBusy, analyze_resume_task
+
+REQUESTS = 200
+CLIENTS = 16
+
+JOB_DESCRIPTION = (
+    "Senior backend engineer: Python, Django, PostgreSQL, Redis, Docker, Kubernetes, AWS, "
+    "Terraform and CI/CD. Mentoring, code review and strong communication skills."
+)
+
+
+def long_resume(i):
+    """A resume with a few thousand words of experience text"""
+    paragraph = (
+        "Led the migration of a monolith to Python microservices on Kubernetes, cutting deploy time "
+        "from hours to minutes. Built REST APIs in Django and FastAPI backed by PostgreSQL and Redis; "
+        "owned on-call, incident reviews and capacity planning; mentored four engineers. "
+    )
+    return {
+        'personalInfo': {'firstName': 'Candidate', 'lastName': str(i), 'email': f'c{i}@example.com', 'phone': '555-0100'},
+        'professionalSummary': 'Backend engineer with ten years of experience in distributed systems.',
+        'experience': [{
+            'jobTitle': 'Senior Software Engineer',
+            'companyName': f'Company {job}',
+            'description': paragraph * 20
+        } for job in range(6)],
+        'skills': ['Python', 'Django', 'PostgreSQL', 'Docker', 'Kubernetes', 'AWS']
+    }
+
+
+def load_test(executor, resumes):
+    """Send every resume from CLIENTS threads; returns latencies, rejections and wall time"""
+    def one(resume):
+        start = time.perf_counter()
+        try:
+            executor.run(analyze_resume_task, resume, resume['professionalSummary'], JOB_DESCRIPTION)
+        except ExecutorBusy:
+            return None
+        return (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(CLIENTS) as clients:
+        latencies = list(clients.map(one, resumes))
+    wall = time.perf_counter() - start
+    completed = [latency for latency in latencies if latency is not None]
+    return completed, len(latencies) - len(completed), wall
+
+
+def main():
+    resumes = [long_resume(i) for i in range(REQUESTS)]
+    workers = min(4, os.cpu_count() or 1)
+    setups = [
+        ('inline', ATSExecutor()),
+        (f'pool, {workers} workers, queue {CLIENTS}', ATSExecutor(workers=workers, queue_size=CLIENTS)),
+        (f'pool, {workers} workers, queue {workers}', ATSExecutor(workers=workers, queue_size=workers))
+    ]
+
+    rows = []
+    for label, executor in setups:
+        try:
+            load_test(executor, resumes[:CLIENTS])  # warm up the workers
+            completed, rejected, wall = load_test(executor, resumes)
+        finally:
+            executor.shutdown()
+        stats = summarize(completed)
+        rows.append([label, len(completed) / wall, stats['p50'], stats['p99'], rejected])
+
+    print_table(f'{REQUESTS} ATS analyses from {CLIENTS} concurrent clients ({os.cpu_count()} CPUs)',
+                ['mode', 'req/s', 'p50 ms', 'p99 ms', 'rejected (503)'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Career Lookup Benchmark
+p50/p99 latency of /recommend and /career with the precomputed career
+index versus the per-request DataFrame filtering it replaced
+
+Both routes read the table the loaded Recommender keeps in its `careers`
+attribute, so that is what gets swapped. /recommend is dominated by
+predict_proba, so the lookup change shows mostly in /career and in the
+single-lookup table. The /career page cache is switched off so every
+request does the lookup.
+"""
+
+import os
+
+import pandas as pd
+
+from bench_utils import SERVICE_DIR, measure, print_table
+
+import app as service
+from career_index import parse_topics
+from response_cache import ResponseCache
+
+PROFILE = {
+    'Class/Grade': '12th',
+    'Skills': 'Python, Machine Learning, SQL',
+    'Interests': 'Data Science',
+    'Hobbies': 'Reading Tech Blogs',
+    'Passion': 'Solving Problems',
+    'Favourite Subject': 'Mathematics'
+}
+
+
+class DataFrameLookup:
+    """The boolean-mask lookups the routes ran before the career index"""
+
+    def __init__(self, df):
+        self.df = df
+
+    def get(self, name):
+        df = self.df
+        rows = df[df['Recommended Career'] == name]
+        if rows.empty:
+            rows = df[df['Recommended Career'].str.lower() == name.lower()]
+        if rows.empty:
+            return None
+        return LegacyRecord(name, rows.iloc[0])
+
+
+class LegacyRecord:
+    """Adapts a DataFrame row to the CareerRecord attributes the routes read"""
+
+    def __init__(self, name, row):
+        self.name = name
+        self.salary = int(row['Salary'])
+        self.job_security = row['Job Security']
+        self.job_description = row['Job Description']
+        self.topics = parse_topics(row['Topics to Be Covered'])
+
+    def short_description(self, limit=150):
+        text = str(self.job_description)
+        return text[:limit] + '...' if len(text) > limit else text
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'salary': self.salary,
+            'job_security': self.job_security,
+            'job_description': self.job_description,
+            'topics': list(self.topics)
+        }
+
+
+def time_routes(client, careers):
+    """Latency of both routes, cycling through careers for /career"""
+    names = iter(careers * 1000)
+    recommend = measure(lambda: client.post('/recommend', data=PROFILE), repeat=300)
+    career = measure(lambda: client.get('/career', query_string={'name': next(names)}), repeat=300)
+    lower = measure(lambda: client.get('/career', query_string={'name': next(names).lower()}), repeat=300)
+    return recommend, career, lower
+
+
+def main():
+    df = pd.read_csv(os.path.join(SERVICE_DIR, 'skills.csv'))
+    careers = sorted(df['Recommended Career'].unique())
+    service.page_cache = ResponseCache(maxsize=0)
+    client = service.app.test_client()
+    recommender = service.get_recommender()
+    indexed = service.get_career_index()
+
+    rows = []
+    try:
+        for label, lookup in (('DataFrame filter', DataFrameLookup(df)), ('career index', indexed)):
+            recommender.careers = lookup
+            recommend, career, lower = time_routes(client, careers)
+            rows.append([label, recommend['p50'], recommend['p99'], career['p50'], career['p99'],
+                         lower['p50'], lower['p99']])
+    finally:
+        recommender.careers = indexed
+
+    legacy = DataFrameLookup(df)
+    names = iter(careers * 10000)
+    lookup_rows = [
+        ['DataFrame filter', measure(lambda: legacy.get(next(names)), repeat=1000)['p50'] * 1000],
+        ['career index', measure(lambda: indexed.get(next(names)), repeat=1000)['p50'] * 1000]
+    ]
+
+    print(f"{len(df)} rows, {len(careers)} careers")
+    print_table('Route latency in ms (Flask test client)',
+                ['lookup', '/recommend p50', '/recommend p99', '/career p50', '/career p99',
+                 '/career lowercase p50', '/career lowercase p99'],
+                rows)
+    print_table('Single lookup, p50 in microseconds', ['lookup', 'p50'], lookup_rows)
+
+
+if __name__ == '__main__':
+    main()
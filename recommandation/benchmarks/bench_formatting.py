@@ -0,0 +1,73 @@
+"""
+Formatting Scanner Benchmark
+Compares the counting formatting scan with the separate regex and
+per-character passes it replaced, on 50 KB resume texts
+"""
+
+import re
+
+from bench_utils import measure, print_table
+
+from ats_analyzer import ATSAnalyzer
+
+TARGET_BYTES = 50 * 1024
+
+PARAGRAPHS = {
+    'plain ASCII': (
+        "Senior software engineer with eight years of experience building Python and Go services. "
+        "Contact jane.doe@example.com or +1 (555) 010-0199. Led a team of six; improved latency by 40%. "
+    ),
+    'bullets and symbols': (
+        "• Designed REST APIs in Django®   • Cut build times by 60%   ★ Employee of the year. "
+        "Reach me at jane.doe@example.com. "
+    ),
+    'Devanagari': (
+        "वरिष्ठ सॉफ्टवेयर "
+        "इंजीनियर, Python और AWS का "
+        "अनुभव। "
+    )
+}
+
+
+def legacy_formatting(resume_text):
+    """The formatting checks as they ran before the scanner"""
+    score = 25
+    suggestions = []
+    special_char_count = sum(1 for char in resume_text if char in ATSAnalyzer.UNFRIENDLY_CHARACTERS)
+    if special_char_count > 0:
+        score -= min(5, special_char_count)
+        suggestions.append(f"Remove {special_char_count} special characters - ATS systems may not parse them correctly")
+    if len(re.findall(r'  {2,}', resume_text)) > 10:
+        score -= 5
+        suggestions.append("Reduce excessive spacing - Use single spaces between words")
+    if len(re.findall(r'[^\x00-\x7F]', resume_text)) > 5:
+        score -= 5
+        suggestions.append("Remove non-ASCII characters - ATS systems work best with standard characters")
+    if not re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', resume_text):
+        score -= 3
+        suggestions.append("Add a valid email address in standard format")
+    if not re.findall(r'[\d\-\+\(\) ]{10,}', resume_text):
+        score -= 2
+        suggestions.append("Add a phone number in a standard format")
+    return max(0, score), suggestions
+
+
+def main():
+    analyzer = ATSAnalyzer()
+    rows = []
+    for label, paragraph in PARAGRAPHS.items():
+        text = paragraph * (TARGET_BYTES // len(paragraph.encode('utf-8')) + 1)
+        assert analyzer._score_formatting(text) == legacy_formatting(text)
+
+        legacy = measure(lambda: legacy_formatting(text), repeat=30)
+        scanner = measure(lambda: analyzer._score_formatting(text), repeat=30)
+        rows.append([label, len(text.encode('utf-8')) // 1024, legacy['p50'], scanner['p50'],
+                     f"{legacy['p50'] / scanner['p50']:.1f}x"])
+
+    print_table('Formatting score of a 50 KB resume',
+                ['text', 'KB', 'separate passes ms', 'scanner ms', 'speedup'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
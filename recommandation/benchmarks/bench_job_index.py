@@ -0,0 +1,79 @@
+"""
+Job Posting Index Benchmark
+Latency of finding the best postings for one resume among 2,000 postings
+with the inverted job index versus calling analyze_job_match per posting
+"""
+
+import os
+import random
+import shutil
+import tempfile
+import time
+
+from bench_utils import SERVICE_DIR, measure, print_table
+
+from ats_analyzer import ATSAnalyzer
+from job_index import create_index, open_index
+from job_matcher import read_postings
+
+POSTINGS = 2000
+
+RESUME_TEXT = (
+    "Backend engineer with six years of experience building Python and Django services. "
+    "Designed REST APIs backed by PostgreSQL and Redis, deployed with Docker and Kubernetes on AWS, "
+    "and automated CI/CD with Jenkins. Mentored junior developers and led code reviews."
+)
+
+
+def synthetic_postings(count, seed=0):
+    """Postings made by recombining sentences of the bundled corpus"""
+    base = list(read_postings(os.path.join(SERVICE_DIR, 'data', 'job_postings.jsonl')))
+    sentences = [sentence.strip() + '.' for posting in base
+                 for sentence in posting['description'].split('.') if sentence.strip()]
+    rng = random.Random(seed)
+    return [{
+        'id': f"job-{i}",
+        'title': rng.choice(base)['title'],
+        'description': ' '.join(rng.sample(sentences, 6))
+    } for i in range(count)]
+
+
+def main():
+    analyzer = ATSAnalyzer()
+    taxonomy = analyzer.taxonomy.current
+    analyzer.JOB_WEIGHTS.current  # learn the weights before timing
+    postings = synthetic_postings(POSTINGS)
+    directory = tempfile.mkdtemp()
+
+    try:
+        start = time.perf_counter()
+        create_index(directory, postings, taxonomy)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        index = open_index(directory)
+        open_ms = (time.perf_counter() - start) * 1000
+
+        descriptions = [f"{posting['title']} {posting['description']}" for posting in postings]
+
+        def per_posting():
+            scored = [(analyzer.analyze_job_match(RESUME_TEXT, description)['match_score'], i)
+                      for i, description in enumerate(descriptions)]
+            return sorted(scored, reverse=True)[:10]
+
+        rows = [
+            ['analyze_job_match per posting', measure(per_posting, repeat=5, warmup=1)],
+            ['job index search, top 10', measure(lambda: index.search(RESUME_TEXT, taxonomy, 10), repeat=200)]
+        ]
+        print_table(f'Best postings for one resume among {POSTINGS} postings',
+                    ['method', 'p50 ms', 'p99 ms'],
+                    [[label, stats['p50'], stats['p99']] for label, stats in rows])
+        print_table('Index maintenance',
+                    ['step', 'ms'],
+                    [[f'build {POSTINGS} postings', build_ms], ['open (memory-mapped)', open_ms]])
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
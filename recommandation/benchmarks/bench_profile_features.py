@@ -0,0 +1,85 @@
+"""
+Profile Feature Benchmark
+Top-3 accuracy and latency of models trained on the Skills column alone
+versus the full profile template, for forests of different sizes and the
+lighter engines
+
+Accuracy uses a stratified 80/20 split of skills.csv. Queries are built
+from the held-out rows with create_user_profile, the way /recommend
+builds them.
+"""
+
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.model_selection import train_test_split
+
+from bench_utils import SERVICE_DIR, measure, print_table
+
+from engines import make_engine
+from features import PROFILE_FIELDS, create_user_profile, csv_profile, training_texts
+from ranking import top_k_indices
+
+EQUAL_WEIGHTS = {field: 1 for field in PROFILE_FIELDS}
+
+FEATURE_SETS = {
+    'skills column': None,
+    'profile, equal weights': EQUAL_WEIGHTS,
+    'profile, skills x3': dict(EQUAL_WEIGHTS, Skills=3),
+    'profile, no grade/subject': dict(EQUAL_WEIGHTS, **{'Class/Grade': 0, 'Favourite Subject': 0})
+}
+
+MODELS = {
+    'forest 100': lambda: RandomForestClassifier(n_estimators=100, random_state=42),
+    'forest 25': lambda: RandomForestClassifier(n_estimators=25, random_state=42),
+    'forest 10': lambda: RandomForestClassifier(n_estimators=10, random_state=42),
+    'linear': lambda: make_engine('linear'),
+    'centroid': lambda: make_engine('centroid')
+}
+
+
+def texts_for(rows, weights):
+    """Training texts; None means the old Skills-only input"""
+    if weights is None:
+        return [row['Skills'] for row in rows]
+    return training_texts(rows, weights)
+
+
+def main():
+    df = pd.read_csv(os.path.join(SERVICE_DIR, 'skills.csv'))
+    train, test = train_test_split(df, test_size=0.2, random_state=42, stratify=df['Recommended Career'])
+    train_rows = train.to_dict('records')
+    test_rows = test.to_dict('records')
+    y_train = train['Recommended Career'].to_numpy()
+    y_test = np.asarray(test['Recommended Career'].to_numpy(), dtype=object)
+
+    rows = []
+    for feature_name, weights in FEATURE_SETS.items():
+        vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+        X_train = vectorizer.fit_transform(texts_for(train_rows, weights))
+        # Queries always arrive as full profiles
+        queries = [create_user_profile(csv_profile(row), weights or EQUAL_WEIGHTS) for row in test_rows]
+        X_test = vectorizer.transform(queries)
+
+        for model_name, factory in MODELS.items():
+            model = factory().fit(X_train, y_train)
+            top = np.asarray(model.classes_, dtype=object)[top_k_indices(model.predict_proba(X_test), 3)]
+            top1 = float((top[:, 0] == y_test).mean())
+            top3 = float((top == y_test[:, None]).any(axis=1).mean())
+            size_kb = len(pickle.dumps(model)) / 1024
+            query = queries[0]
+            latency = measure(lambda: model.predict_proba(vectorizer.transform([query])), repeat=100)
+            rows.append([feature_name, model_name, top1, top3, size_kb, latency['p50'], latency['p99']])
+
+    print(f"{len(train)} training rows, {len(test)} test rows, chance top-3 = {3 / df['Recommended Career'].nunique():.3f}")
+    print_table('Feature sets and models',
+                ['features', 'model', 'top-1 acc', 'top-3 acc', 'size KB', 'request p50 ms', 'request p99 ms'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Resume Ranking Benchmark
+Throughput of ranking 10,000 resumes against one job description with
+rank_resumes versus calling analyze_job_match once per resume
+"""
+
+import random
+import time
+
+from bench_utils import print_table
+
+from ats_analyzer import ATSAnalyzer
+
+SKILLS = ['Python', 'Java', 'JavaScript', 'React', 'Django', 'Flask', 'Docker', 'Kubernetes',
+          'AWS', 'Azure', 'PostgreSQL', 'MongoDB', 'Redis', 'Kafka', 'Spark', 'Terraform',
+          'Linux', 'Go', 'Rust', 'TypeScript', 'GraphQL', 'Jenkins', 'Airflow', 'Pandas']
+
+JOB_DESCRIPTION = (
+    "We are hiring a senior backend engineer to design and operate scalable Python services. "
+    "You will build REST and GraphQL APIs with Django or Flask, run them on Kubernetes in AWS, "
+    "and own PostgreSQL and Redis performance. Experience with Kafka, Terraform, CI/CD in "
+    "Jenkins and mentoring engineers is a strong plus. "
+) * 4
+
+
+def synthetic_resumes(count, seed=0):
+    """Resumes shaped like the Mongo documents the Node.js backend stores"""
+    rng = random.Random(seed)
+    resumes = []
+    for i in range(count):
+        skills = rng.sample(SKILLS, 8)
+        resumes.append({
+            '_id': f"{i:024x}",
+            'personalInfo': {'firstName': 'Candidate', 'lastName': str(i), 'email': f"c{i}@example.com"},
+            'professionalSummary': f"Engineer with {rng.randint(1, 15)} years of experience in {', '.join(skills[:3])}.",
+            'experience': [{
+                'jobTitle': rng.choice(['Software Engineer', 'Backend Developer', 'Data Engineer']),
+                'companyName': f"Company {rng.randint(1, 500)}",
+                'description': f"Built services with {skills[3]} and {skills[4]}; improved reliability and mentored engineers."
+            } for _ in range(3)],
+            'education': [{'degree': 'BSc', 'fieldOfStudy': 'Computer Science', 'schoolName': 'State University'}],
+            'skills': skills
+        })
+    return resumes
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    analyzer = ATSAnalyzer()
+    analyzer.JOB_WEIGHTS.current  # learn the weights before timing
+
+    rows = []
+    for count in (1000, 10000):
+        resumes = synthetic_resumes(count)
+
+        def per_resume():
+            return [analyzer.analyze_job_match(analyzer._get_resume_text(resume), JOB_DESCRIPTION)
+                    for resume in resumes]
+
+        def parse_once():
+            job = analyzer.parse_job_description(JOB_DESCRIPTION)
+            return [analyzer.match_job(analyzer._get_resume_text(resume), job) for resume in resumes]
+
+        for label, func in (('analyze_job_match per resume', per_resume),
+                            ('match_job, JD parsed once', parse_once),
+                            ('rank_resumes top 50', lambda: analyzer.rank_resumes(resumes, JOB_DESCRIPTION, 50)),
+                            ('rank_resumes from generator', lambda: analyzer.rank_resumes(iter(resumes), JOB_DESCRIPTION, 50))):
+            _, seconds = timed(func)
+            rows.append([count, label, seconds * 1000, int(count / seconds)])
+
+    print_table('Ranking resumes against one job description',
+                ['resumes', 'method', 'total ms', 'resumes/s'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
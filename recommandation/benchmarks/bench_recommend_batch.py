@@ -0,0 +1,73 @@
+"""
+Batch Recommendation Benchmark
+Compares one predict_proba call per student (with a full argsort) against
+Recommender.recommend_batch for classroom-sized batches
+
+With only a few dozen careers the top-k selection itself costs
+microseconds either way; the gain comes from one transform and one
+predict_proba per batch instead of per student.
+"""
+
+import csv
+import os
+
+import numpy as np
+
+from bench_utils import SERVICE_DIR, measure, print_table
+
+from artifacts import load_or_build_bundle
+from career_index import CareerIndex
+from features import create_user_profile, csv_profile
+from ranking import top_k_indices
+from recommender import Recommender
+
+
+def load_profiles(limit):
+    """Student profiles taken from skills.csv rows"""
+    profiles = []
+    with open(os.path.join(SERVICE_DIR, 'skills.csv'), newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            profiles.append(csv_profile(row))
+            if len(profiles) == limit:
+                break
+    return profiles
+
+
+def per_profile(bundle, careers, profiles, k=3):
+    """The single-profile path /recommend used before batching"""
+    vectorizer, model = bundle['vectorizer'], bundle['model']
+    results = []
+    for profile in profiles:
+        probs = model.predict_proba(vectorizer.transform([create_user_profile(profile)]))
+        top = [model.classes_[i] for i in probs.argsort()[0][-k:]][::-1]
+        results.append([careers.get(career).to_dict() for career in top])
+    return results
+
+
+def main():
+    bundle = load_or_build_bundle()
+    careers = CareerIndex.from_table(bundle['careers'])
+    recommender = Recommender(bundle['vectorizer'], bundle['model'], careers)
+
+    rows = []
+    for size in (1, 40, 200, 500):
+        profiles = load_profiles(size)
+        repeat = 20 if size <= 200 else 5
+        loop = measure(lambda: per_profile(bundle, careers, profiles), repeat=repeat, warmup=1)
+        batch = measure(lambda: recommender.recommend_batch(profiles, 3), repeat=repeat, warmup=1)
+        rows.append([size, loop['p50'], batch['p50'], loop['p50'] / size, batch['p50'] / size,
+                     f"{loop['p50'] / batch['p50']:.1f}x"])
+
+    scores = np.random.default_rng(0).random((200, len(careers)))
+    sort = measure(lambda: np.argsort(scores, axis=1)[:, -3:], repeat=500)
+    select = measure(lambda: top_k_indices(scores, 3), repeat=500)
+
+    print_table('Recommendations, p50 latency in ms',
+                ['profiles', 'per-profile loop', 'recommend_batch', 'loop ms/profile', 'batch ms/profile', 'speedup'],
+                rows)
+    print_table(f'Top-3 selection over 200 x {len(careers)} scores, p50 in ms',
+                ['method', 'p50'], [['argsort', sort['p50']], ['top_k_indices', select['p50']]])
+
+
+if __name__ == '__main__':
+    main()
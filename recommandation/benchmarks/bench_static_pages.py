@@ -0,0 +1,47 @@
+"""
+Static Page Benchmark
+Throughput of the aptitude test, career page and ATS scoring info routes
+through the Flask test client: rendered on every request (page cache
+disabled), served from the page cache, and revalidated with If-None-Match
+(304 without a body)
+
+In-process there is no network, so a 304 saves only the body bytes
+listed; cached responses cost about as much as an empty Flask route.
+"""
+
+import contextlib
+import io
+
+from bench_utils import measure, print_table
+
+import app as service
+from response_cache import ResponseCache
+
+ROUTES = ['/aptitude_test', '/career?name=Data%20Scientist', '/api/ats-score-info']
+
+
+def main():
+    client = service.app.test_client()
+    cached_pages = service.page_cache
+    rows = []
+    with contextlib.redirect_stdout(io.StringIO()):  # the career route logs every request
+        for url in ROUTES:
+            service.page_cache = ResponseCache(maxsize=0)
+            rendered = measure(lambda: client.get(url), repeat=500)
+
+            service.page_cache = cached_pages
+            first = client.get(url)
+            etag = first.headers['ETag']
+            cached = measure(lambda: client.get(url), repeat=500)
+            not_modified = measure(lambda: client.get(url, headers={'If-None-Match': etag}), repeat=500)
+
+            rows.append([url, 1000 / rendered['mean'], 1000 / cached['mean'], 1000 / not_modified['mean'],
+                         f"{rendered['mean'] / cached['mean']:.1f}x", len(first.get_data())])
+
+    print_table('Requests per second, one thread',
+                ['route', 'rendered', 'cached', '304', 'cached speedup', 'body bytes'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
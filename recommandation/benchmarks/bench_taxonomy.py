@@ -0,0 +1,70 @@
+"""
+Skill Taxonomy Benchmark
+Shows that keyword scoring time stays flat as the taxonomy grows 100x
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from bench_utils import measure, print_table
+
+from ats_analyzer import ATSAnalyzer
+from skill_taxonomy import DEFAULT_TAXONOMY_PATH, TaxonomyStore
+
+RESUME = {
+    'personalInfo': {'firstName': 'Jane', 'lastName': 'Smith', 'email': 'jane@example.com',
+                     'phone': '+1-234-567-8900', 'location': 'Boston, MA'},
+    'professionalSummary': ('Backend engineer working with Python, Go and postgres on k8s. '
+                            'Strong communication and project management. ') * 40,
+    'experience': [{'jobTitle': 'Engineer', 'companyName': f'Company {i}',
+                    'description': 'Built React and Django apps deployed with Docker on AWS. ' * 10}
+                   for i in range(8)],
+    'skills': ['Python', 'Go', 'PostgreSQL', 'Kubernetes', 'React', 'Docker', 'AWS']
+}
+
+
+def grown_taxonomy(factor):
+    """The bundled taxonomy plus generated skills, `factor` times its size"""
+    with open(DEFAULT_TAXONOMY_PATH) as f:
+        data = json.load(f)
+
+    base = sum(len(spec['skills']) for spec in data['categories'].values())
+    extra = base * (factor - 1)
+    generated = {}
+    for i in range(extra):
+        name = f"tool{i} suite" if i % 4 == 0 else f"tool{i}"
+        generated[name] = {'synonyms': [f"t{i}x"]}
+    if generated:
+        data['categories']['generated'] = {'skills': generated}
+    return data
+
+
+def main():
+    rows = []
+    text = ATSAnalyzer()._get_resume_text(RESUME)
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmp:
+        for factor in (1, 10, 100):
+            path = os.path.join(tmp, f'taxonomy_{factor}.json')
+            with open(path, 'w') as f:
+                json.dump(grown_taxonomy(factor), f)
+
+            store = TaxonomyStore(path)
+            start = time.perf_counter()
+            taxonomy = store.current
+            compile_ms = (time.perf_counter() - start) * 1000
+
+            analyzer = ATSAnalyzer(taxonomy=store)
+            stats = measure(lambda: analyzer.analyze_keywords(text, RESUME), repeat=200)
+            baseline = baseline or stats['p50']
+            rows.append([factor, taxonomy.skill_count + taxonomy.synonym_count, compile_ms,
+                         stats['p50'], stats['p99'], f"{stats['p50'] / baseline:.2f}x"])
+
+    print_table(f'analyze_keywords on a {len(text) // 1024} KB resume, latency in ms',
+                ['growth', 'terms', 'compile', 'p50', 'p99', 'p50 vs 1x'], rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark Utilities
+Small timing helpers shared by the benchmark scripts in this directory
+
+Run the scripts from the recommandation/ directory, for example:
+    python benchmarks/bench_keyword_matcher.py
+"""
+
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+# Make the service modules importable when a script is run directly
+SERVICE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if SERVICE_DIR not in sys.path:
+    sys.path.insert(0, SERVICE_DIR)
+
+
+def measure(func: Callable[[], object], repeat: int = 50, warmup: int = 3) -> Dict[str, float]:
+    """
+    Time repeated calls of a zero-argument function
+
+    Args:
+        func (Callable): Function to time
+        repeat (int): Number of timed calls
+        warmup (int): Untimed calls made first
+
+    Returns:
+        Dict[str, float]: Latency statistics in milliseconds
+    """
+    for _ in range(warmup):
+        func()
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return summarize(samples)
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """
+    Summarize latency samples
+
+    Args:
+        samples (List[float]): Latencies in milliseconds
+
+    Returns:
+        Dict[str, float]: min, mean, p50, p99 and max in milliseconds
+    """
+    ordered = sorted(samples)
+    return {
+        'min': ordered[0],
+        'mean': statistics.fmean(ordered),
+        'p50': percentile(ordered, 50),
+        'p99': percentile(ordered, 99),
+        'max': ordered[-1],
+        'runs': len(ordered)
+    }
+
+
+def percentile(ordered: List[float], pct: float) -> float:
+    """
+    Nearest-rank percentile of already sorted samples
+
+    Args:
+        ordered (List[float]): Sorted samples
+        pct (float): Percentile between 0 and 100
+
+    Returns:
+        float: The percentile value
+    """
+    if not ordered:
+        return 0.0
+    rank = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[rank]
+
+
+def print_table(title: str, columns: List[str], rows: List[List[object]]) -> None:
+    """
+    Print results as an aligned text table
+
+    Args:
+        title (str): Table heading
+        columns (List[str]): Column names
+        rows (List[List[object]]): Table rows
+    """
+    cells = [[format_cell(value) for value in row] for row in rows]
+    widths = [max(len(column), *(len(row[i]) for row in cells)) if cells else len(column)
+              for i, column in enumerate(columns)]
+
+    print(f"\n{title}")
+    print('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    print('  '.join('-' * width for width in widths))
+    for row in cells:
+        print('  '.join(value.ljust(width) for value, width in zip(row, widths)))
+
+
+def format_cell(value: object) -> str:
+    """Format a table cell, keeping floats short"""
+    if isinstance(value, float):
+        return f"{value:.3f}"
+    return str(value)
@@ -0,0 +1,170 @@
+"""
+Server Load Benchmark
+Requests per second and memory of the service under concurrent load:
+the Flask development server (`python app.py`) versus gunicorn with the
+models loaded once in the master (preload_app) and with every worker
+loading its own copy
+
+Each server is started as a subprocess on a free port and driven by
+CLIENTS threads for DURATION seconds with a mix of recommendation, career
+lookup and ATS analysis requests. Memory is read from /proc afterwards:
+RSS and private (unshared) memory per worker, and the PSS of all server
+processes together, which counts shared pages once. Linux only.
+
+    python benchmarks/bench_wsgi.py [workers]
+"""
+
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_utils import SERVICE_DIR, print_table
+
+from bench_incremental import resume
+
+CLIENTS = 8
+DURATION = 15.0
+STARTUP_TIMEOUT = 120.0
+
+PROFILE = urllib.parse.urlencode({
+    'Class/Grade': '12th',
+    'Skills': 'Python, Machine Learning, SQL',
+    'Interests': 'Data Science',
+    'Hobbies': 'Reading Tech Blogs',
+    'Passion': 'Solving Problems',
+    'Favourite Subject': 'Mathematics'
+}).encode()
+
+RESUME = json.dumps({'resume_data': resume(3, 2)}).encode()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def requests_for(base):
+    """The request mix, as urllib Request factories"""
+    return [
+        lambda: urllib.request.Request(f'{base}/recommend', data=PROFILE),
+        lambda: urllib.request.Request(f'{base}/career?name=Data%20Scientist'),
+        lambda: urllib.request.Request(f'{base}/api/analyze-ats', data=RESUME,
+                                       headers={'Content-Type': 'application/json'})
+    ]
+
+
+def wait_until_ready(base, process):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            with urllib.request.urlopen(f'{base}/career?name=Data%20Scientist', timeout=2):
+                return
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError("Server did not start in time")
+
+
+def load(base):
+    """Send requests from CLIENTS threads for DURATION seconds; returns (completed, errors)"""
+    factories = requests_for(base)
+    deadline = time.monotonic() + DURATION
+
+    def client(number):
+        completed = errors = 0
+        while time.monotonic() < deadline:
+            request = factories[(number + completed + errors) % len(factories)]()
+            try:
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    response.read()
+                completed += 1
+            except OSError:
+                errors += 1
+        return completed, errors
+
+    with ThreadPoolExecutor(CLIENTS) as clients:
+        results = list(clients.map(client, range(CLIENTS)))
+    return sum(done for done, _ in results), sum(failed for _, failed in results)
+
+
+def process_tree(pid):
+    """pid and all its descendants"""
+    parents = {}
+    for entry in os.listdir('/proc'):
+        if entry.isdigit():
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    parents[int(entry)] = int(f.read().rsplit(')', 1)[1].split()[1])
+            except OSError:
+                continue
+    tree = [pid]
+    for current in tree:
+        tree.extend(child for child, parent in parents.items() if parent == current)
+    return tree
+
+
+def memory_mb(pid):
+    """RSS, PSS and private memory of one process in MB, from smaps_rollup"""
+    fields = {}
+    with open(f'/proc/{pid}/smaps_rollup') as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == 'kB':
+                fields[parts[0].rstrip(':')] = int(parts[1]) / 1024
+    private = fields.get('Private_Clean', 0) + fields.get('Private_Dirty', 0)
+    return fields.get('Rss', 0), fields.get('Pss', 0), private
+
+
+def run_server(label, command, env):
+    port = free_port()
+    base = f'http://127.0.0.1:{port}'
+    env = dict(os.environ, **env, BIND=f'127.0.0.1:{port}', PORT=str(port))
+    process = subprocess.Popen(command, cwd=SERVICE_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                               start_new_session=True)
+    try:
+        wait_until_ready(base, process)
+        completed, errors = load(base)
+        pids = process_tree(process.pid)
+        memory = [memory_mb(pid) for pid in pids]
+    finally:
+        os.killpg(process.pid, signal.SIGTERM)
+        process.wait(timeout=30)
+
+    # The gunicorn master and the reloader parent serve no requests
+    workers = memory[1:] if len(memory) > 1 else memory
+    return [
+        label,
+        round(completed / DURATION, 1),
+        errors,
+        len(workers),
+        sum(rss for rss, _, _ in workers) / len(workers),
+        sum(private for _, _, private in workers) / len(workers),
+        sum(pss for _, pss, _ in memory)
+    ]
+
+
+def main():
+    workers = sys.argv[1] if len(sys.argv) > 1 else str(os.cpu_count() or 1)
+    gunicorn = [sys.executable, '-m', 'gunicorn', 'wsgi:application']
+    setups = [
+        ('python app.py (dev server)', [sys.executable, 'app.py'], {}),
+        (f'gunicorn, {workers} workers, no preload', gunicorn, {'WEB_CONCURRENCY': workers, 'WEB_PRELOAD': '0'}),
+        (f'gunicorn, {workers} workers, preload', gunicorn, {'WEB_CONCURRENCY': workers})
+    ]
+    rows = [run_server(*setup) for setup in setups]
+    print_table(f'{CLIENTS} clients for {DURATION:.0f}s (recommend, career, analyze-ats)',
+                ['server', 'req/s', 'errors', 'workers', 'RSS/worker MB', 'private/worker MB', 'total PSS MB'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
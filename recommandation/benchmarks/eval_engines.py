@@ -0,0 +1,76 @@
+"""
+Recommender Engine Evaluation
+Accuracy, model size, load time and per-request latency of every engine
+in engines.py on skills.csv
+
+Accuracy is measured on a stratified 80/20 split; the other columns use
+a model trained on the split's training rows and saved the same way the
+artifact bundle stores it.
+"""
+
+import os
+import tempfile
+import time
+
+import joblib
+import pandas as pd
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.model_selection import train_test_split
+
+from bench_utils import SERVICE_DIR, measure, print_table
+
+from engines import ENGINES, make_engine
+from ranking import top_k_indices
+
+PROFILE = "Class/Grade: 12th Skills: Python, Machine Learning, SQL Interests: Data Science " \
+          "Hobbies: Reading Tech Blogs Passion: Solving Problems Favourite Subject: Mathematics"
+
+
+def evaluate(name, X_train, X_test, y_train, y_test, vectorizer, tmpdir):
+    """Train one engine and collect its metrics"""
+    model = make_engine(name)
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    train_ms = (time.perf_counter() - start) * 1000
+
+    probs = model.predict_proba(X_test)
+    top = model.classes_[top_k_indices(probs, 3)]
+    accuracy = float((top[:, 0] == y_test).mean())
+    top3 = float((top == y_test[:, None]).any(axis=1).mean())
+
+    path = os.path.join(tmpdir, f'{name}.joblib')
+    joblib.dump(model, path)
+    size_kb = os.path.getsize(path) / 1024
+    load = measure(lambda: joblib.load(path, mmap_mode='r'), repeat=10, warmup=1)
+
+    single = measure(lambda: model.predict_proba(vectorizer.transform([PROFILE])), repeat=200)
+    batch_texts = [PROFILE] * 200
+    batch = measure(lambda: model.predict_proba(vectorizer.transform(batch_texts)), repeat=20)
+
+    return [name, accuracy, top3, train_ms, size_kb, load['p50'], single['p50'], single['p99'], batch['p50']]
+
+
+def main():
+    df = pd.read_csv(os.path.join(SERVICE_DIR, 'skills.csv'))
+    train, test = train_test_split(df, test_size=0.2, random_state=42, stratify=df['Recommended Career'])
+
+    vectorizer = TfidfVectorizer(max_features=1000, stop_words='english')
+    X_train = vectorizer.fit_transform(train['Skills'])
+    X_test = vectorizer.transform(test['Skills'])
+    y_train = train['Recommended Career'].to_numpy()
+    y_test = test['Recommended Career'].to_numpy()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        rows = [evaluate(name, X_train, X_test, y_train, y_test, vectorizer, tmpdir) for name in ENGINES]
+
+    careers = df['Recommended Career'].nunique()
+    print(f"{len(train)} training rows, {len(test)} test rows, {careers} careers")
+    print(f"Chance: accuracy {1 / careers:.3f}, top-3 {min(3 / careers, 1):.3f}")
+    print_table('Recommender engines',
+                ['engine', 'accuracy', 'top-3 acc', 'train ms', 'size KB', 'load ms',
+                 'request p50 ms', 'request p99 ms', '200 profiles ms'],
+                rows)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+"""
+Benchmark Suite
+Named, repeatable benchmarks of the recommendation service, stored as JSON
+so that runs on different commits can be compared
+
+    python benchmarks/suite.py list
+    python benchmarks/suite.py run                    # -> benchmarks/results/<commit>.json
+    python benchmarks/suite.py run --filter api. --quick
+    python benchmarks/suite.py compare benchmarks/results/<base>.json benchmarks/results/<head>.json
+
+A benchmark is a setup function registered under a dotted name. Setup
+prepares the inputs (untimed) and returns the zero-argument callable that
+is timed. `compare` lists the p50 change of every benchmark both runs have
+and exits with status 1 when one got slower by more than --threshold.
+
+The bench_*.py scripts next to this file compare an optimization with the
+code it replaced; this suite tracks the current code over time.
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+from typing import Callable, Dict, List, Optional
+
+from bench_utils import SERVICE_DIR, measure, print_table
+
+RESULTS_DIR = os.path.join(SERVICE_DIR, 'benchmarks', 'results')
+DEFAULT_THRESHOLD = 0.10
+
+# name -> (setup, repeat, warmup)
+BENCHMARKS: Dict[str, tuple] = {}
+
+
+def register(name: str, setup: Callable[[], Callable[[], object]], repeat: int = 50, warmup: int = 3) -> None:
+    """
+    Add a benchmark to the suite
+
+    Args:
+        name (str): Unique dotted name, e.g. 'ats.analyze_resume[large]'
+        setup (Callable): Prepares inputs and returns the function to time
+        repeat (int): Timed calls
+        warmup (int): Untimed calls made first
+    """
+    if name in BENCHMARKS:
+        raise ValueError(f"Duplicate benchmark name: {name}")
+    BENCHMARKS[name] = (setup, repeat, warmup)
+
+
+def benchmark(name: str, repeat: int = 50, warmup: int = 3):
+    """Decorator form of register()"""
+    def decorate(setup):
+        register(name, setup, repeat, warmup)
+        return setup
+    return decorate
+
+
+# ---------------------------------------------------------------------------
+# ATS analysis
+
+RESUME_SIZES = (('small', 1, 1), ('medium', 3, 2), ('large', 6, 20))
+JOB_DESCRIPTION_WORDS = (200, 1000, 5000)
+
+
+def _analyze_resume(jobs, paragraphs):
+    def setup():
+        from ats_analyzer import ATSAnalyzer
+        from bench_incremental import resume
+        analyzer = ATSAnalyzer()
+        resume_data = resume(jobs, paragraphs)
+        return lambda: analyzer.analyze_resume(resume_data)
+    return setup
+
+
+for _size, _jobs, _paragraphs in RESUME_SIZES:
+    register(f'ats.analyze_resume[{_size}]', _analyze_resume(_jobs, _paragraphs))
+
+
+def _analyze_job_match(words):
+    def setup():
+        from ats_analyzer import ATSAnalyzer
+        from bench_job_match import RESUME, job_description
+        analyzer = ATSAnalyzer()
+        text = job_description(words)
+        return lambda: analyzer.analyze_job_match(RESUME, text)
+    return setup
+
+
+for _words in JOB_DESCRIPTION_WORDS:
+    register(f'ats.analyze_job_match[{_words} words]', _analyze_job_match(_words), repeat=20)
+
+
+# ---------------------------------------------------------------------------
+# Career recommendations
+
+def _recommender():
+    from artifacts import load_or_build_bundle
+    from career_index import CareerIndex
+    from recommender import Recommender
+    bundle = load_or_build_bundle()
+    return Recommender(bundle['vectorizer'], bundle['model'], CareerIndex.from_table(bundle['careers']))
+
+
+def _recommend(count):
+    def setup():
+        from bench_recommend_batch import load_profiles
+        recommender = _recommender()
+        profiles = load_profiles(count)
+        return lambda: recommender.recommend_batch(profiles)
+    return setup
+
+
+register('recommend.inference[1 profile]', _recommend(1))
+register('recommend.inference[30 profiles]', _recommend(30), repeat=20)
+
+
+@benchmark('career.lookup', repeat=1000)
+def career_lookup():
+    careers = _recommender().careers
+    names = [record.name for record in careers] * 2
+    position = iter(range(10 ** 9))
+    return lambda: careers.get(names[next(position) % len(names)])
+
+
+@benchmark('career.lookup[lowercase]', repeat=1000)
+def career_lookup_lowercase():
+    careers = _recommender().careers
+    names = [record.name.lower() for record in careers]
+    position = iter(range(10 ** 9))
+    return lambda: careers.get(names[next(position) % len(names)])
+
+
+# ---------------------------------------------------------------------------
+# Startup
+
+@benchmark('startup.load_bundle', repeat=10, warmup=1)
+def startup_load_bundle():
+    from artifacts import default_bundle_path, load_bundle, load_or_build_bundle
+    load_or_build_bundle()  # make sure the bundle exists before timing loads
+    path = default_bundle_path()
+    return lambda: load_bundle(path)
+
+
+@benchmark('startup.import_app', repeat=3, warmup=1)
+def startup_import_app():
+    command = [sys.executable, '-c', 'import app']
+
+    def start():
+        subprocess.run(command, cwd=SERVICE_DIR, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return start
+
+
+# ---------------------------------------------------------------------------
+# Flask endpoints, through the test client
+
+PROFILE = {
+    'Class/Grade': '12th',
+    'Skills': 'Python, Machine Learning, SQL',
+    'Interests': 'Data Science',
+    'Hobbies': 'Reading Tech Blogs',
+    'Passion': 'Solving Problems',
+    'Favourite Subject': 'Mathematics'
+}
+
+
+def _client():
+    import app as service
+    return service.app.test_client()
+
+
+def _checked(call):
+    """Fail setup instead of timing an error response"""
+    response = call()
+    if response.status_code != 200:
+        raise RuntimeError(f"Benchmark request failed with HTTP {response.status_code}")
+    return call
+
+
+@benchmark('api.recommend')
+def api_recommend():
+    client = _client()
+    return _checked(lambda: client.post('/recommend', data=PROFILE))
+
+
+@benchmark('api.career', repeat=200)
+def api_career():
+    client = _client()
+    return _checked(lambda: client.get('/career', query_string={'name': 'Data Scientist'}))
+
+
+@benchmark('api.aptitude_test', repeat=200)
+def api_aptitude_test():
+    client = _client()
+    return _checked(lambda: client.get('/aptitude_test'))
+
+
+@benchmark('api.ats_score_info', repeat=200)
+def api_ats_score_info():
+    client = _client()
+    return _checked(lambda: client.get('/api/ats-score-info'))
+
+
+@benchmark('api.analyze_ats[cached]', repeat=200)
+def api_analyze_ats_cached():
+    from bench_incremental import resume
+    client = _client()
+    body = {'resume_data': resume(3, 2)}
+    return _checked(lambda: client.post('/api/analyze-ats', json=body))
+
+
+@benchmark('api.analyze_ats[uncached]')
+def api_analyze_ats_uncached():
+    from bench_incremental import resume
+    client = _client()
+    resume_data = resume(3, 2)
+    counter = iter(range(10 ** 9))
+
+    def call():
+        # A new summary each time misses the result cache
+        resume_data['professionalSummary'] = f"Backend engineer, revision {next(counter)}"
+        return client.post('/api/analyze-ats', json={'resume_data': resume_data})
+    return _checked(call)
+
+
+@benchmark('api.job_postings_match', repeat=100)
+def api_job_postings_match():
+    from bench_incremental import resume
+    client = _client()
+    body = {'resume_data': resume(3, 2), 'top_k': 10}
+    return _checked(lambda: client.post('/api/job-postings/match', json=body))
+
+
+# ---------------------------------------------------------------------------
+# Running and comparing
+
+def git_commit() -> str:
+    """Short commit id of the working tree, with '-dirty' for uncommitted changes"""
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=SERVICE_DIR, capture_output=True, text=True).stdout.strip()
+    commit = git('rev-parse', '--short', 'HEAD') or 'unknown'
+    return commit + '-dirty' if git('status', '--porcelain', '--untracked-files=no', '--', '.') else commit
+
+
+def run(names: List[str], quick: bool = False) -> Dict:
+    """
+    Run benchmarks
+
+    Args:
+        names (List[str]): Benchmarks to run, in order
+        quick (bool): Run a fifth of the repetitions
+
+    Returns:
+        Dict: Environment description and per-benchmark latency statistics in ms
+    """
+    results = {}
+    for name in names:
+        setup, repeat, warmup = BENCHMARKS[name]
+        if quick:
+            repeat = max(3, repeat // 5)
+        print(f"[BENCH] {name}", file=sys.stderr, flush=True)
+        # Keep the service's request logging out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[name] = measure(setup(), repeat=repeat, warmup=warmup)
+    return {
+        'commit': git_commit(),
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'quick': quick,
+        'benchmarks': results
+    }
+
+
+def compare(base: Dict, head: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[List[object]]:
+    """
+    p50 change of every benchmark present in both runs
+
+    Args:
+        base (Dict): Earlier run() result
+        head (Dict): Later run() result
+        threshold (float): Relative change reported as slower or faster
+
+    Returns:
+        List[List[object]]: [name, base p50, head p50, change, verdict] rows
+    """
+    rows = []
+    for name, stats in head['benchmarks'].items():
+        before = base['benchmarks'].get(name)
+        if before is None:
+            continue
+        change = stats['p50'] / before['p50'] - 1 if before['p50'] > 0 else 0.0
+        verdict = 'slower' if change > threshold else 'faster' if change < -threshold else ''
+        rows.append([name, before['p50'], stats['p50'], f"{change:+.1%}", verdict])
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Recommendation service benchmark suite')
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help='List benchmark names')
+    run_parser = commands.add_parser('run', help='Run benchmarks and store the results as JSON')
+    run_parser.add_argument('--filter', default='', help='Only benchmarks whose name contains this text')
+    run_parser.add_argument('--quick', action='store_true', help='Fewer repetitions, for a fast check')
+    run_parser.add_argument('--output', help='Result file (default: benchmarks/results/<commit>.json)')
+    compare_parser = commands.add_parser('compare', help='Compare two result files')
+    compare_parser.add_argument('base')
+    compare_parser.add_argument('head')
+    compare_parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                                help='Relative p50 change that counts as a regression (default 0.10)')
+    args = parser.parse_args(argv)
+
+    if args.command == 'list':
+        for name in BENCHMARKS:
+            print(name)
+        return 0
+
+    if args.command == 'compare':
+        with open(args.base, encoding='utf-8') as f:
+            base = json.load(f)
+        with open(args.head, encoding='utf-8') as f:
+            head = json.load(f)
+        rows = compare(base, head, args.threshold)
+        print_table(f"p50 in ms, {base['commit']} -> {head['commit']}",
+                    ['benchmark', 'base', 'head', 'change', ''], rows)
+        return 1 if any(row[4] == 'slower' for row in rows) else 0
+
+    names = [name for name in BENCHMARKS if args.filter in name]
+    if not names:
+        print(f"No benchmark matches '{args.filter}'", file=sys.stderr)
+        return 1
+    report = run(names, args.quick)
+
+    path = args.output or os.path.join(RESULTS_DIR, f"{report['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print_table(f"Benchmarks at {report['commit']} (ms)", ['benchmark', 'p50', 'p99', 'runs'],
+                [[name, stats['p50'], stats['p99'], stats['runs']] for name, stats in report['benchmarks'].items()])
+    print(f"\nResults written to {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""
+Career Index Module
+Precomputed career lookup table used by the recommendation routes
+
+skills.csv holds many rows per career; the routes only ever need the
+first row's salary, job security, description and topics. The index is
+built once at startup so a lookup is a dict access instead of a boolean
+mask over every row. Repeated strings (job security levels, topic names)
+are interned so every record shares one copy.
+"""
+
+import sys
+from typing import Dict, Iterator, List, Optional
+
+
+class CareerRecord:
+    """Display data for one career"""
+
+    __slots__ = ('name', 'salary', 'job_security', 'job_description', 'topics')
+
+    def __init__(self, name: str, salary: int, job_security: str, job_description: str, topics: tuple):
+        self.name = name
+        self.salary = salary
+        self.job_security = job_security
+        self.job_description = job_description
+        self.topics = topics
+
+    def short_description(self, limit: int = 150) -> str:
+        """
+        Job description truncated for recommendation cards
+
+        Args:
+            limit (int): Maximum number of characters kept
+
+        Returns:
+            str: The description, with '...' appended if it was cut
+        """
+        if len(self.job_description) > limit:
+            return self.job_description[:limit] + '...'
+        return self.job_description
+
+    def to_dict(self) -> Dict:
+        """JSON-serializable form of the record"""
+        return {
+            'name': self.name,
+            'salary': self.salary,
+            'job_security': self.job_security,
+            'job_description': self.job_description,
+            'topics': list(self.topics)
+        }
+
+
+class CareerIndex:
+    """
+    Read-only mapping from career name to CareerRecord
+
+    Lookups try the exact name first and then a case- and
+    whitespace-insensitive form, matching how /career resolves names.
+    """
+
+    def __init__(self, records: List[CareerRecord]):
+        """
+        Args:
+            records (List[CareerRecord]): One record per career; the first record wins on duplicates
+        """
+        self._exact = {}
+        self._normalized = {}
+        for record in records:
+            self._exact.setdefault(record.name, record)
+            self._normalized.setdefault(normalize_career_name(record.name), record)
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def __iter__(self) -> Iterator[CareerRecord]:
+        return iter(self._exact.values())
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def get(self, name: str) -> Optional[CareerRecord]:
+        """
+        Find a career by name
+
+        Args:
+            name (str): Career name as shown to users or predicted by the model
+
+        Returns:
+            CareerRecord: The record, or None if the career is unknown
+        """
+        record = self._exact.get(name)
+        if record is None and name:
+            record = self._normalized.get(normalize_career_name(name))
+        return record
+
+    @classmethod
+    def from_table(cls, careers: Dict[str, Dict]) -> 'CareerIndex':
+        """
+        Build the index from the career table stored in the artifact bundle
+
+        Args:
+            careers (Dict[str, Dict]): Career name to salary, job_security, job_description and topics
+
+        Returns:
+            CareerIndex: The index
+        """
+        return cls([
+            CareerRecord(
+                name=sys.intern(name),
+                salary=int(details['salary']),
+                job_security=sys.intern(details['job_security']),
+                job_description=details['job_description'],
+                topics=parse_topics(details['topics'])
+            )
+            for name, details in careers.items()
+        ])
+
+
+def parse_topics(topics_string: str) -> tuple:
+    """
+    Split the 'Topics to Be Covered' column into individual topics
+
+    Args:
+        topics_string (str): Topics separated by '-', e.g. 'HTML-CSS-React'
+
+    Returns:
+        tuple: Non-empty, stripped topic names
+    """
+    return tuple(sys.intern(topic.strip()) for topic in str(topics_string).split('-') if topic.strip())
+
+
+def normalize_career_name(name: str) -> str:
+    """Case- and whitespace-insensitive form of a career name"""
+    return ' '.join(name.casefold().split())
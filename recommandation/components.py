@@ -0,0 +1,148 @@
+"""
+Components Module
+Service components that are loaded on first use or warmed in the background
+
+The recommendation model is the slowest and largest thing the service
+loads, and ATS-only deployments never use it. A LazyComponent defers such
+a load until it is first needed, can start it on a background thread once
+the server is up, or can be disabled for the whole process.
+
+Load modes (RECOMMENDER_LOAD for the recommender):
+    background  Start loading on a background thread at startup; requests
+                that need it before it is done wait for it (default)
+    lazy        Load on the first request that needs it
+    eager       Load during startup, before the server accepts traffic
+    off         Never load; routes that need it answer 503
+"""
+
+import threading
+import time
+import traceback
+from typing import Callable, Dict, Optional
+
+LOAD_MODES = ('background', 'lazy', 'eager', 'off')
+
+# Component states reported by status()
+NOT_LOADED = 'not_loaded'
+LOADING = 'loading'
+LOADED = 'loaded'
+FAILED = 'failed'
+DISABLED = 'disabled'
+
+
+class ComponentDisabled(Exception):
+    """Raised when a disabled component is requested"""
+
+    def __init__(self, name: str):
+        super().__init__(f"The {name} component is disabled in this process")
+        self.name = name
+
+
+class LazyComponent:
+    """
+    Value created by a loader function once, on demand, thread-safely
+
+    A failed load is recorded and retried by the next get().
+    """
+
+    def __init__(self, name: str, loader: Callable[[], object], mode: str = 'lazy'):
+        """
+        Args:
+            name (str): Component name shown by status()
+            loader (Callable): Builds the value
+            mode (str): One of LOAD_MODES; see start()
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        if mode not in LOAD_MODES:
+            raise ValueError(f"Unknown load mode '{mode}'; expected one of {', '.join(LOAD_MODES)}")
+        self.name = name
+        self.loader = loader
+        self.mode = mode
+        self._value = None
+        self._state = DISABLED if mode == 'off' else NOT_LOADED
+        self._error: Optional[str] = None
+        self._load_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != 'off'
+
+    @property
+    def loaded(self) -> bool:
+        return self._state == LOADED
+
+    def get(self):
+        """
+        The component, loading it first if needed
+
+        Returns:
+            The loaded value
+
+        Raises:
+            ComponentDisabled: If the component is disabled
+            Exception: Whatever the loader raised
+        """
+        if self._state == LOADED:
+            return self._value
+        if not self.enabled:
+            raise ComponentDisabled(self.name)
+        with self._lock:
+            if self._state != LOADED:
+                self._load()
+            return self._value
+
+    def start(self) -> Optional[threading.Thread]:
+        """
+        Apply the load mode at startup: load now (eager), start a background
+        load (background) or do nothing (lazy, off)
+
+        Returns:
+            threading.Thread: The warm-up thread in background mode, else None
+        """
+        if self.mode == 'eager':
+            self.get()
+        elif self.mode == 'background':
+            thread = threading.Thread(target=self._warm, name=f'warm-{self.name}', daemon=True)
+            thread.start()
+            return thread
+        return None
+
+    def status(self) -> Dict:
+        """
+        Load state for the readiness endpoint
+
+        Returns:
+            Dict: 'state', 'mode', 'load_seconds' and 'error'
+        """
+        return {
+            'state': self._state,
+            'mode': self.mode,
+            'load_seconds': None if self._load_seconds is None else round(self._load_seconds, 3),
+            'error': self._error
+        }
+
+    def _load(self) -> None:
+        """Run the loader; call with the lock held"""
+        self._state = LOADING
+        start = time.perf_counter()
+        try:
+            value = self.loader()
+        except Exception as e:
+            self._state = FAILED
+            self._error = str(e)
+            raise
+        self._value = value
+        self._load_seconds = time.perf_counter() - start
+        self._error = None
+        self._state = LOADED
+
+    def _warm(self) -> None:
+        try:
+            self.get()
+            print(f"[COMPONENTS] {self.name} loaded in the background in {self._load_seconds:.2f}s")
+        except Exception:
+            print(f"[COMPONENTS] Background load of {self.name} failed; retrying on first use")
+            traceback.print_exc()
@@ -0,0 +1,118 @@
+"""
+Recommender Engines Module
+Classifiers that can back the career recommender
+
+Every engine is trained on the same TF-IDF features and exposes the
+scikit-learn classifier interface the recommender relies on: fit,
+predict_proba, predict and classes_.
+
+Engines:
+    random_forest  RandomForestClassifier, 100 trees (default)
+    linear         Multinomial logistic regression
+    centroid       Cosine similarity to one L2-normalized centroid per career
+
+Select one with the RECOMMENDER_ENGINE environment variable or
+`python artifacts.py build --engine <name>`.
+"""
+
+import os
+from typing import Callable, Dict
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+# Kept so existing deployments keep their recommendations. On skills.csv
+# every engine scores about chance in benchmarks/eval_engines.py, and
+# linear is far cheaper to serve; see the README
+DEFAULT_ENGINE = 'random_forest'
+
+
+class CentroidClassifier:
+    """
+    Sparse nearest-centroid classifier with cosine similarity
+
+    Each career is represented by the normalized mean of its normalized
+    TF-IDF rows. Scoring a batch is one sparse matrix product; the
+    similarities are rescaled to sum to one so they can be used like
+    predict_proba output.
+    """
+
+    def fit(self, X, y) -> 'CentroidClassifier':
+        """
+        Args:
+            X: TF-IDF matrix of shape (rows, features)
+            y: Career label per row
+
+        Returns:
+            CentroidClassifier: self
+        """
+        X = normalize(sparse.csr_matrix(X))
+        labels = np.asarray(y)
+        self.classes_, codes = np.unique(labels, return_inverse=True)
+
+        # Row i of `membership` averages the rows that belong to class i
+        counts = np.bincount(codes, minlength=len(self.classes_))
+        membership = sparse.csr_matrix(
+            (1.0 / counts[codes], (codes, np.arange(len(codes)))),
+            shape=(len(self.classes_), X.shape[0])
+        )
+        self.centroids_ = normalize(membership @ X).tocsr()
+        self.centroids_.eliminate_zeros()
+        return self
+
+    def decision_function(self, X) -> np.ndarray:
+        """Cosine similarity of every row to every centroid"""
+        similarity = normalize(sparse.csr_matrix(X)) @ self.centroids_.T
+        return np.asarray(similarity.todense())
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Similarities rescaled to sum to one; rows with no overlap are uniform"""
+        scores = self.decision_function(X)
+        totals = scores.sum(axis=1, keepdims=True)
+        uniform = np.full_like(scores, 1.0 / scores.shape[1])
+        return np.divide(scores, totals, out=uniform, where=totals > 0)
+
+    def predict(self, X) -> np.ndarray:
+        """Career with the most similar centroid"""
+        return self.classes_[self.decision_function(X).argmax(axis=1)]
+
+
+def _random_forest():
+    from sklearn.ensemble import RandomForestClassifier
+    return RandomForestClassifier(n_estimators=100, random_state=42)
+
+
+def _linear():
+    from sklearn.linear_model import LogisticRegression
+    return LogisticRegression(max_iter=1000, random_state=42)
+
+
+ENGINES: Dict[str, Callable[[], object]] = {
+    'random_forest': _random_forest,
+    'linear': _linear,
+    'centroid': CentroidClassifier
+}
+
+
+def configured_engine() -> str:
+    """Engine named by RECOMMENDER_ENGINE, or the default"""
+    return os.environ.get('RECOMMENDER_ENGINE') or DEFAULT_ENGINE
+
+
+def make_engine(name: str):
+    """
+    Create an untrained classifier
+
+    Args:
+        name (str): Engine name from ENGINES
+
+    Returns:
+        object: Unfitted classifier
+
+    Raises:
+        ValueError: If the engine name is unknown
+    """
+    if name not in ENGINES:
+        raise ValueError(f"Unknown recommender engine '{name}'; choose from {', '.join(sorted(ENGINES))}")
+    return ENGINES[name]()
@@ -0,0 +1,90 @@
+"""
+Profile Features Module
+Builds the recommender's input text from student profile fields
+
+Training rows from skills.csv and profiles submitted through the form or
+the batch API go through the same template, so the vectorizer sees the
+same vocabulary at training and at query time. Each field's value is
+repeated according to its weight, which scales its TF-IDF term counts.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional
+
+# Form fields that make up a student profile, in template order
+PROFILE_FIELDS = ('Class/Grade', 'Skills', 'Interests', 'Hobbies', 'Passion', 'Favourite Subject')
+
+# skills.csv column holding each form field
+CSV_COLUMNS = {
+    'Class/Grade': 'Grade/Class',
+    'Skills': 'Skills',
+    'Interests': 'Interests',
+    'Hobbies': 'Hobbies',
+    'Passion': 'Passion',
+    'Favourite Subject': 'Favorite Subject'
+}
+
+# How many times each field's value appears in the profile text. On the
+# current skills.csv no weighting beats equal weights (see
+# benchmarks/bench_profile_features.py), and no engine beats chance (see
+# benchmarks/eval_engines.py), so every field counts once.
+FIELD_WEIGHTS = {
+    'Class/Grade': 1,
+    'Skills': 1,
+    'Interests': 1,
+    'Hobbies': 1,
+    'Passion': 1,
+    'Favourite Subject': 1
+}
+
+
+def create_user_profile(user_input: Mapping, weights: Optional[Dict[str, int]] = None) -> str:
+    """
+    Profile text fed to the vectorizer
+
+    Args:
+        user_input (Mapping): Form or JSON fields of one student; missing fields are empty
+        weights (Dict[str, int]): Repetitions per field, FIELD_WEIGHTS by default
+
+    Returns:
+        str: Labelled profile text, e.g. "Class/Grade: 12th Skills: Python, SQL Interests: ..."
+    """
+    weights = FIELD_WEIGHTS if weights is None else weights
+    parts = []
+    for field in PROFILE_FIELDS:
+        value = str(user_input.get(field) or '').strip()
+        repeat = weights.get(field, 1)
+        if repeat > 0:
+            parts.append(f"{field}: " + ' '.join([value] * repeat))
+    return ' '.join(parts)
+
+
+def csv_profile(row: Mapping) -> Dict[str, str]:
+    """
+    Map a skills.csv row onto the form field names
+
+    Args:
+        row (Mapping): Row with the skills.csv column names
+
+    Returns:
+        Dict[str, str]: Profile keyed by PROFILE_FIELDS
+    """
+    profile = {}
+    for field, column in CSV_COLUMNS.items():
+        value = row.get(column)
+        # Empty CSV cells come back from pandas as NaN
+        profile[field] = value if isinstance(value, str) else ''
+    return profile
+
+
+def training_texts(rows: Iterable[Mapping], weights: Optional[Dict[str, int]] = None) -> List[str]:
+    """
+    Profile texts for skills.csv rows, built exactly like query profiles
+
+    Args:
+        rows (Iterable[Mapping]): skills.csv rows, e.g. df.to_dict('records')
+        weights (Dict[str, int]): Repetitions per field, FIELD_WEIGHTS by default
+
+    Returns:
+        List[str]: One profile text per row
+    """
+    return [create_user_profile(csv_profile(row), weights) for row in rows]
@@ -0,0 +1,45 @@
+"""
+Gunicorn Configuration
+Read automatically by `gunicorn wsgi:application` from this directory
+
+Configuration (environment variables):
+    BIND             Address to listen on (default 0.0.0.0:5001, the port the Node app calls)
+    WEB_CONCURRENCY  Worker processes (default: CPU count). Recommendation and
+                     ATS analysis are CPU-bound, so more workers than cores
+                     only adds memory.
+    WEB_THREADS      Threads per worker (default 4); they overlap requests
+                     that wait on I/O, such as job polling and callbacks
+    WEB_TIMEOUT      Seconds before a stuck worker is restarted (default 60)
+    WEB_PRELOAD      Set to 0 to load the models in every worker instead of
+                     once in the master (default 1)
+    ATS_JOB_DB       SQLite file holding the async ATS jobs, shared by all
+                     workers (default artifacts/ats_jobs.sqlite3). Set it
+                     empty to keep jobs in process memory; only possible
+                     with a single worker.
+"""
+
+import os
+
+bind = os.environ.get('BIND', '0.0.0.0:5001')
+workers = int(os.environ.get('WEB_CONCURRENCY') or os.cpu_count() or 1)
+threads = int(os.environ.get('WEB_THREADS') or 4)
+worker_class = 'gthread' if threads > 1 else 'sync'
+timeout = int(os.environ.get('WEB_TIMEOUT') or 60)
+
+# Load the models once in the master and fork the workers from it; see wsgi.py
+preload_app = os.environ.get('WEB_PRELOAD', '1') != '0'
+
+# A client may poll an async ATS job through any worker, so the workers
+# keep jobs in one SQLite file instead of each in its own memory
+os.environ.setdefault('ATS_JOB_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                 'artifacts', 'ats_jobs.sqlite3'))
+
+
+def post_worker_init(worker):
+    """Refuse to start several workers that each keep jobs in their own memory"""
+    import app as service
+    if worker.cfg.workers > 1 and not service.ats_jobs.shared:
+        raise RuntimeError(
+            f"{worker.cfg.workers} workers cannot share async ATS jobs kept in process memory; "
+            "set ATS_JOB_DB to a SQLite file or run a single worker"
+        )
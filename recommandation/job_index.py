@@ -0,0 +1,685 @@
+"""
+Job Posting Index Module
+On-disk inverted index of job postings for matching one resume against many jobs
+
+Each posting is reduced to its keywords (extract_keywords) plus the skills
+the taxonomy finds in it, including short ones such as "aws" or "sql" that
+extract_keywords drops. Matching a resume reads only the posting lists of
+the resume's own terms, so finding the best postings costs a few
+milliseconds instead of one analyze_job_match call per posting.
+
+A posting scores the IDF-weighted share of its terms found in the resume,
+0-100, where IDF is learned from the indexed postings themselves.
+
+Layout (one directory):
+    manifest.json        Format version, taxonomy version, segments, deletions
+    seg-000001/          One immutable segment per build or update:
+        terms.json           Term of each local term id
+        documents.json       Posting id, content hash, title and metadata
+        document_frequency.npy, postings_offsets.npy, postings.npy
+        document_offsets.npy, document_terms.npy
+
+Arrays are memory-mapped when the index is opened. Updates never rewrite a
+segment: new and changed postings go into a new segment and superseded
+ones are marked deleted in the manifest; compact() merges everything back
+into one segment.
+
+Writers (sync, rebuild, compact) hold an exclusive flock on index.lock
+in the index directory, so the server's workers, a taxonomy reload and
+the CLI never update the same index at once. manifest.json is replaced
+last, after the segments it lists are in place, and segments are only
+removed once no manifest refers to them.
+
+Keep the index in step with the posting corpus with:
+    python job_index.py sync
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: concurrent updates are not serialized
+    fcntl = None
+
+from job_matcher import DEFAULT_JOB_CORPUS_PATH, extract_keywords, read_postings
+from ranking import top_k_indices
+from skill_taxonomy import SkillTaxonomy, TaxonomyStore
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Index directory used when ATS_JOB_INDEX_PATH is not set
+DEFAULT_JOB_INDEX_DIR = os.path.join(BASE_DIR, 'artifacts', 'job_index')
+
+# Bump when the on-disk layout changes so old indexes are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+# sync() merges the segments once an update leaves more than this many
+MAX_SEGMENTS = 8
+
+# Optional posting fields returned with every match
+METADATA_FIELDS = ('company', 'location', 'url')
+
+_ARRAYS = ('document_frequency', 'postings_offsets', 'postings', 'document_offsets', 'document_terms')
+
+
+def posting_text(posting: Dict) -> str:
+    """Title and description of a posting as one text"""
+    return f"{posting.get('title') or ''} {posting.get('description') or ''}"
+
+
+def posting_id(posting: Dict) -> str:
+    """
+    Stable id of a posting: its 'id' field, or a hash of its text
+
+    Args:
+        posting (Dict): Posting object
+
+    Returns:
+        str: Posting id
+    """
+    if posting.get('id') is not None:
+        return str(posting['id'])
+    return hashlib.sha1(posting_text(posting).encode('utf-8')).hexdigest()[:16]
+
+
+def index_terms(text: str, taxonomy: SkillTaxonomy) -> List[str]:
+    """
+    Terms a posting or resume is indexed and matched by
+
+    Args:
+        text (str): Posting or resume text
+        taxonomy (SkillTaxonomy): Skill taxonomy
+
+    Returns:
+        List[str]: Unique keywords followed by taxonomy skills not already among them
+    """
+    terms = dict.fromkeys(extract_keywords(text))
+    for _, skill in sorted(taxonomy.matcher.find(text)):
+        terms.setdefault(skill)
+    return list(terms)
+
+
+@contextmanager
+def index_lock(directory: str):
+    """
+    Exclusive lock on the index directory while it is read and updated
+
+    Args:
+        directory (str): Index directory, created if missing
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, 'index.lock'), 'a') as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Closing the file releases the lock
+        yield
+
+
+def _document(posting: Dict, taxonomy: SkillTaxonomy) -> Tuple[Dict, List[str]]:
+    """Stored metadata and index terms of one posting"""
+    text = posting_text(posting)
+    meta = {
+        'id': posting_id(posting),
+        'hash': hashlib.sha1(text.encode('utf-8')).hexdigest(),
+        'title': str(posting.get('title') or '')
+    }
+    for field in METADATA_FIELDS:
+        if posting.get(field) is not None:
+            meta[field] = posting[field]
+    return meta, index_terms(text, taxonomy)
+
+
+def _documents(postings: Iterable[Dict], taxonomy: SkillTaxonomy) -> Dict[str, Tuple[Dict, List[str]]]:
+    """Analyzed postings keyed by id; a later posting with the same id wins"""
+    documents = {}
+    for posting in postings:
+        meta, terms = _document(posting, taxonomy)
+        documents[meta['id']] = (meta, terms)
+    return documents
+
+
+class Segment:
+    """
+    One immutable part of the index: a term dictionary, posting lists
+    (term -> postings) and term lists (posting -> terms)
+    """
+
+    __slots__ = ('name', 'terms', 'vocabulary', 'documents') + _ARRAYS
+
+    def __init__(self, name: str, terms: List[str], documents: List[Dict], arrays: Dict[str, np.ndarray]):
+        self.name = name
+        self.terms = terms
+        self.vocabulary = {term: position for position, term in enumerate(terms)}
+        self.documents = documents
+        for key in _ARRAYS:
+            setattr(self, key, arrays[key])
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def document_term_ids(self, document: int) -> np.ndarray:
+        """Local term ids of one posting"""
+        return self.document_terms[self.document_offsets[document]:self.document_offsets[document + 1]]
+
+    @classmethod
+    def write(cls, directory: str, name: str, documents: List[Tuple[Dict, List[str]]]) -> 'Segment':
+        """
+        Write a segment for already analyzed postings
+
+        The segment is written to a temporary directory and renamed into
+        place, so a crash never leaves a half-written segment behind.
+
+        Args:
+            directory (str): Index directory
+            name (str): Segment directory name
+            documents (List[Tuple[Dict, List[str]]]): Metadata and terms of each posting
+
+        Returns:
+            Segment: The written segment, memory-mapped
+        """
+        terms = sorted({term for _, document_terms in documents for term in document_terms})
+        vocabulary = {term: position for position, term in enumerate(terms)}
+
+        lengths = np.fromiter((len(document_terms) for _, document_terms in documents), dtype=np.int64,
+                              count=len(documents))
+        document_offsets = np.zeros(len(documents) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=document_offsets[1:])
+        document_terms = np.fromiter(
+            (vocabulary[term] for _, terms_of_document in documents for term in terms_of_document),
+            dtype=np.int32, count=int(document_offsets[-1])
+        )
+
+        # Invert the term lists: a stable sort by term keeps each posting list in document order
+        owners = np.repeat(np.arange(len(documents), dtype=np.int32), lengths)
+        document_frequency = np.bincount(document_terms, minlength=len(terms)).astype(np.int32)
+        postings_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(document_frequency, out=postings_offsets[1:])
+        postings = owners[np.argsort(document_terms, kind='stable')]
+
+        arrays = {
+            'document_frequency': document_frequency,
+            'postings_offsets': postings_offsets,
+            'postings': postings,
+            'document_offsets': document_offsets,
+            'document_terms': document_terms
+        }
+
+        staging = tempfile.mkdtemp(prefix=f'.{name}-', dir=directory)
+        try:
+            for key, array in arrays.items():
+                np.save(os.path.join(staging, f'{key}.npy'), array)
+            _write_json(os.path.join(staging, 'terms.json'), terms)
+            _write_json(os.path.join(staging, 'documents.json'), [meta for meta, _ in documents])
+            os.replace(staging, os.path.join(directory, name))
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return cls.load(directory, name)
+
+    @classmethod
+    def load(cls, directory: str, name: str, mmap: bool = True) -> 'Segment':
+        """
+        Open a segment
+
+        Args:
+            directory (str): Index directory
+            name (str): Segment directory name
+            mmap (bool): Memory-map the arrays instead of reading them
+
+        Returns:
+            Segment: The opened segment
+        """
+        path = os.path.join(directory, name)
+        with open(os.path.join(path, 'terms.json'), 'r', encoding='utf-8') as f:
+            terms = json.load(f)
+        with open(os.path.join(path, 'documents.json'), 'r', encoding='utf-8') as f:
+            documents = json.load(f)
+        arrays = {key: np.load(os.path.join(path, f'{key}.npy'), mmap_mode='r' if mmap else None)
+                  for key in _ARRAYS}
+        return cls(name, terms, documents, arrays)
+
+
+class JobIndex:
+    """
+    Read-only view of an index directory
+
+    Updating methods write to disk and return a new JobIndex; the instance
+    they were called on keeps answering queries from the old state. Call
+    them with index_lock() held, as sync_index() and create_index() do.
+    """
+
+    def __init__(self, directory: str, manifest: Dict, segments: List[Segment]):
+        """
+        Args:
+            directory (str): Index directory
+            manifest (Dict): Parsed manifest.json
+            segments (List[Segment]): Opened segments, oldest first
+        """
+        self.directory = directory
+        self.manifest = manifest
+        self.segments = segments
+        self.taxonomy_version = manifest.get('taxonomy_version')
+
+        deleted = manifest.get('deleted', {})
+        self._live = []
+        for segment in segments:
+            live = np.ones(len(segment), dtype=bool)
+            live[deleted.get(segment.name, [])] = False
+            self._live.append(live)
+
+        # Document frequencies across all segments; deleted postings still
+        # count until the next compaction, as in most segment-based indexes
+        frequency = Counter()
+        for segment in segments:
+            frequency.update(dict(zip(segment.terms, segment.document_frequency.tolist())))
+        documents = sum(len(segment) for segment in segments)
+
+        self._idf = []
+        self._norms = []
+        for segment in segments:
+            df = np.fromiter((frequency[term] for term in segment.terms), dtype=np.float64,
+                             count=len(segment.terms))
+            idf = np.log((1 + documents) / (1 + df)) + 1
+            owners = np.repeat(np.arange(len(segment)), np.diff(segment.document_offsets))
+            self._idf.append(idf)
+            self._norms.append(np.bincount(owners, weights=idf[segment.document_terms], minlength=len(segment)))
+
+        self._ids = {}
+        for number, (segment, live) in enumerate(zip(segments, self._live)):
+            for document in np.flatnonzero(live):
+                self._ids[segment.documents[document]['id']] = (number, int(document))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, posting_id: str) -> bool:
+        return posting_id in self._ids
+
+    def hashes(self) -> Dict[str, str]:
+        """Content hash of every live posting, keyed by posting id"""
+        return {posting_id: self.segments[number].documents[document]['hash']
+                for posting_id, (number, document) in self._ids.items()}
+
+    def search(self, text: str, taxonomy: SkillTaxonomy, top_k: int = 10) -> Dict:
+        """
+        Best matching postings for a resume
+
+        Args:
+            text (str): Plain text version of resume
+            taxonomy (SkillTaxonomy): Skill taxonomy the index was built with
+            top_k (int): Number of postings to return
+
+        Returns:
+            Dict: 'results' (best first), 'total_postings' and 'resume_terms'
+        """
+        return self.search_terms(set(index_terms(text, taxonomy)), top_k)
+
+    def search_terms(self, terms: Set[str], top_k: int = 10) -> Dict:
+        """
+        Best matching postings for a set of resume terms
+
+        Args:
+            terms (Set[str]): Terms from index_terms()
+            top_k (int): Number of postings to return
+
+        Returns:
+            Dict: Same as search()
+        """
+        scores = []
+        for segment, idf, norms, live in zip(self.segments, self._idf, self._norms, self._live):
+            ids = [segment.vocabulary[term] for term in terms if term in segment.vocabulary]
+            offsets = segment.postings_offsets
+            hits = [segment.postings[offsets[term]:offsets[term + 1]] for term in ids]
+            weights = [np.full(len(documents), idf[term]) for term, documents in zip(ids, hits)]
+            matched = np.bincount(np.concatenate(hits), weights=np.concatenate(weights),
+                                  minlength=len(segment)) if hits else np.zeros(len(segment))
+            segment_scores = np.divide(matched, norms, out=np.zeros(len(segment)), where=norms > 0) * 100
+            segment_scores[~live] = 0
+            scores.append(segment_scores)
+
+        results = []
+        if scores and top_k > 0:
+            combined = np.concatenate(scores)
+            starts = np.cumsum([0] + [len(segment) for segment in self.segments])
+            for position in top_k_indices(combined[np.newaxis, :], top_k)[0]:
+                if combined[position] <= 0:
+                    break
+                number = int(np.searchsorted(starts, position, side='right')) - 1
+                results.append(self._describe(number, int(position - starts[number]), terms, combined[position]))
+        for rank, result in enumerate(results, 1):
+            result['rank'] = rank
+
+        return {'results': results, 'total_postings': len(self), 'resume_terms': len(terms)}
+
+    def _describe(self, number: int, document: int, terms: Set[str], score: float) -> Dict:
+        """Match details of one posting"""
+        segment = self.segments[number]
+        idf = self._idf[number]
+        ranked = sorted(segment.document_term_ids(document).tolist(), key=lambda term: (-idf[term], term))
+        matched = [segment.terms[term] for term in ranked if segment.terms[term] in terms]
+        missing = [segment.terms[term] for term in ranked if segment.terms[term] not in terms]
+
+        meta = segment.documents[document]
+        result = {'posting_id': meta['id'], 'title': meta['title']}
+        result.update((field, meta[field]) for field in METADATA_FIELDS if field in meta)
+        result.update({
+            'match_score': int(round(score)),
+            'weighted_match_percentage': round(float(score), 2),
+            'matched_keywords': matched[:20],
+            'missing_keywords': missing[:10],
+            'keywords_matched_count': len(matched),
+            'total_job_keywords': len(ranked)
+        })
+        return result
+
+    def add(self, postings: Iterable[Dict], taxonomy: SkillTaxonomy) -> 'JobIndex':
+        """
+        Index new or changed postings in a new segment
+
+        Postings whose id is already indexed replace the old version.
+
+        Args:
+            postings (Iterable[Dict]): Posting objects with title and description
+            taxonomy (SkillTaxonomy): Skill taxonomy
+
+        Returns:
+            JobIndex: The updated index
+        """
+        documents = _documents(postings, taxonomy)
+        if not documents:
+            return self
+
+        manifest = self._next_manifest()
+        self._delete(manifest, documents)
+        segment = _write_segment(self.directory, manifest, list(documents.values()))
+        return _commit(self.directory, manifest, self.segments + [segment])
+
+    def remove(self, posting_ids: Iterable[str]) -> 'JobIndex':
+        """
+        Mark postings deleted
+
+        Args:
+            posting_ids (Iterable[str]): Ids of postings to drop; unknown ids are ignored
+
+        Returns:
+            JobIndex: The updated index
+        """
+        manifest = self._next_manifest()
+        if not self._delete(manifest, posting_ids):
+            return self
+        return _commit(self.directory, manifest, self.segments)
+
+    def compact(self) -> 'JobIndex':
+        """
+        Merge all segments into one, dropping deleted postings
+
+        Returns:
+            JobIndex: The compacted index
+        """
+        documents = []
+        for segment, live in zip(self.segments, self._live):
+            for document in np.flatnonzero(live):
+                terms = [segment.terms[term] for term in segment.document_term_ids(document).tolist()]
+                documents.append((segment.documents[document], terms))
+
+        manifest = self._next_manifest()
+        manifest['deleted'] = {}
+        manifest['segments'] = []
+        segments = [_write_segment(self.directory, manifest, documents)] if documents else []
+        index = _commit(self.directory, manifest, segments)
+        _remove_segments(self.directory, self.segments)
+        return index
+
+    def _next_manifest(self) -> Dict:
+        """Copy of the manifest to edit for an update"""
+        manifest = json.loads(json.dumps(self.manifest))
+        manifest.setdefault('deleted', {})
+        return manifest
+
+    def _delete(self, manifest: Dict, posting_ids: Iterable[str]) -> int:
+        """Record deletions in the manifest; returns how many postings were live"""
+        count = 0
+        for posting_id in posting_ids:
+            location = self._ids.get(posting_id)
+            if location is None:
+                continue
+            number, document = location
+            manifest['deleted'].setdefault(self.segments[number].name, []).append(document)
+            count += 1
+        return count
+
+
+def _write_json(path: str, data) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+
+def _write_segment(directory: str, manifest: Dict, documents: List[Tuple[Dict, List[str]]]) -> Segment:
+    """Write the next segment and list it in the (not yet committed) manifest"""
+    name = f"seg-{manifest['next_segment']:06d}"
+    manifest['next_segment'] += 1
+    segment = Segment.write(directory, name, documents)
+    manifest['segments'].append(name)
+    return segment
+
+
+def _remove_segments(directory: str, segments: List[Segment]) -> None:
+    """Delete segments the committed manifest no longer lists"""
+    for segment in segments:
+        shutil.rmtree(os.path.join(directory, segment.name), ignore_errors=True)
+
+
+def _commit(directory: str, manifest: Dict, segments: List[Segment]) -> JobIndex:
+    """Atomically replace manifest.json and return the index it describes"""
+    manifest['updated_at'] = datetime.datetime.now().isoformat(timespec='seconds')
+    fd, staging = tempfile.mkstemp(prefix='.manifest-', dir=directory)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(staging, os.path.join(directory, 'manifest.json'))
+    return JobIndex(directory, manifest, segments)
+
+
+def create_index(directory: str, postings: Iterable[Dict], taxonomy: SkillTaxonomy) -> JobIndex:
+    """
+    Build a fresh index, replacing whatever the directory held
+
+    Args:
+        directory (str): Index directory
+        postings (Iterable[Dict]): Posting objects
+        taxonomy (SkillTaxonomy): Skill taxonomy
+
+    Returns:
+        JobIndex: The new index
+    """
+    with index_lock(directory):
+        return _create_index(directory, postings, taxonomy)
+
+
+def _create_index(directory: str, postings: Iterable[Dict], taxonomy: SkillTaxonomy) -> JobIndex:
+    """create_index() for a caller that holds the index lock"""
+    previous = open_index(directory)
+    manifest = {
+        'format_version': INDEX_FORMAT_VERSION,
+        'taxonomy_version': taxonomy.version,
+        'next_segment': previous.manifest['next_segment'] if previous else 1,
+        'segments': [],
+        'deleted': {}
+    }
+    documents = list(_documents(postings, taxonomy).values())
+    segments = [_write_segment(directory, manifest, documents)] if documents else []
+    index = _commit(directory, manifest, segments)
+    if previous:
+        _remove_segments(directory, previous.segments)
+    return index
+
+
+def open_index(directory: str, mmap: bool = True) -> Optional[JobIndex]:
+    """
+    Open an index directory
+
+    Args:
+        directory (str): Index directory
+        mmap (bool): Memory-map the segment arrays
+
+    Returns:
+        JobIndex or None: None if there is no index or it has an old format
+    """
+    try:
+        with open(os.path.join(directory, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format_version') != INDEX_FORMAT_VERSION:
+            return None
+        segments = [Segment.load(directory, name, mmap=mmap) for name in manifest['segments']]
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        print(f"[JOB INDEX] Ignoring unusable index in {directory}: {e}")
+        return None
+    return JobIndex(directory, manifest, segments)
+
+
+def sync_index(directory: str, corpus_path: str, taxonomy: SkillTaxonomy) -> JobIndex:
+    """
+    Bring the index in line with the posting corpus
+
+    Only postings that were added, changed or removed since the last sync
+    are touched. The index is rebuilt from scratch when it is missing, has
+    an old format or was built with a different taxonomy.
+
+    Args:
+        directory (str): Index directory
+        corpus_path (str): JSON Lines file of postings; a missing file means no postings
+        taxonomy (SkillTaxonomy): Skill taxonomy
+
+    Returns:
+        JobIndex: The up-to-date index
+    """
+    postings = list(read_postings(corpus_path)) if os.path.exists(corpus_path) else []
+    with index_lock(directory):
+        index = open_index(directory)
+        if index is None or index.taxonomy_version != taxonomy.version:
+            return _create_index(directory, postings, taxonomy)
+        return _apply_changes(index, postings, taxonomy)
+
+
+def _apply_changes(index: JobIndex, postings: List[Dict], taxonomy: SkillTaxonomy) -> JobIndex:
+    """Index added and changed postings and drop removed ones; call with the index lock held"""
+    indexed = index.hashes()
+    current = {}
+    for posting in postings:
+        current[posting_id(posting)] = posting
+    changed = [posting for key, posting in current.items()
+               if indexed.get(key) != hashlib.sha1(posting_text(posting).encode('utf-8')).hexdigest()]
+    removed = [key for key in indexed if key not in current]
+
+    index = index.remove(removed).add(changed, taxonomy)
+    if len(index.segments) > MAX_SEGMENTS:
+        index = index.compact()
+    return index
+
+
+class JobIndexStore:
+    """
+    Holds the active job posting index and swaps it on sync
+
+    Searches use whichever index was active when they started; a sync
+    builds the new state on disk first and then replaces the reference.
+    """
+
+    def __init__(self, directory: Optional[str] = None, corpus_path: Optional[str] = None,
+                 taxonomy: Optional[TaxonomyStore] = None):
+        """
+        Args:
+            directory (str): Index directory; defaults to ATS_JOB_INDEX_PATH or artifacts/job_index
+            corpus_path (str): Posting corpus; defaults to ATS_JOB_CORPUS_PATH or the bundled corpus
+            taxonomy (TaxonomyStore): Skill taxonomy postings and resumes are matched with
+        """
+        self.directory = directory or os.environ.get('ATS_JOB_INDEX_PATH') or DEFAULT_JOB_INDEX_DIR
+        self.corpus_path = corpus_path or os.environ.get('ATS_JOB_CORPUS_PATH') or DEFAULT_JOB_CORPUS_PATH
+        self.taxonomy = taxonomy or TaxonomyStore()
+        self._index = None
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> JobIndex:
+        """The active index, synced with the corpus on first use"""
+        index = self._index
+        if index is None:
+            with self._lock:
+                if self._index is None:
+                    self._index = sync_index(self.directory, self.corpus_path, self.taxonomy.current)
+                index = self._index
+        return index
+
+    def sync(self) -> JobIndex:
+        """
+        Apply corpus changes to the index and make the result active
+
+        Returns:
+            JobIndex: The newly active index
+        """
+        with self._lock:
+            self._index = sync_index(self.directory, self.corpus_path, self.taxonomy.current)
+            return self._index
+
+    def search(self, resume_text: str, top_k: int = 10) -> Dict:
+        """
+        Best matching postings for a resume
+
+        Args:
+            resume_text (str): Plain text version of resume
+            top_k (int): Number of postings to return
+
+        Returns:
+            Dict: See JobIndex.search()
+        """
+        return self.current.search(resume_text, self.taxonomy.current, top_k)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Manage the job posting index')
+    parser.add_argument('command', choices=['sync', 'rebuild', 'compact', 'info'])
+    parser.add_argument('--index', help='Index directory (default: ATS_JOB_INDEX_PATH or artifacts/job_index)')
+    parser.add_argument('--corpus', help='Posting corpus (default: ATS_JOB_CORPUS_PATH or data/job_postings.jsonl)')
+    args = parser.parse_args(argv)
+
+    from ats_analyzer import ATSAnalyzer
+    store = JobIndexStore(args.index, args.corpus, ATSAnalyzer.TAXONOMY)
+
+    if args.command == 'rebuild':
+        postings = read_postings(store.corpus_path) if os.path.exists(store.corpus_path) else []
+        index = create_index(store.directory, postings, store.taxonomy.current)
+    elif args.command == 'sync':
+        index = store.sync()
+    else:
+        with index_lock(store.directory):
+            index = open_index(store.directory)
+            if index is not None and args.command == 'compact':
+                index = index.compact()
+        if index is None:
+            print(f"No usable index in {store.directory}")
+            return 1
+
+    print(f"Index:     {index.directory}")
+    print(f"Postings:  {len(index)}")
+    print(f"Segments:  {len(index.segments)}")
+    print(f"Taxonomy:  {index.taxonomy_version}")
+    print(f"Updated:   {index.manifest.get('updated_at')}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,383 @@
+"""
+Job Matcher Module
+IDF-weighted matching of resumes against job description keywords
+
+Keyword weights are inverse document frequencies learned from a corpus of
+job postings, so words every posting uses ("experience", "team") count for
+little and distinctive skills ("kubernetes", "solidity") count for a lot.
+A job description is parsed into a JobProfile once; each resume is then
+tokenized into a set and every keyword is a set lookup.
+
+Corpus format (JSON Lines, one posting per line):
+    {"title": "Data Engineer", "description": "Experience with Apache Spark ..."}
+"""
+
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+import numpy as np
+from scipy import sparse
+
+from keyword_matcher import tokenize
+
+# Job posting corpus used when ATS_JOB_CORPUS_PATH is not set
+DEFAULT_JOB_CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'job_postings.jsonl')
+
+STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'from', 'as', 'is', 'be', 'are', 'was', 'were',
+    'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'could', 'should', 'may', 'might', 'must', 'can', 'this', 'that',
+    'these', 'those', 'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'what', 'which', 'who', 'when', 'where', 'why', 'how', 'all',
+    'each', 'every', 'both', 'few', 'more', 'some', 'such', 'no', 'not'
+})
+
+_SPECIAL_CHARACTERS = re.compile(r'[^a-zA-Z0-9\s\-\+]')
+
+
+def extract_keywords(text: str) -> List[str]:
+    """
+    Extract meaningful keywords from text
+
+    Keeps words that are not stop words, are at least 4 characters long
+    (unless hyphenated) and are not pure numbers.
+
+    Args:
+        text (str): Text to extract keywords from
+
+    Returns:
+        List[str]: Unique lowercase keywords in order of first appearance
+    """
+    # Remove special characters and convert to lowercase
+    words = _SPECIAL_CHARACTERS.sub('', text).lower().split()
+    keywords = [
+        word for word in words
+        if word not in STOP_WORDS and (len(word) > 3 or '-' in word) and not word.isdigit()
+    ]
+    return list(dict.fromkeys(keywords))
+
+
+class IDFWeights:
+    """
+    Read-only keyword weights learned from job postings
+
+    weight = ln((1 + documents) / (1 + document_frequency)) + 1
+
+    Keywords that never appear in the corpus get the highest weight. With
+    an empty corpus every keyword weighs 1.0.
+    """
+
+    __slots__ = ('idf', 'documents', 'default', 'source', 'version')
+
+    def __init__(self, document_frequency: Dict[str, int], documents: int, source: Optional[str] = None):
+        """
+        Args:
+            document_frequency (Dict[str, int]): Number of postings containing each keyword
+            documents (int): Number of postings in the corpus
+            source (str): Corpus file, if any
+        """
+        self.documents = documents
+        self.source = source
+        self.default = math.log(1 + documents) + 1
+        self.idf = {
+            keyword: math.log((1 + documents) / (1 + count)) + 1
+            for keyword, count in document_frequency.items()
+        }
+        # Identifies the weights, so results computed with them can be cached per version
+        counts = json.dumps([documents, sorted(document_frequency.items())], separators=(',', ':'))
+        self.version = hashlib.sha256(counts.encode('utf-8')).hexdigest()[:12]
+
+    def weight(self, keyword: str) -> float:
+        """
+        Weight of a keyword
+
+        Args:
+            keyword (str): Lowercase keyword from extract_keywords
+
+        Returns:
+            float: IDF weight, at least 1.0
+        """
+        return self.idf.get(keyword, self.default)
+
+    @classmethod
+    def from_documents(cls, documents: Iterable[str], source: Optional[str] = None) -> 'IDFWeights':
+        """
+        Learn weights from job description texts
+
+        Args:
+            documents (Iterable[str]): Job descriptions
+            source (str): Where the documents came from
+
+        Returns:
+            IDFWeights: Learned weights
+        """
+        frequency = Counter()
+        count = 0
+        for document in documents:
+            frequency.update(extract_keywords(document))
+            count += 1
+        return cls(frequency, count, source)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'IDFWeights':
+        """
+        Learn weights from a JSON Lines corpus of job postings
+
+        Args:
+            path (str): Corpus file
+
+        Returns:
+            IDFWeights: Learned weights
+
+        Raises:
+            ValueError: If a line is not a posting object
+        """
+        documents = (f"{posting.get('title') or ''} {posting.get('description') or ''}"
+                     for posting in read_postings(path))
+        return cls.from_documents(documents, source=path)
+
+
+def read_postings(path: str) -> Iterator[Dict]:
+    """
+    Read job postings from a JSON Lines file
+
+    Args:
+        path (str): Corpus file
+
+    Returns:
+        Iterator[Dict]: Posting objects in file order; blank lines are skipped
+
+    Raises:
+        ValueError: If a line is not a posting object
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                posting = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"Line {number} of {path} is not valid JSON: {e}")
+            if not isinstance(posting, dict):
+                raise ValueError(f"Line {number} of {path} must be a JSON object")
+            yield posting
+
+
+class IDFStore:
+    """
+    Holds the active keyword weights, learned from the corpus on first use
+
+    If the corpus file does not exist every keyword weighs the same.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path (str): Corpus file; defaults to ATS_JOB_CORPUS_PATH or the bundled corpus
+        """
+        self.path = path or os.environ.get('ATS_JOB_CORPUS_PATH') or DEFAULT_JOB_CORPUS_PATH
+        self._weights = None
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> IDFWeights:
+        """The active weights, loaded on first use"""
+        weights = self._weights
+        if weights is None:
+            with self._lock:
+                if self._weights is None:
+                    self._weights = self._load(self.path)
+                weights = self._weights
+        return weights
+
+    @property
+    def version(self) -> str:
+        """Version of the active weights"""
+        return self.current.version
+
+    def reload(self, path: Optional[str] = None) -> IDFWeights:
+        """
+        Learn the weights again and make them active
+
+        Args:
+            path (str): Optional new corpus file
+
+        Returns:
+            IDFWeights: The newly active weights
+        """
+        with self._lock:
+            weights = self._load(path or self.path)
+            if path:
+                self.path = path
+            self._weights = weights
+        return weights
+
+    def _load(self, path: str) -> IDFWeights:
+        if not os.path.exists(path):
+            return IDFWeights({}, 0)
+        return IDFWeights.from_file(path)
+
+
+class JobProfile:
+    """
+    A job description parsed once and matched against many resumes
+
+    Keywords are kept in descending weight order, so the matched and
+    missing lists returned by match() lead with the most important terms.
+    Matching intersects the resume's token set with the job's terms, so
+    its cost follows the number of keywords found rather than the length
+    of the job description.
+    """
+
+    __slots__ = ('job_keywords', 'keywords', 'weights', 'total_weight', 'weight_vector',
+                 '_rank', '_weight', '_single', '_single_terms', '_phrases')
+
+    def __init__(self, job_keywords: List[str], weights: IDFWeights):
+        """
+        Args:
+            job_keywords (List[str]): Keywords from extract_keywords, in job description order
+            weights (IDFWeights): Keyword weights
+        """
+        ranked = []
+        single = {}
+        phrases = []
+        for position, keyword in enumerate(dict.fromkeys(job_keywords)):
+            # Hyphenated keywords such as "full-stack" need all their parts
+            terms = (keyword,) if keyword.isalnum() else tuple(tokenize(keyword))
+            if not terms:
+                continue
+            ranked.append((-weights.weight(keyword), position, keyword))
+            if len(terms) == 1:
+                single.setdefault(terms[0], []).append(keyword)
+            else:
+                phrases.append((keyword, terms))
+        ranked.sort()
+
+        self.job_keywords = [item[2] for item in sorted(ranked, key=lambda item: item[1])]
+        self.keywords = tuple(item[2] for item in ranked)
+        self.weights = tuple(-item[0] for item in ranked)
+        self.total_weight = sum(self.weights)
+        self.weight_vector = np.asarray(self.weights, dtype=np.float64)
+        self._rank = {keyword: rank for rank, keyword in enumerate(self.keywords)}
+        self._weight = dict(zip(self.keywords, self.weights))
+        self._single = single
+        self._single_terms = frozenset(single)
+        self._phrases = tuple(phrases)
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+    def matched_keywords(self, resume_tokens: Set[str]) -> List[str]:
+        """
+        Job keywords present in a tokenized resume
+
+        Args:
+            resume_tokens (Set[str]): Tokens of the resume text
+
+        Returns:
+            List[str]: Matched keywords, most important first
+        """
+        matched = self._hits(resume_tokens)
+        matched.sort(key=self._rank.__getitem__)
+        return matched
+
+    def keyword_matrix(self, token_sets: Iterable[Set[str]]) -> sparse.csr_matrix:
+        """
+        Binary resume-by-keyword matrix for many tokenized resumes
+
+        Args:
+            token_sets (Iterable[Set[str]]): Token set of each resume
+
+        Returns:
+            sparse.csr_matrix: Row i has a 1 in column j when resume i contains
+            keyword j (columns in self.keywords order)
+        """
+        rank = self._rank
+        indices = []
+        indptr = [0]
+        for tokens in token_sets:
+            indices.extend(rank[keyword] for keyword in self._hits(tokens))
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, len(self.keywords)))
+
+    def score_many(self, token_sets: Iterable[Set[str]]) -> np.ndarray:
+        """
+        Weighted match percentages for many tokenized resumes at once
+
+        Args:
+            token_sets (Iterable[Set[str]]): Token set of each resume
+
+        Returns:
+            np.ndarray: weighted_match_percentage of each resume, 0-100
+        """
+        matrix = self.keyword_matrix(token_sets)
+        if not self.total_weight:
+            return np.zeros(matrix.shape[0])
+        return matrix @ self.weight_vector * (100.0 / self.total_weight)
+
+    def _hits(self, resume_tokens: Set[str]) -> List[str]:
+        """Matched keywords in no particular order"""
+        matched = [keyword for term in self._single_terms.intersection(resume_tokens)
+                   for keyword in self._single[term]]
+        for keyword, terms in self._phrases:
+            if all(term in resume_tokens for term in terms):
+                matched.append(keyword)
+        return matched
+
+    def match(self, resume_tokens: Set[str]) -> Dict:
+        """
+        Match the job keywords against a tokenized resume
+
+        Args:
+            resume_tokens (Set[str]): Tokens of the resume text
+
+        Returns:
+            Dict: Job matching analysis results; match_score is the
+            IDF-weighted share of job keywords found, 0-100
+        """
+        matched = self.matched_keywords(resume_tokens)
+        matched_weight = sum(map(self._weight.__getitem__, matched))
+
+        # Only the first ten missing keywords are reported
+        found = set(matched)
+        missing = []
+        for keyword in self.keywords:
+            if keyword not in found:
+                missing.append(keyword)
+                if len(missing) == 10:
+                    break
+
+        total = len(self.keywords)
+        weighted_percentage = matched_weight / self.total_weight * 100 if self.total_weight else 0
+        return {
+            'match_score': int(round(weighted_percentage)),
+            'matched_keywords': matched[:20],  # Limit to top 20
+            'missing_keywords': missing,  # Show top 10 missing
+            'job_keywords': self.job_keywords[:30],
+            'match_percentage': round(len(matched) / total * 100, 2) if total else 0,
+            'weighted_match_percentage': round(weighted_percentage, 2),
+            'keywords_matched_count': len(matched),
+            'keywords_missing_count': total - len(matched),
+            'total_job_keywords': total
+        }
+
+
+def resume_tokens(resume_text: str) -> Set[str]:
+    """
+    Token set of a resume, built once per resume
+
+    Args:
+        resume_text (str): Plain text version of resume
+
+    Returns:
+        Set[str]: Lowercase tokens
+    """
+    return set(tokenize(resume_text))
@@ -0,0 +1,252 @@
+"""
+Keyword Matcher Module
+Finds categorized keywords in resume text with a single pass over its tokens
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Set, Tuple
+
+# A token is a run of word characters that may carry '+' or '#' (c++, c#)
+# and inner dots (node.js, asp.net). Hyphens split tokens, so "React-based"
+# yields "react" and "problem-solving" is matched as two tokens.
+TOKEN_PATTERN = re.compile(r'\w[\w+#]*(?:\.[\w+#]+)*')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase keyword tokens
+
+    Args:
+        text (str): Text to tokenize
+
+    Returns:
+        List[str]: Tokens in text order
+    """
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class KeywordMatch(NamedTuple):
+    """A single keyword occurrence in the scanned text"""
+    keyword: str
+    category: str
+    start: int
+    end: int
+
+
+class KeywordScan:
+    """
+    Result of scanning one text: every match with its position,
+    plus per-keyword counts
+    """
+
+    __slots__ = ('matches', 'counts')
+
+    def __init__(self, matches: List[KeywordMatch]):
+        self.matches = matches
+        self.counts = Counter((match.category, match.keyword) for match in matches)
+
+    def found(self, category: str = None) -> Set[str]:
+        """
+        Keywords present in the text, optionally limited to one category
+
+        Args:
+            category (str): Category name, or None for all categories
+
+        Returns:
+            Set[str]: Matched keywords
+        """
+        return {keyword for (cat, keyword) in self.counts if category is None or cat == category}
+
+    def count(self, keyword: str, category: str = None) -> int:
+        """
+        Number of occurrences of a keyword
+
+        Args:
+            keyword (str): Keyword as listed in the matcher
+            category (str): Category name, or None to sum over all categories
+
+        Returns:
+            int: Occurrence count
+        """
+        if category is not None:
+            return self.counts[(category, keyword)]
+        return sum(n for (cat, kw), n in self.counts.items() if kw == keyword)
+
+    def positions(self, keyword: str) -> List[Tuple[int, int]]:
+        """
+        Character spans of every occurrence of a keyword
+
+        Args:
+            keyword (str): Keyword as listed in the matcher
+
+        Returns:
+            List[Tuple[int, int]]: (start, end) offsets into the scanned text
+        """
+        return [(match.start, match.end) for match in self.matches if match.keyword == keyword]
+
+    def category_counts(self) -> Dict[str, int]:
+        """
+        Total occurrences per category
+
+        Returns:
+            Dict[str, int]: Category name to occurrence count
+        """
+        totals = Counter()
+        for (category, _), n in self.counts.items():
+            totals[category] += n
+        return dict(totals)
+
+
+class KeywordMatcher:
+    """
+    Precompiled index of categorized keywords
+
+    Keywords are tokenized once and indexed by their first token, so finding
+    them in a text costs a set intersection over the text's vocabulary
+    regardless of how many keywords are indexed. Multi-word keywords are
+    matched as whole token sequences. Occurrences may overlap, so
+    "machine learning" also counts "learning" when both are keywords.
+
+    Tokenizing the text is the fixed cost. With only a few dozen keywords,
+    one C-level substring search per keyword is 1.5-2x faster, but it
+    matches inside words. With the bundled taxonomy (about 340 skills and
+    synonyms) the index is 4-5x faster; see benchmarks/bench_keyword_matcher.py.
+    """
+
+    def __init__(self, keywords: Dict[str, Iterable[str]], synonyms: Dict[str, str] = None):
+        """
+        Build the index
+
+        Args:
+            keywords (Dict[str, Iterable[str]]): Category name to keywords
+            synonyms (Dict[str, str]): Optional alias to keyword map; an alias
+                is reported as the keyword it stands for ("k8s" -> "kubernetes")
+        """
+        index = {}
+        owners = {}
+
+        def add(phrase, term, category):
+            tokens = tuple(tokenize(phrase))
+            if not tokens:
+                return
+            candidates = index.setdefault(tokens[0], [])
+            if any(tail == tokens[1:] for tail, _, _ in candidates):
+                # First category to list a term owns it
+                return
+            candidates.append((tokens[1:], term, category))
+
+        for category, terms in keywords.items():
+            for term in terms:
+                owners.setdefault(term, category)
+                add(term, term, category)
+
+        for alias, term in (synonyms or {}).items():
+            if term in owners:
+                add(alias, term, owners[term])
+
+        self._index = index
+        # Set intersection iterates the smaller operand only when both are sets
+        self._first_tokens = frozenset(index)
+        self.categories = tuple(keywords.keys())
+        # Tokens in the longest keyword; a match never spans more
+        self.max_phrase_tokens = max(
+            (len(tail) + 1 for candidates in index.values() for tail, _, _ in candidates), default=0
+        )
+
+    def __len__(self) -> int:
+        return sum(len(candidates) for candidates in self._index.values())
+
+    def _match_tokens(self, tokens: List[str]) -> List[Tuple[int, int, str, str]]:
+        """
+        Find every keyword occurrence in a token list
+
+        Args:
+            tokens (List[str]): Lowercase tokens
+
+        Returns:
+            List[Tuple[int, int, str, str]]: (first token, token count, keyword, category)
+        """
+        index = self._index
+        found = []
+        for i, token in enumerate(tokens):
+            candidates = index.get(token)
+            if candidates is None:
+                continue
+            for tail, term, category in candidates:
+                size = len(tail)
+                if not size or tuple(tokens[i + 1:i + 1 + size]) == tail:
+                    found.append((i, size + 1, term, category))
+        return found
+
+    def find_tokens(self, tokens: List[str]) -> Set[Tuple[str, str]]:
+        """
+        Keywords present in an already tokenized text
+
+        Args:
+            tokens (List[str]): Lowercase tokens from tokenize()
+
+        Returns:
+            Set[Tuple[str, str]]: (category, keyword) pairs
+        """
+        vocabulary = set(tokens)
+        found = set()
+        phrases = []
+        for first in vocabulary.intersection(self._first_tokens):
+            for tail, term, category in self._index[first]:
+                if not tail:
+                    found.add((category, term))
+                elif vocabulary.issuperset(tail):
+                    phrases.append((first, tail, term, category))
+
+        # Phrase words all occur somewhere; confirm they occur in sequence
+        for first, tail, term, category in phrases:
+            size = len(tail)
+            position = -1
+            try:
+                while True:
+                    position = tokens.index(first, position + 1)
+                    if tuple(tokens[position + 1:position + 1 + size]) == tail:
+                        found.add((category, term))
+                        break
+            except ValueError:
+                pass
+        return found
+
+    def find(self, text: str) -> Set[Tuple[str, str]]:
+        """
+        Keywords present in the text, without positions
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            Set[Tuple[str, str]]: (category, keyword) pairs
+        """
+        return self.find_tokens(tokenize(text))
+
+    def scan(self, text: str) -> KeywordScan:
+        """
+        Scan the text once and report every keyword with its position
+
+        Args:
+            text (str): Text to scan
+
+        Returns:
+            KeywordScan: Matches, positions and counts
+        """
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            spans = [(m.start(), m.end()) for m in TOKEN_PATTERN.finditer(lowered)]
+            tokens = [lowered[start:end] for start, end in spans]
+        else:
+            # Some characters change length when lowercased; tokenize the
+            # original text so offsets still point into it
+            spans = [(m.start(), m.end()) for m in TOKEN_PATTERN.finditer(text)]
+            tokens = [text[start:end].lower() for start, end in spans]
+
+        matches = [
+            KeywordMatch(term, category, spans[first][0], spans[first + size - 1][1])
+            for first, size, term, category in self._match_tokens(tokens)
+        ]
+        return KeywordScan(matches)
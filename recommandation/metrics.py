@@ -0,0 +1,272 @@
+"""
+Metrics Module
+In-process latency histograms and counters, exported at /metrics in the
+Prometheus text format
+
+Hot paths time themselves with, for example:
+
+    with STAGE_SECONDS.time('ats_formatting'):
+        ...
+
+When metrics are disabled, time() returns a shared no-op context manager
+and observe()/inc() return at once, so instrumented code costs a
+function call.
+
+Values are kept per process. With ATS_WORKERS set, ATS stage timings are
+recorded inside the worker processes and do not show up here; request
+latencies do.
+
+Configuration (environment variables):
+    METRICS_ENABLED    Set to 0 to disable every timer and counter (default 1)
+"""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List, Sequence, Tuple
+
+# Upper bounds in seconds; stages take microseconds to milliseconds, requests up to seconds
+DEFAULT_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Returned by time() while metrics are disabled; nullcontext is reusable
+_NO_TIMER = nullcontext()
+
+
+class _Timer:
+    """Context manager that observes its elapsed time on exit"""
+
+    __slots__ = ('histogram', 'labels', 'started')
+
+    def __init__(self, histogram: 'Histogram', labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> '_Timer':
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+
+
+class Histogram:
+    """
+    Distribution of observed values, e.g. latencies in seconds, per label combination
+    """
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str,
+                 labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """
+        Args:
+            registry (MetricsRegistry): Registry the histogram belongs to
+            name (str): Metric name
+            documentation (str): HELP text
+            labelnames (Sequence[str]): Label names, in the order values are passed
+            buckets (Sequence[float]): Sorted bucket upper bounds
+        """
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last one is +Inf), sum, count]
+        self._series: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Record one value
+
+        Args:
+            value (float): Observed value
+            *labels (str): Label values, in labelnames order
+        """
+        if not self.registry.enabled:
+            return
+        bucket = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][bucket] += 1
+            series[1] += value
+            series[2] += 1
+
+    def time(self, *labels: str):
+        """
+        Context manager that records how long its block took, in seconds
+
+        Args:
+            *labels (str): Label values, in labelnames order
+        """
+        if not self.registry.enabled:
+            return _NO_TIMER
+        return _Timer(self, labels)
+
+    def snapshot(self) -> Dict[Tuple[str, ...], Tuple[List[int], float, int]]:
+        """Copy of every series: cumulative bucket counts, sum and count"""
+        with self._lock:
+            series = {labels: (list(counts), total, count) for labels, (counts, total, count) in self._series.items()}
+        for labels, (counts, total, count) in series.items():
+            for i in range(1, len(counts)):
+                counts[i] += counts[i - 1]
+        return series
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        bounds = [_format_value(bound) for bound in self.buckets] + ['+Inf']
+        for labels, (counts, total, count) in sorted(self.snapshot().items()):
+            pairs = list(zip(self.labelnames, labels))
+            for bound, cumulative in zip(bounds, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(pairs + [('le', bound)])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(pairs)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(pairs)} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._series.clear()
+
+
+class Counter:
+    """
+    Monotonically increasing count per label combination
+    """
+
+    def __init__(self, registry: 'MetricsRegistry', name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Args:
+            registry (MetricsRegistry): Registry the counter belongs to
+            name (str): Metric name, conventionally ending in _total
+            documentation (str): HELP text
+            labelnames (Sequence[str]): Label names, in the order values are passed
+        """
+        self.registry = registry
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """
+        Add to the count
+
+        Args:
+            *labels (str): Label values, in labelnames order
+            amount (float): Increment
+        """
+        if not self.registry.enabled:
+            return
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        """Current count for the label values"""
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def expose(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            values = sorted(self._values.items())
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(list(zip(self.labelnames, labels)))} {_format_value(value)}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class MetricsRegistry:
+    """
+    Set of metrics exported together
+    """
+
+    def __init__(self, enabled: bool = True):
+        """
+        Args:
+            enabled (bool): Whether metrics record anything
+        """
+        self.enabled = enabled
+        self._metrics = []
+
+    @classmethod
+    def from_env(cls) -> 'MetricsRegistry':
+        """Registry enabled unless METRICS_ENABLED is 0, false or no"""
+        return cls(enabled=os.environ.get('METRICS_ENABLED', '1').strip().lower() not in ('0', 'false', 'no'))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Create and register a histogram"""
+        metric = Histogram(self, name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """Create and register a counter"""
+        metric = Counter(self, name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def expose(self) -> str:
+        """
+        Every metric in the Prometheus text exposition format
+
+        Returns:
+            str: Exposition text ending with a newline
+        """
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
+
+    def clear(self) -> None:
+        """Drop every recorded value, e.g. between tests"""
+        for metric in self._metrics:
+            metric.clear()
+
+
+def _format_labels(pairs: List[Tuple[str, str]]) -> str:
+    if not pairs:
+        return ''
+    escaped = (f'{name}="{_escape(value)}"' for name, value in pairs)
+    return '{' + ','.join(escaped) + '}'
+
+
+def _escape(value: object) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value))
+
+
+# Process-wide registry and the metrics the service records
+REGISTRY = MetricsRegistry.from_env()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    'stage_duration_seconds',
+    'Time spent in one processing stage (ATS analysis, job matching, recommendation, rendering)',
+    ('stage',)
+)
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    'http_request_duration_seconds',
+    'HTTP request latency by route',
+    ('method', 'route', 'status')
+)
+
+REQUESTS_TOTAL = REGISTRY.counter(
+    'http_requests_total',
+    'HTTP requests served by route',
+    ('method', 'route', 'status')
+)
@@ -0,0 +1,72 @@
+"""
+Ranking Module
+Top-k selection shared by the career recommender, the job posting index
+and resume ranking
+"""
+
+import numpy as np
+
+# Up to this many columns a full stable sort is cheaper than partitioning
+# (about 0.06 ms against 0.1 ms for 200 rows of 18 careers)
+SORT_COLUMNS = 32
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Column indices of the k highest scores in every row, best first
+
+    Wide matrices use argpartition so only the k winners are sorted;
+    narrow ones are sorted whole. Ties are broken by the lower column
+    index, which keeps results deterministic: in rows where more columns
+    tie with the k-th score than there are places left, the tied columns
+    are taken in index order.
+
+    Args:
+        scores (np.ndarray): Matrix of shape (rows, classes)
+        k (int): Number of columns to keep per row
+
+    Returns:
+        np.ndarray: Integer matrix of shape (rows, min(k, classes))
+    """
+    scores = np.asarray(scores)
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        return np.empty((scores.shape[0], 0), dtype=np.intp)
+    if scores.shape[1] <= SORT_COLUMNS:
+        return np.argsort(-scores, axis=1, kind='stable')[:, :k]
+
+    if k < scores.shape[1]:
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        kth = np.take_along_axis(scores, candidates, axis=1).min(axis=1, keepdims=True)
+        # argpartition picks arbitrarily among the columns tied with the
+        # k-th score; redo the selection for rows where it had to choose
+        tied_rows = np.flatnonzero(np.count_nonzero(scores >= kth, axis=1) > k)
+        if len(tied_rows):
+            candidates[tied_rows] = _select_with_ties(scores[tied_rows], kth[tied_rows], k)
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+
+    picked = np.take_along_axis(scores, candidates, axis=1)
+    # lexsort uses the last key as primary: score descending, then index ascending
+    order = np.lexsort((candidates, -picked), axis=1)
+    return np.take_along_axis(candidates, order, axis=1)
+
+
+def _select_with_ties(scores: np.ndarray, kth: np.ndarray, k: int) -> np.ndarray:
+    """
+    The k columns of each row above its k-th score, filled up with the
+    lowest columns equal to it
+
+    Args:
+        scores (np.ndarray): Matrix of shape (rows, classes)
+        kth (np.ndarray): The k-th highest score of every row, shape (rows, 1)
+        k (int): Number of columns to select per row
+
+    Returns:
+        np.ndarray: Column indices of shape (rows, k), in index order
+    """
+    above = scores > kth
+    tied = scores == kth
+    room = k - np.count_nonzero(above, axis=1)[:, np.newaxis]
+    selected = above | (tied & (np.cumsum(tied, axis=1) <= room))
+    return np.nonzero(selected)[1].reshape(len(scores), k)
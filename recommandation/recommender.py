@@ -0,0 +1,120 @@
+"""
+Career Recommender Module
+Vectorized top-k career recommendations over the TF-IDF model
+
+One call transforms every profile and runs a single predict_proba over
+the whole batch, then selects the top k careers per row with
+argpartition instead of sorting every probability.
+"""
+
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from career_index import CareerIndex
+from features import FIELD_WEIGHTS, create_user_profile
+from metrics import STAGE_SECONDS
+from ranking import top_k_indices
+
+
+class Recommender:
+    """
+    Career recommendations from a fitted vectorizer and classifier
+
+    The vectorizer, model and career index are only read, so one instance
+    can be shared by every request thread.
+    """
+
+    def __init__(self, vectorizer, model, careers: CareerIndex, field_weights: Optional[Dict[str, int]] = None):
+        """
+        Args:
+            vectorizer: Fitted TfidfVectorizer
+            model: Fitted classifier with predict_proba and classes_
+            careers (CareerIndex): Career metadata lookup
+            field_weights (Dict[str, int]): Profile field weights the model was trained with
+        """
+        self.vectorizer = vectorizer
+        self.model = model
+        self.careers = careers
+        self.field_weights = FIELD_WEIGHTS if field_weights is None else field_weights
+        self.classes = np.asarray(model.classes_)
+
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """
+        Career probabilities for many profile texts with one model call
+
+        Args:
+            texts (List[str]): Profile texts
+
+        Returns:
+            np.ndarray: Matrix of shape (len(texts), careers)
+        """
+        with STAGE_SECONDS.time('recommend_vectorize'):
+            features = self.vectorizer.transform(texts)
+        with STAGE_SECONDS.time('recommend_predict'):
+            return self.model.predict_proba(features)
+
+    def top_careers(self, texts: List[str], k: int = 3) -> List[List[tuple]]:
+        """
+        Top k careers for each profile text
+
+        Args:
+            texts (List[str]): Profile texts
+            k (int): Careers per profile
+
+        Returns:
+            List[List[tuple]]: Per text, (career, score) pairs, best first
+        """
+        if not texts:
+            return []
+        probs = self.predict_proba(texts)
+        top = top_k_indices(probs, k)
+        scores = np.take_along_axis(probs, top, axis=1)
+        return [
+            [(str(self.classes[column]), float(score)) for column, score in zip(columns, row_scores)]
+            for columns, row_scores in zip(top, scores)
+        ]
+
+    def recommend_batch(self, profiles: List, k: int = 3) -> List[Dict]:
+        """
+        Recommend careers for many student profiles at once
+
+        Args:
+            profiles (List): Profile objects keyed by features.PROFILE_FIELDS; missing fields are empty
+            k (int): Careers per profile
+
+        Returns:
+            List[Dict]: One result per profile, in input order:
+                {'index': int, 'success': bool, 'data': {...} or None, 'error': str or None}
+        """
+        results = [None] * len(profiles)
+        texts = []
+        positions = []
+
+        for position, profile in enumerate(profiles):
+            if not isinstance(profile, dict):
+                results[position] = {
+                    'index': position,
+                    'success': False,
+                    'data': None,
+                    'error': 'INVALID_PROFILE'
+                }
+                continue
+            texts.append(create_user_profile(profile, self.field_weights))
+            positions.append(position)
+
+        for position, ranked in zip(positions, self.top_careers(texts, k)):
+            results[position] = {
+                'index': position,
+                'success': True,
+                'data': {'recommendations': [self._describe(career, score) for career, score in ranked]},
+                'error': None
+            }
+        return results
+
+    def _describe(self, career: str, score: float) -> Dict:
+        """Career name and score merged with its metadata"""
+        record = self.careers.get(career)
+        details = record.to_dict() if record is not None else {'name': career}
+        details['score'] = round(score, 4)
+        return details
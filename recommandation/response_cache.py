@@ -0,0 +1,109 @@
+"""
+Response Cache Module
+Pre-rendered responses for routes whose output depends only on static data
+
+The aptitude test, the career pages and the ATS scoring info only change
+when skills.csv / aptitude_questions.csv (through the artifact bundle) or
+the skill taxonomy change. Their bodies are rendered once per data version
+and served as bytes with an ETag and Last-Modified header; a request whose
+If-None-Match or If-Modified-Since still matches gets 304 Not Modified
+without a body.
+
+Entries are keyed by the route's own key plus the data version, so a new
+version misses every old entry and the old ones age out of the LRU.
+Responses carry `Cache-Control: no-cache`, so browsers revalidate and pick
+up new data on their next request.
+
+Configuration (environment variables):
+    PAGE_CACHE_SIZE    Cached responses per process; 0 disables the cache (default 256)
+"""
+
+import datetime
+import hashlib
+import os
+from typing import Callable, Dict, Hashable, NamedTuple, Union
+
+from flask import Response, request
+
+from ats_cache import ResultCache
+
+
+class CachedResponse(NamedTuple):
+    """A rendered response body and its validators"""
+    body: bytes
+    content_type: str
+    etag: str
+    last_modified: datetime.datetime
+
+
+class ResponseCache:
+    """
+    Bounded cache of rendered responses with conditional GET support
+    """
+
+    def __init__(self, maxsize: int = 256):
+        """
+        Args:
+            maxsize (int): Maximum number of cached responses; 0 disables caching
+        """
+        self._cache = ResultCache(maxsize=maxsize, ttl=0)
+
+    @classmethod
+    def from_env(cls) -> 'ResponseCache':
+        """Cache sized by PAGE_CACHE_SIZE"""
+        return cls(maxsize=int(os.environ.get('PAGE_CACHE_SIZE') or 256))
+
+    def get_or_render(self, key: Hashable, version: str,
+                      render: Callable[[], Union[str, Response]]) -> CachedResponse:
+        """
+        The cached response for a key and data version, rendering it on a miss
+
+        Args:
+            key (Hashable): What identifies the response within its data version, e.g. ('career', name)
+            version (str): Version of the data the response is built from
+            render (Callable): Returns the HTML as a string, or a Response
+
+        Returns:
+            CachedResponse: Body, content type and validators
+        """
+        entry, _ = self._cache.get_or_compute((key, version), lambda: _freeze(render()))
+        return entry
+
+    def respond(self, entry: CachedResponse) -> Response:
+        """
+        Response for the current request: the cached body, or 304 if the client's copy is current
+
+        Args:
+            entry (CachedResponse): Entry from get_or_render()
+
+        Returns:
+            Response: 200 with the body, or 304 without it
+        """
+        response = Response(entry.body, content_type=entry.content_type)
+        response.set_etag(entry.etag)
+        response.last_modified = entry.last_modified
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        self._cache.clear()
+
+    def stats(self) -> Dict:
+        """Hit, miss and eviction counters"""
+        return self._cache.stats()
+
+
+def _freeze(rendered: Union[str, Response]) -> CachedResponse:
+    """Turn a rendered template or Response into a cache entry"""
+    if isinstance(rendered, Response):
+        body, content_type = rendered.get_data(), rendered.content_type
+    else:
+        body, content_type = rendered.encode('utf-8'), 'text/html; charset=utf-8'
+    return CachedResponse(
+        body=body,
+        content_type=content_type,
+        etag=hashlib.blake2b(body, digest_size=16).hexdigest(),
+        # HTTP dates have one second resolution
+        last_modified=datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+    )
@@ -0,0 +1,272 @@
+"""
+Skill Taxonomy Module
+Loads the ATS skill taxonomy from a JSON file and compiles it into a matcher
+
+Taxonomy file format:
+{
+    "version": "2026.10",
+    "categories": {
+        "cloud": {
+            "core": ["aws", "kubernetes"],
+            "skills": {
+                "aws": {"label": "AWS", "synonyms": ["amazon web services"]},
+                "kubernetes": {"label": "Kubernetes", "synonyms": ["k8s"]},
+                "terraform": {}
+            }
+        }
+    }
+}
+
+Every skill and synonym is recognized in resume text. Only skills listed in a
+category's "core" list count towards the keyword score, so the taxonomy can
+grow to thousands of skills without diluting the score.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+from keyword_matcher import KeywordMatcher
+
+# Taxonomy file used when ATS_TAXONOMY_PATH is not set
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'skills_taxonomy.json')
+
+
+class SkillTaxonomy:
+    """
+    Compiled, read-only skill taxonomy
+
+    Instances are never modified after construction; reloading builds a new
+    instance and swaps it in, so a request that holds a reference keeps a
+    consistent view.
+    """
+
+    __slots__ = ('version', 'source', 'core', 'labels', 'skill_count', 'synonym_count', 'matcher')
+
+    def __init__(self, categories: Dict[str, Dict], version: str, source: Optional[str] = None):
+        """
+        Compile a taxonomy
+
+        Args:
+            categories (Dict[str, Dict]): Category name to {"core": [...], "skills": {...}}
+            version (str): Version identifier
+            source (str): File the taxonomy was loaded from, if any
+        """
+        keywords = {}
+        synonyms = {}
+        labels = {}
+        core = {}
+
+        for category, spec in categories.items():
+            skills = spec.get('skills', {})
+            if isinstance(skills, list):
+                skills = {skill: {} for skill in skills}
+
+            keywords[category] = [_normalize(skill) for skill in skills]
+            for skill, details in skills.items():
+                canonical = _normalize(skill)
+                details = details or {}
+                labels[canonical] = details.get('label') or skill.capitalize()
+                for alias in details.get('synonyms', []):
+                    synonyms[_normalize(alias)] = canonical
+
+            scored = [_normalize(skill) for skill in spec.get('core', [])]
+            unknown = [skill for skill in scored if skill not in keywords[category]]
+            if unknown:
+                raise ValueError(f"Core skills missing from category '{category}': {', '.join(unknown)}")
+            if scored:
+                core[category] = tuple(scored)
+
+        self.version = version
+        self.source = source
+        self.core = core
+        self.labels = labels
+        self.skill_count = sum(len(skills) for skills in keywords.values())
+        self.synonym_count = len(synonyms)
+        self.matcher = KeywordMatcher(keywords, synonyms)
+
+    @property
+    def core_size(self) -> int:
+        """Number of skills that count towards the keyword score"""
+        return sum(len(skills) for skills in self.core.values())
+
+    def label(self, skill: str) -> str:
+        """
+        Display name of a skill
+
+        Args:
+            skill (str): Canonical skill name
+
+        Returns:
+            str: Label from the taxonomy file, or the capitalized name
+        """
+        return self.labels.get(skill) or skill.capitalize()
+
+    @classmethod
+    def from_keywords(cls, keywords: Dict[str, Iterable[str]], version: str = None) -> 'SkillTaxonomy':
+        """
+        Build a taxonomy in which every keyword is a core skill
+
+        Args:
+            keywords (Dict[str, Iterable[str]]): Category name to keywords
+            version (str): Version identifier, derived from the keywords if omitted
+
+        Returns:
+            SkillTaxonomy: Compiled taxonomy
+        """
+        categories = {
+            category: {'core': list(terms), 'skills': {term: {} for term in terms}}
+            for category, terms in keywords.items()
+        }
+        if version is None:
+            digest = hashlib.sha256(json.dumps(categories, sort_keys=True).encode('utf-8')).hexdigest()
+            version = f"builtin-{digest[:12]}"
+        return cls(categories, version)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'SkillTaxonomy':
+        """
+        Load and compile a taxonomy file
+
+        Args:
+            path (str): Path to a taxonomy JSON file
+
+        Returns:
+            SkillTaxonomy: Compiled taxonomy
+
+        Raises:
+            ValueError: If the file is not a valid taxonomy
+        """
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+        try:
+            data = json.loads(raw.decode('utf-8'))
+        except ValueError as e:
+            raise ValueError(f"Taxonomy file {path} is not valid JSON: {e}")
+
+        if not isinstance(data, dict) or not isinstance(data.get('categories'), dict):
+            raise ValueError(f"Taxonomy file {path} must contain a 'categories' object")
+
+        digest = hashlib.sha256(raw).hexdigest()[:12]
+        declared = data.get('version')
+        version = f"{declared}-{digest}" if declared else digest
+        return cls(data['categories'], version, source=path)
+
+
+class TaxonomyStore:
+    """
+    Holds the active taxonomy and swaps it atomically on reload
+
+    Readers call `current` and get a fully compiled taxonomy; a reload
+    compiles the replacement first and only then replaces the reference,
+    so readers never see a half-built matcher. If the file cannot be loaded
+    the previous taxonomy stays active.
+
+    Every process holds its own store, so under gunicorn a reload in one
+    worker does not reach the others; refresh() lets each of them notice
+    that the file changed and reload it themselves.
+    """
+
+    def __init__(self, path: Optional[str] = None, fallback: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Args:
+            path (str): Taxonomy file; defaults to ATS_TAXONOMY_PATH or the bundled file
+            fallback (Dict[str, Iterable[str]]): Keywords used when the file does not exist
+        """
+        self.path = path or os.environ.get('ATS_TAXONOMY_PATH') or DEFAULT_TAXONOMY_PATH
+        self._fallback = fallback
+        self._taxonomy = None
+        # (mtime, size) of the file when it was last loaded, None if it did not exist
+        self._signature = None
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> SkillTaxonomy:
+        """The active taxonomy, loaded on first use"""
+        taxonomy = self._taxonomy
+        if taxonomy is None:
+            with self._lock:
+                if self._taxonomy is None:
+                    signature = _file_signature(self.path)
+                    self._taxonomy = self._load(self.path)
+                    self._signature = signature
+                taxonomy = self._taxonomy
+        return taxonomy
+
+    @property
+    def version(self) -> str:
+        """Version of the active taxonomy"""
+        return self.current.version
+
+    def reload(self, path: Optional[str] = None) -> SkillTaxonomy:
+        """
+        Load the taxonomy file again and make it active
+
+        Args:
+            path (str): Optional new taxonomy file
+
+        Returns:
+            SkillTaxonomy: The newly active taxonomy
+
+        Raises:
+            ValueError: If the file is not a valid taxonomy
+            OSError: If an explicitly given file cannot be read
+        """
+        with self._lock:
+            signature = _file_signature(path or self.path)
+            taxonomy = self._load(path or self.path, allow_fallback=path is None)
+            if path:
+                self.path = path
+            self._taxonomy = taxonomy
+            self._signature = signature
+        return taxonomy
+
+    def refresh(self) -> Optional[SkillTaxonomy]:
+        """
+        Reload the taxonomy if its file changed since it was loaded
+
+        Costs one stat() when nothing changed, so it can run on every
+        request. A file that fails to load is reported once and the
+        previous taxonomy stays active until the file changes again.
+
+        Returns:
+            SkillTaxonomy: The newly active taxonomy, or None if the version did not change
+        """
+        signature = _file_signature(self.path)
+        if self._taxonomy is None or signature == self._signature:
+            return None
+        with self._lock:
+            if signature == self._signature:
+                return None
+            self._signature = signature
+            try:
+                taxonomy = self._load(self.path)
+            except (OSError, ValueError) as e:
+                print(f"[TAXONOMY] Keeping version {self._taxonomy.version}; could not load {self.path}: {e}")
+                return None
+            if taxonomy.version == self._taxonomy.version:
+                return None
+            self._taxonomy = taxonomy
+        return taxonomy
+
+    def _load(self, path: str, allow_fallback: bool = True) -> SkillTaxonomy:
+        if allow_fallback and self._fallback is not None and not os.path.exists(path):
+            return SkillTaxonomy.from_keywords(self._fallback)
+        return SkillTaxonomy.from_file(path)
+
+
+def _file_signature(path: str) -> Optional[tuple]:
+    """Modification time and size of a file, or None if it does not exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _normalize(skill: str) -> str:
+    """Canonical form of a skill or synonym name"""
+    return ' '.join(skill.lower().split())
@@ -0,0 +1,598 @@
+"""
+Endpoint Tests for the Recommendation Service
+Exercises the Flask routes through the test client
+"""
+
+import json
+import time
+import unittest
+from unittest import mock
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app as app_module
+from app import app, get_career_index
+from ats_executor import ExecutorBusy
+from components import LazyComponent
+from metrics import REGISTRY
+
+
+class TestATSBatchEndpoint(unittest.TestCase):
+    """Tests for /api/analyze-ats/batch"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+        self.resume = {
+            'personalInfo': {
+                'firstName': 'Jane',
+                'lastName': 'Smith',
+                'email': 'jane@example.com',
+                'phone': '+1-234-567-8900',
+                'location': 'Boston, MA'
+            },
+            'professionalSummary': 'Python and JavaScript developer',
+            'experience': [],
+            'education': [],
+            'skills': ['Python', 'JavaScript', 'React']
+        }
+
+    def test_batch_returns_per_item_results(self):
+        """Test that each resume gets its own result"""
+        response = self.client.post('/api/analyze-ats/batch', json={
+            'resumes': [self.resume, 42],
+            'job_description': 'Python developer with React experience'
+        })
+
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertTrue(body['success'])
+        self.assertEqual(body['data']['total'], 2)
+        self.assertEqual(body['data']['succeeded'], 1)
+        self.assertEqual(body['data']['failed'], 1)
+        first = body['data']['results'][0]
+        self.assertIn('ats_score', first['data'])
+        self.assertGreater(first['data']['job_match']['match_percentage'], 0)
+
+    def test_batch_requires_resume_list(self):
+        """Test validation of the request body"""
+        response = self.client.post('/api/analyze-ats/batch', json={'resumes': {}})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'MISSING_RESUMES')
+
+    def test_batch_size_is_bounded(self):
+        """Test that oversized batches are rejected"""
+        import app as app_module
+
+        resumes = [self.resume] * (app_module.MAX_ATS_BATCH_SIZE + 1)
+        response = self.client.post('/api/analyze-ats/batch', json={'resumes': resumes})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'BATCH_TOO_LARGE')
+
+
+class TestATSResultCache(unittest.TestCase):
+    """Tests for caching on /api/analyze-ats"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        import app as app_module
+
+        self.cache = app_module.ats_result_cache
+        self.cache.clear()
+        self.client = app.test_client()
+        self.resume = {
+            '_id': 'abc123',
+            'personalInfo': {'firstName': 'Jane', 'email': 'jane@example.com'},
+            'professionalSummary': 'Python developer',
+            'skills': ['Python', 'Flask']
+        }
+
+    def test_repeat_analysis_is_served_from_cache(self):
+        """Test that an unchanged resume hits the cache"""
+        payload = {'resume_data': self.resume, 'job_description': 'Python Flask developer'}
+        hits_before = self.cache.stats()['hits']
+
+        first = self.client.post('/api/analyze-ats', json=payload)
+        second = self.client.post('/api/analyze-ats', json=payload)
+
+        self.assertEqual(first.headers['X-Cache'], 'MISS')
+        self.assertEqual(second.headers['X-Cache'], 'HIT')
+        self.assertEqual(first.get_json()['data'], second.get_json()['data'])
+        self.assertEqual(self.cache.stats()['hits'], hits_before + 1)
+
+    def test_changed_resume_misses_cache(self):
+        """Test that an edit produces a fresh analysis"""
+        self.client.post('/api/analyze-ats', json={'resume_data': self.resume})
+        edited = dict(self.resume, skills=['Python', 'Flask', 'Docker'])
+
+        response = self.client.post('/api/analyze-ats', json={'resume_data': edited})
+
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+
+    def test_reloaded_job_weights_miss_cache(self):
+        """Test that job-match scores are not served across a job weights reload"""
+        import tempfile
+
+        payload = {'resume_data': self.resume, 'job_description': 'Python Flask developer'}
+        weights = app_module.get_analyzer().job_weights
+        original = weights.path
+        self.client.post('/api/analyze-ats', json=payload)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            corpus = os.path.join(tmpdir, 'postings.jsonl')
+            with open(corpus, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'title': 'Flask Developer', 'description': 'Python and Flask'}) + '\n')
+            weights.reload(corpus)
+            try:
+                response = self.client.post('/api/analyze-ats', json=payload)
+            finally:
+                weights.reload(original)
+
+        self.assertEqual(response.headers['X-Cache'], 'MISS')
+
+    def test_cache_stats_endpoint(self):
+        """Test the cache counters endpoint"""
+        response = self.client.get('/api/analyze-ats/cache-stats')
+
+        data = response.get_json()['data']
+        for counter in ('hits', 'misses', 'evictions', 'size', 'maxsize'):
+            self.assertIn(counter, data)
+
+
+class TestATSTaxonomyEndpoints(unittest.TestCase):
+    """Tests for the taxonomy-backed ATS endpoints"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+        self.admin = {'Authorization': 'Bearer test-token'}
+        environment = mock.patch.dict(os.environ, {'ATS_ADMIN_TOKEN': 'test-token'})
+        environment.start()
+        self.addCleanup(environment.stop)
+
+    def test_score_info_lists_taxonomy_keywords(self):
+        """Test that score info is built from the active taxonomy"""
+        from ats_analyzer import ATSAnalyzer
+
+        response = self.client.get('/api/ats-score-info')
+
+        data = response.get_json()['data']
+        taxonomy = ATSAnalyzer.TAXONOMY.current
+        self.assertEqual(data['taxonomy']['version'], taxonomy.version)
+        self.assertIn('C++', data['important_keywords']['programming_languages'])
+        self.assertEqual(
+            sum(len(skills) for skills in data['important_keywords'].values()),
+            taxonomy.core_size
+        )
+
+    def test_reload_taxonomy(self):
+        """Test reloading the taxonomy file"""
+        response = self.client.post('/api/ats-taxonomy/reload', headers=self.admin)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertGreater(response.get_json()['data']['skills'], 0)
+
+    def test_reload_requires_admin(self):
+        """Test that every client, local ones included, needs the admin token to reload"""
+        remote = {'REMOTE_ADDR': '203.0.113.5'}
+        response = self.client.post('/api/ats-taxonomy/reload', environ_base=remote)
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(response.get_json()['error'], 'FORBIDDEN')
+
+        local = self.client.post('/api/ats-taxonomy/reload')
+        wrong = self.client.post('/api/ats-taxonomy/reload', environ_base=remote,
+                                 headers={'Authorization': 'Bearer guess'})
+        right = self.client.post('/api/ats-taxonomy/reload', environ_base=remote, headers=self.admin)
+        self.assertEqual(local.status_code, 403)
+        self.assertEqual(wrong.status_code, 403)
+        self.assertEqual(right.status_code, 200)
+
+    def test_reload_without_token_configured(self):
+        """Test that without ATS_ADMIN_TOKEN reloads are refused unless local access is opted into"""
+        del os.environ['ATS_ADMIN_TOKEN']
+        # A reverse proxy on the same host makes every client look local
+        self.assertEqual(self.client.post('/api/ats-taxonomy/reload').status_code, 403)
+
+        with mock.patch.dict(os.environ, {'ATS_ADMIN_ALLOW_LOCAL': '1'}):
+            local = self.client.post('/api/ats-taxonomy/reload')
+            remote = self.client.post('/api/ats-taxonomy/reload', environ_base={'REMOTE_ADDR': '203.0.113.5'})
+        self.assertEqual(local.status_code, 200)
+        self.assertEqual(remote.status_code, 403)
+
+    def test_unchanged_reload_keeps_workers(self):
+        """Test that reloading an unchanged file does not re-index or restart the pool"""
+        with mock.patch.object(app_module.job_postings, 'sync') as sync, \
+                mock.patch.object(app_module.ats_executor, 'restart') as restart:
+            response = self.client.post('/api/ats-taxonomy/reload', headers=self.admin)
+
+        self.assertFalse(response.get_json()['data']['changed'])
+        sync.assert_not_called()
+        restart.assert_not_called()
+
+    def test_changed_taxonomy_file_reaches_every_worker(self):
+        """Test that a request notices a taxonomy changed by another process"""
+        from ats_analyzer import ATSAnalyzer
+
+        taxonomy = ATSAnalyzer.TAXONOMY.current
+        with mock.patch.object(ATSAnalyzer.TAXONOMY, 'refresh', return_value=taxonomy), \
+                mock.patch.object(app_module.job_postings, 'sync') as sync, \
+                mock.patch.object(app_module.ats_executor, 'restart') as restart:
+            self.client.get('/api/ats-score-info')
+
+        sync.assert_called_once_with()
+        restart.assert_called_once_with()
+
+
+class TestCareerRoutes(unittest.TestCase):
+    """Tests for /recommend and /career"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+        self.profile = {
+            'Class/Grade': '12th',
+            'Skills': 'Python, Machine Learning, SQL',
+            'Interests': 'Data Science',
+            'Hobbies': 'Reading Tech Blogs',
+            'Passion': 'Solving Problems',
+            'Favourite Subject': 'Mathematics'
+        }
+
+    def test_recommend_renders_top_careers(self):
+        """Test that recommendations are rendered with career metadata"""
+        response = self.client.post('/recommend', data=self.profile)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b'recommendation', response.data.lower())
+
+    def test_career_lookup_is_case_insensitive(self):
+        """Test that /career resolves names regardless of case and spacing"""
+        name = next(iter(get_career_index())).name
+        exact = self.client.get('/career', query_string={'name': name})
+        loose = self.client.get('/career', query_string={'name': '  ' + name.upper() + ' '})
+
+        self.assertEqual(exact.status_code, 200)
+        self.assertEqual(loose.status_code, 200)
+
+    def test_unknown_career(self):
+        """Test that an unknown career returns 404"""
+        response = self.client.get('/career', query_string={'name': 'Professional Juggler'})
+
+        self.assertEqual(response.status_code, 404)
+
+
+class TestRecommendBatchEndpoint(unittest.TestCase):
+    """Tests for /api/recommend/batch"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+        self.profile = {
+            'Class/Grade': '12th',
+            'Skills': 'Python, Machine Learning, SQL',
+            'Interests': 'Data Science',
+            'Hobbies': 'Reading Tech Blogs',
+            'Passion': 'Solving Problems',
+            'Favourite Subject': 'Mathematics'
+        }
+
+    def test_batch_recommendations(self):
+        """Test a classroom-sized batch"""
+        response = self.client.post('/api/recommend/batch', json={'profiles': [self.profile] * 40, 'k': 5})
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual((data['k'], data['total'], data['succeeded']), (5, 40, 40))
+        first = data['results'][0]['data']['recommendations']
+        self.assertEqual(len(first), 5)
+        self.assertIn('salary', first[0])
+        self.assertIn('score', first[0])
+        self.assertEqual(data['results'][0], dict(data['results'][39], index=0))
+
+    def test_missing_profiles(self):
+        """Test that a request without profiles is rejected"""
+        response = self.client.post('/api/recommend/batch', json={})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()['error'], 'MISSING_PROFILES')
+
+    def test_invalid_k(self):
+        """Test that k outside the allowed range is rejected"""
+        for k in (0, 'three', True, 1000):
+            response = self.client.post('/api/recommend/batch', json={'profiles': [self.profile], 'k': k})
+            self.assertEqual(response.get_json()['error'], 'INVALID_K')
+
+    def test_batch_too_large(self):
+        """Test the batch size limit"""
+        response = self.client.post('/api/recommend/batch', json={'profiles': [{}] * 501})
+
+        self.assertEqual(response.get_json()['error'], 'BATCH_TOO_LARGE')
+
+
+class TestRankResumesEndpoint(unittest.TestCase):
+    """Tests for /api/analyze-ats/rank"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+        self.job_description = 'Python engineer with Kubernetes experience'
+        self.resumes = [
+            {'_id': 'a', 'skills': ['Java']},
+            {'_id': 'b', 'skills': ['Python', 'Kubernetes']},
+            {'_id': 'c', 'skills': ['Python']}
+        ]
+
+    def test_rank_json_list(self):
+        """Test ranking a JSON list of resumes"""
+        response = self.client.post('/api/analyze-ats/rank', json={
+            'job_description': self.job_description, 'resumes': self.resumes, 'top_n': 2
+        })
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual([item['resume_id'] for item in data['results']], ['b', 'c'])
+        self.assertEqual(data['total_resumes'], 3)
+
+    def test_rank_ndjson_stream(self):
+        """Test ranking resumes streamed as newline-delimited JSON"""
+        lines = [json.dumps({'job_description': self.job_description, 'top_n': 1})]
+        lines += [json.dumps(resume) for resume in self.resumes] + ['not json']
+        response = self.client.post('/api/analyze-ats/rank', data='\n'.join(lines) + '\n',
+                                    content_type='application/x-ndjson')
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual(data['results'][0]['resume_id'], 'b')
+        self.assertEqual((data['total_resumes'], data['skipped']), (4, 1))
+
+    def test_validation_errors(self):
+        """Test missing resumes, job description and bad top_n"""
+        cases = [
+            ({'job_description': self.job_description}, 'MISSING_RESUMES'),
+            ({'resumes': self.resumes}, 'INVALID_JOB_DESCRIPTION'),
+            ({'resumes': self.resumes, 'job_description': '  '}, 'INVALID_JOB_DESCRIPTION'),
+            ({'resumes': self.resumes, 'job_description': self.job_description, 'top_n': 0}, 'INVALID_TOP_N')
+        ]
+        for body, error in cases:
+            response = self.client.post('/api/analyze-ats/rank', json=body)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()['error'], error)
+
+
+class TestJobPostingMatchEndpoint(unittest.TestCase):
+    """Tests for /api/job-postings/match"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+
+    def test_match_resume_against_postings(self):
+        """Test that a resume gets ranked postings from the bundled corpus"""
+        response = self.client.post('/api/job-postings/match', json={
+            'resume_data': {'skills': ['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS']},
+            'top_k': 3
+        })
+
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()['data']
+        self.assertEqual(len(data['results']), 3)
+        self.assertEqual([result['rank'] for result in data['results']], [1, 2, 3])
+        scores = [result['match_score'] for result in data['results']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_validation_errors(self):
+        """Test missing resume and bad top_k"""
+        cases = [
+            ({}, 'MISSING_RESUME_DATA'),
+            ({'resume_data': 'text'}, 'MISSING_RESUME_DATA'),
+            ({'resume_data': {}, 'top_k': 0}, 'INVALID_TOP_K'),
+            ({'resume_data': {}, 'top_k': True}, 'INVALID_TOP_K')
+        ]
+        for body, error in cases:
+            response = self.client.post('/api/job-postings/match', json=body)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()['error'], error)
+
+
+class TestATSJobsEndpoint(unittest.TestCase):
+    """Tests for /api/analyze-ats/jobs"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.client = app.test_client()
+        self.resume = {'skills': ['Python', 'Django'], 'professionalSummary': 'Async job test resume'}
+
+    def test_submit_and_poll(self):
+        """Test that a queued job can be polled until it has a result"""
+        response = self.client.post('/api/analyze-ats/jobs', json={
+            'resume_data': self.resume, 'job_description': 'Python developer'
+        })
+
+        self.assertEqual(response.status_code, 202)
+        job = response.get_json()['data']
+        self.assertEqual(response.headers['Location'], job['status_url'])
+
+        for _ in range(200):
+            polled = self.client.get(job['status_url']).get_json()['data']
+            if polled['status'] in ('succeeded', 'failed'):
+                break
+            time.sleep(0.01)
+        self.assertEqual(polled['status'], 'succeeded')
+        self.assertIn('ats_score', polled['result'])
+        self.assertIn('job_match', polled['result'])
+
+    def test_unknown_job(self):
+        """Test that an unknown job id is 404"""
+        response = self.client.get('/api/analyze-ats/jobs/does-not-exist')
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.get_json()['error'], 'JOB_NOT_FOUND')
+
+    def test_validation_errors(self):
+        """Test missing resume, bad job description and bad callback URL"""
+        cases = [
+            ({}, 'MISSING_RESUME_DATA'),
+            ({'resume_data': []}, 'INVALID_RESUME_FORMAT'),
+            ({'resume_data': self.resume, 'job_description': 5}, 'INVALID_JOB_DESCRIPTION'),
+            ({'resume_data': self.resume, 'callback_url': 'ftp://example.com'}, 'INVALID_CALLBACK_URL'),
+            ({'resume_data': self.resume, 'callback_url': 'http://169.254.169.254/latest'}, 'INVALID_CALLBACK_URL')
+        ]
+        for body, error in cases:
+            response = self.client.post('/api/analyze-ats/jobs', json=body)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()['error'], error)
+
+
+class BusyExecutor:
+    """Executor whose workers and queue are always full"""
+
+    inline = False
+    workers = 2
+
+    def run(self, func, *args):
+        raise ExecutorBusy(5)
+
+    def run_many(self, func, arguments):
+        raise ExecutorBusy(5)
+
+
+class TestATSBackpressure(unittest.TestCase):
+    """Tests for 503 responses when the ATS workers are saturated"""
+
+    def setUp(self):
+        """Swap in a saturated executor"""
+        self.client = app.test_client()
+        self.executor = app_module.ats_executor
+        app_module.ats_executor = BusyExecutor()
+
+    def tearDown(self):
+        app_module.ats_executor = self.executor
+
+    def test_busy_responses(self):
+        """Test that analysis routes answer 503 with Retry-After instead of queueing"""
+        resume = {'skills': ['Python'], 'professionalSummary': 'Backpressure test resume'}
+        requests = [
+            ('/api/analyze-ats', {'resume_data': resume}),
+            ('/api/analyze-ats/batch', {'resumes': [resume, resume]}),
+            ('/api/analyze-ats/rank', {'job_description': 'Python', 'resumes': [resume]})
+        ]
+        for url, body in requests:
+            response = self.client.post(url, json=body)
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers['Retry-After'], '5')
+            self.assertEqual(response.get_json()['error'], 'SERVER_BUSY')
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+    """Tests for /metrics"""
+
+    def setUp(self):
+        """Set up test client with empty metrics"""
+        self.client = app.test_client()
+        REGISTRY.clear()
+
+    def tearDown(self):
+        REGISTRY.enabled = True
+        REGISTRY.clear()
+
+    def test_exposes_request_and_stage_timings(self):
+        """Test that requests and analysis stages show up in the exposition"""
+        resume = {'skills': ['Python'], 'professionalSummary': 'Metrics test resume'}
+        self.client.post('/api/analyze-ats', json={'resume_data': resume})
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        text = response.get_data(as_text=True)
+        self.assertIn('http_requests_total{method="POST",route="/api/analyze-ats",status="200"} 1.0', text)
+        self.assertIn('http_request_duration_seconds_count{method="POST",route="/api/analyze-ats",status="200"} 1', text)
+
+    def test_disabled(self):
+        """Test that /metrics answers 404 and nothing is recorded while disabled"""
+        REGISTRY.enabled = False
+        self.client.get('/career', query_string={'name': 'Data Scientist'})
+        self.assertEqual(self.client.get('/metrics').status_code, 404)
+        REGISTRY.enabled = True
+        self.assertNotIn('route="/career"', self.client.get('/metrics').get_data(as_text=True))
+
+
+class TestReadinessEndpoint(unittest.TestCase):
+    """Tests for /ready and for routes whose component is disabled"""
+
+    def setUp(self):
+        """Set up test client"""
+        self.client = app.test_client()
+        self.models = app_module.recommendation_models
+
+    def tearDown(self):
+        app_module.recommendation_models = self.models
+
+    def test_reports_components(self):
+        """Test that the ATS routes are ready and the recommender state is reported"""
+        app_module.get_recommender()
+        response = self.client.get('/ready?require=recommender')
+        self.assertEqual(response.status_code, 200)
+        components = response.get_json()['data']['components']
+        self.assertEqual(components['ats']['state'], 'loaded')
+        self.assertEqual(components['recommender']['state'], 'loaded')
+
+        self.assertEqual(self.client.get('/ready?require=tutor').status_code, 400)
+
+    def test_ats_only_process(self):
+        """Test that with the recommender off ATS works and recommendation routes answer 503"""
+        app_module.recommendation_models = LazyComponent('recommender', app_module.load_recommendation_models, 'off')
+
+        self.assertEqual(self.client.get('/ready').status_code, 200)
+        response = self.client.get('/ready?require=recommender')
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.get_json()['data']['components']['recommender']['state'], 'disabled')
+
+        batch = self.client.post('/api/recommend/batch', json={'profiles': [{}]})
+        self.assertEqual(batch.status_code, 503)
+        self.assertEqual(batch.get_json()['error'], 'COMPONENT_DISABLED')
+        self.assertEqual(self.client.get('/career', query_string={'name': 'Data Scientist'}).status_code, 503)
+        self.assertEqual(self.client.get('/aptitude_test').status_code, 503)
+
+        resume = {'skills': ['Python'], 'professionalSummary': 'ATS-only test resume'}
+        self.assertEqual(self.client.post('/api/analyze-ats', json={'resume_data': resume}).status_code, 200)
+
+
+class TestCachedPages(unittest.TestCase):
+    """Tests for the pre-rendered aptitude test, career pages and ATS scoring info"""
+
+    def setUp(self):
+        """Set up test client with an empty page cache"""
+        self.client = app.test_client()
+        app_module.page_cache.clear()
+
+    def test_pages_revalidate(self):
+        """Test that cached pages repeat their body and answer 304 to a current ETag"""
+        name = next(iter(get_career_index())).name
+        urls = ['/aptitude_test', f'/career?name={name}', '/api/ats-score-info']
+        misses = app_module.page_cache.stats()['misses']
+        for url in urls:
+            first = self.client.get(url)
+            second = self.client.get(url)
+            self.assertEqual(first.status_code, 200, url)
+            self.assertEqual(first.get_data(), second.get_data(), url)
+            self.assertEqual(first.headers['ETag'], second.headers['ETag'], url)
+
+            not_modified = self.client.get(url, headers={'If-None-Match': first.headers['ETag']})
+            self.assertEqual(not_modified.status_code, 304, url)
+        self.assertEqual(app_module.page_cache.stats()['misses'], misses + len(urls))
+
+    def test_pages_keep_the_requested_name(self):
+        """Test that differently spelled career names are cached separately"""
+        name = next(iter(get_career_index())).name
+        exact = self.client.get('/career', query_string={'name': name})
+        lower = self.client.get('/career', query_string={'name': name.lower()})
+        self.assertEqual(lower.status_code, 200)
+        self.assertNotEqual(exact.headers['ETag'], lower.headers['ETag'])
+        self.assertEqual(self.client.get('/career', query_string={'name': 'No Such Career'}).status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,236 @@
+"""
+Unit Tests for Recommender Artifacts
+Tests for bundle building, checksums and stale-bundle rebuilds
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import artifacts
+from artifacts import build_bundle, load_bundle, load_or_build_bundle, source_checksum, write_bundle
+
+SKILLS_ROWS = [
+    'Grade/Class,Skills,Interests,Hobbies,Passion,Favorite Subject,Recommended Career,Salary,Job Description,Job Security,Topics to Be Covered',
+    '12th,"Python, SQL, Statistics",Data,Reading,Analysis,Mathematics,Data Scientist,120000,Analyze data.,High,Python-Statistics-ML',
+    '12th,"Pandas, Python, Machine Learning",Data,Chess,Analysis,Mathematics,Data Scientist,125000,Analyze data again.,High,Python-Statistics-ML',
+    'BSc,"HTML, CSS, JavaScript",Design,Drawing,Creating,Art,Frontend Developer,90000,Build web UIs.,Medium,HTML-CSS-React',
+    'BSc,"React, JavaScript, CSS",Design,Gaming,Creating,Art,Frontend Developer,95000,Build web UIs again.,Medium,HTML-CSS-React',
+]
+
+QUESTION_ROWS = [
+    'id,question,option1,option2,option3,option4,answer',
+    '1,What does RAM stand for?,Random Access Memory,Read-Only Memory,Remote Access Module,Randomly Accessed Memory,Random Access Memory',
+]
+
+
+class TestArtifactBundle(unittest.TestCase):
+    """Test suite for the recommender artifact bundle"""
+
+    def setUp(self):
+        """Write small source CSVs into a temporary directory"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.skills_csv = os.path.join(self.tmpdir, 'skills.csv')
+        self.questions_csv = os.path.join(self.tmpdir, 'aptitude_questions.csv')
+        self.bundle_path = os.path.join(self.tmpdir, 'artifacts', 'recommender.joblib')
+        self._write(self.skills_csv, SKILLS_ROWS)
+        self._write(self.questions_csv, QUESTION_ROWS)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write(self, path, rows):
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write('\n'.join(rows) + '\n')
+
+    def test_checksum_tracks_file_contents(self):
+        """Test that the checksum changes only when a source file changes"""
+        before = source_checksum([self.skills_csv, self.questions_csv])
+        self.assertEqual(before, source_checksum([self.skills_csv, self.questions_csv]))
+
+        self._write(self.questions_csv, QUESTION_ROWS + ['2,Q?,a,b,c,d,a'])
+        self.assertNotEqual(before, source_checksum([self.skills_csv, self.questions_csv]))
+
+    def test_bundle_contents(self):
+        """Test that the bundle holds a usable model, careers and questions"""
+        bundle = build_bundle(self.skills_csv, self.questions_csv)
+
+        self.assertEqual(bundle['format_version'], artifacts.BUNDLE_FORMAT_VERSION)
+        self.assertEqual(set(bundle['careers']), {'Data Scientist', 'Frontend Developer'})
+        self.assertEqual(bundle['careers']['Data Scientist']['salary'], 120000)
+        self.assertEqual(bundle['careers']['Frontend Developer']['topics'], 'HTML-CSS-React')
+        self.assertEqual(bundle['questions'][0]['options'][0], 'Random Access Memory')
+
+        vector = bundle['vectorizer'].transform(['python sql statistics'])
+        self.assertEqual(bundle['model'].predict(vector)[0], 'Data Scientist')
+
+    def test_round_trip_with_mmap(self):
+        """Test that a written bundle loads back and predicts the same"""
+        bundle = build_bundle(self.skills_csv, self.questions_csv)
+        write_bundle(bundle, self.bundle_path)
+
+        loaded = load_bundle(self.bundle_path)
+        self.assertIsNotNone(loaded)
+        self.assertEqual(loaded['checksum'], bundle['checksum'])
+        self.assertEqual(loaded['careers'], bundle['careers'])
+
+        vector = loaded['vectorizer'].transform(['html css javascript'])
+        self.assertEqual(list(loaded['model'].predict_proba(vector)[0]),
+                         list(bundle['model'].predict_proba(vector)[0]))
+
+    def test_missing_or_foreign_bundle_is_ignored(self):
+        """Test that unusable bundle files load as None"""
+        self.assertIsNone(load_bundle(self.bundle_path))
+
+        write_bundle({'format_version': -1}, self.bundle_path)
+        self.assertIsNone(load_bundle(self.bundle_path))
+
+        with open(self.bundle_path, 'wb') as f:
+            f.write(b'not a bundle')
+        self.assertIsNone(load_bundle(self.bundle_path))
+
+    def test_load_or_build_reuses_current_bundle(self):
+        """Test that an up-to-date bundle is loaded instead of retrained"""
+        first = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv)
+        second = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv)
+
+        self.assertEqual(first['built_at'], second['built_at'])
+        self.assertEqual(first['checksum'], second['checksum'])
+
+    def test_engine_bundles(self):
+        """Test that each engine trains its own model and a different engine triggers a rebuild"""
+        for engine in ('linear', 'centroid'):
+            bundle = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv, engine=engine)
+            self.assertEqual(bundle['engine'], engine)
+
+            vector = bundle['vectorizer'].transform(['html css javascript'])
+            self.assertEqual(bundle['model'].predict(vector)[0], 'Frontend Developer')
+
+    def test_default_bundle_path_per_engine(self):
+        """Test that engines do not overwrite each other's bundles"""
+        self.assertNotEqual(artifacts.default_bundle_path('linear'), artifacts.default_bundle_path('centroid'))
+
+    def test_load_or_build_rebuilds_stale_bundle(self):
+        """Test that editing a source CSV triggers a rebuild"""
+        first = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv)
+
+        self._write(self.questions_csv, QUESTION_ROWS + ['2,Q?,a,b,c,d,a'])
+        second = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv)
+
+        self.assertNotEqual(first['checksum'], second['checksum'])
+        self.assertEqual(len(second['questions']), 2)
+
+    def test_library_version_and_params_are_part_of_the_key(self):
+        """Test that a scikit-learn upgrade or new hyperparameters trigger a rebuild"""
+        first = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv, engine='linear')
+
+        with mock.patch('sklearn.__version__', '0.0.1'):
+            second = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv, engine='linear')
+        self.assertNotEqual(first['key'], second['key'])
+
+        with mock.patch.dict(artifacts.VECTORIZER_PARAMS, max_features=500):
+            third = load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv, engine='linear')
+        self.assertNotIn(third['key'], (first['key'], second['key']))
+        self.assertEqual(first['checksum'], third['checksum'])
+
+    def test_concurrent_starts_train_once(self):
+        """Test that processes starting together on a missing bundle train only once"""
+        builds = []
+        real_build = artifacts.build_bundle
+
+        def slow_build(*args):
+            builds.append(1)
+            time.sleep(0.2)
+            return real_build(*args)
+
+        results = []
+        with mock.patch.object(artifacts, 'build_bundle', slow_build):
+            threads = [threading.Thread(target=lambda: results.append(
+                load_or_build_bundle(self.bundle_path, self.skills_csv, self.questions_csv, engine='centroid')))
+                for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(30)
+
+        self.assertEqual(len(builds), 1)
+        self.assertEqual(len({bundle['built_at'] for bundle in results}), 1)
+        self.assertEqual(len(results), 3)
+
+    def test_failed_write_keeps_previous_bundle(self):
+        """Test that an interrupted write leaves the old bundle and no temporary file"""
+        bundle = build_bundle(self.skills_csv, self.questions_csv, 'centroid')
+        write_bundle(bundle, self.bundle_path)
+
+        with mock.patch.object(artifacts.joblib, 'dump', side_effect=OSError('disk full')):
+            with self.assertRaises(OSError):
+                write_bundle(dict(bundle, built_at='later'), self.bundle_path)
+
+        self.assertEqual(load_bundle(self.bundle_path)['built_at'], bundle['built_at'])
+        leftovers = [name for name in os.listdir(os.path.dirname(self.bundle_path)) if name.startswith('.')]
+        self.assertEqual(leftovers, [])
+
+    def test_loading_does_not_import_pandas(self):
+        """Test that serving from a bundle leaves pandas unimported"""
+        write_bundle(build_bundle(self.skills_csv, self.questions_csv), self.bundle_path)
+        code = ("import sys, artifacts; artifacts.load_bundle(sys.argv[1])['model'].predict_proba; "
+                "sys.exit('pandas' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code, self.bundle_path],
+                                cwd=os.path.dirname(artifacts.__file__))
+        self.assertEqual(result.returncode, 0)
+
+    def test_without_package(self):
+        """Test that a hidden package cannot be imported inside the block only"""
+        sys.modules.pop('tabnanny', None)
+        with artifacts.without_package('tabnanny'):
+            with self.assertRaises(ImportError):
+                import tabnanny  # noqa: F401
+        import tabnanny  # noqa: F401
+
+    def test_without_package_removes_hook_on_error(self):
+        """Test that the import hook is gone after a failing block"""
+        hooks = list(sys.meta_path)
+        with self.assertRaises(RuntimeError):
+            with artifacts.without_package('tabnanny'):
+                raise RuntimeError('boom')
+        self.assertEqual(sys.meta_path, hooks)
+
+    def test_import_without_falls_back_when_needed(self):
+        """Test that a module that needs the hidden package is imported with it"""
+        package = os.path.join(self.tmpdir, 'needs_tabnanny')
+        os.makedirs(package)
+        with open(os.path.join(package, '__init__.py'), 'w') as f:
+            f.write('import tabnanny\n')
+        sys.path.insert(0, self.tmpdir)
+        sys.modules.pop('tabnanny', None)
+        try:
+            self.assertFalse(artifacts.import_without('needs_tabnanny', 'tabnanny'))
+            self.assertIn('needs_tabnanny', sys.modules)
+            self.assertIn('tabnanny', sys.modules)
+        finally:
+            sys.path.remove(self.tmpdir)
+            sys.modules.pop('needs_tabnanny', None)
+
+    def test_sklearn_models_work_without_pandas(self):
+        """Test that the serving models train and predict with pandas hidden on the installed scikit-learn"""
+        code = ("import sys, artifacts\n"
+                "from sklearn.feature_extraction.text import TfidfVectorizer\n"
+                "from engines import make_engine\n"
+                "texts = ['python sql data', 'react css design', 'python data science', 'css html react']\n"
+                "X = TfidfVectorizer().fit_transform(texts)\n"
+                "for engine in ('random_forest', 'linear', 'centroid'):\n"
+                "    make_engine(engine).fit(X, ['data', 'web', 'data', 'web']).predict_proba(X)\n"
+                "sys.exit('pandas' in sys.modules)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=os.path.dirname(artifacts.__file__))
+        self.assertEqual(result.returncode, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,7 +8,7 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(__file__))
 
-from ats_analyzer import ATSAnalyzer
+from ats_analyzer import ATSAnalyzer, ATSResult, analyze_ats, analyze_ats_batch, get_analyzer, rank_resumes
 
 
 class TestATSAnalyzer(unittest.TestCase):
@@ -185,6 +185,22 @@ class TestATSAnalyzer(unittest.TestCase):
         score = self.analyzer.get_keyword_score(resume)
         self.assertGreater(score, 15)
 
+    def test_keyword_analysis_matches_whole_words(self):
+        """Test that keywords are not found inside longer words"""
+        resume = {
+            'personalInfo': {'email': 'john@example.com'},
+            'professionalSummary': 'Good JavaScript developer',
+            'skills': []
+        }
+
+        analysis = self.analyzer.analyze_resume(resume)
+        text = self.analyzer._get_resume_text(resume)
+        found = self.analyzer.taxonomy.current.matcher.find(text)
+        self.assertEqual(found, {('programming_languages', 'javascript')})
+        # The analysis itself still reports Java as missing
+        self.assertIn('Java', analysis['missing_keywords'])
+        self.assertNotIn('Javascript', analysis['missing_keywords'])
+
     # ============================================
     # STRUCTURE SCORE TESTS
     # ============================================
@@ -634,6 +650,263 @@ class TestATSAnalyzer(unittest.TestCase):
         self.assertLessEqual(analysis['ats_score'], 100)
 
 
+class TestATSBatchAnalysis(unittest.TestCase):
+    """Tests for batch ATS analysis"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.resume = {
+            'personalInfo': {
+                'firstName': 'John',
+                'lastName': 'Doe',
+                'email': 'john@example.com',
+                'phone': '+1-234-567-8900',
+                'location': 'New York, NY'
+            },
+            'professionalSummary': 'Python developer',
+            'experience': [],
+            'education': [],
+            'skills': ['Python', 'JavaScript']
+        }
+
+    def test_batch_matches_single_analysis(self):
+        """Test that batch scores equal scores from analyze_ats"""
+        results = analyze_ats_batch([self.resume, self.resume])
+
+        single = analyze_ats(self.resume)
+        self.assertEqual(len(results), 2)
+        for index, item in enumerate(results):
+            self.assertEqual(item['index'], index)
+            self.assertTrue(item['success'])
+            self.assertEqual(item['data']['ats_score'], single['ats_score'])
+            self.assertEqual(item['data']['job_match']['match_percentage'], 0)
+
+    def test_batch_uses_shared_job_description(self):
+        """Test job matching against a shared job description"""
+        job_description = 'Looking for Python developer'
+
+        results = analyze_ats_batch([self.resume], job_description)
+
+        expected = ATSAnalyzer().analyze_job_match(
+            ATSAnalyzer()._get_resume_text(self.resume), job_description
+        )
+        self.assertEqual(results[0]['data']['job_match'], expected)
+
+    def test_batch_isolates_failures(self):
+        """Test that a bad item does not fail the rest of the batch"""
+        broken = dict(self.resume, skills=None)
+
+        results = analyze_ats_batch([self.resume, 'not a resume', broken, self.resume])
+
+        self.assertEqual([item['success'] for item in results], [True, False, False, True])
+        self.assertEqual(results[1]['error'], 'INVALID_RESUME_FORMAT')
+        self.assertIsNotNone(results[2]['error'])
+        self.assertIsNone(results[2]['data'])
+
+    def test_empty_batch(self):
+        """Test that an empty batch returns no results"""
+        self.assertEqual(analyze_ats_batch([]), [])
+
+
+class TestResumeRanking(unittest.TestCase):
+    """Tests for ranking many resumes against one job description"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.analyzer = ATSAnalyzer()
+        self.job_description = 'Backend engineer: Python, Kubernetes and PostgreSQL experience'
+
+    def resume(self, resume_id, skills):
+        return {'_id': resume_id, 'professionalSummary': 'Software engineer', 'skills': skills}
+
+    def test_ranks_best_matches_first(self):
+        """Test ordering, top_n and the reported match fields"""
+        resumes = [
+            self.resume('a', ['Java']),
+            self.resume('b', ['Python', 'Kubernetes', 'PostgreSQL']),
+            self.resume('c', ['Python']),
+            self.resume('d', ['Python', 'Kubernetes'])
+        ]
+
+        ranking = rank_resumes(resumes, self.job_description, top_n=3)
+
+        self.assertEqual([item['resume_id'] for item in ranking['results']], ['b', 'd', 'c'])
+        self.assertEqual([item['rank'] for item in ranking['results']], [1, 2, 3])
+        self.assertEqual(ranking['results'][0]['index'], 1)
+        scores = [item['weighted_match_percentage'] for item in ranking['results']]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual((ranking['total_resumes'], ranking['ranked'], ranking['skipped']), (4, 4, 0))
+
+    def test_matches_single_resume_analysis(self):
+        """Test that ranked scores equal analyze_job_match for each resume"""
+        resume = self.resume('b', ['Python', 'PostgreSQL'])
+
+        item = rank_resumes([resume], self.job_description)['results'][0]
+        expected = self.analyzer.analyze_job_match(self.analyzer._get_resume_text(resume), self.job_description)
+
+        self.assertEqual(item['match_score'], expected['match_score'])
+        self.assertEqual(item['matched_keywords'], expected['matched_keywords'])
+
+    def test_streams_in_chunks_with_stable_ties(self):
+        """Test a generator spanning several chunks; ties keep input order"""
+        resumes = (self.resume(i, ['Python'] if i % 7 else ['Python', 'Kubernetes']) for i in range(50))
+
+        ranking = self.analyzer.rank_resumes(resumes, self.job_description, top_n=10, chunk_size=8)
+
+        self.assertEqual([item['index'] for item in ranking['results']], [0, 7, 14, 21, 28, 35, 42, 49, 1, 2])
+        self.assertEqual(ranking['total_resumes'], 50)
+
+    def test_skips_invalid_resumes(self):
+        """Test that non-objects and malformed resumes are counted, not ranked"""
+        resumes = ['text', None, {'skills': None}, self.resume('ok', ['Python'])]
+
+        ranking = rank_resumes(resumes, self.job_description)
+
+        self.assertEqual((ranking['ranked'], ranking['skipped']), (1, 3))
+        self.assertEqual(ranking['results'][0]['resume_id'], 'ok')
+        self.assertEqual(ranking['results'][0]['index'], 3)
+
+    def test_accepts_parsed_job_description(self):
+        """Test passing a JobProfile parsed once"""
+        job = self.analyzer.parse_job_description(self.job_description)
+        resumes = [self.resume('x', ['Kubernetes'])]
+
+        self.assertEqual(self.analyzer.rank_resumes(resumes, job), rank_resumes(resumes, self.job_description))
+
+
+class TestATSAnalyzerConcurrency(unittest.TestCase):
+    """Tests for sharing one analyzer across threads"""
+
+    SKILL_SETS = [
+        [],
+        ['Python'],
+        ['Python', 'Django', 'PostgreSQL', 'Docker', 'AWS'],
+        ['JavaScript', 'React', 'MongoDB'],
+        ['Java', 'Spring', 'MySQL', 'Kubernetes', 'Jenkins', 'GitHub'],
+        ['Leadership', 'Communication', 'Teamwork']
+    ]
+
+    def make_resume(self, i):
+        """Build a distinct resume for index i"""
+        skills = self.SKILL_SETS[i % len(self.SKILL_SETS)]
+        return {
+            'personalInfo': {
+                'firstName': f'Person{i}',
+                'lastName': 'Test',
+                'email': f'person{i}@example.com' if i % 3 else '',
+                'phone': '+1-234-567-8900' if i % 4 else '',
+                'location': 'Remote'
+            },
+            'professionalSummary': ' '.join(skills) + ' engineer' * (i % 5),
+            'experience': [
+                {'jobTitle': 'Engineer', 'companyName': f'Co {j}', 'description': ' '.join(skills)}
+                for j in range(i % 3)
+            ],
+            'education': [{'schoolName': 'State', 'degree': 'BSc'}] if i % 2 else [],
+            'skills': skills
+        }
+
+    def test_shared_analyzer_results_never_bleed(self):
+        """Test concurrent analyses on one instance against serial results"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        analyzer = get_analyzer()
+        resumes = [self.make_resume(i) for i in range(24)]
+        expected = [analyzer.analyze(resume)._replace(timestamp='') for resume in resumes]
+        self.assertGreater(len(set(expected)), 10)
+
+        def run(i):
+            index = (i * 7) % len(resumes)
+            result = analyzer.analyze_resume(resumes[index])
+            breakdown = analyzer.get_score_breakdown()
+            return index, result, breakdown
+
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            with ThreadPoolExecutor(max_workers=16) as pool:
+                outcomes = list(pool.map(run, range(2000)))
+        finally:
+            sys.setswitchinterval(switch_interval)
+
+        for index, result, breakdown in outcomes:
+            want = expected[index]
+            result['timestamp'] = ''
+            self.assertEqual(result, want.to_dict())
+            self.assertEqual(breakdown, want.score_breakdown())
+
+    def test_result_is_immutable(self):
+        """Test that analysis results cannot be modified"""
+        result = ATSAnalyzer().analyze(self.make_resume(2))
+
+        self.assertIsInstance(result, ATSResult)
+        self.assertIsInstance(result.suggestions, tuple)
+        with self.assertRaises(AttributeError):
+            result.ats_score = 100
+
+    def test_score_breakdown_compatibility(self):
+        """Test get_score_breakdown after analyze_resume"""
+        analyzer = ATSAnalyzer()
+        self.assertEqual(analyzer.get_score_breakdown()['overall'], 0)
+
+        analysis = analyzer.analyze_resume(self.make_resume(4))
+
+        breakdown = analyzer.get_score_breakdown()
+        self.assertEqual(breakdown['overall'], analysis['ats_score'])
+        self.assertEqual(breakdown['keywords']['score'], analysis['keyword_score'])
+
+
+class TestFormattingScanner(unittest.TestCase):
+    """Tests that scan_formatting scores exactly like the per-check regex passes"""
+
+    FRAGMENTS = ['Python developer', 'jane@example.com', 'a@b', 'x@y.z', '+1 (234) 567-8900', '12345',
+                 '   ', '     ', '  ', '\u2022', '\u00ae', '\u00e9', '\u0928\u092e\u0938\u094d\u0924\u0947', '\u2605 Lead',
+                 '--', '\n', 'Senior engineer, 2019-2023', '(555) 010 0199']
+
+    def reference_formatting(self, resume_text):
+        """The formatting checks as separate passes over the text"""
+        import re
+        score = 25
+        suggestions = []
+        special_char_count = sum(1 for char in resume_text if char in ATSAnalyzer.UNFRIENDLY_CHARACTERS)
+        if special_char_count > 0:
+            score -= min(5, special_char_count)
+            suggestions.append(f"Remove {special_char_count} special characters - ATS systems may not parse them correctly")
+        if len(re.findall(r'  {2,}', resume_text)) > 10:
+            score -= 5
+            suggestions.append("Reduce excessive spacing - Use single spaces between words")
+        if len(re.findall(r'[^\x00-\x7F]', resume_text)) > 5:
+            score -= 5
+            suggestions.append("Remove non-ASCII characters - ATS systems work best with standard characters")
+        if not re.findall(r'[\w\.-]+@[\w\.-]+\.\w+', resume_text):
+            score -= 3
+            suggestions.append("Add a valid email address in standard format")
+        if not re.findall(r'[\d\-\+\(\) ]{10,}', resume_text):
+            score -= 2
+            suggestions.append("Add a phone number in a standard format")
+        return max(0, score), suggestions
+
+    def test_matches_reference_on_random_texts(self):
+        """Test identical scores and suggestions over many generated texts"""
+        import random
+        rng = random.Random(7)
+        analyzer = ATSAnalyzer()
+        texts = [''] + [' '.join(rng.choice(self.FRAGMENTS) for _ in range(rng.randint(1, 60))) for _ in range(500)]
+
+        for text in texts:
+            self.assertEqual(analyzer._score_formatting(text), self.reference_formatting(text), repr(text))
+
+    def test_signals(self):
+        """Test the individual signals of a text"""
+        signals = ATSAnalyzer().scan_formatting('\u2022 Lead \u00e9 jane@example.com' + '   x' * 3)
+
+        self.assertEqual(signals.special_characters, 1)
+        self.assertEqual(signals.non_ascii, 2)
+        self.assertEqual(signals.spacing_runs, 3)
+        self.assertTrue(signals.has_email)
+        self.assertFalse(signals.has_phone)
+
+
 class TestATSAnalyzerPerformance(unittest.TestCase):
     """Performance tests for ATS Analyzer"""
 
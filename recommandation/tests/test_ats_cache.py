@@ -0,0 +1,110 @@
+"""
+Unit Tests for ATS Result Cache
+Tests for LRU eviction, expiry, counters and content-hash keys
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_cache import ResultCache, resume_cache_key
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache(unittest.TestCase):
+    """Test suite for ResultCache"""
+
+    def test_hit_and_miss_counters(self):
+        """Test that lookups are counted"""
+        cache = ResultCache(maxsize=4)
+
+        value, cached = cache.get_or_compute('a', lambda: 1)
+        self.assertEqual((value, cached), (1, False))
+        value, cached = cache.get_or_compute('a', lambda: 2)
+        self.assertEqual((value, cached), (1, True))
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (1, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_size_bound_evicts_least_recently_used(self):
+        """Test LRU eviction at maxsize"""
+        cache = ResultCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+
+        cache.put('c', 3)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_entries_expire_after_ttl(self):
+        """Test TTL expiry"""
+        clock = FakeClock()
+        cache = ResultCache(maxsize=2, ttl=10, clock=clock)
+        cache.put('a', 1)
+
+        clock.now = 9.9
+        self.assertEqual(cache.get('a'), (True, 1))
+        clock.now = 10.0
+        self.assertEqual(cache.get('a'), (False, None))
+        self.assertEqual(cache.stats()['expirations'], 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_zero_size_disables_cache(self):
+        """Test that maxsize 0 never stores entries"""
+        cache = ResultCache(maxsize=0)
+        cache.get_or_compute('a', lambda: 1)
+
+        self.assertEqual(cache.get_or_compute('a', lambda: 2), (2, False))
+
+
+class TestResumeCacheKey(unittest.TestCase):
+    """Test suite for resume_cache_key"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.resume = {
+            '_id': '65a1',
+            'updatedAt': '2024-01-01',
+            'personalInfo': {'firstName': 'Jane', 'email': 'jane@example.com'},
+            'skills': ['Python', 'React']
+        }
+
+    def test_key_ignores_bookkeeping_and_key_order(self):
+        """Test that unrelated fields and dict order do not change the key"""
+        reordered = {
+            'skills': ['Python', 'React'],
+            'personalInfo': {'email': 'jane@example.com', 'firstName': 'Jane'},
+            '_id': 'other',
+            'atsScore': 71
+        }
+
+        self.assertEqual(resume_cache_key(self.resume), resume_cache_key(reordered))
+
+    def test_key_changes_with_content_job_and_version(self):
+        """Test that every relevant input is part of the key"""
+        base = resume_cache_key(self.resume, 'Python role', 'v1')
+        changed = dict(self.resume, skills=['Python'])
+
+        self.assertNotEqual(base, resume_cache_key(changed, 'Python role', 'v1'))
+        self.assertNotEqual(base, resume_cache_key(self.resume, 'Java role', 'v1'))
+        self.assertNotEqual(base, resume_cache_key(self.resume, 'Python role', 'v2'))
+        self.assertEqual(base, resume_cache_key(self.resume, '  Python role ', 'v1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Unit Tests for the ATS Executor
+Tests for inline and process-pool execution and queue backpressure
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_analyzer import analyze_ats_batch
+from ats_executor import ATSExecutor, ExecutorBusy, analyze_batch, analyze_resume_task
+
+
+def _without_timestamp(analysis):
+    """Drop the analysis time, which differs between runs"""
+    analysis.pop('timestamp', None)
+    return analysis
+
+
+class TestATSExecutor(unittest.TestCase):
+    """Test suite for ATSExecutor"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.resume = {
+            'personalInfo': {'firstName': 'Ada', 'lastName': 'Lovelace', 'email': 'ada@example.com', 'phone': '555-0100'},
+            'professionalSummary': 'Backend engineer building Python services on AWS.',
+            'experience': [{'jobTitle': 'Engineer', 'companyName': 'Acme', 'description': 'Built Django APIs.'}],
+            'skills': ['Python', 'Django', 'Docker']
+        }
+        self.job_description = 'Python engineer with Django and Kubernetes experience'
+        self.executors = []
+
+    def tearDown(self):
+        for executor in self.executors:
+            executor.shutdown()
+
+    def _executor(self, **kwargs):
+        executor = ATSExecutor(**kwargs)
+        self.executors.append(executor)
+        return executor
+
+    def test_inline_by_default(self):
+        """Test that an executor without workers runs tasks on the calling thread"""
+        executor = self._executor()
+
+        self.assertTrue(executor.inline)
+        self.assertEqual(executor.run(threading.get_ident), threading.get_ident())
+        self.assertEqual(executor.stats()['mode'], 'inline')
+
+    def test_pool_matches_inline(self):
+        """Test that worker processes return the same analysis as inline execution"""
+        pool = self._executor(workers=2)
+        args = (self.resume, 'Python Django', self.job_description)
+
+        self.assertEqual(_without_timestamp(pool.run(analyze_resume_task, *args)),
+                         _without_timestamp(analyze_resume_task(*args)))
+        self.assertNotEqual(pool.run(os.getpid), os.getpid())
+        self.assertEqual(pool.stats()['in_flight'], 0)
+
+    def test_batch_slices_keep_order(self):
+        """Test that a batch split across workers keeps input order and indexes"""
+        pool = self._executor(workers=2)
+        resumes = [self.resume, 'not a resume', dict(self.resume, skills=['Java'])]
+
+        results = analyze_batch(pool, resumes, self.job_description)
+
+        expected = analyze_ats_batch(resumes, self.job_description)
+        for item in results + expected:
+            if item['data'] is not None:
+                _without_timestamp(item['data'])
+        self.assertEqual(results, expected)
+        self.assertEqual([item['index'] for item in results], [0, 1, 2])
+
+    def test_full_queue_is_rejected(self):
+        """Test that tasks beyond workers plus queue size raise ExecutorBusy"""
+        pool = self._executor(workers=1, queue_size=0, retry_after=3)
+        pool.run(os.getpid)  # start the worker before timing anything
+
+        sleeper = threading.Thread(target=pool.run, args=(time.sleep, 1.0))
+        sleeper.start()
+        while pool.stats()['in_flight'] == 0:
+            time.sleep(0.01)
+
+        with self.assertRaises(ExecutorBusy) as context:
+            pool.run(os.getpid)
+        self.assertEqual(context.exception.retry_after, 3)
+        self.assertEqual(pool.stats()['rejected'], 1)
+
+        sleeper.join()
+        self.assertIsInstance(pool.run(os.getpid), int)
+
+    def test_imap_reads_arguments_lazily(self):
+        """Test that imap keeps order and takes only a window of tasks from the input"""
+        pool = self._executor(workers=1, queue_size=2)
+        pulled = []
+
+        def arguments():
+            for number in range(1000):
+                pulled.append(number)
+                yield (number,)
+
+        results = pool.imap(abs, arguments())
+        self.assertEqual([next(results) for _ in range(5)], [0, 1, 2, 3, 4])
+        self.assertLessEqual(len(pulled), 5 + 3)
+        results.close()
+        self.assertEqual(list(self._executor().imap(abs, [(-1,), (2,)])), [1, 2])
+
+    def test_configuration_from_env(self):
+        """Test ATS_WORKERS and ATS_QUEUE_SIZE"""
+        saved = {key: os.environ.get(key) for key in ('ATS_WORKERS', 'ATS_QUEUE_SIZE')}
+        try:
+            os.environ['ATS_WORKERS'] = '3'
+            os.environ.pop('ATS_QUEUE_SIZE', None)
+            executor = ATSExecutor.from_env()
+            self.assertEqual((executor.workers, executor.queue_size), (3, 6))
+
+            os.environ['ATS_QUEUE_SIZE'] = '1'
+            self.assertEqual(ATSExecutor.from_env().queue_size, 1)
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+Unit Tests for Incremental ATS Analysis
+Tests that section-wise re-analysis matches a full analysis
+"""
+
+import copy
+import os
+import random
+import re
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_analyzer import ATSAnalyzer, EXTRA_SPACES_PATTERN, PHONE_PATTERN
+from ats_cache import ResultCache
+from ats_incremental import (IncrementalAnalyzer, PHONE_RUN_MINIMUM, SPACING_RUN_MINIMUM, count_runs,
+                             join_runs, summarize_runs)
+from skill_taxonomy import TaxonomyStore
+
+# Fragments that exercise every formatting and keyword rule, including
+# phone numbers, spacing runs and skills split across section boundaries
+FRAGMENTS = [
+    'Python', 'Django', 'machine', 'learning', 'project', 'management', 'AWS', 'docker',
+    'jane@example.com', '555', '123-4567', '(555)', '+1', '    ', '   ', ' ', '', '•', '®',
+    'café', 'वरिष्ठ', 'Led a team of six.', 'node.js', 'C++', '42'
+]
+
+
+def random_text(rng, words=6):
+    return ''.join(rng.choice(FRAGMENTS) + rng.choice(['', ' ', '  ']) for _ in range(rng.randint(0, words)))
+
+
+def random_resume(rng):
+    resume = {
+        'personalInfo': {
+            'firstName': random_text(rng, 1), 'lastName': random_text(rng, 1),
+            'email': rng.choice(['jane@example.com', '', 'not-an-email']),
+            'phone': rng.choice(['555 123', '555-123-4567', '', '   ']),
+            'location': random_text(rng, 2)
+        },
+        'professionalSummary': random_text(rng, 12),
+        'experience': [{
+            'jobTitle': random_text(rng, 2), 'companyName': random_text(rng, 1),
+            'startDate': '2020-01', 'description': random_text(rng, 40)
+        } for _ in range(rng.randint(0, 3))],
+        'education': [{
+            'degree': random_text(rng, 1), 'fieldOfStudy': random_text(rng, 2), 'schoolName': random_text(rng, 2)
+        } for _ in range(rng.randint(0, 2))],
+        'skills': [random_text(rng, 1) for _ in range(rng.randint(0, 8))],
+        'projects': [{'projectName': random_text(rng, 1), 'description': random_text(rng, 10)}
+                     for _ in range(rng.randint(0, 2))]
+    }
+    for optional in ('professionalSummary', 'education', 'projects'):
+        if rng.random() < 0.2:
+            del resume[optional]
+    return resume
+
+
+def edit_one_field(rng, resume):
+    """Change a single field, as an editor autosave does"""
+    edited = copy.deepcopy(resume)
+    choices = [('personalInfo', 'phone'), ('personalInfo', 'location')]
+    if 'professionalSummary' in edited:
+        choices.append(('professionalSummary', None))
+    choices += [('experience', i) for i in range(len(edited['experience']))]
+    section, field = rng.choice(choices)
+    if section == 'experience':
+        edited['experience'][field]['description'] += ' ' + random_text(rng, 4)
+    elif field is None:
+        edited[section] = random_text(rng, 12)
+    else:
+        edited[section][field] = random_text(rng, 2)
+    return edited
+
+
+class TestRunSummary(unittest.TestCase):
+    """Test suite for joining character runs across texts"""
+
+    def test_joined_summaries_count_like_the_patterns(self):
+        """Test that counting runs of joined pieces agrees with the regex on the whole text"""
+        rng = random.Random(7)
+        cases = [(re.compile(r' *'), EXTRA_SPACES_PATTERN, SPACING_RUN_MINIMUM),
+                 (re.compile(r'[\d\-\+\(\) ]*'), PHONE_PATTERN, PHONE_RUN_MINIMUM)]
+        for _ in range(500):
+            pieces = [''.join(rng.choice('  1a-') for _ in range(rng.randint(0, 8))) for _ in range(rng.randint(1, 5))]
+            text = ''.join(pieces)
+            for any_run, long_run, minimum in cases:
+                joined = summarize_runs(pieces[0], any_run, long_run)
+                for piece in pieces[1:]:
+                    joined = join_runs(joined, summarize_runs(piece, any_run, long_run), minimum)
+                self.assertEqual(joined, summarize_runs(text, any_run, long_run), repr(pieces))
+                self.assertEqual(count_runs(joined, minimum), len(long_run.findall(text)), repr(pieces))
+
+
+class TestIncrementalAnalyzer(unittest.TestCase):
+    """Test suite for IncrementalAnalyzer"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.analyzer = ATSAnalyzer()
+        self.incremental = IncrementalAnalyzer(self.analyzer, ResultCache(maxsize=1000, ttl=0))
+
+    def assertSameAnalysis(self, resume):
+        self.assertEqual(self.incremental.analyze(resume)._replace(timestamp=''),
+                         self.analyzer.analyze(resume)._replace(timestamp=''), repr(resume))
+
+    def test_matches_full_analysis_after_edits(self):
+        """Test that every result equals a full analysis while single fields are edited"""
+        rng = random.Random(2024)
+        for _ in range(100):
+            resume = random_resume(rng)
+            self.assertSameAnalysis(resume)
+            for _ in range(3):
+                resume = edit_one_field(rng, resume)
+                self.assertSameAnalysis(resume)
+
+    def test_matches_across_section_boundaries(self):
+        """Test phone numbers, spacing and skills that only exist once sections are joined"""
+        resume = {
+            'personalInfo': {'firstName': 'Ada', 'lastName': 'L', 'email': 'ada@example.com',
+                             'phone': '555 12', 'location': ''},
+            'professionalSummary': '567 Experienced in project',
+            'experience': [{'jobTitle': 'management', 'companyName': 'Acme  ', 'description': '  x'}],
+            'skills': []
+        }
+        full = self.analyzer.analyze(resume)
+        self.assertNotIn("Add a phone number in a standard format", full.suggestions)
+        self.assertSameAnalysis(resume)
+
+        for spacing in range(1, 14):
+            resume['experience'].append({'description': '  ', 'jobTitle': ' ', 'companyName': ' ' * (spacing % 4)})
+            self.assertSameAnalysis(resume)
+
+    def test_keyword_spanning_several_sections(self):
+        """Test a three-word skill whose words sit in three consecutive one-word sections"""
+        taxonomy = TaxonomyStore(path=os.path.join(os.path.dirname(__file__), 'missing.json'),
+                                 fallback={'platforms': ['machine learning platform', 'python'], 'soft_skills': []})
+        analyzer = ATSAnalyzer(taxonomy=taxonomy)
+        incremental = IncrementalAnalyzer(analyzer, ResultCache(maxsize=100, ttl=0))
+        resume = {'skills': ['Python'],
+                  'certifications': [{'certificationName': word} for word in ('machine', 'learning', 'platform')]}
+
+        full = analyzer.analyze(resume)
+        self.assertEqual(full.missing_keywords, ())
+        self.assertEqual(incremental.analyze(resume)._replace(timestamp=''), full._replace(timestamp=''))
+
+        resume['certifications'][1]['certificationName'] = 'teaching'
+        self.assertEqual(incremental.analyze(resume)._replace(timestamp=''),
+                         analyzer.analyze(resume)._replace(timestamp=''))
+        self.assertEqual(incremental.analyze(resume).missing_keywords, ('Machine learning platform',))
+
+    def test_only_changed_sections_are_rescanned(self):
+        """Test that editing one experience entry scans just that entry again"""
+        rng = random.Random(1)
+        resume = random_resume(rng)
+        resume['experience'] = [{'jobTitle': 'Engineer', 'companyName': f'Company {i}', 'description': f'Work {i}'}
+                                for i in range(4)]
+        self.incremental.analyze(resume)
+        misses = self.incremental.stats()['misses']
+
+        resume['experience'][2]['description'] = 'Built Django services on AWS'
+        self.assertSameAnalysis(resume)
+        self.assertEqual(self.incremental.stats()['misses'], misses + 1)
+
+    def test_invalid_resume_fails_like_full_analysis(self):
+        """Test that malformed sections raise the same error as a full analysis"""
+        resume = {'personalInfo': {'firstName': 'Ada'}, 'skills': ['Python', 3]}
+        with self.assertRaises(TypeError):
+            self.analyzer.analyze(resume)
+        with self.assertRaises(TypeError):
+            self.incremental.analyze(resume)
+
+
+if __name__ == '__main__':
+    unittest.main()
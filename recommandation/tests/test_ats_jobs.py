@@ -0,0 +1,409 @@
+"""
+Unit Tests for Asynchronous ATS Jobs
+Tests for the job queue, job store, workers and callbacks
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from http.server import BaseHTTPRequestHandler, HTTPServer
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_executor import ExecutorBusy
+import ats_jobs
+from ats_jobs import (FAILED, QUEUED, RUNNING, SUCCEEDED, JobManager, JobQueue, JobStore, LocalJobQueue,
+                      LocalJobStore, QueueFull, SqliteJobQueue, SqliteJobStore, deliver_callback)
+
+
+class FakeClock:
+    """Manually advanced time source"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class CallbackReceiver(BaseHTTPRequestHandler):
+    """Records every POSTed body on the server"""
+
+    def do_POST(self):
+        length = int(self.headers['Content-Length'])
+        self.server.bodies.append(json.loads(self.rfile.read(length)))
+        self.server.hosts.append(self.headers['Host'])
+        self.send_response(self.server.status)
+        if 300 <= self.server.status < 400:
+            self.send_header('Location', self.server.location)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class TestJobManager(unittest.TestCase):
+    """Test suite for JobManager run without background threads"""
+
+    def setUp(self):
+        """Set up a manager whose jobs are processed explicitly"""
+        def handler(payload):
+            if payload.get('fail'):
+                raise ValueError('bad resume')
+            return {'ats_score': 80, 'name': payload['name']}
+
+        self.manager = JobManager(handler, LocalJobQueue(2), workers=0, callback_workers=0)
+
+    def test_job_lifecycle(self):
+        """Test that a job moves from queued to succeeded and keeps its result"""
+        job = self.manager.submit({'name': 'a'})
+
+        self.assertEqual(job['status'], QUEUED)
+        self.assertNotIn('payload', job)
+        self.assertEqual(self.manager.get(job['job_id'])['status'], QUEUED)
+
+        finished = self.manager.process_next()
+        self.assertEqual(finished['status'], SUCCEEDED)
+        self.assertEqual(self.manager.get(job['job_id'])['result'], {'ats_score': 80, 'name': 'a'})
+        self.assertIsNotNone(self.manager.get(job['job_id'])['finished_at'])
+
+    def test_failed_job_reports_error(self):
+        """Test that a handler exception fails only that job"""
+        job = self.manager.submit({'name': 'b', 'fail': True})
+        self.manager.process_next()
+
+        stored = self.manager.get(job['job_id'])
+        self.assertEqual((stored['status'], stored['error'], stored['result']), (FAILED, 'bad resume', None))
+
+    def test_busy_executor_is_retried(self):
+        """Test that a job waits out ExecutorBusy instead of failing"""
+        attempts = []
+
+        def handler(payload):
+            attempts.append(payload)
+            if len(attempts) < 3:
+                raise ExecutorBusy(0)
+            return {'ok': True}
+
+        manager = JobManager(handler, workers=0)
+        job = manager.submit({})
+        manager.process_next()
+
+        self.assertEqual(len(attempts), 3)
+        self.assertEqual(manager.get(job['job_id'])['status'], SUCCEEDED)
+
+    def test_full_queue(self):
+        """Test that submitting beyond the queue size raises QueueFull and stores nothing"""
+        self.manager.submit({'name': 'a'})
+        self.manager.submit({'name': 'b'})
+
+        with self.assertRaises(QueueFull):
+            self.manager.submit({'name': 'c'})
+        self.assertEqual(len(self.manager.store), 2)
+
+    def test_background_workers(self):
+        """Test that started workers pick up jobs on their own"""
+        done = threading.Event()
+        manager = JobManager(lambda payload: done.set() or {'ok': True}, workers=1)
+        try:
+            job = manager.submit({})
+            self.assertTrue(done.wait(5))
+            for _ in range(100):
+                if manager.get(job['job_id'])['status'] == SUCCEEDED:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(manager.get(job['job_id'])['status'], SUCCEEDED)
+        finally:
+            manager.stop()
+
+    def test_callback_url_check(self):
+        """Test that only http(s) URLs to allowed hosts are accepted"""
+        with mock.patch.object(ats_jobs, 'resolve_host', return_value=['93.184.215.14']):
+            self.assertTrue(self.manager.check_callback_url('https://example.com/hook'))
+        self.assertFalse(self.manager.check_callback_url('file:///etc/passwd'))
+        self.assertFalse(self.manager.check_callback_url('http://'))
+
+        restricted = JobManager(lambda payload: {}, workers=0, callback_hosts={'localhost'})
+        self.assertTrue(restricted.check_callback_url('http://localhost:8080/ats'))
+        self.assertFalse(restricted.check_callback_url('http://example.com/ats'))
+
+    def test_internal_callback_hosts_are_refused(self):
+        """Test that without an allowlist no internal address is accepted"""
+        for url in ('http://127.0.0.1:5000/ats', 'http://localhost/ats', 'http://169.254.169.254/latest/meta-data',
+                    'http://10.0.0.5/ats', 'http://192.168.1.1/ats', 'http://[::1]/ats',
+                    'http://[::ffff:127.0.0.1]/ats', 'http://0.0.0.0/ats'):
+            self.assertFalse(self.manager.check_callback_url(url), url)
+
+        # A public name that also resolves to a private address is refused too
+        with mock.patch.object(ats_jobs, 'resolve_host', return_value=['93.184.215.14', '10.1.2.3']):
+            self.assertFalse(self.manager.check_callback_url('https://example.com/hook'))
+        with mock.patch.object(ats_jobs, 'resolve_host', return_value=[]):
+            self.assertFalse(self.manager.check_callback_url('https://unresolvable.invalid/hook'))
+
+    def test_callback_host_is_checked_again_before_delivery(self):
+        """Test that a host that resolves internally by delivery time gets no callback"""
+        with mock.patch.object(ats_jobs, 'resolve_host', return_value=['93.184.215.14']):
+            job = self.manager.submit({'name': 'a'}, callback_url='https://example.com/hook')
+        with mock.patch.object(ats_jobs, 'resolve_host', return_value=['127.0.0.1']), \
+                mock.patch.object(ats_jobs, 'deliver_callback') as deliver:
+            self.manager.process_next()
+
+        deliver.assert_not_called()
+        self.assertEqual(self.manager.get(job['job_id'])['callback_status'], 'failed: callback host not allowed')
+
+    def test_job_queue_is_abstract(self):
+        """Test that a queue must implement the whole interface"""
+        class Incomplete(JobQueue):
+            def put(self, job_id):
+                pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+
+class TestJobStore(unittest.TestCase):
+    """Test suite for LocalJobStore expiry"""
+
+    def test_finished_jobs_expire(self):
+        """Test that finished jobs are dropped after the TTL but running ones are kept"""
+        clock = FakeClock()
+        store = LocalJobStore(ttl=60, clock=clock)
+        store.add({'job_id': 'done', 'status': QUEUED})
+        store.add({'job_id': 'busy', 'status': QUEUED})
+        store.update('done', status=SUCCEEDED)
+
+        clock.now = 59
+        self.assertIsNotNone(store.get('done'))
+        clock.now = 61
+        self.assertIsNone(store.get('done'))
+        self.assertIsNotNone(store.get('busy'))
+
+    def test_finished_job_limit(self):
+        """Test that the oldest finished jobs go first once the limit is reached"""
+        store = LocalJobStore(max_finished=2, clock=FakeClock())
+        for job_id in 'abc':
+            store.add({'job_id': job_id, 'status': QUEUED})
+            store.update(job_id, status=SUCCEEDED)
+
+        self.assertIsNone(store.get('a'))
+        self.assertEqual([store.get(job_id)['job_id'] for job_id in 'bc'], ['b', 'c'])
+
+    def test_job_store_is_abstract(self):
+        """Test that a store must implement the whole interface"""
+        class Incomplete(JobStore):
+            def get(self, job_id):
+                return None
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_manager_uses_given_store(self):
+        """Test that a JobManager keeps its jobs in the store it is given"""
+        store = LocalJobStore()
+        manager = JobManager(lambda payload: {'ok': True}, store=store, workers=0)
+        job = manager.submit({})
+        manager.process_next()
+
+        self.assertEqual(store.get(job['job_id'])['status'], SUCCEEDED)
+
+
+class TestSqliteJobs(unittest.TestCase):
+    """Test suite for the job queue and store shared through SQLite"""
+
+    def setUp(self):
+        """Create a temporary directory for the database"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, 'jobs', 'ats_jobs.sqlite3')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir)
+
+    def manager(self, handler=lambda payload: {'ats_score': 75, 'name': payload['name']}, queue_size=100):
+        """A manager on the shared database, as one server process would have"""
+        return JobManager(handler, SqliteJobQueue(self.path, queue_size), SqliteJobStore(self.path),
+                          workers=0, callback_workers=0)
+
+    def test_jobs_are_visible_to_every_process(self):
+        """Test that a job submitted through one manager can be run and polled through another"""
+        first, second = self.manager(), self.manager()
+        job = first.submit({'name': 'a'})
+
+        self.assertTrue(first.shared)
+        self.assertEqual(second.get(job['job_id'])['status'], QUEUED)
+        self.assertEqual(second.process_next()['status'], SUCCEEDED)
+        self.assertIsNone(first.process_next())
+        self.assertEqual(first.get(job['job_id'])['result'], {'ats_score': 75, 'name': 'a'})
+
+    def test_every_job_runs_once(self):
+        """Test that workers polling the same queue never take the same job"""
+        managers = [self.manager(), self.manager()]
+        submitted = {managers[0].submit({'name': str(number)})['job_id'] for number in range(20)}
+        taken = []
+
+        def work(manager):
+            while True:
+                job = manager.process_next()
+                if job is None:
+                    return
+                taken.append(job['job_id'])
+
+        threads = [threading.Thread(target=work, args=(manager,)) for manager in managers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+
+        self.assertEqual(sorted(taken), sorted(submitted))
+
+    def test_full_queue(self):
+        """Test that the shared queue is bounded across processes"""
+        first, second = self.manager(queue_size=1), self.manager(queue_size=1)
+        first.submit({'name': 'a'})
+
+        with self.assertRaises(QueueFull):
+            second.submit({'name': 'b'})
+        self.assertEqual(len(second.store), 1)
+
+    def test_get_waits_for_a_job(self):
+        """Test that get() returns None after its timeout and a job id as soon as one arrives"""
+        job_queue = SqliteJobQueue(self.path)
+        self.assertIsNone(job_queue.get(0.1))
+
+        threading.Timer(0.1, job_queue.put, args=('late',)).start()
+        self.assertEqual(job_queue.get(5), 'late')
+        self.assertEqual(job_queue.qsize(), 0)
+
+    def test_finished_jobs_expire(self):
+        """Test that finished jobs are dropped after the TTL but running ones are kept"""
+        clock = FakeClock()
+        store = SqliteJobStore(self.path, ttl=60, clock=clock)
+        store.add({'job_id': 'done', 'status': QUEUED})
+        store.add({'job_id': 'busy', 'status': QUEUED})
+        store.update('done', status=SUCCEEDED)
+        store.update('busy', status=RUNNING)
+
+        clock.now = 59
+        self.assertIsNotNone(store.get('done'))
+        clock.now = 61
+        self.assertIsNone(store.get('done'))
+        self.assertEqual(store.get('busy')['status'], RUNNING)
+
+    def test_finished_job_limit(self):
+        """Test that the oldest finished jobs go first once the limit is reached"""
+        clock = FakeClock()
+        store = SqliteJobStore(self.path, max_finished=2, clock=clock)
+        for job_id in 'abc':
+            clock.now += 1
+            store.add({'job_id': job_id, 'status': QUEUED})
+            store.update(job_id, status=SUCCEEDED)
+
+        self.assertIsNone(store.get('a'))
+        self.assertEqual([store.get(job_id)['job_id'] for job_id in 'bc'], ['b', 'c'])
+
+    def test_from_env(self):
+        """Test that ATS_JOB_DB selects the shared store"""
+        with mock.patch.dict(os.environ, {'ATS_JOB_DB': self.path}):
+            self.assertTrue(JobManager.from_env(lambda payload: {}).shared)
+        with mock.patch.dict(os.environ, {'ATS_JOB_DB': ''}):
+            self.assertFalse(JobManager.from_env(lambda payload: {}).shared)
+
+
+class TestCallbacks(unittest.TestCase):
+    """Test suite for callback delivery"""
+
+    def setUp(self):
+        """Start a local HTTP server that records callbacks"""
+        self.server = HTTPServer(('127.0.0.1', 0), CallbackReceiver)
+        self.server.bodies = []
+        self.server.hosts = []
+        self.server.status = 200
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/ats-callback"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_finished_job_is_posted(self):
+        """Test that the callback receives the finished job in the API envelope"""
+        manager = JobManager(lambda payload: {'ats_score': 91}, workers=0, callback_hosts={'127.0.0.1'},
+                             callback_workers=0)
+        job = manager.submit({}, callback_url=self.url)
+        manager.process_next()
+
+        self.assertEqual(len(self.server.bodies), 1)
+        body = self.server.bodies[0]
+        self.assertTrue(body['success'])
+        self.assertEqual(body['data']['job_id'], job['job_id'])
+        self.assertEqual(body['data']['result'], {'ats_score': 91})
+        self.assertEqual(manager.get(job['job_id'])['callback_status'], 'delivered')
+
+    def test_rejected_callback_is_not_retried(self):
+        """Test that a 4xx answer fails delivery after one attempt"""
+        self.server.status = 410
+        status = deliver_callback(self.url, {'job_id': 'x', 'status': SUCCEEDED, 'error': None}, '127.0.0.1')
+
+        self.assertEqual(status, 'failed: HTTP 410')
+        self.assertEqual(len(self.server.bodies), 1)
+
+    def test_redirect_is_not_followed(self):
+        """Test that a redirect fails delivery instead of posting to the new location"""
+        self.server.status = 307
+        self.server.location = 'http://169.254.169.254/latest/meta-data'
+
+        status = deliver_callback(self.url, {'job_id': 'x', 'status': SUCCEEDED, 'error': None}, '127.0.0.1')
+
+        self.assertEqual(status, 'failed: HTTP 307')
+        self.assertEqual(len(self.server.bodies), 1)
+
+    def test_callback_connects_to_checked_address(self):
+        """Test that delivery uses the address that passed the check instead of resolving the host again"""
+        manager = JobManager(lambda payload: {}, workers=0, callback_hosts={'callback.test'}, callback_workers=0)
+        url = f"http://callback.test:{self.server.server_port}/ats-callback"
+        # callback.test does not resolve, so only the checked address can be reached
+        with mock.patch.object(ats_jobs, 'resolve_host', return_value=['127.0.0.1']) as resolve:
+            job = manager.submit({}, callback_url=url)
+            manager.process_next()
+
+        self.assertEqual(manager.get(job['job_id'])['callback_status'], 'delivered')
+        self.assertEqual(self.server.hosts, [f'callback.test:{self.server.server_port}'])
+        self.assertEqual(resolve.call_count, 1)
+
+    def test_slow_callbacks_do_not_block_jobs(self):
+        """Test that jobs keep finishing while their callbacks are still being delivered"""
+        release = threading.Event()
+        manager = JobManager(lambda payload: {'ok': True}, workers=0, callback_hosts={'127.0.0.1'},
+                             callback_workers=1, callback_backlog=2)
+        try:
+            with mock.patch.object(ats_jobs, 'deliver_callback', side_effect=lambda *args: release.wait(5) and 'delivered'):
+                jobs = [manager.submit({}, callback_url=self.url) for _ in range(3)]
+                start = time.perf_counter()
+                finished = [manager.process_next() for _ in jobs]
+                elapsed = time.perf_counter() - start
+
+                self.assertLess(elapsed, 1)
+                self.assertEqual([job['status'] for job in finished], [SUCCEEDED] * 3)
+                # Two callbacks fit in the backlog, the third is dropped
+                self.assertEqual([job['callback_status'] for job in finished],
+                                 ['pending', 'pending', 'failed: callback backlog full'])
+
+                release.set()
+                for _ in range(100):
+                    if manager.get(jobs[1]['job_id'])['callback_status'] == 'delivered':
+                        break
+                    time.sleep(0.01)
+            self.assertEqual(manager.get(jobs[0]['job_id'])['callback_status'], 'delivered')
+            self.assertEqual(manager.get(jobs[1]['job_id'])['callback_status'], 'delivered')
+        finally:
+            release.set()
+            manager.stop()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit Tests for the ATS Rescore CLI
+Tests for streaming NDJSON re-scoring
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_analyzer import ATSAnalyzer
+from ats_executor import ATSExecutor
+from ats_rescore import main, read_chunks, rescore
+
+
+def _without_timestamp(item):
+    if item['data'] is not None:
+        item['data'].pop('timestamp')
+    return item
+
+
+class TestRescore(unittest.TestCase):
+    """Test suite for rescore() and the command line"""
+
+    def setUp(self):
+        """Set up an NDJSON input with good, bad and blank lines"""
+        self.resume = {
+            '_id': {'$oid': '65f1c0ffee0000000000abcd'},
+            'personalInfo': {'firstName': 'Ada', 'lastName': 'Lovelace', 'email': 'ada@example.com'},
+            'professionalSummary': 'Python engineer building Django services on AWS.',
+            'skills': ['Python', 'Django']
+        }
+        self.lines = [
+            json.dumps(self.resume),
+            '',
+            '{not json',
+            json.dumps(['a list']),
+            json.dumps(dict(self.resume, _id=42, skills=['Python', 7]))
+        ]
+        self.text = '\n'.join(self.lines) + '\n'
+
+    def _rescore(self, executor, chunk_size=2):
+        out = io.StringIO()
+        summary = rescore(io.StringIO(self.text), out, executor, chunk_size, progress_interval=0)
+        return [json.loads(line) for line in out.getvalue().splitlines()], summary
+
+    def test_results_follow_input_lines(self):
+        """Test that every non-blank line yields one result in input order"""
+        results, summary = self._rescore(ATSExecutor())
+
+        self.assertEqual([item['line'] for item in results], [1, 3, 4, 5])
+        self.assertEqual([item['error'] for item in results[1:3]], ['INVALID_JSON', 'INVALID_RESUME_FORMAT'])
+        self.assertEqual(results[0]['resume_id'], '65f1c0ffee0000000000abcd')
+        self.assertEqual(results[3]['resume_id'], '42')
+        self.assertFalse(results[3]['success'])
+        self.assertEqual(summary['resumes'], 4)
+        self.assertEqual(summary['failed'], 3)
+
+        expected = ATSAnalyzer().analyze(self.resume)._replace(timestamp='').to_dict()
+        self.assertEqual(results[0]['data'], dict(expected, timestamp=results[0]['data']['timestamp']))
+
+    def test_worker_processes_match_inline(self):
+        """Test that a process pool writes the same results in the same order"""
+        pool = ATSExecutor(workers=2, queue_size=1)
+        try:
+            pooled, _ = self._rescore(pool, chunk_size=1)
+        finally:
+            pool.shutdown()
+        inline, _ = self._rescore(ATSExecutor(), chunk_size=1)
+
+        self.assertEqual([_without_timestamp(item) for item in pooled], [_without_timestamp(item) for item in inline])
+
+    def test_chunks_skip_blank_lines(self):
+        """Test that chunks keep line numbers and hold at most chunk_size lines"""
+        chunks = list(read_chunks(io.StringIO('a\n\nb\nc\n'), 2))
+        self.assertEqual(chunks, [[(1, 'a\n'), (3, 'b\n')], [(4, 'c\n')]])
+
+    def test_command_line_files(self):
+        """Test the command line with input and output files"""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'resumes.ndjson')
+            target = os.path.join(directory, 'scores.ndjson')
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write(self.text)
+
+            self.assertEqual(main([source, '-o', target, '--workers', '0', '--progress-interval', '0']), 0)
+            with open(target, encoding='utf-8') as f:
+                self.assertEqual(len(f.readlines()), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
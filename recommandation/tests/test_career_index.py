@@ -0,0 +1,70 @@
+"""
+Unit Tests for the Career Index
+Tests for career lookup, name normalization and topic parsing
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from career_index import CareerIndex, parse_topics
+
+
+class TestCareerIndex(unittest.TestCase):
+    """Test suite for CareerIndex"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.index = CareerIndex.from_table({
+            'Data Scientist': {
+                'salary': 120000,
+                'job_security': 'High',
+                'job_description': 'Analyze data.',
+                'topics': 'Python-Statistics - Machine Learning-'
+            },
+            'Frontend Developer': {
+                'salary': '95000',
+                'job_security': 'Medium',
+                'job_description': 'x' * 200,
+                'topics': 'HTML-CSS-React'
+            }
+        })
+
+    def test_exact_lookup(self):
+        """Test lookup by the exact career name"""
+        record = self.index.get('Data Scientist')
+
+        self.assertEqual(record.salary, 120000)
+        self.assertEqual(record.job_security, 'High')
+        self.assertEqual(record.topics, ('Python', 'Statistics', 'Machine Learning'))
+
+    def test_normalized_lookup(self):
+        """Test that lookups ignore case and extra whitespace"""
+        self.assertIs(self.index.get('data scientist'), self.index.get('Data Scientist'))
+        self.assertIs(self.index.get('  FRONTEND   developer '), self.index.get('Frontend Developer'))
+        self.assertIn('frontend developer', self.index)
+
+    def test_unknown_career(self):
+        """Test that unknown or empty names return None"""
+        self.assertIsNone(self.index.get('Astronaut'))
+        self.assertIsNone(self.index.get(''))
+        self.assertEqual(len(self.index), 2)
+
+    def test_record_values(self):
+        """Test salary coercion, truncation and serialization"""
+        record = self.index.get('Frontend Developer')
+
+        self.assertEqual(record.salary, 95000)
+        self.assertEqual(record.short_description(150), 'x' * 150 + '...')
+        self.assertEqual(self.index.get('Data Scientist').short_description(150), 'Analyze data.')
+        self.assertEqual(record.to_dict()['topics'], ['HTML', 'CSS', 'React'])
+
+    def test_parse_topics(self):
+        """Test splitting of the topics column"""
+        self.assertEqual(parse_topics('Unity-3D Modeling-ARKit'), ('Unity', '3D Modeling', 'ARKit'))
+        self.assertEqual(parse_topics(''), ())
+
+
+if __name__ == '__main__':
+    unittest.main()
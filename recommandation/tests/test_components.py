@@ -0,0 +1,97 @@
+"""
+Unit Tests for the Components Module
+Tests for lazily loaded components and their load modes
+"""
+
+import os
+import sys
+import threading
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from components import ComponentDisabled, LazyComponent
+
+
+class TestLazyComponent(unittest.TestCase):
+    """Test suite for LazyComponent"""
+
+    def setUp(self):
+        """Set up a loader that counts its calls"""
+        self.calls = 0
+
+    def loader(self):
+        self.calls += 1
+        return {'model': self.calls}
+
+    def test_lazy_loads_once_on_first_use(self):
+        """Test that nothing loads until get() and concurrent callers share one load"""
+        release = threading.Event()
+
+        def slow_loader():
+            release.wait(5)
+            return self.loader()
+
+        component = LazyComponent('model', slow_loader, 'lazy')
+        self.assertIsNone(component.start())
+        self.assertEqual(component.status()['state'], 'not_loaded')
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(component.get())) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(results, [{'model': 1}] * 4)
+        self.assertTrue(component.loaded)
+        self.assertIsNotNone(component.status()['load_seconds'])
+
+    def test_eager_and_background_modes(self):
+        """Test that start() loads at once or on a warm-up thread"""
+        eager = LazyComponent('model', self.loader, 'eager')
+        eager.start()
+        self.assertTrue(eager.loaded)
+
+        background = LazyComponent('model', self.loader, 'background')
+        background.start().join(5)
+        self.assertTrue(background.loaded)
+        self.assertEqual(self.calls, 2)
+
+    def test_disabled_component(self):
+        """Test that an 'off' component never loads"""
+        component = LazyComponent('model', self.loader, 'off')
+        self.assertIsNone(component.start())
+        with self.assertRaises(ComponentDisabled):
+            component.get()
+        self.assertEqual(component.status()['state'], 'disabled')
+        self.assertEqual(self.calls, 0)
+
+    def test_failed_load_is_retried(self):
+        """Test that a failing loader is reported and tried again on the next get()"""
+        attempts = []
+
+        def flaky_loader():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise OSError('bundle unreadable')
+            return 'model'
+
+        component = LazyComponent('model', flaky_loader)
+        with self.assertRaises(OSError):
+            component.get()
+        self.assertEqual(component.status()['state'], 'failed')
+        self.assertEqual(component.status()['error'], 'bundle unreadable')
+
+        self.assertEqual(component.get(), 'model')
+        self.assertIsNone(component.status()['error'])
+
+    def test_unknown_mode(self):
+        """Test that a misspelled mode is rejected"""
+        with self.assertRaises(ValueError):
+            LazyComponent('model', self.loader, 'sometimes')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Unit Tests for Recommender Engines
+Tests for the engine registry and the sparse centroid classifier
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from engines import DEFAULT_ENGINE, ENGINES, CentroidClassifier, make_engine
+
+
+class TestCentroidClassifier(unittest.TestCase):
+    """Test suite for CentroidClassifier"""
+
+    def setUp(self):
+        """Fit a centroid model on a few short skill lists"""
+        self.vectorizer = TfidfVectorizer()
+        X = self.vectorizer.fit_transform([
+            'python sql statistics', 'pandas python machine learning',
+            'html css javascript', 'react javascript css'
+        ])
+        self.model = CentroidClassifier().fit(X, ['Data', 'Data', 'Web', 'Web'])
+
+    def test_predicts_nearest_centroid(self):
+        """Test that profiles go to the career with the closest centroid"""
+        X = self.vectorizer.transform(['python statistics', 'css react'])
+
+        self.assertEqual(list(self.model.predict(X)), ['Data', 'Web'])
+        self.assertEqual(list(self.model.classes_), ['Data', 'Web'])
+
+    def test_probabilities(self):
+        """Test that scores sum to one and unmatched profiles are uniform"""
+        probs = self.model.predict_proba(self.vectorizer.transform(['python css', 'gardening']))
+
+        np.testing.assert_allclose(probs.sum(axis=1), [1.0, 1.0])
+        np.testing.assert_allclose(probs[1], [0.5, 0.5])
+
+    def test_centroids_are_sparse_unit_vectors(self):
+        """Test the stored centroid matrix"""
+        norms = np.sqrt(self.model.centroids_.multiply(self.model.centroids_).sum(axis=1))
+
+        np.testing.assert_allclose(np.asarray(norms).ravel(), [1.0, 1.0])
+        self.assertLess(self.model.centroids_.nnz, 2 * len(self.vectorizer.vocabulary_))
+
+
+class TestEngineRegistry(unittest.TestCase):
+    """Test suite for make_engine"""
+
+    def test_default_engine(self):
+        """Test that the Random Forest stays the default"""
+        self.assertEqual(DEFAULT_ENGINE, 'random_forest')
+        self.assertEqual(type(make_engine(DEFAULT_ENGINE)).__name__, 'RandomForestClassifier')
+
+    def test_every_engine_has_predict_proba(self):
+        """Test that every registered engine can back the recommender"""
+        for name in ENGINES:
+            self.assertTrue(hasattr(make_engine(name), 'predict_proba'), name)
+
+    def test_unknown_engine(self):
+        """Test that unknown engine names are rejected"""
+        with self.assertRaises(ValueError):
+            make_engine('xgboost')
+
+
+if __name__ == '__main__':
+    unittest.main()
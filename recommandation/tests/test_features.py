@@ -0,0 +1,70 @@
+"""
+Unit Tests for Profile Features
+Tests that training rows and query profiles produce the same text
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from features import FIELD_WEIGHTS, PROFILE_FIELDS, create_user_profile, csv_profile, training_texts
+
+
+class TestProfileFeatures(unittest.TestCase):
+    """Test suite for the profile text template"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.row = {
+            'Grade/Class': '12th',
+            'Skills': 'Python, SQL',
+            'Interests': 'Data Science',
+            'Hobbies': 'Chess',
+            'Passion': 'Solving Problems',
+            'Favorite Subject': 'Mathematics',
+            'Recommended Career': 'Data Scientist'
+        }
+        self.form = {
+            'Class/Grade': '12th',
+            'Skills': 'Python, SQL',
+            'Interests': 'Data Science',
+            'Hobbies': 'Chess',
+            'Passion': 'Solving Problems',
+            'Favourite Subject': 'Mathematics'
+        }
+
+    def test_training_text_matches_query_text(self):
+        """Test that a CSV row and the equivalent form give the same text"""
+        self.assertEqual(training_texts([self.row]), [create_user_profile(self.form)])
+
+    def test_every_field_is_used(self):
+        """Test that all profile fields appear in the text"""
+        text = create_user_profile(self.form)
+
+        for field in PROFILE_FIELDS:
+            self.assertIn(f"{field}: ", text)
+        self.assertIn('Mathematics', text)
+        self.assertIn('Chess', text)
+
+    def test_field_weights(self):
+        """Test that weights repeat a field's value and zero drops it"""
+        weights = dict(FIELD_WEIGHTS, Skills=3, Hobbies=0)
+        text = create_user_profile(self.form, weights)
+
+        self.assertEqual(text.count('Python, SQL'), 3)
+        self.assertNotIn('Chess', text)
+        self.assertEqual(create_user_profile(self.form).count('Python, SQL'), FIELD_WEIGHTS['Skills'])
+
+    def test_missing_values(self):
+        """Test that missing form fields and NaN cells become empty"""
+        self.assertEqual(csv_profile({'Skills': float('nan')})['Skills'], '')
+        text = create_user_profile({'Skills': 'React'})
+
+        self.assertIn('React', text)
+        self.assertTrue(text.startswith('Class/Grade: '))
+        self.assertNotIn('None', text)
+
+
+if __name__ == '__main__':
+    unittest.main()
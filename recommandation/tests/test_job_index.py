@@ -0,0 +1,152 @@
+"""
+Unit Tests for the Job Posting Index
+Tests for building, searching, syncing and compacting the on-disk index
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_analyzer import ATSAnalyzer
+from job_index import INDEX_FORMAT_VERSION, JobIndexStore, create_index, index_terms, open_index, posting_id, sync_index
+
+POSTINGS = [
+    {'id': 'backend', 'title': 'Backend Engineer', 'company': 'Acme',
+     'description': 'Python and Django services on AWS with PostgreSQL and Docker.'},
+    {'id': 'frontend', 'title': 'Frontend Developer',
+     'description': 'React and TypeScript interfaces, accessible design, CSS.'},
+    {'id': 'data', 'title': 'Data Engineer',
+     'description': 'Python pipelines with Spark, Airflow and SQL warehouses.'}
+]
+
+
+class TestJobIndex(unittest.TestCase):
+    """Test suite for the job posting index"""
+
+    def setUp(self):
+        """Write a small posting corpus into a temporary directory"""
+        self.tmpdir = tempfile.mkdtemp()
+        self.directory = os.path.join(self.tmpdir, 'index')
+        self.corpus = os.path.join(self.tmpdir, 'postings.jsonl')
+        self.taxonomy = ATSAnalyzer.TAXONOMY.current
+        self._write_corpus(POSTINGS)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _write_corpus(self, postings):
+        with open(self.corpus, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(json.dumps(posting) for posting in postings) + '\n')
+
+    def test_terms_include_short_taxonomy_skills(self):
+        """Test that skills too short for extract_keywords are still indexed"""
+        terms = index_terms('Deploying Django on AWS', self.taxonomy)
+
+        self.assertIn('django', terms)
+        self.assertIn('aws', terms)
+        self.assertNotIn('on', terms)
+
+    def test_search_ranks_postings(self):
+        """Test that the posting sharing the most weighted terms ranks first"""
+        index = create_index(self.directory, POSTINGS, self.taxonomy)
+        matches = index.search('Django, Python, Docker and AWS', self.taxonomy, top_k=2)
+
+        self.assertEqual(matches['total_postings'], 3)
+        self.assertEqual([result['posting_id'] for result in matches['results']], ['backend', 'data'])
+        best = matches['results'][0]
+        self.assertEqual((best['rank'], best['title'], best['company']), (1, 'Backend Engineer', 'Acme'))
+        self.assertIn('django', best['matched_keywords'])
+        self.assertIn('postgresql', best['missing_keywords'])
+        self.assertTrue(0 < best['match_score'] <= 100)
+
+    def test_postings_without_overlap_are_not_returned(self):
+        """Test that only postings sharing a term with the resume are returned"""
+        index = create_index(self.directory, POSTINGS, self.taxonomy)
+
+        self.assertEqual(index.search('Spark Airflow', self.taxonomy, top_k=10)['results'][0]['posting_id'], 'data')
+        self.assertEqual(len(index.search('Spark Airflow', self.taxonomy, top_k=10)['results']), 1)
+        self.assertEqual(index.search('watercolour painting', self.taxonomy)['results'], [])
+
+    def test_reopen_memory_mapped(self):
+        """Test that a written index opens from disk with the same results"""
+        built = create_index(self.directory, POSTINGS, self.taxonomy)
+        opened = open_index(self.directory)
+
+        self.assertEqual(opened.manifest['format_version'], INDEX_FORMAT_VERSION)
+        self.assertEqual(opened.search('React CSS', self.taxonomy), built.search('React CSS', self.taxonomy))
+
+    def test_sync_applies_only_changes(self):
+        """Test that syncing adds, replaces and removes postings incrementally"""
+        first = sync_index(self.directory, self.corpus, self.taxonomy)
+        self.assertEqual(len(first.segments), 1)
+
+        # Unchanged corpus: nothing is rewritten
+        again = sync_index(self.directory, self.corpus, self.taxonomy)
+        self.assertEqual([segment.name for segment in again.segments], [segment.name for segment in first.segments])
+
+        changed = dict(POSTINGS[1], description='Vue and Svelte single page applications.')
+        added = {'title': 'Go Developer', 'description': 'Go and Kubernetes microservices.'}
+        self._write_corpus([POSTINGS[0], changed, added])
+        updated = sync_index(self.directory, self.corpus, self.taxonomy)
+
+        self.assertEqual(len(updated), 3)
+        self.assertEqual(len(updated.segments), 2)
+        self.assertNotIn('data', updated)
+        self.assertIn(posting_id(added), updated)
+        self.assertEqual(updated.search('React', self.taxonomy)['results'], [])
+        self.assertEqual(updated.search('Svelte', self.taxonomy)['results'][0]['posting_id'], 'frontend')
+
+    def test_compact_merges_segments(self):
+        """Test that compaction keeps live postings only, in one segment"""
+        index = create_index(self.directory, POSTINGS, self.taxonomy)
+        index = index.add([{'id': 'data', 'title': 'Data Analyst', 'description': 'Excel and Tableau.'}], self.taxonomy)
+        before = index.search('Tableau Python', self.taxonomy)
+
+        compacted = index.compact()
+
+        self.assertEqual(len(compacted.segments), 1)
+        self.assertEqual(len(compacted), 3)
+        self.assertEqual(sorted(os.listdir(self.directory)), ['index.lock', 'manifest.json', compacted.segments[0].name])
+        self.assertEqual([result['posting_id'] for result in compacted.search('Tableau Python', self.taxonomy)['results']],
+                         [result['posting_id'] for result in before['results']])
+
+    def test_concurrent_rebuilds_leave_consistent_index(self):
+        """Test that simultaneous rebuilds and syncs never leave segments the manifest does not list"""
+        errors = []
+
+        def rebuild(number):
+            try:
+                if number % 2:
+                    create_index(self.directory, POSTINGS, self.taxonomy)
+                else:
+                    sync_index(self.directory, self.corpus, self.taxonomy)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=rebuild, args=(number,)) for number in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+
+        index = open_index(self.directory)
+        self.assertEqual(errors, [])
+        self.assertEqual(len(index), 3)
+        segments = sorted(name for name in os.listdir(self.directory) if name.startswith('seg-'))
+        self.assertEqual(segments, index.manifest['segments'])
+        self.assertFalse([name for name in os.listdir(self.directory) if name.startswith('.')])
+
+    def test_store_without_corpus(self):
+        """Test that a missing corpus gives an empty index"""
+        store = JobIndexStore(self.directory, os.path.join(self.tmpdir, 'missing.jsonl'), ATSAnalyzer.TAXONOMY)
+
+        self.assertEqual(store.search('Python', top_k=5), {'results': [], 'total_postings': 0, 'resume_terms': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+Unit Tests for the Job Matcher
+Tests for IDF weights, keyword extraction and weighted job matching
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_analyzer import ATSAnalyzer
+from job_matcher import IDFStore, IDFWeights, JobProfile, extract_keywords, resume_tokens
+
+
+class TestIDFWeights(unittest.TestCase):
+    """Test suite for IDFWeights"""
+
+    def test_common_words_weigh_less(self):
+        """Test that keywords found in every posting get the lowest weight"""
+        weights = IDFWeights.from_documents([
+            'experience with kubernetes', 'experience with python', 'experience with react'
+        ])
+
+        self.assertEqual(weights.documents, 3)
+        self.assertAlmostEqual(weights.weight('experience'), 1.0)
+        self.assertGreater(weights.weight('kubernetes'), weights.weight('experience'))
+        self.assertGreater(weights.weight('solidity'), weights.weight('kubernetes'))
+
+    def test_empty_corpus_is_uniform(self):
+        """Test that without a corpus every keyword weighs 1"""
+        store = IDFStore(path=os.path.join(tempfile.gettempdir(), 'no-such-corpus.jsonl'))
+
+        self.assertEqual(store.current.weight('python'), 1.0)
+        self.assertEqual(store.current.weight('experience'), 1.0)
+
+    def test_corpus_file(self):
+        """Test learning weights from a JSON Lines corpus"""
+        tmpdir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmpdir, 'postings.jsonl')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'title': 'Data Engineer', 'description': 'Spark and Kafka'}) + '\n\n')
+                f.write(json.dumps({'title': 'Backend Engineer', 'description': 'Python and Kafka'}) + '\n')
+
+            weights = IDFStore(path).current
+            self.assertEqual(weights.documents, 2)
+            self.assertEqual(weights.source, path)
+            self.assertLess(weights.weight('kafka'), weights.weight('spark'))
+
+            with open(path, 'a', encoding='utf-8') as f:
+                f.write('[1, 2]\n')
+            with self.assertRaises(ValueError):
+                IDFWeights.from_file(path)
+        finally:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+
+    def test_version_follows_counts(self):
+        """Test that weights learned from the same postings share a version"""
+        first = IDFWeights.from_documents(['Python and Kafka', 'Spark and Kafka'])
+        again = IDFWeights.from_documents(['Spark and Kafka', 'Python and Kafka'])
+        changed = IDFWeights.from_documents(['Python and Kafka', 'Spark and Kafka', 'Rust'])
+
+        self.assertEqual(first.version, again.version)
+        self.assertNotEqual(first.version, changed.version)
+
+    def test_bundled_corpus(self):
+        """Test that the bundled corpus ranks generic terms below skills"""
+        weights = ATSAnalyzer.JOB_WEIGHTS.current
+
+        self.assertGreater(weights.documents, 0)
+        self.assertGreater(weights.weight('kubernetes'), weights.weight('experience'))
+
+
+class TestJobProfile(unittest.TestCase):
+    """Test suite for JobProfile matching"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.weights = IDFWeights.from_documents([
+            'experience team python', 'experience team java', 'experience team react', 'experience kubernetes'
+        ])
+
+    def test_extract_keywords(self):
+        """Test the keyword extraction rules"""
+        keywords = extract_keywords('The Python developer; full-stack, C++ and 2024 skills. Python!')
+
+        self.assertEqual(keywords, ['python', 'developer', 'full-stack', 'skills'])
+
+    def test_weighted_score(self):
+        """Test that rare keywords count for more than common ones"""
+        job = JobProfile(['experience', 'team', 'kubernetes'], self.weights)
+
+        generic = job.match(resume_tokens('Ten years of experience leading a team'))
+        specific = job.match(resume_tokens('Operated Kubernetes clusters'))
+
+        self.assertEqual(generic['match_percentage'], 66.67)
+        self.assertEqual(specific['match_percentage'], 33.33)
+        self.assertGreater(specific['match_score'], 33.33)
+        self.assertLess(generic['match_score'], 66.67)
+        self.assertEqual(job.match(resume_tokens('experience team kubernetes'))['match_score'], 100)
+
+    def test_lists_lead_with_important_keywords(self):
+        """Test that matched and missing keywords are ordered by weight"""
+        job = JobProfile(['experience', 'kubernetes', 'team', 'python'], self.weights)
+        result = job.match(resume_tokens('python and team work'))
+
+        self.assertEqual(result['matched_keywords'], ['python', 'team'])
+        self.assertEqual(result['missing_keywords'], ['kubernetes', 'experience'])
+        self.assertEqual(result['job_keywords'], ['experience', 'kubernetes', 'team', 'python'])
+        self.assertEqual(result['keywords_missing_count'], 2)
+
+    def test_whole_word_matching(self):
+        """Test that keywords match whole tokens, including hyphenated ones"""
+        job = JobProfile(['java', 'full-stack'], self.weights)
+
+        self.assertEqual(job.match(resume_tokens('JavaScript developer'))['matched_keywords'], [])
+        self.assertEqual(job.match(resume_tokens('Full-stack Java engineer'))['keywords_matched_count'], 2)
+
+    def test_analyzer_parses_job_description_once(self):
+        """Test that a parsed job description gives the same result as a direct match"""
+        analyzer = ATSAnalyzer()
+        description = 'Senior Python engineer with Kubernetes and PostgreSQL experience'
+        resume_text = 'Python developer running PostgreSQL on Kubernetes'
+
+        job = analyzer.parse_job_description(description)
+        self.assertEqual(analyzer.match_job(resume_text, job), analyzer.analyze_job_match(resume_text, description))
+        self.assertEqual(analyzer.match_job(resume_text, analyzer.parse_job_description('')), analyzer.analyze_job_match(resume_text, ''))
+
+
+if __name__ == '__main__':
+    unittest.main()
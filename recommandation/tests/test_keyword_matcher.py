@@ -0,0 +1,86 @@
+"""
+Unit Tests for Keyword Matcher
+Tests for token boundaries, phrases, positions and counts
+"""
+
+import unittest
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from keyword_matcher import KeywordMatcher, tokenize
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test suite for KeywordMatcher"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.matcher = KeywordMatcher({
+            'programming_languages': ['python', 'java', 'javascript', 'c++', 'c#', 'go'],
+            'frameworks': ['node.js', 'react'],
+            'soft_skills': ['project management', 'problem-solving', 'leadership']
+        })
+
+    def test_tokenize_keeps_language_symbols(self):
+        """Test that c++, c# and node.js stay single tokens"""
+        self.assertEqual(
+            tokenize('C++, C# and Node.js.'),
+            ['c++', 'c#', 'and', 'node.js']
+        )
+
+    def test_no_substring_matches(self):
+        """Test that keywords only match whole tokens"""
+        found = self.matcher.find('Good JavaScript developer')
+
+        self.assertIn(('programming_languages', 'javascript'), found)
+        self.assertNotIn(('programming_languages', 'java'), found)
+        self.assertNotIn(('programming_languages', 'go'), found)
+
+    def test_symbol_keywords(self):
+        """Test matching of keywords containing symbols"""
+        found = self.matcher.find('Wrote C++ and C# services on Node.js')
+
+        self.assertEqual(found, {
+            ('programming_languages', 'c++'),
+            ('programming_languages', 'c#'),
+            ('frameworks', 'node.js')
+        })
+
+    def test_phrases_must_be_in_sequence(self):
+        """Test that multi-word keywords match only as a sequence"""
+        self.assertIn(
+            ('soft_skills', 'project management'),
+            self.matcher.find('Led project management for the team')
+        )
+        self.assertNotIn(
+            ('soft_skills', 'project management'),
+            self.matcher.find('Management of every project')
+        )
+
+    def test_hyphenated_words(self):
+        """Test that hyphens and spaces are interchangeable in phrases"""
+        self.assertIn(('soft_skills', 'problem-solving'), self.matcher.find('strong problem solving'))
+        self.assertIn(('frameworks', 'react'), self.matcher.find('React-based dashboards'))
+
+    def test_scan_reports_positions_and_counts(self):
+        """Test match positions and per-keyword counts"""
+        text = 'Python, Java and more Python'
+        scan = self.matcher.scan(text)
+
+        self.assertEqual(scan.count('python'), 2)
+        self.assertEqual(scan.count('java', 'programming_languages'), 1)
+        self.assertEqual([text[start:end] for start, end in scan.positions('python')], ['Python', 'Python'])
+        self.assertEqual(scan.category_counts(), {'programming_languages': 3})
+        self.assertEqual(scan.found(), {'python', 'java'})
+
+    def test_scan_agrees_with_find(self):
+        """Test that scan and find report the same keywords"""
+        text = 'Leadership in project management, C++ and React; not a go-getter'
+        scan = self.matcher.scan(text)
+
+        self.assertEqual(set((m.category, m.keyword) for m in scan.matches), self.matcher.find(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
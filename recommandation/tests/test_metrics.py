@@ -0,0 +1,70 @@
+"""
+Unit Tests for the Metrics Module
+Tests for histograms, counters and the Prometheus text format
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from metrics import MetricsRegistry
+
+
+class TestMetrics(unittest.TestCase):
+    """Test suite for MetricsRegistry"""
+
+    def setUp(self):
+        """Set up a registry with one histogram and one counter"""
+        self.registry = MetricsRegistry()
+        self.stages = self.registry.histogram('stage_seconds', 'Stage time', ('stage',), buckets=(0.1, 1.0))
+        self.requests = self.registry.counter('requests_total', 'Requests', ('route',))
+
+    def test_histogram_buckets_are_cumulative(self):
+        """Test bucket counts, sum and count of observed values"""
+        for value in (0.05, 0.1, 0.5, 3.0):
+            self.stages.observe(value, 'parse')
+
+        counts, total, count = self.stages.snapshot()[('parse',)]
+        self.assertEqual(counts, [2, 3, 4])
+        self.assertAlmostEqual(total, 3.65)
+        self.assertEqual(count, 4)
+
+    def test_exposition_format(self):
+        """Test the HELP/TYPE lines, label rendering and +Inf bucket"""
+        self.stages.observe(0.5, 'parse')
+        self.requests.inc('/say "hi"')
+        self.requests.inc('/say "hi"', amount=2)
+
+        text = self.registry.expose()
+        self.assertIn('# TYPE stage_seconds histogram\n', text)
+        self.assertIn('stage_seconds_bucket{stage="parse",le="0.1"} 0\n', text)
+        self.assertIn('stage_seconds_bucket{stage="parse",le="+Inf"} 1\n', text)
+        self.assertIn('stage_seconds_count{stage="parse"} 1\n', text)
+        self.assertIn('# TYPE requests_total counter\n', text)
+        self.assertIn('requests_total{route="/say \\"hi\\""} 3.0\n', text)
+
+    def test_timer_records_elapsed_time(self):
+        """Test that time() observes one value per block"""
+        with self.stages.time('render'):
+            pass
+        self.assertEqual(self.stages.snapshot()[('render',)][2], 1)
+
+    def test_disabled_registry_records_nothing(self):
+        """Test that a disabled registry turns timers and counters into no-ops"""
+        registry = MetricsRegistry(enabled=False)
+        stages = registry.histogram('stage_seconds', 'Stage time', ('stage',))
+        requests = registry.counter('requests_total', 'Requests')
+
+        with stages.time('parse'):
+            pass
+        stages.observe(1.0, 'parse')
+        requests.inc()
+
+        self.assertEqual(stages.snapshot(), {})
+        self.assertEqual(requests.value(), 0)
+        self.assertIs(stages.time('a'), stages.time('b'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Unit Tests for Top-k Selection
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+
+from ranking import SORT_COLUMNS, top_k_indices
+
+
+class TestTopK(unittest.TestCase):
+    """Test suite for top_k_indices"""
+
+    def test_matches_full_sort(self):
+        """Test that argpartition selection equals a full descending sort"""
+        rng = np.random.default_rng(7)
+        scores = rng.random((50, 300))
+
+        expected = np.argsort(-scores, axis=1, kind='stable')[:, :5]
+        np.testing.assert_array_equal(top_k_indices(scores, 5), expected)
+
+    def test_ties_prefer_lower_index(self):
+        """Test deterministic ordering of equal scores"""
+        scores = np.array([[0.2, 0.4, 0.4, 0.0, 0.4]])
+
+        np.testing.assert_array_equal(top_k_indices(scores, 2), [[1, 2]])
+        np.testing.assert_array_equal(top_k_indices(scores, 4), [[1, 2, 4, 0]])
+
+    def test_ties_at_the_cutoff_match_sorted_reference(self):
+        """Test that values tied with the k-th score are taken in index order"""
+        rng = np.random.default_rng(11)
+        for _ in range(2000):
+            # Both the sorting path and the partitioning path
+            columns = int(rng.integers(1, 3 * SORT_COLUMNS))
+            # Few distinct values, so most rows have ties around the k-th place
+            scores = rng.integers(0, 4, size=(3, columns)).astype(float)
+            k = int(rng.integers(1, columns + 2))
+
+            expected = [sorted(range(columns), key=lambda i: (-row[i], i))[:k] for row in scores]
+            np.testing.assert_array_equal(top_k_indices(scores, k), expected)
+
+    def test_k_larger_than_classes(self):
+        """Test that k is capped at the number of classes"""
+        scores = np.array([[0.1, 0.9], [0.7, 0.3]])
+
+        np.testing.assert_array_equal(top_k_indices(scores, 5), [[1, 0], [0, 1]])
+        self.assertEqual(top_k_indices(scores, 0).shape, (2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
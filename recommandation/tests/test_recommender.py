@@ -0,0 +1,89 @@
+"""
+Unit Tests for the Career Recommender
+Tests for batched recommendations
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from career_index import CareerIndex
+from recommender import Recommender, create_user_profile
+
+
+class TestRecommender(unittest.TestCase):
+    """Test suite for Recommender"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Train a tiny model once for every test"""
+        skills = ['python sql statistics', 'pandas machine learning python',
+                  'html css javascript', 'react javascript css',
+                  'linux networking firewall', 'security networking linux']
+        careers = ['Data Scientist', 'Data Scientist', 'Frontend Developer',
+                   'Frontend Developer', 'Network Engineer', 'Network Engineer']
+        vectorizer = TfidfVectorizer()
+        model = RandomForestClassifier(n_estimators=10, random_state=0)
+        model.fit(vectorizer.fit_transform(skills), careers)
+
+        index = CareerIndex.from_table({
+            career: {'salary': 100, 'job_security': 'High', 'job_description': career, 'topics': 'A-B'}
+            for career in set(careers)
+        })
+        cls.recommender = Recommender(vectorizer, model, index)
+
+    def profile(self, skills):
+        return {
+            'Class/Grade': '12th', 'Skills': skills, 'Interests': '',
+            'Hobbies': '', 'Passion': '', 'Favourite Subject': ''
+        }
+
+    def test_batch_matches_single_predictions(self):
+        """Test that batching gives the same ranking as one call per profile"""
+        profiles = [self.profile(skills) for skills in
+                    ('python statistics', 'css javascript', 'linux firewall', 'python css')]
+
+        batch = self.recommender.recommend_batch(profiles, k=2)
+        for profile, result in zip(profiles, batch):
+            single = self.recommender.top_careers([create_user_profile(profile)], 2)[0]
+            names = [item['name'] for item in result['data']['recommendations']]
+            self.assertEqual(names, [career for career, _ in single])
+
+        self.assertEqual(batch[0]['data']['recommendations'][0]['name'], 'Data Scientist')
+        self.assertEqual(batch[1]['data']['recommendations'][0]['name'], 'Frontend Developer')
+
+    def test_recommendation_metadata(self):
+        """Test that each recommendation carries score and career details"""
+        result = self.recommender.recommend_batch([self.profile('python sql')], k=3)[0]
+        recommendations = result['data']['recommendations']
+
+        self.assertTrue(result['success'])
+        self.assertEqual(len(recommendations), 3)
+        self.assertEqual(recommendations[0]['salary'], 100)
+        self.assertEqual(recommendations[0]['topics'], ['A', 'B'])
+        scores = [item['score'] for item in recommendations]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+
+    def test_invalid_profiles_are_reported_in_place(self):
+        """Test that non-object profiles fail individually"""
+        results = self.recommender.recommend_batch(['text', self.profile('html'), None], k=1)
+
+        self.assertEqual([item['success'] for item in results], [False, True, False])
+        self.assertEqual(results[0]['error'], 'INVALID_PROFILE')
+        self.assertEqual([item['index'] for item in results], [0, 1, 2])
+
+    def test_missing_fields_and_empty_batch(self):
+        """Test that missing profile fields are treated as empty"""
+        results = self.recommender.recommend_batch([{'Skills': 'html css javascript react'}], k=1)
+
+        self.assertEqual(results[0]['data']['recommendations'][0]['name'], 'Frontend Developer')
+        self.assertEqual(self.recommender.recommend_batch([], k=3), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Unit Tests for the Response Cache
+Tests for pre-rendered responses, versioning and conditional GET
+"""
+
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from flask import Flask, jsonify
+
+from response_cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """Test suite for ResponseCache"""
+
+    def setUp(self):
+        """Set up a small app whose pages count their renders"""
+        self.renders = 0
+        self.version = 'v1'
+        self.cache = ResponseCache(maxsize=10)
+        app = Flask(__name__)
+
+        def render_page():
+            self.renders += 1
+            return f"<p>{self.version}</p>"
+
+        @app.route('/page')
+        def page():
+            return self.cache.respond(self.cache.get_or_render(('page',), self.version, render_page))
+
+        @app.route('/data')
+        def data():
+            return self.cache.respond(self.cache.get_or_render(('data',), self.version,
+                                                               lambda: jsonify({'version': self.version})))
+
+        self.client = app.test_client()
+
+    def test_renders_once_per_version(self):
+        """Test that repeat requests reuse the body until the data version changes"""
+        first = self.client.get('/page')
+        second = self.client.get('/page')
+        self.assertEqual(self.renders, 1)
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertEqual(first.headers['ETag'], second.headers['ETag'])
+        self.assertEqual(first.headers['Cache-Control'], 'no-cache')
+        self.assertEqual(first.content_type, 'text/html; charset=utf-8')
+
+        self.version = 'v2'
+        third = self.client.get('/page')
+        self.assertEqual(self.renders, 2)
+        self.assertEqual(third.get_data(as_text=True), '<p>v2</p>')
+        self.assertNotEqual(third.headers['ETag'], first.headers['ETag'])
+
+    def test_conditional_requests(self):
+        """Test 304 for a current ETag or date and 200 for a stale ETag"""
+        first = self.client.get('/data')
+        self.assertEqual(first.content_type, 'application/json')
+
+        revalidated = self.client.get('/data', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(revalidated.status_code, 304)
+        self.assertEqual(revalidated.get_data(), b'')
+
+        since = self.client.get('/data', headers={'If-Modified-Since': first.headers['Last-Modified']})
+        self.assertEqual(since.status_code, 304)
+
+        self.version = 'v2'
+        changed = self.client.get('/data', headers={'If-None-Match': first.headers['ETag']})
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.get_json(), {'version': 'v2'})
+
+    def test_disabled_cache_renders_every_time(self):
+        """Test that maxsize 0 still serves validators but renders each request"""
+        self.cache = ResponseCache(maxsize=0)
+        self.client.get('/page')
+        response = self.client.get('/page')
+        self.assertEqual(self.renders, 2)
+        self.assertIn('ETag', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+Unit Tests for Skill Taxonomy
+Tests for taxonomy loading, synonyms, scoring subsets and hot reload
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from ats_analyzer import ATSAnalyzer
+from skill_taxonomy import DEFAULT_TAXONOMY_PATH, SkillTaxonomy, TaxonomyStore
+
+
+def write_taxonomy(path, categories, version='test'):
+    with open(path, 'w') as f:
+        json.dump({'version': version, 'categories': categories}, f)
+
+
+class TestSkillTaxonomy(unittest.TestCase):
+    """Test suite for SkillTaxonomy and TaxonomyStore"""
+
+    def setUp(self):
+        """Set up test fixtures"""
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'taxonomy.json')
+        write_taxonomy(self.path, {
+            'cloud': {
+                'core': ['kubernetes'],
+                'skills': {
+                    'kubernetes': {'label': 'Kubernetes', 'synonyms': ['k8s']},
+                    'terraform': {}
+                }
+            },
+            'databases': {
+                'core': ['postgresql'],
+                'skills': {'postgresql': {'label': 'PostgreSQL', 'synonyms': ['postgres']}}
+            }
+        })
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_synonyms_map_to_canonical_skill(self):
+        """Test that synonyms are reported as their canonical skill"""
+        taxonomy = SkillTaxonomy.from_file(self.path)
+
+        found = taxonomy.matcher.find('Ran postgres on k8s with Terraform')
+
+        self.assertEqual(found, {
+            ('cloud', 'kubernetes'),
+            ('cloud', 'terraform'),
+            ('databases', 'postgresql')
+        })
+
+    def test_only_core_skills_are_scored(self):
+        """Test that non-core skills are recognized but not scored"""
+        taxonomy = SkillTaxonomy.from_file(self.path)
+
+        self.assertEqual(taxonomy.core, {'cloud': ('kubernetes',), 'databases': ('postgresql',)})
+        self.assertEqual(taxonomy.core_size, 2)
+        self.assertEqual(taxonomy.skill_count, 3)
+        self.assertEqual(taxonomy.label('postgresql'), 'PostgreSQL')
+
+    def test_analyzer_scores_with_store(self):
+        """Test keyword scoring against a custom taxonomy"""
+        analyzer = ATSAnalyzer(taxonomy=TaxonomyStore(self.path))
+
+        result = analyzer.analyze({'professionalSummary': 'postgres and k8s', 'skills': []})
+
+        self.assertEqual(result.keyword_score, 25)
+        self.assertEqual(result.missing_keywords, ())
+
+    def test_reload_swaps_taxonomy(self):
+        """Test that reload replaces the active taxonomy"""
+        store = TaxonomyStore(self.path)
+        before = store.current
+        write_taxonomy(self.path, {'cloud': {'core': ['aws'], 'skills': ['aws']}}, version='v2')
+
+        after = store.reload()
+
+        self.assertIsNot(before, after)
+        self.assertIs(store.current, after)
+        self.assertTrue(after.version.startswith('v2-'))
+        self.assertNotEqual(before.version, after.version)
+
+    def test_failed_reload_keeps_previous_taxonomy(self):
+        """Test that a broken file does not replace the active taxonomy"""
+        store = TaxonomyStore(self.path)
+        before = store.current
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+
+        with self.assertRaises(ValueError):
+            store.reload()
+        self.assertIs(store.current, before)
+
+    def test_refresh_picks_up_changed_file(self):
+        """Test that refresh reloads only after the file changed"""
+        store = TaxonomyStore(self.path)
+        before = store.current
+        self.assertIsNone(store.refresh())
+
+        write_taxonomy(self.path, {'cloud': {'core': ['aws'], 'skills': ['aws']}}, version='v2')
+        after = store.refresh()
+
+        self.assertIs(store.current, after)
+        self.assertNotEqual(before.version, after.version)
+        self.assertIsNone(store.refresh())
+
+    def test_refresh_keeps_taxonomy_on_broken_file(self):
+        """Test that a broken file is skipped until it changes again"""
+        store = TaxonomyStore(self.path)
+        before = store.current
+        with open(self.path, 'w') as f:
+            f.write('{not json')
+
+        self.assertIsNone(store.refresh())
+        self.assertIs(store.current, before)
+
+        write_taxonomy(self.path, {'cloud': {'core': ['aws'], 'skills': ['aws']}}, version='v2')
+        self.assertTrue(store.refresh().version.startswith('v2-'))
+
+    def test_core_must_reference_known_skills(self):
+        """Test validation of core skill lists"""
+        write_taxonomy(self.path, {'cloud': {'core': ['aws'], 'skills': ['gcp']}})
+
+        with self.assertRaises(ValueError):
+            SkillTaxonomy.from_file(self.path)
+
+    def test_missing_file_uses_fallback(self):
+        """Test the built-in keyword fallback"""
+        store = TaxonomyStore(os.path.join(self.tmp, 'missing.json'), fallback={'cloud': ['aws']})
+
+        self.assertTrue(store.version.startswith('builtin-'))
+        self.assertEqual(store.current.core, {'cloud': ('aws',)})
+
+    def test_bundled_core_matches_important_keywords(self):
+        """Test that the bundled taxonomy scores the same keywords as the built-in list"""
+        taxonomy = SkillTaxonomy.from_file(DEFAULT_TAXONOMY_PATH)
+
+        self.assertEqual(
+            {category: list(skills) for category, skills in taxonomy.core.items()},
+            ATSAnalyzer.IMPORTANT_KEYWORDS
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
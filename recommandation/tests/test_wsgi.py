@@ -0,0 +1,68 @@
+"""
+Unit Tests for the Gunicorn Configuration
+Tests that worker, thread and preload settings follow the environment
+"""
+
+import os
+import runpy
+import types
+import unittest
+from unittest import mock
+
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), '..', 'gunicorn.conf.py')
+
+
+def load_config(**env):
+    with mock.patch.dict(os.environ, env, clear=True):
+        return runpy.run_path(CONFIG_PATH)
+
+
+class TestGunicornConfig(unittest.TestCase):
+    """Test suite for gunicorn.conf.py"""
+
+    def test_defaults(self):
+        """Test that models are preloaded and workers match the CPU count"""
+        config = load_config()
+        self.assertTrue(config['preload_app'])
+        self.assertEqual(config['workers'], os.cpu_count() or 1)
+        self.assertEqual(config['bind'], '0.0.0.0:5001')
+        self.assertEqual(config['worker_class'], 'gthread')
+
+    def test_environment_overrides(self):
+        """Test worker count, single-threaded workers and disabled preloading"""
+        config = load_config(WEB_CONCURRENCY='3', WEB_THREADS='1', WEB_PRELOAD='0', BIND='127.0.0.1:9000')
+        self.assertEqual(config['workers'], 3)
+        self.assertEqual(config['threads'], 1)
+        self.assertEqual(config['worker_class'], 'sync')
+        self.assertFalse(config['preload_app'])
+        self.assertEqual(config['bind'], '127.0.0.1:9000')
+
+    def test_jobs_are_shared_by_default(self):
+        """Test that the workers keep async jobs in a shared SQLite file unless configured otherwise"""
+        with mock.patch.dict(os.environ, {}, clear=True):
+            runpy.run_path(CONFIG_PATH)
+            self.assertTrue(os.environ['ATS_JOB_DB'].endswith(os.path.join('artifacts', 'ats_jobs.sqlite3')))
+        with mock.patch.dict(os.environ, {'ATS_JOB_DB': '/srv/jobs.sqlite3'}, clear=True):
+            runpy.run_path(CONFIG_PATH)
+            self.assertEqual(os.environ['ATS_JOB_DB'], '/srv/jobs.sqlite3')
+
+    def test_several_workers_need_shared_jobs(self):
+        """Test that workers refuse to start with in-memory jobs unless there is only one"""
+        post_worker_init = load_config()['post_worker_init']
+
+        def worker(workers, shared):
+            service = types.SimpleNamespace(ats_jobs=types.SimpleNamespace(shared=shared))
+            return service, types.SimpleNamespace(cfg=types.SimpleNamespace(workers=workers))
+
+        for workers, shared, refused in ((4, False, True), (4, True, False), (1, False, False)):
+            service, gunicorn_worker = worker(workers, shared)
+            with mock.patch.dict('sys.modules', {'app': service}):
+                if refused:
+                    with self.assertRaises(RuntimeError):
+                        post_worker_init(gunicorn_worker)
+                else:
+                    post_worker_init(gunicorn_worker)
+
+
+if __name__ == '__main__':
+    unittest.main()
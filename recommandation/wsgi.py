@@ -0,0 +1,69 @@
+"""
+WSGI Entry Point
+Production server entry for the recommendation service
+
+    gunicorn wsgi:application            # settings from gunicorn.conf.py
+
+With preload_app (see gunicorn.conf.py) gunicorn imports this module once
+in the master: the artifact bundle (vectorizer, model, career table and
+aptitude questions), the skill taxonomy and the job posting index are
+loaded there, and the workers forked afterwards share those pages
+copy-on-write instead of loading a copy each.
+
+Everything the service starts in the background (ATS worker processes,
+async job threads) is created on first use, so nothing is running yet
+when the master forks. For the same reason the recommender's default
+background load becomes an eager one here; RECOMMENDER_LOAD=lazy or off
+are kept.
+"""
+
+import gc
+import os
+
+# Used to warm the recommender before forking
+WARMUP_PROFILE = {
+    'Class/Grade': '12th',
+    'Skills': 'Python, SQL',
+    'Interests': 'Data Science',
+    'Hobbies': 'Reading',
+    'Passion': 'Solving Problems',
+    'Favourite Subject': 'Mathematics'
+}
+
+
+def create_app(freeze: bool = True):
+    """
+    Load the service and everything it loads lazily, ready to be forked
+
+    Args:
+        freeze (bool): Move every object loaded so far into the permanent
+            GC generation, so that collections in the workers do not write
+            to (and thereby copy) the shared pages
+
+    Returns:
+        Flask: The configured application
+    """
+    # A background load would still be running when the workers are forked,
+    # so load in the master instead; lazy and off are kept as configured
+    if os.environ.get('RECOMMENDER_LOAD', 'background').strip().lower() == 'background':
+        os.environ['RECOMMENDER_LOAD'] = 'eager'
+
+    import app as service
+    from metrics import REGISTRY
+
+    # Touch what would otherwise load on the first request in every worker
+    analyzer = service.get_analyzer()
+    analyzer.taxonomy.current
+    analyzer.job_weights.current
+    if service.recommendation_models.enabled:
+        service.get_recommender().recommend_batch([WARMUP_PROFILE])
+    REGISTRY.clear()
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+        print(f"[WSGI] Froze {gc.get_freeze_count()} objects for copy-on-write sharing")
+    return service.app
+
+
+application = create_app()
@@ -37,7 +37,7 @@ sleep 2
 echo "🐍 Starting Python Server (Port 5000)..."
 cd "$PROJECT_PATH/recommandation"
 pip install -r requirements.txt > /dev/null 2>&1
-python app.py &
+gunicorn wsgi:application &
 PYTHON_PID=$!
 sleep 2
 
@@ -26,7 +26,7 @@ sleep 3
 
 # Start Python Server in a new terminal
 echo "🐍 Starting Python Server (Port 5000)..."
-open -a Terminal "cd '$PROJECT_PATH/recommandation' && pip install -r requirements.txt > /dev/null 2>&1 && python app.py"
+open -a Terminal "cd '$PROJECT_PATH/recommandation' && pip install -r requirements.txt > /dev/null 2>&1 && gunicorn wsgi:application"
 
 sleep 2
 